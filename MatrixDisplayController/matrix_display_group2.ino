@@ -1,5 +1,4 @@
 #include <LedControl.h>
-#include <ArduinoJson.h>
 
 // 4,5,6 번 매트릭스 제어
 
@@ -233,15 +232,59 @@ void initializeModules() {
   }
 }
 
-const int BUFFER_SIZE = 256; // JSON 데이터의 충분한 버퍼 크기
-char jsonBuffer[BUFFER_SIZE];
+const int BUFFER_SIZE = 64; // 압축 프레임 버퍼 크기
+char frameBuffer[BUFFER_SIZE];
+
+// 디스플레이 번호에 해당하는 LedControl 그룹을 선택하는 함수
+bool selectGroup(int display, LedControl* lcGroup[]) {
+  switch (display) {
+    case 4:
+      lcGroup[0] = &lc1; lcGroup[1] = &lc2; lcGroup[2] = &lc3; lcGroup[3] = &lc4;
+      break;
+    case 5:
+      lcGroup[0] = &lc5; lcGroup[1] = &lc6; lcGroup[2] = &lc7; lcGroup[3] = &lc8;
+      break;
+    case 6:
+      lcGroup[0] = &lc9; lcGroup[1] = &lc10; lcGroup[2] = &lc11; lcGroup[3] = &lc12;
+      break;
+    default:
+      return false;
+  }
+  return true;
+}
+
+// 디스플레이 하나의 화살표를 변경하는 함수 (U/D/L/R: 방향, '-': 끄기)
+void applyDisplay(int display, char code) {
+  LedControl* lcGroup[4];
+  int groupSize = 4;
+
+  if (!selectGroup(display, lcGroup)) {
+    return;
+  }
+
+  if (code == 'U') {
+    displayArrow(arrowUp, lcGroup, groupSize);
+  } else if (code == 'D') {
+    displayArrow(arrowDown, lcGroup, groupSize);
+  } else if (code == 'L') {
+    displayArrow(arrowLeft, lcGroup, groupSize);
+  } else if (code == 'R') {
+    displayArrow(arrowRight, lcGroup, groupSize);
+  } else {
+    for (int i = 0; i < groupSize; i++) {
+      for (int j = 0; j < 4; j++) {
+        lcGroup[i]->clearDisplay(j);
+      }
+    }
+  }
+}
 
 void setup() {
   Serial.begin(9600); // UART 통신 초기화
   while (!Serial) {
     ; // 시리얼 포트가 연결될 때까지 대기
   }
-  Serial.println("Arduino is ready to receive JSON data."); // 아두이노가 준비되었음을 알림
+  Serial.println("READY"); // 아두이노가 준비되었음을 알림
 
   // LedControl 모듈 초기화
   initializeModules();
@@ -251,70 +294,25 @@ void setup() {
 }
 
 void loop() {
-  static String lastJson = "";
-  // 시리얼 데이터가 있는지 확인
+  // 프레임 형식: "<seq>:<디스플레이 번호><방향 코드>...\n" (예: "17:1R3-")
+  // 변경된 디스플레이만 전송되므로 수신하지 않은 디스플레이는 이전 화살표를 유지
   if (Serial.available() > 0) {
-    // 시리얼 데이터를 버퍼에 읽기
-    size_t len = Serial.readBytesUntil('\n', jsonBuffer, BUFFER_SIZE);
-    jsonBuffer[len] = '\0'; // JSON 문자열의 끝을 null로 설정
-
-    Serial.print("Received JSON: ");
-    Serial.println(jsonBuffer);  // 수신된 JSON 데이터를 에코 출력
-
-    // JSON 파싱
-    StaticJsonDocument<256> doc;
-    DeserializationError error = deserializeJson(doc, jsonBuffer);
-
-    if (error) {
-      Serial.print("Failed to parse JSON: ");
-      Serial.println(error.c_str());  // 오류 메시지 출력
-      // 파싱 실패 시 모든 매트릭스를 끔
-      turnOffAllMatrices();
-    } else {
-      String currentJson = String(jsonBuffer);
-      if (currentJson != lastJson) {
-        lastJson = currentJson;
-        // JSON 파싱 성공 시
-        for (int i = 4; i <= 6; i++) {
-          if (doc.containsKey(String(i))) {
-            const char* direction = doc[String(i)]["direction"];
-            Serial.print("Car ");
-            Serial.print(i);
-            Serial.print(" direction: ");
-            Serial.println(direction);
-
-            // 올바른 LedControl 객체 그룹 선택
-            LedControl* lcGroup[4];
-            int groupSize = 4;
+    size_t len = Serial.readBytesUntil('\n', frameBuffer, BUFFER_SIZE - 1);
+    frameBuffer[len] = '\0';
 
-            switch (i) {
-              case 4:
-                lcGroup[0] = &lc1; lcGroup[1] = &lc2; lcGroup[2] = &lc3; lcGroup[3] = &lc4;
-                break;
-              case 5:
-                lcGroup[0] = &lc5; lcGroup[1] = &lc6; lcGroup[2] = &lc7; lcGroup[3] = &lc8;
-                break;
-              case 6:
-                lcGroup[0] = &lc9; lcGroup[1] = &lc10; lcGroup[2] = &lc11; lcGroup[3] = &lc12;
-                break;
-            }
+    char* body = strchr(frameBuffer, ':');
+    if (body == NULL) {
+      return;
+    }
+    *body = '\0';
+    body++;
 
-            // 방향에 따라 적절한 화살표 표시
-            if (strcmp(direction, "up") == 0) {
-              displayArrow(arrowUp, lcGroup, groupSize);
-            } else if (strcmp(direction, "down") == 0) {
-              displayArrow(arrowDown, lcGroup, groupSize);
-            } else if (strcmp(direction, "left") == 0) {
-              displayArrow(arrowLeft, lcGroup, groupSize);
-            } else if (strcmp(direction, "right") == 0) {
-              displayArrow(arrowRight, lcGroup, groupSize);
-            }
-          }
-        }
-      }
+    for (size_t i = 0; body[i] != '\0' && body[i + 1] != '\0'; i += 2) {
+      applyDisplay(body[i] - '0', body[i + 1]);
     }
-  } else {
-    // 데이터가 수신되지 않으면 모든 매트릭스를 끔
-    turnOffAllMatrices();
+
+    // 처리 완료 응답 (송신 측에서 지연 시간 측정에 사용)
+    Serial.print("A");
+    Serial.println(frameBuffer);
   }
-}
\ No newline at end of file
+}
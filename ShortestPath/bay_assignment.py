@@ -0,0 +1,110 @@
+# 여러 차량의 목표 주차 구역을 한 번에 배정하는 모듈 (헝가리안 알고리즘)
+
+from typing import Callable, Hashable, Sequence
+
+# 배정할 수 없는 (차량, 주차 구역) 쌍의 비용
+INF = float('inf')
+
+
+def hungarian(cost: Sequence[Sequence[float]]) -> list[tuple[int, int]]:
+    """
+    비용 행렬의 최소 비용 배정을 계산하는 함수 (헝가리안 알고리즘, 포텐셜 방식 O(n^2 m))
+
+    행과 열의 수가 달라도 되며, 작은 쪽의 모든 행(또는 열)이 하나씩 배정됨
+
+    Args:
+        cost: cost[i][j] = i번 행을 j번 열에 배정하는 비용 (INF는 사용하지 않음, 큰 유한값으로 전달)
+
+    Returns:
+        list: (행 번호, 열 번호) 쌍 목록 (행 번호 순서)
+    """
+    rows = len(cost)
+    if rows == 0 or len(cost[0]) == 0:
+        return []
+    cols = len(cost[0])
+
+    # 행이 열보다 많으면 전치하여 계산
+    if rows > cols:
+        transposed = [[cost[i][j] for i in range(rows)] for j in range(cols)]
+        return sorted((i, j) for j, i in hungarian(transposed))
+
+    # 1부터 시작하는 인덱스 사용 (0번은 가상의 행/열)
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (cols + 1)
+    match = [0] * (cols + 1)    # 열 -> 배정된 행
+    way = [0] * (cols + 1)
+
+    for i in range(1, rows + 1):
+        match[0] = i
+        j0 = 0
+        min_value = [INF] * (cols + 1)
+        used = [False] * (cols + 1)
+
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            delta = INF
+            j1 = 0
+
+            for j in range(1, cols + 1):
+                if used[j]:
+                    continue
+                current = cost[i0 - 1][j - 1] - u[i0] - v[j]
+                if current < min_value[j]:
+                    min_value[j] = current
+                    way[j] = j0
+                if min_value[j] < delta:
+                    delta = min_value[j]
+                    j1 = j
+
+            for j in range(cols + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_value[j] -= delta
+
+            j0 = j1
+            if match[j0] == 0:
+                break
+
+        # 증가 경로를 따라 배정 갱신
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    return sorted((match[j] - 1, j - 1) for j in range(1, cols + 1) if match[j] != 0)
+
+
+def assign_bays(
+    car_ids: Sequence[Hashable],
+    bay_ids: Sequence[Hashable],
+    cost_fn: Callable[[Hashable, Hashable], float],
+) -> dict:
+    """
+    차량 목록과 빈 주차 구역 목록의 총 비용이 최소가 되는 배정을 계산하는 함수
+
+    Args:
+        car_ids: 목표가 필요한 차량 ID
+        bay_ids: 목표로 지정 가능한 주차 구역 ID
+        cost_fn: (차량 ID, 주차 구역 ID) -> 비용 (도달할 수 없으면 INF)
+
+    Returns:
+        dict: 차량 ID -> 주차 구역 ID (주차 구역이 부족하거나 도달할 수 없는 차량은 제외)
+    """
+    if not car_ids or not bay_ids:
+        return {}
+
+    cost = [[cost_fn(car_id, bay_id) for bay_id in bay_ids] for car_id in car_ids]
+
+    # 도달할 수 없는 쌍은 다른 어떤 배정보다 큰 유한값으로 바꿔 계산한 뒤 제외
+    finite = [value for row in cost for value in row if value != INF]
+    unreachable = (max(finite) + 1) * (len(car_ids) + 1) if finite else 1.0
+    matrix = [[unreachable if value == INF else value for value in row] for row in cost]
+
+    return {
+        car_ids[i]: bay_ids[j]
+        for i, j in hungarian(matrix)
+        if cost[i][j] != INF
+    }
@@ -0,0 +1,209 @@
+# 이동 구역의 시간 감쇠 유입량과 경로 기반 예상 점유를 이용해 다익스트라 가중치를 계산하는 모듈
+
+from __future__ import annotations
+import math
+from typing import Callable, Mapping, Optional, TYPE_CHECKING
+
+# shortest_route에서 사용하므로 타입 확인 시에만 import (순환 import 방지)
+if TYPE_CHECKING:
+    from shortest_route import Car, MovingSpace
+
+
+class CongestionModel:
+    """
+    이동 구역 혼잡도 모델
+
+    - 유입량: 구역에 차량이 들어올 때마다 1씩 더하고 flow_time_constant초의 시간 상수로 지수 감쇠 (최근 유입이 많은 구역일수록 큼)
+    - 예상 점유: 경로에 해당 구역이 있는 차량의 도착 예상 시간(ETA)을 exp(-ETA / horizon)으로 가중 (곧 도착할 차량일수록 큼)
+    - 가중치: MovingSpace.congestion에서 경로 차량 수만큼 더해진 값을 예상 점유로 바꾸고 유입량을 더한 값
+      update에서 프레임마다 한 번 계산하여 weights에 저장
+    - 경로를 다시 계산하는 차량은 clear_route에서 remove_route로 자신의 예상 점유를 가중치에서 빼서 자기 경로를 피하지 않도록 함
+    - 차량 속도: velocity_source(칼만 필터 속도)가 있으면 사용하고, 없는 차량만 중심점 이동 거리의 지수 이동 평균으로 계산
+    """
+
+    def __init__(
+        self,
+        horizon: float = 10.0,
+        flow_time_constant: float = 60.0,
+        flow_congestion: float = 50.0,
+        min_speed: float = 20.0,
+        speed_smoothing: float = 0.3,
+        velocity_source: Optional[Callable[[], Mapping[int, tuple[float, float]]]] = None,
+    ) -> None:
+        """
+        Args:
+            horizon: 예상 점유 계산 시간 범위 (초)
+            flow_time_constant: 유입량 감쇠 시간 상수 (초)
+            flow_congestion: 유입률 1대/분당 더할 혼잡도
+            min_speed: ETA 계산에 사용하는 최소 속도 (픽셀/초, 정지한 차량의 ETA가 무한대가 되지 않도록)
+            speed_smoothing: 차량 속도 지수 이동 평균의 새 값 가중치
+            velocity_source: 차량 ID -> 속도 (vx, vy) (픽셀/초)를 반환하는 함수 (kalman_tracker.CentroidKalman.latest_velocities)
+        """
+        self.horizon: float = horizon
+        self.flow_time_constant: float = flow_time_constant
+        self.flow_congestion: float = flow_congestion
+        self.min_speed: float = min_speed
+        self.speed_smoothing: float = speed_smoothing
+        self.velocity_source: Optional[Callable[[], Mapping[int, tuple[float, float]]]] = velocity_source
+
+        # 구역 ID -> (감쇠 유입량, 마지막 갱신 시각)
+        self.flow: dict[int, tuple[float, float]] = {}
+
+        # 차량 ID -> (마지막 위치, 마지막 시각, 평활화된 속도)
+        self.car_motion: dict[int, tuple[tuple[float, float], float, float]] = {}
+
+        # 차량 ID -> 마지막으로 확인한 이동 구역 ID (유입 감지용)
+        self.car_space: dict[int, int] = {}
+
+        # 차량 ID -> (구역 ID -> 예상 점유), 마지막 update의 route_congestion (remove_route에서 사용)
+        self.contributions: dict[int, dict[int, float]] = {}
+        self.route_congestion: float = 0.0
+
+        # 구역 ID -> 다익스트라 가중치
+        self.weights: dict[int, float] = {}
+
+    def update(self, cars: Mapping[int, Car], moving_spaces: Mapping[int, MovingSpace], now: float, route_congestion: float) -> dict[int, float]:
+        """
+        프레임마다 한 번 호출하여 차량 속도, 유입량, 예상 점유를 갱신하고 구역별 가중치를 계산
+
+        Args:
+            cars: 현재 추적 중인 차량
+            moving_spaces: 이동 구역
+            now: 현재 시각
+            route_congestion: 곧 도착할 차량 한 대의 최대 혼잡도 (MovingSpace.ROUTE_CONGESTION)
+
+        Returns:
+            dict: 구역 ID -> 가중치
+        """
+        predicted = {space_id: 0.0 for space_id in moving_spaces}
+        contributions: dict[int, dict[int, float]] = {}
+        velocities = self.velocity_source() if self.velocity_source is not None else {}
+
+        for car_id, car in cars.items():
+            if car_id in velocities:
+                speed = math.hypot(*velocities[car_id])
+            else:
+                speed = self.update_speed(car_id, car.position, now)
+
+            if car.is_moving():
+                # 다른 이동 구역으로 들어온 경우 유입량 증가
+                if self.car_space.get(car_id) != car.space_id and car.space_id in moving_spaces:
+                    self.add_flow(car.space_id, now)
+                self.car_space[car_id] = car.space_id
+            else:
+                self.car_space.pop(car_id, None)
+
+            contribution = {}
+            for space_id, eta in self.route_eta(car, moving_spaces, speed):
+                if space_id in predicted:
+                    contribution[space_id] = contribution.get(space_id, 0.0) + math.exp(-eta / self.horizon)
+                    predicted[space_id] += math.exp(-eta / self.horizon)
+            if contribution:
+                contributions[car_id] = contribution
+
+        # 사라진 차량 정리
+        for car_id in (self.car_motion.keys() | self.car_space.keys()) - cars.keys():
+            self.car_motion.pop(car_id, None)
+            self.car_space.pop(car_id, None)
+
+        weights = {}
+        for space_id, space in moving_spaces.items():
+            weights[space_id] = (
+                space.congestion
+                - route_congestion * len(space.route_set)
+                + route_congestion * predicted[space_id]
+                + self.flow_congestion * self.flow_rate(space_id, now)
+            )
+
+        self.weights = weights
+        self.contributions = contributions
+        self.route_congestion = route_congestion
+        return weights
+
+    def remove_route(self, car_id: int) -> None:
+        """경로를 해제한 차량의 예상 점유를 가중치에서 제거 (같은 프레임에 다시 계산하는 경로가 자신의 이전 경로를 피하지 않도록)"""
+
+        for space_id, value in self.contributions.pop(car_id, {}).items():
+            if space_id in self.weights:
+                self.weights[space_id] -= self.route_congestion * value
+
+    def relayout(self, cars: Mapping[int, Car], moving_spaces: Mapping[int, MovingSpace], now: float, route_congestion: float) -> dict[int, float]:
+        """
+        구역 데이터를 교체한 뒤 새 구역으로 가중치를 다시 계산
+
+        남은 구역의 유입량은 유지하고, 교체로 바뀐 차량의 구역은 유입으로 세지 않음
+        """
+        self.flow = {space_id: flow for space_id, flow in self.flow.items() if space_id in moving_spaces}
+        self.car_space = {car_id: car.space_id for car_id, car in cars.items() if car.is_moving() and car.space_id in moving_spaces}
+        self.contributions = {}
+        return self.update(cars, moving_spaces, now, route_congestion)
+
+    def rename(self, old_car_id: int, new_car_id: int) -> None:
+        """트래커의 ID가 바뀐 차량의 속도와 구역 기록을 새 ID로 이동 (같은 구역에 다시 유입량을 더하지 않도록)"""
+
+        if old_car_id in self.car_motion:
+            self.car_motion[new_car_id] = self.car_motion.pop(old_car_id)
+        if old_car_id in self.car_space:
+            self.car_space[new_car_id] = self.car_space.pop(old_car_id)
+        if old_car_id in self.contributions:
+            self.contributions[new_car_id] = self.contributions.pop(old_car_id)
+
+    def update_speed(self, car_id: int, position: tuple[float, float], now: float) -> float:
+        """차량의 이동 속도(픽셀/초)를 지수 이동 평균으로 갱신하여 반환"""
+
+        motion = self.car_motion.get(car_id)
+
+        if motion is None:
+            speed = 0.0
+        else:
+            last_position, last_time, last_speed = motion
+            dt = now - last_time
+            if dt <= 0:
+                return last_speed
+            observed = math.hypot(position[0] - last_position[0], position[1] - last_position[1]) / dt
+            speed = self.speed_smoothing * observed + (1 - self.speed_smoothing) * last_speed
+
+        self.car_motion[car_id] = (position, now, speed)
+        return speed
+
+    def route_eta(self, car: Car, moving_spaces: Mapping[int, MovingSpace], speed: float) -> list[tuple[int, float]]:
+        """차량 경로의 다음 구역들의 도착 예상 시간 (현재 구역 제외, 구역 중심점 사이 거리 기준)"""
+
+        speed = max(speed, self.min_speed)
+        result = []
+        position = car.position
+        distance = 0.0
+
+        for space_id in car.route:
+            if space_id == car.space_id or space_id not in moving_spaces:
+                continue
+
+            center = moving_spaces[space_id].center_position
+            distance += math.hypot(center[0] - position[0], center[1] - position[1])
+            position = center
+
+            eta = distance / speed
+            if eta > self.horizon * 3:    # exp(-3) 미만은 무시
+                break
+            result.append((space_id, eta))
+
+        return result
+
+    def add_flow(self, space_id: int, now: float) -> None:
+        """구역 유입량에 1 추가"""
+
+        self.flow[space_id] = (self.decayed_flow(space_id, now) + 1.0, now)
+
+    def decayed_flow(self, space_id: int, now: float) -> float:
+        """now 시각까지 감쇠된 유입량"""
+
+        if space_id not in self.flow:
+            return 0.0
+
+        value, last_time = self.flow[space_id]
+        return value * math.exp(-(now - last_time) / self.flow_time_constant)
+
+    def flow_rate(self, space_id: int, now: float) -> float:
+        """최근 유입률 (대/분)"""
+
+        return self.decayed_flow(space_id, now) * 60.0 / self.flow_time_constant
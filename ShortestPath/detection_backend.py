@@ -0,0 +1,333 @@
+# 차량 탐지/추적 백엔드 인터페이스 (프레임 -> 트랙 배열)
+#
+# - bytetrack: ultralytics YOLO + 내장 ByteTrack (custom_bytetrack.yaml)
+# - deepsort: ultralytics YOLO + deep_sort_realtime (외형 임베딩은 embedding_cache로 배치 계산, 재사용)
+# - onnx: ONNX Runtime CPU 추론 + NumPy ByteTrack (ultralytics, torch 없이 실행, 양자화 모델 사용 가능)
+#
+# 백엔드마다 필요한 패키지는 생성할 때 import 하므로, 설치되지 않은 패키지의 백엔드만 사용할 수 없음
+
+from abc import ABC, abstractmethod
+import platform
+from typing import Any, Optional
+
+import numpy as np
+import cv2
+
+from embedding_cache import Embedder, EmbeddingCache, crop_boxes
+from frame_preprocess import CropRect, FramePreprocessor
+from numpy_bytetrack import ByteTracker
+from performance_profiler import profiler
+from track_array import empty_tracks, tracks_to_array
+
+
+class DetectionBackend(ABC):
+    """프레임 한 장을 탐지/추적하여 트랙 배열을 반환하는 백엔드"""
+
+    # 모델 입력 크기 (너비, 높이)
+    input_size: tuple[int, int] = (640, 640)
+
+    # 생성할 때 imgsz로 입력 크기를 바꿀 수 있는지 (ONNX 모델은 변환할 때의 크기로 고정)
+    resizable_input: bool = True
+
+    @abstractmethod
+    def detect(self, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        추적 없이 탐지만 수행 (모델 벤치마크, 정확도 비교용, 트래커 상태를 바꾸지 않음)
+
+        Returns:
+            tuple: (바운딩 박스 (N, 4) [xmin, ymin, xmax, ymax], 신뢰도 (N,))
+        """
+
+    @abstractmethod
+    def track(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            frame: BGR 프레임
+
+        Returns:
+            np.ndarray: 트랙 배열 (N, 5) [track_id, xmin, ymin, xmax, ymax]
+        """
+
+    def close(self) -> None:
+        """모델 등 자원 해제 (필요한 백엔드만 구현)"""
+
+
+def select_torch_device():
+    """운영체제별 torch 장치 선택 (macOS: mps, 그 외: cuda, 없으면 cpu)"""
+
+    import torch
+
+    if platform.system() == "Darwin":
+        return torch.device("mps") if torch.backends.mps.is_available() else "cpu"
+
+    return torch.device("cuda") if torch.cuda.is_available() else "cpu"
+
+
+def ultralytics_detect(model, frame: np.ndarray, device, min_confidence: float, imgsz: int) -> tuple[np.ndarray, np.ndarray]:
+    """ultralytics 모델의 탐지 결과를 (바운딩 박스, 신뢰도) 배열로 변환"""
+
+    result = model.predict(frame, device=device, conf=min_confidence, imgsz=imgsz, verbose=False)[0]
+    if result.boxes is None:
+        return np.zeros((0, 4), dtype=np.float32), np.zeros((0,), dtype=np.float32)
+
+    return result.boxes.xyxy.cpu().numpy().astype(np.float32), result.boxes.conf.cpu().numpy().astype(np.float32)
+
+
+class UltralyticsByteTrackBackend(DetectionBackend):
+    """YOLOv8의 내장 ByteTrack을 이용한 추적"""
+
+    def __init__(self, model_path: str, tracker_config: str = "custom_bytetrack.yaml", min_confidence: float = 0.1, imgsz: int = 640) -> None:
+        """
+        Args:
+            model_path: .pt, .engine(TensorRT), _openvino_model 폴더 등 ultralytics가 읽을 수 있는 모델
+            tracker_config: ByteTrack 설정 파일
+            min_confidence: detect의 최소 신뢰도 (custom_bytetrack.yaml의 track_high_thresh)
+            imgsz: 모델 입력 크기 (.engine, _openvino_model은 변환할 때의 크기)
+        """
+        from ultralytics import YOLO
+
+        self.model = YOLO(model_path, task="detect")
+        self.device = select_torch_device()
+        self.tracker_config: str = tracker_config
+        self.min_confidence: float = min_confidence
+        self.imgsz: int = imgsz
+        self.input_size = (imgsz, imgsz)
+
+    def detect(self, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return ultralytics_detect(self.model, frame, self.device, self.min_confidence, self.imgsz)
+
+    def track(self, frame: np.ndarray) -> np.ndarray:
+        results = self.model.track(frame, device=self.device, persist=True, tracker=self.tracker_config, imgsz=self.imgsz)
+        result = results[0]
+
+        # boxes가 있고 id가 있는 경우 (추적 성공)
+        if result.boxes is None or result.boxes.id is None:
+            return empty_tracks()
+
+        boxes = result.boxes.xyxy.cpu().numpy()
+        track_ids = result.boxes.id.cpu().numpy()
+        return np.column_stack([track_ids, boxes]).astype(np.float32)
+
+
+class DeepSortBackend(DetectionBackend):
+    """
+    YOLOv8 탐지 결과를 DeepSORT로 추적
+
+    외형 임베딩은 embedding_cache.EmbeddingCache로 계산하여 정지한 주차 차량과 IoU만으로 구분되는 차량은 이전 임베딩을 재사용하고,
+    나머지 박스만 모아 임베딩 모델을 프레임당 한 번 호출
+    """
+
+    def __init__(self, model_path: str, min_confidence: float = 0.1, max_age: int = 70, n_init: int = 1,
+                 max_iou_distance: float = 1, nn_budget: int = 150, imgsz: int = 640,
+                 embedding_cache: bool = True, embedder_batch_size: int = 64) -> None:
+        """
+        Args:
+            embedding_cache: 이전 프레임의 임베딩 재사용 (False이면 매 프레임 모든 박스를 계산)
+            embedder_batch_size: 임베딩 모델 한 번의 추론에 넣는 최대 박스 수 (주차장 전체 차량이 한 번에 들어가도록)
+        """
+        from ultralytics import YOLO
+        from deep_sort_realtime.deepsort_tracker import DeepSort
+
+        self.model = YOLO(model_path, task="detect")
+        self.device = select_torch_device()
+        self.min_confidence: float = min_confidence
+        self.imgsz: int = imgsz
+        self.input_size = (imgsz, imgsz)
+
+        # 임베딩 모델은 CUDA가 있을 때만 GPU, 반정밀도 사용 (mps, cpu는 float32 CPU 추론)
+        use_cuda = str(self.device).startswith("cuda")
+        self.tracker = DeepSort(max_age=max_age, n_init=n_init, max_iou_distance=max_iou_distance, nn_budget=nn_budget,
+                                half=use_cuda, embedder_gpu=use_cuda)
+        self.tracker.embedder.max_batch_size = embedder_batch_size
+
+        self.embeddings: Embedder = EmbeddingCache(self.embed) if embedding_cache else self.embed
+
+    def embed(self, frame: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+        """여러 박스의 임베딩을 임베딩 모델 한 번의 호출로 계산"""
+
+        if len(boxes) == 0:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.asarray(self.tracker.embedder.predict(crop_boxes(frame, boxes)))
+
+    def detect(self, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return ultralytics_detect(self.model, frame, self.device, self.min_confidence, self.imgsz)
+
+    def track(self, frame: np.ndarray) -> np.ndarray:
+        with profiler.measure("2. YOLO Inference"):
+            detections = self.model(frame, device=self.device, imgsz=self.imgsz)[0]
+        dets = []
+        boxes = []
+
+        with profiler.measure("3. Detections Loop"):
+            if detections.boxes is not None:
+                for data in detections.boxes.data.tolist():
+                    conf = float(data[4])
+                    if conf < self.min_confidence:
+                        continue
+
+                    xmin, ymin, xmax, ymax = int(data[0]), int(data[1]), int(data[2]), int(data[3])
+                    if xmax <= xmin or ymax <= ymin:
+                        continue    # DeepSORT가 버리는 박스 (embeds와 순서가 어긋나지 않도록 미리 제외)
+
+                    dets.append([[xmin, ymin, xmax - xmin, ymax - ymin], conf, int(data[5])])
+                    boxes.append([xmin, ymin, xmax, ymax])
+
+        # 임베딩을 직접 전달하면 DeepSORT는 박스를 잘라 임베딩을 계산하지 않음 (탐지가 없는 프레임도 캐시에 전달하여 이전 박스를 비움)
+        with profiler.measure("4a. DeepSort Embedding"):
+            embeds = list(self.embeddings(frame, np.array(boxes, dtype=np.float32).reshape(-1, 4)))
+
+        with profiler.measure("4b. DeepSort Update"):
+            tracks = self.tracker.update_tracks(dets, embeds=embeds)
+
+        with profiler.measure("5. Tracks Loop"):
+            return tracks_to_array(tracks)
+
+    def close(self) -> None:
+        if isinstance(self.embeddings, EmbeddingCache):
+            print(f"DeepSORT {self.embeddings.stats()}")
+
+
+def decode_yolo_output(output: np.ndarray, min_confidence: float, iou_threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    YOLOv8 ONNX 출력 (1, 4 + 클래스 수, 앵커 수)을 입력 이미지 좌표의 바운딩 박스로 변환 (NMS 포함)
+
+    Returns:
+        tuple: (바운딩 박스 (N, 4) [xmin, ymin, xmax, ymax], 신뢰도 (N,))
+    """
+    predictions = output[0].T                               # (앵커 수, 4 + 클래스 수)
+    scores = predictions[:, 4:].max(axis=1)
+
+    keep = scores >= min_confidence
+    predictions, scores = predictions[keep], scores[keep]
+    if len(scores) == 0:
+        return np.zeros((0, 4), dtype=np.float32), np.zeros((0,), dtype=np.float32)
+
+    # [cx, cy, w, h] -> [x, y, w, h]
+    boxes = predictions[:, :4].copy()
+    boxes[:, :2] -= boxes[:, 2:] / 2
+
+    indices = cv2.dnn.NMSBoxes(boxes.tolist(), scores.tolist(), min_confidence, iou_threshold)
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+
+    boxes, scores = boxes[indices], scores[indices]
+    boxes[:, 2:] += boxes[:, :2]
+    return boxes.astype(np.float32), scores.astype(np.float32)
+
+
+class OnnxByteTrackBackend(DetectionBackend):
+    """
+    ONNX Runtime CPU 추론과 NumPy ByteTrack을 이용한 추적
+
+    torch를 import 하지 않으므로 시작이 빠르고, CPU 전용 장비에서는 양자화(INT8) 모델로 처리량을 높일 수 있음
+    """
+
+    resizable_input = False
+
+    def __init__(self, model_path: str, iou_threshold: float = 0.7, num_threads: int = 0,
+                 tracker_options: Optional[dict[str, Any]] = None, min_confidence: Optional[float] = None) -> None:
+        """
+        Args:
+            model_path: YOLOv8 ONNX 모델 경로 (ultralytics export format=onnx)
+            iou_threshold: NMS IoU 임계값
+            num_threads: ONNX Runtime 연산 쓰레드 수 (0이면 CPU 코어 수)
+            tracker_options: ByteTracker 설정 (None이면 custom_bytetrack.yaml과 같은 기본값)
+            min_confidence: detect의 최소 신뢰도 (None이면 track_high_thresh, ultralytics 백엔드의 min_confidence와 같은 기준)
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        model_input = self.session.get_inputs()[0]
+        self.input_name: str = model_input.name
+
+        # 입력 크기가 고정되지 않은 모델(dynamic)은 640으로 추론
+        height, width = model_input.shape[2:4]
+        self.input_size: tuple[int, int] = (width if isinstance(width, int) else 640, height if isinstance(height, int) else 640)
+
+        self.iou_threshold: float = iou_threshold
+        self.preprocessor = FramePreprocessor(self.input_size)
+        self.tracker = ByteTracker(**(tracker_options or {}))
+        self.min_confidence: float = self.tracker.track_high_thresh if min_confidence is None else min_confidence
+
+    def infer(self, frame: np.ndarray, min_confidence: float) -> tuple[np.ndarray, np.ndarray]:
+        """min_confidence 이상의 탐지 결과 (카메라 좌표)"""
+
+        image = self.preprocessor(frame)
+
+        # BGR HWC uint8 -> RGB NCHW float32 (0 ~ 1)
+        blob = cv2.dnn.blobFromImage(image, scalefactor=1 / 255, swapRB=True)
+        output = self.session.run(None, {self.input_name: blob})[0]
+
+        boxes, scores = decode_yolo_output(output, min_confidence, self.iou_threshold)
+        return self.preprocessor.boxes_to_frame(boxes), scores
+
+    def detect(self, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # 모델 비교(model_manager)에서 다른 백엔드와 같은 기준이 되도록 2차 매칭용 낮은 신뢰도 탐지는 제외
+        return self.infer(frame, self.min_confidence)
+
+    def track(self, frame: np.ndarray) -> np.ndarray:
+        with profiler.measure("2. ONNX Inference"):
+            boxes, scores = self.infer(frame, self.tracker.track_low_thresh)
+
+        with profiler.measure("4. ByteTrack Update"):
+            return self.tracker.update(boxes, scores)
+
+
+class ZoneCropBackend(DetectionBackend):
+    """
+    프레임을 구역 영역(crop)만 잘라 모델 입력 크기로 축소한 뒤 다른 백엔드로 탐지/추적하고, 결과를 카메라 좌표로 되돌리는 백엔드
+
+    ultralytics가 호출마다 카메라 해상도 프레임을 복사, 축소하지 않도록 입력 크기의 이미지를 전달
+    """
+
+    def __init__(self, backend: DetectionBackend, crop: Optional[CropRect] = None) -> None:
+        self.backend: DetectionBackend = backend
+        self.input_size = backend.input_size
+        self.preprocessor = FramePreprocessor(backend.input_size, crop)
+
+    def detect(self, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        boxes, scores = self.backend.detect(self.preprocessor(frame))
+        return self.preprocessor.boxes_to_frame(boxes), scores
+
+    def track(self, frame: np.ndarray) -> np.ndarray:
+        track_array = self.backend.track(self.preprocessor(frame)).copy()
+        track_array[:, 1:5] = self.preprocessor.boxes_to_frame(track_array[:, 1:5])
+        return track_array
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+# main.py의 DETECTION_BACKEND 이름 -> 백엔드 클래스
+BACKENDS: dict[str, type[DetectionBackend]] = {
+    "bytetrack": UltralyticsByteTrackBackend,
+    "deepsort": DeepSortBackend,
+    "onnx": OnnxByteTrackBackend,
+}
+
+
+def create_backend(name: str, model_path: str, options: Optional[dict[str, Any]] = None, imgsz: Optional[int] = None) -> DetectionBackend:
+    """
+    설정 이름으로 백엔드 생성
+
+    Args:
+        name: BACKENDS의 키
+        model_path: 모델 경로 (bytetrack, deepsort: .pt / .engine, onnx: .onnx)
+        options: 백엔드 생성자에 전달할 추가 설정
+        imgsz: 모델 입력 크기 (options에 imgsz가 없을 때 사용, 입력 크기가 고정된 onnx는 무시)
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 탐지 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+
+    backend_class = BACKENDS[name]
+    options = dict(options or {})
+    if imgsz is not None and backend_class.resizable_input:
+        options.setdefault("imgsz", imgsz)
+
+    return backend_class(model_path, **options)
@@ -0,0 +1,149 @@
+# 카메라 프레임을 탐지 백엔드(detection_backend)로 추적하여 중심점은 yolo_data_queue, 프레임과 트랙은 frame_queue로 전달
+# 프레임은 frame_pool의 버퍼에 읽고, frame_queue에는 (FrameLease, 트랙)을 전달 (받는 쪽에서 사용 후 release)
+
+import argparse
+import time
+from typing import Any, Optional
+
+from detection_backend import DetectionBackend, ZoneCropBackend, create_backend
+from frame_pool import FramePool
+from frame_preprocess import CropRect
+from frame_source import FrameSource, open_source
+import model_manager
+from performance_profiler import profiler
+from track_array import array_to_tracks, track_centers
+
+
+def main(yolo_data_queue, frame_queue, event, model_path, video_source, frame_width, frame_height, stop_event,
+         backend: str = "bytetrack", backend_options: Optional[dict[str, Any]] = None,
+         imgsz: Optional[int] = None, crop: Optional[CropRect] = None, realtime: bool = True):
+    """
+    트래커 쓰레드(또는 프로세스)에서 실행되는 함수
+
+    Args:
+        backend: 탐지 백엔드 이름 (detection_backend.BACKENDS), "auto"이면 model_manager가 측정하여 가장 빠른 모델 선택
+        backend_options: 백엔드 생성자에 전달할 추가 설정 ("auto"이면 model_manager.select_backend 설정)
+        imgsz: 모델 입력 크기 (None이면 백엔드 기본값, onnx는 모델의 입력 크기)
+        crop: 탐지할 영역 (frame_preprocess.zone_bounds), 지정하면 이 영역만 잘라 모델 입력 크기로 축소하여 탐지
+        video_source: 카메라 번호, 동영상 파일, 이미지 폴더, RTSP 주소 (frame_source.open_source)
+        realtime: 파일, 폴더 입력을 원래 FPS로 재생 (False이면 최대 속도)
+    """
+    cap = open_source(video_source, frame_width, frame_height, realtime)
+
+    if backend == "auto":
+        options = dict(backend_options or {})
+        if imgsz is not None:
+            options.setdefault("imgsz", imgsz)
+        detector = model_manager.select_backend(model_path, model_manager.read_frames(cap), **options)
+    else:
+        detector = create_backend(backend, model_path, backend_options, imgsz)
+
+    if crop is not None:
+        detector = ZoneCropBackend(detector, crop)
+
+    pool = FramePool()
+
+    try:
+        # 사전에 주차 되어 있는 차량 데이터 전송
+        for _ in range(11):
+            one_frame(cap, detector, yolo_data_queue, frame_queue, pool)
+
+        # 사전 주차 되어 있는 차량의 번호판 입력 기다림
+        event.wait()
+
+        while not stop_event.is_set():
+            if one_frame(cap, detector, yolo_data_queue, frame_queue, pool):
+                continue
+
+            # 반복하지 않는 동영상 파일, 이미지 폴더가 끝나면 트래커 종료 (읽기에 실패한 프레임을 계속 다시 읽지 않음)
+            if cap.exhausted:
+                print("입력이 끝났습니다.")
+                break
+    finally:
+        print(f"카메라 입력 종료: {cap.stats()}")
+        cap.release()
+        detector.close()
+        profiler.print_stats()
+
+
+def one_frame(cap: FrameSource, detector: DetectionBackend, yolo_data_queue, frame_queue, pool: FramePool) -> bool:
+    """
+    한 프레임을 처리하는 함수 (프레임을 읽지 못하면 False)
+
+    단계별 시간은 performance_profiler로 측정 (백엔드 내부 단계는 각 백엔드의 track에서 측정)
+    """
+    with profiler.measure("1. Frame Read"):
+        lease = pool.read(cap)
+    if lease is None:
+        if not cap.exhausted:
+            print("Cam Error")
+        return False
+
+    try:
+        with profiler.measure("2-5. Track (total)"):
+            track_array = detector.track(lease.image)
+
+        with profiler.measure("6. Queue Put"):
+            # 객체 정보를 큐에 저장
+            yolo_data_queue.put(track_centers(track_array))
+
+            # 프레임을 메인 스레드로 전송 (GUI 표시용, frame_queue가 None이면 전송하지 않음)
+            if frame_queue is not None and not frame_queue.full():
+                frame_queue.put((lease.retain(), array_to_tracks(track_array)))
+    finally:
+        lease.release()
+
+    return True
+
+
+def measure_throughput(source: FrameSource, detector: DetectionBackend, frame_limit: int) -> tuple[int, float, float]:
+    """
+    입력에서 frame_limit장(입력이 끝나면 그때까지)을 추적하여 처리량 측정
+
+    Returns:
+        tuple: (처리한 프레임 수, 걸린 시간 (초), 프레임을 읽은 시각부터 추적이 끝날 때까지의 평균 지연 (초))
+    """
+    pool = FramePool()
+    processed = 0
+    latency = 0.0
+    start = time.perf_counter()
+
+    while processed < frame_limit:
+        lease = pool.read(source)
+        if lease is None:
+            break
+
+        try:
+            detector.track(lease.image)
+            latency += time.time() - source.timestamp
+        finally:
+            lease.release()
+        processed += 1
+
+    return processed, time.perf_counter() - start, latency / processed if processed else 0.0
+
+
+if __name__ == "__main__":
+    # 트래커 처리량 측정: python detection_tracking.py MODEL SOURCE [--backend onnx] [--fast]
+    parser = argparse.ArgumentParser(description="탐지/추적 처리량 측정")
+    parser.add_argument("model", help="탐지 모델")
+    parser.add_argument("source", help="카메라 번호, 동영상 파일, 이미지 폴더, RTSP 주소, live:동영상 파일")
+    parser.add_argument("--backend", default="bytetrack", help="탐지 백엔드 (detection_backend.BACKENDS)")
+    parser.add_argument("--imgsz", type=int, default=None, help="모델 입력 크기")
+    parser.add_argument("--frames", type=int, default=300, help="측정 프레임 수")
+    parser.add_argument("--fast", action="store_true", help="파일, 폴더를 원래 FPS가 아니라 최대 속도로 읽기")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=not args.fast)
+    detector = create_backend(args.backend, args.model, imgsz=args.imgsz)
+
+    try:
+        processed, elapsed, latency = measure_throughput(source, detector, args.frames)
+    finally:
+        source.release()
+        detector.close()
+
+    if processed:
+        print(f"{processed}장, {processed / elapsed:.1f} FPS, 평균 지연 {latency * 1000:.1f}ms ({source.stats()})")
+    else:
+        print(f"프레임을 읽을 수 없습니다: {args.source}")
@@ -0,0 +1,188 @@
+# 경로 안내 디스플레이에 표시할 방향을 계산하고 차량별 배정을 관리하는 모듈
+
+from __future__ import annotations
+from enum import Enum
+from typing import Iterable, Mapping, Optional, TYPE_CHECKING
+
+# shortest_route에서 방향 테이블을 생성하므로 타입 확인 시에만 import (순환 import 방지)
+if TYPE_CHECKING:
+    from shortest_route import Car, ParkingSpace, MovingSpace
+
+class Direction(Enum):
+    RIGHT = "right"
+    LEFT = "left"
+    UP = "up"
+    DOWN = "down"
+
+# 경로를 안내하는 디스플레이의 구역 번호 (아두이노의 메트릭스 순서에 맞게 조정)
+DISPLAY_SPACE = (12, 7, 2, 14, 9, 4)
+
+# (디스플레이 구역 ID, 다음 구역 종류("moving", "parking"), 다음 구역 ID) -> 방향
+# 디스플레이는 카메라가 보는 방향 기준으로 표시하므로 웹 좌표용 회전(send_to_server.CAMERA_ROTATION_ANGLE)은 적용하지 않음
+# initialize_space에서 build_direction_table로 생성
+direction_table: dict[tuple[int, str, int], Direction] = {}
+
+
+def cal_display_direction(display_center: tuple[float, float], next_center: tuple[float, float]) -> Direction:
+    """
+    중심점을 이용해서 다음 구역의 방향을 반환하는 함수
+
+    :return: 카메라가 보는 방향 기준 방향 반환
+    """
+
+    # display 구역과 다음 구역의 중심점 좌표 차이 계산
+    delta_x = abs(display_center[0] - next_center[0])
+    delta_y = abs(display_center[1] - next_center[1])
+
+    if delta_x > delta_y:
+        if display_center[0] > next_center[0]:
+            return Direction.LEFT
+        else:
+            return Direction.RIGHT
+
+    else:
+        if display_center[1] > next_center[1]:
+            return Direction.UP
+        else:
+            return Direction.DOWN
+
+
+def build_direction_table(
+    parking_spaces: Mapping[int, ParkingSpace],
+    moving_spaces: Mapping[int, MovingSpace],
+    display_space: tuple[int, ...] = DISPLAY_SPACE,
+    install: bool = True,
+) -> dict[tuple[int, str, int], Direction]:
+    """
+    모든 (디스플레이 구역, 다음 이동 구역 또는 주차 구역) 쌍의 방향을 미리 계산하는 함수
+
+    구역의 중심점은 변하지 않으므로 최초 실행 시 한 번만 계산하여 direction_table에 저장
+    구역 데이터를 다시 불러오는 경우 install=False로 미리 계산한 뒤 install_direction_table로 교체
+
+    Returns:
+        dict: (디스플레이 구역 ID, 다음 구역 종류, 다음 구역 ID) -> 방향
+    """
+    table = {}
+    next_spaces = [("moving", space) for space in moving_spaces.values()] + [("parking", space) for space in parking_spaces.values()]
+
+    for display_space_id in display_space:
+        if display_space_id not in moving_spaces:
+            continue
+
+        display_center = moving_spaces[display_space_id].center_position
+
+        for kind, next_space in next_spaces:
+            if kind == "moving" and next_space.space_id == display_space_id:
+                continue
+
+            table[(display_space_id, kind, next_space.space_id)] = cal_display_direction(display_center, next_space.center_position)
+
+    if install:
+        install_direction_table(table)
+
+    return table
+
+
+def install_direction_table(table: Mapping[tuple[int, str, int], Direction]) -> None:
+    """미리 계산한 방향 테이블로 교체"""
+
+    direction_table.clear()
+    direction_table.update(table)
+
+
+def lookup_direction(
+    display_space_id: int,
+    next_kind: str,
+    next_space_id: int,
+    parking_spaces: Mapping[int, ParkingSpace],
+    moving_spaces: Mapping[int, MovingSpace],
+) -> Direction:
+    """미리 계산된 방향 테이블에서 방향을 조회 (테이블에 없는 경우에만 중심점으로 직접 계산)"""
+
+    direction = direction_table.get((display_space_id, next_kind, next_space_id))
+    if direction is not None:
+        return direction
+
+    next_spaces = parking_spaces if next_kind == "parking" else moving_spaces
+    return cal_display_direction(moving_spaces[display_space_id].center_position, next_spaces[next_space_id].center_position)
+
+
+class DisplayAssignment:
+    """
+    차량별 디스플레이 배정을 유지하는 클래스
+
+    매 프레임 모든 차량을 다시 계산하지 않고, 경로가 변경된 차량(route_changed)만 다시 계산
+    """
+
+    def __init__(self, display_space: tuple[int, ...] = DISPLAY_SPACE) -> None:
+        # 디스플레이 구역 번호 -> 디스플레이 번호 (1번부터 시작)
+        self.display_number: dict[int, int] = {space_id: i + 1 for i, space_id in enumerate(display_space)}
+
+        # 디스플레이 번호 -> {차량 ID: (차량 번호, 방향)} (배정된 순서 유지)
+        self.displays: dict[int, dict[int, tuple[str, str]]] = {number: {} for number in self.display_number.values()}
+
+        # 차량 ID -> 배정된 디스플레이 번호
+        self.car_display: dict[int, int] = {}
+
+    def apply(
+        self,
+        changed_car_ids: Iterable[int],
+        cars: Mapping[int, Car],
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> None:
+        """
+        경로가 변경된 차량의 디스플레이 배정을 갱신하는 함수
+
+        Args:
+            changed_car_ids: 이전 갱신 이후 경로 또는 목표 주차 구역이 변경된 차량 ID
+            cars: 현재 추적 중인 차량
+        """
+        for car_id in changed_car_ids:
+            self.remove(car_id)
+
+            car = cars.get(car_id)
+            if car is None:
+                continue
+
+            assignment = self.cal_assignment(car, parking_spaces, moving_spaces)
+            if assignment is None:
+                continue
+
+            display_number, direction = assignment
+            self.displays[display_number][car_id] = (car.car_number, direction.value)
+            self.car_display[car_id] = display_number
+
+    def remove(self, car_id: int) -> None:
+        """차량의 디스플레이 배정을 삭제"""
+
+        display_number = self.car_display.pop(car_id, None)
+        if display_number is not None:
+            del self.displays[display_number][car_id]
+
+    def cal_assignment(
+        self,
+        car: Car,
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> Optional[tuple[int, Direction]]:
+        """차량의 경로로부터 (디스플레이 번호, 방향)을 계산, 디스플레이를 지나지 않는 경우 None 반환"""
+
+        route = car.route
+
+        if len(route) < 2 or route[1] not in self.display_number:
+            return None
+
+        if len(route) == 2 and car.target_parking_space_id is not None:
+            direction = lookup_direction(route[1], "parking", car.target_parking_space_id, parking_spaces, moving_spaces)
+        elif len(route) > 2:
+            direction = lookup_direction(route[1], "moving", route[2], parking_spaces, moving_spaces)
+        else:
+            return None
+
+        return self.display_number[route[1]], direction
+
+    def to_display_dict(self) -> dict[int, list[tuple[str, str]]]:
+        """send_to_server에서 사용하는 display_dict 형태로 변환"""
+
+        return {number: list(entries.values()) for number, entries in self.displays.items()}
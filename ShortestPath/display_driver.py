@@ -0,0 +1,229 @@
+# 경로 안내 매트릭스 디스플레이(아두이노)로 변경된 방향 정보만 압축 프레임으로 전송
+# pyserial은 포트를 연결할 때 import 하므로, 설치되지 않은 환경에서도 send_to_server를 import 할 수 있음 (디스플레이 전송만 비활성화)
+
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Mapping, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import serial
+
+# 방향 문자열 -> 1바이트 방향 코드 (MatrixDisplayController의 applyDisplay와 동일)
+DIRECTION_CODE = {
+    "up": "U",
+    "down": "D",
+    "left": "L",
+    "right": "R",
+}
+
+# 안내할 차량이 없는 디스플레이의 코드
+OFF_CODE = "-"
+
+# 프레임 순번의 최대값 (아두이노의 응답 "A<seq>"와 매칭)
+SEQ_MODULO = 100
+
+
+def encode_display(entries: Sequence[tuple[str, str]]) -> str:
+    """
+    디스플레이 하나에 표시할 내용을 방향 코드로 변환하는 함수
+
+    디스플레이는 화살표 하나만 표시할 수 있으므로 가장 먼저 배정된 차량의 방향을 사용
+
+    Args:
+        entries: display_dict의 값 [(차량 번호, 방향), ...]
+
+    Returns:
+        str: 방향 코드 (U, D, L, R) 또는 OFF_CODE
+    """
+    if not entries:
+        return OFF_CODE
+
+    return DIRECTION_CODE.get(entries[0][1], OFF_CODE)
+
+
+def build_frame(seq: int, changes: Mapping[int, str]) -> bytes:
+    """
+    변경된 디스플레이들을 하나의 압축 프레임으로 만드는 함수
+
+    형식: "<seq>:<디스플레이 번호><방향 코드>...\\n" (예: b"17:1R3-\\n")
+    """
+    body = "".join(f"{display}{code}" for display, code in sorted(changes.items()))
+    return f"{seq}:{body}\n".encode()
+
+
+class DisplayDriver:
+    """
+    display_dict를 받아 시리얼 포트별로 변경된 디스플레이만 전송하는 클래스
+
+    - 디스플레이 내용이 바뀐 경우에만 전송
+    - 한 번의 update에서 시리얼 포트당 한 번만 write
+    - 아두이노의 응답(A<seq>)으로 지연 시간을 측정하고, 응답이 없으면 해당 디스플레이를 재전송
+    """
+
+    def __init__(
+        self,
+        port_displays: Mapping[str, Sequence[int]],
+        baudrate: int = 9600,
+        ack_timeout: float = 1.0,
+        latency_samples: int = 100,
+    ) -> None:
+        """
+        Args:
+            port_displays: 시리얼 포트 -> 해당 아두이노가 담당하는 디스플레이 번호
+                (예: {"/dev/ttyUSB0": (1, 2, 3), "/dev/ttyUSB1": (4, 5, 6)})
+            baudrate: 시리얼 통신 속도 (아두이노 설정과 동일하게 9600)
+            ack_timeout: 응답을 기다리는 최대 시간 (초), 초과 시 재전송
+            latency_samples: 평균 지연 시간 계산에 사용할 최근 샘플 수
+        """
+        self.port_displays: dict[str, tuple[int, ...]] = {port: tuple(displays) for port, displays in port_displays.items()}
+        self.baudrate: int = baudrate
+        self.ack_timeout: float = ack_timeout
+
+        self.serials: dict[str, serial.Serial] = {}
+        self.read_buffers: dict[str, bytes] = {}
+        self.seq: dict[str, int] = {port: 0 for port in self.port_displays}
+
+        # 아두이노로 전송한 디스플레이별 방향 코드 (응답이 없으면 삭제되어 재전송 대상이 됨)
+        self.sent_codes: dict[int, str] = {}
+
+        # 응답을 기다리는 프레임: 포트 -> {seq: (전송 시간, {디스플레이 번호: 코드})}
+        self.pending: dict[str, dict[int, tuple[float, dict[int, str]]]] = {port: {} for port in self.port_displays}
+
+        self.latencies: deque[float] = deque(maxlen=latency_samples)
+        self.frame_count: int = 0
+        self.byte_count: int = 0
+        self.ack_count: int = 0
+        self.timeout_count: int = 0
+
+    def open(self) -> None:
+        """설정된 시리얼 포트를 모두 연결 (연결에 실패한 포트는 전송 대상에서 제외)"""
+
+        try:
+            import serial
+        except ImportError:
+            print("⚠️ pyserial이 설치되지 않아 디스플레이로 전송하지 않습니다. (pip install pyserial)")
+            return
+
+        for port in self.port_displays:
+            try:
+                self.serials[port] = serial.Serial(port, self.baudrate, timeout=0, write_timeout=0)
+                self.read_buffers[port] = b""
+                print(f"✅ 디스플레이 시리얼 연결: {port}")
+            except OSError as e:    # serial.SerialException 포함
+                print(f"⚠️ 디스플레이 시리얼 연결 실패 ({port}): {e}")
+
+    def close(self) -> None:
+        """연결된 시리얼 포트를 모두 닫음"""
+
+        for ser in self.serials.values():
+            ser.close()
+        self.serials.clear()
+
+    def build_frames(self, display_dict: Mapping[int, Sequence[tuple[str, str]]]) -> dict[str, tuple[int, dict[int, str]]]:
+        """
+        포트별로 변경된 디스플레이만 모아 전송할 프레임 정보를 만드는 함수
+
+        Returns:
+            dict: 포트 -> (seq, {디스플레이 번호: 방향 코드})
+        """
+        frames = {}
+
+        for port, displays in self.port_displays.items():
+            changes = {}
+
+            for display in displays:
+                code = encode_display(display_dict.get(display, ()))
+                if self.sent_codes.get(display) != code:
+                    changes[display] = code
+
+            if changes:
+                seq = self.seq[port]
+                self.seq[port] = (seq + 1) % SEQ_MODULO
+                frames[port] = (seq, changes)
+
+        return frames
+
+    def update(self, display_dict: Mapping[int, Sequence[tuple[str, str]]]) -> None:
+        """display_dict를 받아 변경된 디스플레이만 포트당 한 번에 전송"""
+
+        now = time.perf_counter()
+        self.poll_acks(now)
+
+        for port, (seq, changes) in self.build_frames(display_dict).items():
+            ser = self.serials.get(port)
+            if ser is None:
+                continue
+
+            frame = build_frame(seq, changes)
+            try:
+                ser.write(frame)
+            except OSError as e:    # serial.SerialException 포함
+                print(f"❌ 디스플레이 전송 오류 ({port}): {e}")
+                continue
+
+            self.sent_codes.update(changes)
+            self.pending[port][seq] = (now, changes)
+            self.frame_count += 1
+            self.byte_count += len(frame)
+
+    def poll_acks(self, now: Optional[float] = None) -> None:
+        """아두이노의 응답을 논블로킹으로 읽어 지연 시간을 기록하고, 응답 시간이 초과된 프레임은 재전송 대상으로 되돌림"""
+
+        if now is None:
+            now = time.perf_counter()
+
+        for port, ser in self.serials.items():
+            try:
+                waiting = ser.in_waiting
+                data = ser.read(waiting) if waiting else b""
+            except OSError:         # serial.SerialException 포함
+                data = b""
+
+            *lines, self.read_buffers[port] = (self.read_buffers[port] + data).split(b"\n")
+            for line in lines:
+                self.handle_line(port, line.strip(), now)
+
+        for port, frames in self.pending.items():
+            for seq, (sent_time, changes) in list(frames.items()):
+                if now - sent_time < self.ack_timeout:
+                    continue
+
+                # 응답이 없는 경우 같은 내용을 유지하고 있는 디스플레이를 다음 update에서 재전송
+                del frames[seq]
+                self.timeout_count += 1
+                for display, code in changes.items():
+                    if self.sent_codes.get(display) == code:
+                        del self.sent_codes[display]
+
+    def handle_line(self, port: str, line: bytes, now: float) -> None:
+        """아두이노로부터 받은 한 줄을 처리 ("A<seq>" 형식만 응답으로 처리)"""
+
+        if not line.startswith(b"A"):
+            return
+
+        try:
+            seq = int(line[1:])
+        except ValueError:
+            return
+
+        sent = self.pending[port].pop(seq, None)
+        if sent is None:
+            return
+
+        self.ack_count += 1
+        self.latencies.append((now - sent[0]) * 1000)  # ms 단위
+
+    def stats(self) -> dict[str, float]:
+        """전송 통계 반환"""
+
+        avg_latency = sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+        return {
+            "frames": self.frame_count,
+            "bytes": self.byte_count,
+            "acks": self.ack_count,
+            "timeouts": self.timeout_count,
+            "pending": sum(len(frames) for frames in self.pending.values()),
+            "avg_latency_ms": avg_latency,
+        }
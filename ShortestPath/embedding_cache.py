@@ -0,0 +1,152 @@
+# DeepSORT 외형 임베딩을 프레임마다 한 번의 배치로 계산하고, 이전 프레임의 임베딩을 재사용하는 캐시
+#
+# 주차장 박스의 대부분은 움직이지 않는 주차 차량이므로 매 프레임 임베딩을 다시 계산할 필요가 없음
+# 이전 프레임 탐지와의 IoU로 재사용 여부를 판단 (DeepSORT 내부 상태와 무관하게 탐지 박스만 사용)
+# - 정지 차량: IoU가 STATIONARY_IOU 이상이면 STATIONARY_REFRESH 프레임 동안 재사용
+# - 이동 차량: IoU가 MATCH_IOU 이상이고 주변에 겹치는 다른 박스가 없어 IoU 매칭만으로 충분하면 MOVING_REFRESH 프레임 동안 재사용
+# - 그 외 (새 차량, 다른 차량과 겹침): 한 프레임의 모든 박스를 모아 임베딩 모델을 한 번만 호출
+
+from typing import Callable, Optional
+
+import numpy as np
+
+from numpy_bytetrack import iou_matrix
+
+# 이 IoU 이상이면 정지한 차량으로 판단
+STATIONARY_IOU = 0.9
+STATIONARY_REFRESH = 90     # 정지 차량의 임베딩을 다시 계산하는 프레임 간격 (30 FPS에서 3초)
+
+# 이 IoU 이상이고 다른 박스와 AMBIGUOUS_IOU 이상 겹치지 않으면 같은 차량으로 판단
+MATCH_IOU = 0.5
+AMBIGUOUS_IOU = 0.1
+MOVING_REFRESH = 5          # 이동 차량의 임베딩을 다시 계산하는 프레임 간격
+
+# (프레임, 바운딩 박스 (N, 4) [xmin, ymin, xmax, ymax]) -> 임베딩 (N, 차원)
+Embedder = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def crop_boxes(frame: np.ndarray, boxes: np.ndarray) -> list[np.ndarray]:
+    """바운딩 박스 영역을 잘라낸 이미지 목록 (프레임 밖은 잘라내고 최소 1픽셀)"""
+
+    height, width = frame.shape[:2]
+    crops = []
+
+    for xmin, ymin, xmax, ymax in boxes:
+        left = min(max(int(xmin), 0), width - 1)
+        top = min(max(int(ymin), 0), height - 1)
+        right = max(min(int(xmax), width), left + 1)
+        bottom = max(min(int(ymax), height), top + 1)
+        crops.append(frame[top:bottom, left:right])
+
+    return crops
+
+
+class EmbeddingCache:
+    """이전 프레임 탐지의 임베딩을 재사용하고 나머지만 한 번에 계산"""
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        stationary_iou: float = STATIONARY_IOU,
+        stationary_refresh: int = STATIONARY_REFRESH,
+        match_iou: float = MATCH_IOU,
+        ambiguous_iou: float = AMBIGUOUS_IOU,
+        moving_refresh: int = MOVING_REFRESH,
+    ) -> None:
+        """
+        Args:
+            embedder: 한 프레임의 여러 박스 임베딩을 한 번에 계산하는 함수
+            stationary_iou, stationary_refresh: 정지 차량 판단 IoU와 재계산 간격 (프레임)
+            match_iou, ambiguous_iou, moving_refresh: 이동 차량 매칭 IoU, 다른 박스와 겹친다고 판단할 IoU, 재계산 간격 (프레임)
+        """
+        self.embedder: Embedder = embedder
+        self.stationary_iou: float = stationary_iou
+        self.stationary_refresh: int = stationary_refresh
+        self.match_iou: float = match_iou
+        self.ambiguous_iou: float = ambiguous_iou
+        self.moving_refresh: int = moving_refresh
+
+        # 이전 프레임의 탐지 박스, 임베딩, 임베딩을 계산한 뒤 지난 프레임 수
+        self.boxes: np.ndarray = np.zeros((0, 4), dtype=np.float32)
+        self.embeddings: list[np.ndarray] = []
+        self.ages: np.ndarray = np.zeros(0, dtype=np.int64)
+
+        self.computed: int = 0      # 임베딩을 계산한 박스 수
+        self.reused: int = 0        # 이전 임베딩을 재사용한 박스 수
+        self.batches: int = 0       # 임베딩 모델 호출 수
+
+    def reuse_sources(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        각 탐지가 임베딩을 재사용할 이전 프레임 탐지 번호
+
+        Returns:
+            np.ndarray: (N,) 이전 프레임 탐지 번호 (-1이면 새로 계산)
+        """
+        sources = np.full(len(boxes), -1, dtype=np.int64)
+        if len(boxes) == 0 or len(self.boxes) == 0:
+            return sources
+
+        ious = iou_matrix(boxes, self.boxes)
+        used = set()
+
+        for i, j in enumerate(ious.argmax(axis=1)):
+            iou = ious[i, j]
+            if j in used:
+                continue
+
+            if iou >= self.stationary_iou:
+                refresh = self.stationary_refresh
+            elif iou >= self.match_iou and self.unambiguous(ious, i, j):
+                refresh = self.moving_refresh
+            else:
+                continue
+
+            if self.ages[j] < refresh:
+                sources[i] = j
+                used.add(j)
+
+        return sources
+
+    def unambiguous(self, ious: np.ndarray, row: int, col: int) -> bool:
+        """탐지 row와 이전 탐지 col이 서로 외의 다른 박스와 겹치지 않는지"""
+
+        others_in_row = np.delete(ious[row], col)
+        others_in_col = np.delete(ious[:, col], row)
+        return bool(np.all(others_in_row < self.ambiguous_iou) and np.all(others_in_col < self.ambiguous_iou))
+
+    def __call__(self, frame: np.ndarray, boxes: np.ndarray) -> list[np.ndarray]:
+        """
+        한 프레임 탐지의 임베딩 (DeepSort.update_tracks의 embeds)
+
+        Args:
+            frame: BGR 프레임
+            boxes: 탐지 박스 (N, 4) [xmin, ymin, xmax, ymax]
+        """
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        sources = self.reuse_sources(boxes)
+        missing = np.flatnonzero(sources < 0)
+
+        embeddings: list[Optional[np.ndarray]] = [None] * len(boxes)
+        ages = np.zeros(len(boxes), dtype=np.int64)
+
+        for i in np.flatnonzero(sources >= 0):
+            embeddings[i] = self.embeddings[sources[i]]
+            ages[i] = self.ages[sources[i]] + 1
+
+        if len(missing):
+            for i, embedding in zip(missing, self.embedder(frame, boxes[missing])):
+                embeddings[i] = np.asarray(embedding)
+            self.batches += 1
+
+        self.computed += len(missing)
+        self.reused += len(boxes) - len(missing)
+
+        self.boxes = boxes
+        self.embeddings = embeddings
+        self.ages = ages
+        return embeddings
+
+    def stats(self) -> str:
+        total = self.computed + self.reused
+        ratio = self.reused / total * 100 if total else 0.0
+        return f"임베딩 계산 {self.computed}개 ({self.batches}회), 재사용 {self.reused}개 ({ratio:.1f}%)"
@@ -1,26 +1,41 @@
 # Flask 서버 - 차량 번호 수신용
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from queue import Queue, Empty
-from typing import Optional
+from typing import Callable, Optional
+from preview_stream import PreviewStream
+from layout_manager import LayoutManager
 
 app = Flask(__name__)
 
 # 전역 큐 (main.py에서 주입)
 car_number_queue: Optional[Queue] = None
 response_queue: Optional[Queue] = None
+preview_stream: Optional[PreviewStream] = None
 
+# 차량 번호로 주차 구역을 예약하는 함수 (main.py에서 주입, None이면 shortest_route의 응답을 기다리는 방식)
+reserve_bay: Optional[Callable[[str], Optional[tuple[int, str]]]] = None
 
-def init_flask_server(input_queue: Queue, output_queue: Queue):
+# 구역 데이터 교체 관리 (main.py에서 주입, None이면 /layout 비활성화)
+layout_manager: Optional[LayoutManager] = None
+
+
+def init_flask_server(input_queue: Queue, output_queue: Queue, preview: Optional[PreviewStream] = None, reserve: Optional[Callable[[str], Optional[tuple[int, str]]]] = None, layout: Optional[LayoutManager] = None):
     """
     Flask 서버 초기화 - main.py에서 큐를 주입받음
 
     Args:
         input_queue: 차량 번호를 shortest_route로 전달하는 큐
         output_queue: shortest_route로부터 결과를 받는 큐
+        preview: 미리보기 스트림 (None이면 /preview 비활성화)
+        reserve: 차량 번호 -> (주차 구역 ID, 주차 구역 이름) 예약 함수, 만차이면 None 반환 (None이면 예약 비활성화)
+        layout: 구역 데이터 교체 관리 (None이면 /layout 비활성화)
     """
-    global car_number_queue, response_queue
+    global car_number_queue, response_queue, preview_stream, reserve_bay, layout_manager
     car_number_queue = input_queue
     response_queue = output_queue
+    preview_stream = preview
+    reserve_bay = reserve
+    layout_manager = layout
 
 
 @app.route('/entry', methods=['POST'])
@@ -41,6 +56,16 @@ def entry():
             "car_number": "1234",
             "parking_available": True
         }
+
+        예약 방식인 경우 예약된 주차 구역을 함께 반환 (shortest_route의 응답을 기다리지 않음)
+        {
+            "status": "success",
+            "message": "주차 구역이 예약되었습니다.",
+            "car_number": "1234",
+            "parking_available": True,
+            "parking_space_id": 3,
+            "parking_space_name": "A3"
+        }
     """
     try:
         # Query Parameter에서 차량 번호 가져오기
@@ -73,6 +98,31 @@ def entry():
                 "parking_available": False
             }), 500
 
+        # 예약 방식: 주차 구역을 바로 예약하고 응답
+        if reserve_bay is not None:
+            reservation = reserve_bay(car_number)
+
+            if reservation is None:
+                return jsonify({
+                    "status": "success",
+                    "message": "주차 공간이 부족합니다.",
+                    "car_number": car_number,
+                    "parking_available": False
+                }), 200
+
+            # 예약 방식은 큐에 번호를 넣지 않음 (roop의 entry가 유효한 예약 목록에서 도착 순서대로 사용)
+            parking_space_id, parking_space_name = reservation
+            print(f"Flask 서버: 차량 번호 수신 및 주차 구역 예약 완료 - {car_number} -> {parking_space_name}")
+
+            return jsonify({
+                "status": "success",
+                "message": "주차 구역이 예약되었습니다.",
+                "car_number": car_number,
+                "parking_available": True,
+                "parking_space_id": parking_space_id,
+                "parking_space_name": parking_space_name
+            }), 200
+
         # 큐에 차량 번호 저장
         car_number_queue.put(car_number)
         print(f"Flask 서버: 차량 번호 수신 및 Queue 저장 완료 - {car_number}")
@@ -124,7 +174,88 @@ def health_check():
     }), 200
 
 
-def run_flask_server(car_number_data_queue: Queue, response_data_queue: Queue, port: int = 5005):
+@app.route('/preview', methods=['GET'])
+def preview():
+    """
+    구역과 차량을 표시한 미리보기 영상 (MJPEG)
+
+    Example:
+        GET /preview  (브라우저에서 <img src="/preview">로 표시)
+    """
+    if preview_stream is None:
+        return jsonify({
+            "status": "error",
+            "message": "미리보기 스트림이 비활성화되어 있습니다."
+        }), 404
+
+    return Response(preview_stream.frames(), mimetype='multipart/x-mixed-replace; boundary=frame')
+
+
+@app.route('/layout', methods=['POST'])
+def layout():
+    """
+    구역 데이터를 교체하는 API (프로그램을 재시작하지 않고 구역 보정)
+
+    검증에 성공하면 구역 파일에 저장하고, 경로 계산 쓰레드가 다음 프레임 처리 전에 교체
+
+    Body (JSON):
+        {
+            "parking_space": { parking_space.json과 같은 형식 },
+            "moving_space": { moving_space.json과 같은 형식 }
+        }
+
+    Response:
+        {
+            "status": "success",
+            "message": "구역 데이터가 교체 대기 중입니다.",
+            "version": 2
+        }
+
+        검증에 실패한 경우 (400)
+        {
+            "status": "error",
+            "message": "구역 데이터가 올바르지 않습니다.",
+            "errors": ["주차 구역 3: 인접 이동 구역 20이(가) 없습니다."]
+        }
+    """
+    if layout_manager is None:
+        return jsonify({
+            "status": "error",
+            "message": "구역 데이터 교체가 비활성화되어 있습니다."
+        }), 404
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or "parking_space" not in data or "moving_space" not in data:
+        return jsonify({
+            "status": "error",
+            "message": "parking_space와 moving_space가 필요합니다."
+        }), 400
+
+    try:
+        staged = layout_manager.submit(data["parking_space"], data["moving_space"])
+
+    except ValueError as e:
+        return jsonify({
+            "status": "error",
+            "message": "구역 데이터가 올바르지 않습니다.",
+            "errors": str(e).splitlines()
+        }), 400
+
+    except OSError as e:
+        print(f"Flask 서버 에러: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"구역 파일 저장 실패: {str(e)}"
+        }), 500
+
+    return jsonify({
+        "status": "success",
+        "message": "구역 데이터가 교체 대기 중입니다.",
+        "version": staged.version
+    }), 200
+
+
+def run_flask_server(car_number_data_queue: Queue, response_data_queue: Queue, port: int = 5005, preview: Optional[PreviewStream] = None, reserve: Optional[Callable[[str], Optional[tuple[int, str]]]] = None, layout: Optional[LayoutManager] = None):
     """
     Flask 서버 실행 함수 (스레드에서 호출)
 
@@ -132,8 +263,11 @@ def run_flask_server(car_number_data_queue: Queue, response_data_queue: Queue, p
         car_number_data_queue: 차량 번호를 shortest_route로 전달하는 Queue
         response_data_queue: shortest_route로부터 응답을 받는 Queue
         port: 서버 포트 번호 (기본값: 5005)
+        preview: 미리보기 스트림 (None이면 /preview 비활성화)
+        reserve: 주차 구역 예약 함수 (None이면 예약 비활성화)
+        layout: 구역 데이터 교체 관리 (None이면 /layout 비활성화)
     """
-    init_flask_server(car_number_data_queue, response_data_queue)
+    init_flask_server(car_number_data_queue, response_data_queue, preview, reserve, layout)
     print(f"Flask 서버 시작: http://0.0.0.0:{port}")
     app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
 
@@ -0,0 +1,106 @@
+# 카메라 프레임을 미리 할당한 버퍼에 읽어 재사용하는 프레임 풀
+#
+# cap.read()는 프레임마다 새 배열(1080p BGR 약 6MB)을 만들기 때문에 30 FPS에서 메모리 할당과 GC 부담이 커짐
+# 풀은 고정된 수의 버퍼를 두고 cap.read(image=버퍼)로 읽으며, 추론과 GUI(frame_queue)가 각각 FrameLease로 참조를 잡고 있는 동안은
+# 다른 프레임을 쓰지 않음. 모든 버퍼가 참조 중이면 가장 오래된 버퍼를 덮어쓰고 그 버퍼의 이전 lease는 image가 None이 됨
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+# 캡처 1 + frame_queue(maxsize=2) + GUI가 처리 중인 프레임 1 + 여유 1 (정상적으로 release하면 덮어쓰지 않는 수)
+FRAME_POOL_SLOTS = 5
+
+
+class FrameSlot:
+    """풀의 버퍼 하나"""
+
+    def __init__(self) -> None:
+        self.image: Optional[np.ndarray] = None
+        self.generation: int = -1   # 버퍼에 새 프레임을 쓸 때마다 바뀌는 번호 (이전 lease 무효화)
+        self.refs: int = 0          # 이 프레임을 참조 중인 lease 수
+
+
+class FrameLease:
+    """풀 버퍼의 프레임 하나에 대한 참조 (사용이 끝나면 release)"""
+
+    def __init__(self, pool: "FramePool", slot: FrameSlot, generation: int) -> None:
+        self.pool: FramePool = pool
+        self.slot: FrameSlot = slot
+        self.generation: int = generation
+        self.released: bool = False
+
+    @property
+    def image(self) -> Optional[np.ndarray]:
+        """프레임 (풀이 가득 차 다른 프레임으로 덮어쓴 경우 None)"""
+
+        if self.slot.generation != self.generation:
+            return None
+        return self.slot.image
+
+    def retain(self) -> "FrameLease":
+        """같은 프레임에 대한 참조를 하나 더 만들어 반환 (다른 소비자에게 전달할 때 사용)"""
+
+        with self.pool.lock:
+            if self.slot.generation == self.generation:
+                self.slot.refs += 1
+        return FrameLease(self.pool, self.slot, self.generation)
+
+    def release(self) -> None:
+        """참조 해제 (여러 번 호출해도 한 번만 해제)"""
+
+        with self.pool.lock:
+            if self.released:
+                return
+            self.released = True
+
+            if self.slot.generation == self.generation:
+                self.slot.refs -= 1
+
+
+class FramePool:
+    """미리 할당한 프레임 버퍼의 순환 풀 (여러 쓰레드에서 사용)"""
+
+    def __init__(self, slots: int = FRAME_POOL_SLOTS) -> None:
+        self.lock = threading.Lock()
+        self.slots: list[FrameSlot] = [FrameSlot() for _ in range(slots)]
+        self.next_generation: int = 0
+        self.overwrites: int = 0    # 참조 중인 버퍼를 덮어쓴 횟수 (release 누락 확인용)
+
+    def acquire(self, shape: Optional[tuple[int, ...]] = None) -> FrameLease:
+        """
+        새 프레임을 쓸 버퍼를 가져옴 (참조가 없는 버퍼 중 가장 오래된 것, 없으면 가장 오래된 버퍼를 덮어씀)
+
+        Args:
+            shape: 버퍼 크기 (지정하면 크기가 다른 버퍼는 다시 할당, None이면 cap.read가 처음 할당한 크기 사용)
+        """
+        with self.lock:
+            free = [slot for slot in self.slots if slot.refs == 0]
+            if not free:
+                free = self.slots
+                self.overwrites += 1
+
+            slot = min(free, key=lambda candidate: candidate.generation)
+            slot.generation = self.next_generation
+            slot.refs = 1
+            self.next_generation += 1
+
+        if shape is not None and (slot.image is None or slot.image.shape != tuple(shape)):
+            slot.image = np.empty(shape, dtype=np.uint8)
+
+        return FrameLease(self, slot, slot.generation)
+
+    def read(self, cap) -> Optional[FrameLease]:
+        """카메라 프레임을 풀 버퍼에 읽기 (실패하면 None)"""
+
+        lease = self.acquire()
+        ret, image = cap.read(image=lease.slot.image) if lease.slot.image is not None else cap.read()
+
+        if not ret or image is None:
+            lease.release()
+            return None
+
+        # 첫 프레임이나 해상도가 바뀐 경우 cap.read가 새로 할당한 배열을 버퍼로 사용
+        lease.slot.image = image
+        return lease
@@ -0,0 +1,134 @@
+# 탐지 전처리: 카메라 프레임에서 구역(주차, 이동)이 있는 영역만 잘라 모델 입력 크기로 한 번만 축소하고,
+# 탐지한 바운딩 박스를 카메라 좌표로 되돌리는 모듈
+#
+# 축소한 이미지는 미리 할당한 버퍼(여백은 회색 114, YOLOv8 letterbox와 동일)에 직접 써서 프레임마다 새 배열을 만들지 않음
+
+import json
+import math
+from typing import Mapping, Optional
+
+import numpy as np
+import cv2
+
+import layout_manager
+
+# 자르는 영역을 구역 바깥으로 넓히는 픽셀 수 (구역 경계에 걸친 차량의 바운딩 박스가 잘리지 않도록)
+CROP_MARGIN = 80
+
+# 잘라낼 영역 (xmin, ymin, xmax, ymax), 카메라 픽셀 좌표
+CropRect = tuple[int, int, int, int]
+
+
+def zone_bounds(
+    parking_spaces: Mapping[int, dict],
+    moving_spaces: Mapping[int, dict],
+    frame_size: tuple[int, int],
+    margin: int = CROP_MARGIN,
+) -> CropRect:
+    """
+    모든 구역의 꼭짓점을 포함하는 영역을 margin만큼 넓혀 프레임 안으로 제한
+
+    Args:
+        parking_spaces, moving_spaces: 구역 ID -> 구역 데이터 ("position" 꼭짓점 목록)
+        frame_size: 카메라 프레임 크기 (너비, 높이)
+    """
+    points = np.array(
+        [point for spaces in (parking_spaces, moving_spaces) for space in spaces.values() for point in space["position"]],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+
+    if len(points) == 0:
+        return (0, 0, frame_size[0], frame_size[1])
+
+    xmin, ymin = points.min(axis=0)
+    xmax, ymax = points.max(axis=0)
+
+    return (
+        max(0, math.floor(xmin) - margin),
+        max(0, math.floor(ymin) - margin),
+        min(frame_size[0], math.ceil(xmax) + margin),
+        min(frame_size[1], math.ceil(ymax) + margin),
+    )
+
+
+def load_zone_bounds(parking_space_path: str, moving_space_path: str, frame_size: tuple[int, int], margin: int = CROP_MARGIN) -> CropRect:
+    """구역 json 파일로 zone_bounds 계산 (실행 중에 구역을 수정하는 경우를 위해 margin을 여유 있게 설정)"""
+
+    with open(parking_space_path, "r") as f:
+        parking = layout_manager.parse_space_keys(json.load(f), "주차 구역")
+
+    with open(moving_space_path, "r") as f:
+        moving = layout_manager.parse_space_keys(json.load(f), "이동 구역")
+
+    return zone_bounds(parking, moving, frame_size, margin)
+
+
+class FramePreprocessor:
+    """
+    프레임(또는 crop 영역)을 비율을 유지하여 size(너비, 높이)에 맞추는 letterbox 전처리
+
+    반환하는 이미지는 내부 버퍼이므로 다음 호출에서 덮어씀 (탐지가 끝난 뒤 보관하지 않아야 함)
+    """
+
+    def __init__(self, size: tuple[int, int], crop: Optional[CropRect] = None) -> None:
+        """
+        Args:
+            size: 모델 입력 크기 (너비, 높이)
+            crop: 잘라낼 영역 (None이면 프레임 전체)
+        """
+        self.size: tuple[int, int] = (int(size[0]), int(size[1]))
+        self.crop: Optional[CropRect] = crop
+        self.offset: tuple[int, int] = (crop[0], crop[1]) if crop is not None else (0, 0)
+
+        # 입력 영역 크기가 바뀔 때 (첫 프레임, 카메라 해상도 변경) 다시 계산
+        self.source_shape: Optional[tuple[int, int]] = None
+        self.scale: float = 1.0
+        self.pad: tuple[float, float] = (0.0, 0.0)
+        self.buffer: Optional[np.ndarray] = None
+        self.resized: Optional[np.ndarray] = None    # buffer에서 축소한 이미지가 들어가는 부분 (뷰)
+
+    def layout(self, height: int, width: int) -> None:
+        """입력 영역 크기에 맞는 배율, 여백과 버퍼 준비"""
+
+        self.source_shape = (height, width)
+        self.scale = min(self.size[0] / width, self.size[1] / height)
+        resized_width, resized_height = int(round(width * self.scale)), int(round(height * self.scale))
+
+        pad_x = (self.size[0] - resized_width) / 2
+        pad_y = (self.size[1] - resized_height) / 2
+        left, top = int(round(pad_x - 0.1)), int(round(pad_y - 0.1))
+        self.pad = (float(left), float(top))
+
+        self.buffer = np.full((self.size[1], self.size[0], 3), 114, dtype=np.uint8)
+        self.resized = self.buffer[top:top + resized_height, left:left + resized_width]
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            frame: BGR 프레임 (카메라 해상도)
+
+        Returns:
+            np.ndarray: size 크기의 이미지 (입력 영역이 이미 size이면 복사하지 않고 그대로 반환)
+        """
+        if self.crop is not None:
+            frame = frame[self.crop[1]:self.crop[3], self.crop[0]:self.crop[2]]
+
+        height, width = frame.shape[:2]
+        if (width, height) == self.size:
+            self.source_shape, self.scale, self.pad = (height, width), 1.0, (0.0, 0.0)
+            return frame
+
+        if self.source_shape != (height, width) or self.buffer is None:
+            self.layout(height, width)
+
+        interpolation = cv2.INTER_AREA if self.scale < 1 else cv2.INTER_LINEAR
+        cv2.resize(frame, (self.resized.shape[1], self.resized.shape[0]), dst=self.resized, interpolation=interpolation)
+        return self.buffer
+
+    def boxes_to_frame(self, boxes: np.ndarray) -> np.ndarray:
+        """입력 이미지 좌표의 바운딩 박스 (N, 4) [xmin, ymin, xmax, ymax]를 카메라 좌표로 변환 (새 배열)"""
+
+        result = np.array(boxes, dtype=np.float32).reshape(-1, 4)
+        result[:, [0, 2]] = (result[:, [0, 2]] - self.pad[0]) / self.scale + self.offset[0]
+        result[:, [1, 3]] = (result[:, [1, 3]] - self.pad[1]) / self.scale + self.offset[1]
+        return result
@@ -0,0 +1,298 @@
+# 카메라(V4L2 등), 동영상 파일, 이미지 폴더, RTSP를 같은 방식으로 읽는 프레임 입력
+#
+# 모든 입력은 cv2.VideoCapture와 같은 read(image=None) -> (ret, frame)을 제공하므로 frame_pool.FramePool.read에 그대로 사용
+# - timestamp: 마지막 프레임을 읽은 시각 (time.time)
+# - frame_count, dropped: 읽은 프레임 수와 누락한 프레임 수 (카메라는 프레임 간격으로 추정, 파일은 실시간 재생에서 건너뛴 수)
+# - realtime: 파일과 이미지 폴더를 원래 FPS로 재생 (처리가 늦으면 카메라처럼 프레임을 건너뜀), False이면 최대 속도로 모두 읽음
+# - exhausted: 반복하지 않는 파일, 이미지 폴더를 끝까지 읽은 경우 True (카메라, RTSP는 항상 False)
+#
+# 입력 지정 (open_source): 0, "/dev/video0" -> 카메라, "rtsp://..." -> RTSP, 폴더 -> 이미지 폴더, "live:영상.mp4" -> RTSP 대신 쓰는
+# 로컬 영상 (실시간 재생, 반복), 그 외 -> 동영상 파일
+
+from abc import ABC, abstractmethod
+import os
+import platform
+import time
+from typing import Optional, Union
+
+import numpy as np
+import cv2
+
+# 이미지 폴더에서 읽는 확장자
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+# RTSP 대신 사용할 로컬 영상 지정 접두어
+LIVE_FILE_PREFIX = "live:"
+
+# 카메라 프레임 간격이 (1 / FPS)의 이 배수를 넘으면 그 사이 프레임을 누락한 것으로 계산
+DROP_INTERVAL_RATIO = 1.5
+
+# RTSP 연결이 끊긴 뒤 다시 연결할 때까지 연속으로 실패한 읽기 수
+RTSP_RECONNECT_FAILURES = 30
+
+
+class FrameSource(ABC):
+    """프레임 입력의 공통 동작 (타임스탬프, 읽은/누락 프레임 수)"""
+
+    def __init__(self, fps: float) -> None:
+        self.fps: float = fps if fps and fps > 0 else 30.0
+        self.timestamp: float = 0.0
+        self.frame_count: int = 0
+        self.dropped: int = 0
+
+    @abstractmethod
+    def grab(self, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        """입력에서 다음 프레임 하나를 읽기 (image가 있으면 가능한 경우 그 배열에 씀)"""
+
+    def read(self, image: Optional[np.ndarray] = None) -> tuple[bool, Optional[np.ndarray]]:
+        """cv2.VideoCapture.read와 같은 형식으로 프레임 읽기"""
+
+        ret, frame = self.grab(image)
+        if not ret:
+            return False, None
+
+        self.timestamp = time.time()
+        self.frame_count += 1
+        return True, frame
+
+    @property
+    def exhausted(self) -> bool:
+        """더 읽을 프레임이 없는지 (읽기 실패가 일시적인 카메라, RTSP는 False)"""
+
+        return False
+
+    def release(self) -> None:
+        """입력 해제 (필요한 입력만 구현)"""
+
+    def stats(self) -> str:
+        return f"프레임 {self.frame_count}장, 누락 {self.dropped}장"
+
+
+class LiveSource(FrameSource):
+    """카메라, RTSP 등 실시간 입력 (프레임 간격으로 누락 수 추정)"""
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        super().__init__(cap.get(cv2.CAP_PROP_FPS))
+        self.cap: cv2.VideoCapture = cap
+        self.last_read: Optional[float] = None
+
+    def grab(self, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        ret, frame = self.cap.read(image=image) if image is not None else self.cap.read()
+
+        if ret:
+            now = time.perf_counter()
+            if self.last_read is not None:
+                self.count_dropped(now - self.last_read)
+            self.last_read = now
+
+        return ret, frame
+
+    def count_dropped(self, interval: float) -> None:
+        """프레임 간격이 길면 그 사이에 카메라가 보낸 프레임을 누락한 것으로 계산"""
+
+        frame_interval = 1.0 / self.fps
+        if interval > frame_interval * DROP_INTERVAL_RATIO:
+            self.dropped += int(round(interval / frame_interval)) - 1
+
+    def release(self) -> None:
+        self.cap.release()
+
+
+class CameraSource(LiveSource):
+    """USB 카메라 (Linux는 V4L2)"""
+
+    def __init__(self, device: Union[int, str], frame_width: int, frame_height: int, fps: int = 30) -> None:
+        if platform.system() in ("Darwin", "Windows"):
+            cap = cv2.VideoCapture(device)
+        else:   # Linux
+            cap = cv2.VideoCapture(device, cv2.CAP_V4L2)
+
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, frame_width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, frame_height)
+        cap.set(cv2.CAP_PROP_FPS, fps)
+
+        super().__init__(cap)
+
+
+class RtspSource(LiveSource):
+    """RTSP 카메라 (연속으로 읽지 못하면 다시 연결)"""
+
+    def __init__(self, url: str) -> None:
+        self.url: str = url
+        self.failures: int = 0
+        super().__init__(self.connect())
+
+    def connect(self) -> cv2.VideoCapture:
+        cap = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)     # 오래된 프레임이 쌓이지 않도록 버퍼 최소화
+        return cap
+
+    def grab(self, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        ret, frame = super().grab(image)
+
+        if ret:
+            self.failures = 0
+        else:
+            self.failures += 1
+            if self.failures >= RTSP_RECONNECT_FAILURES:
+                print(f"RTSP 연결이 끊겼습니다. 다시 연결합니다: {self.url}")
+                self.cap.release()
+                self.cap = self.connect()
+                self.failures = 0
+                self.last_read = None
+
+        return ret, frame
+
+
+class PacedSource(FrameSource):
+    """
+    파일, 이미지 폴더처럼 원하는 만큼 빨리 읽을 수 있는 입력의 재생 속도 조절
+
+    realtime이면 시작 시각 기준으로 프레임 번호의 재생 시각까지 기다리고, 늦었으면 그 사이 프레임을 건너뛰어 카메라와 같이 동작
+    """
+
+    def __init__(self, fps: float, realtime: bool, loop: bool) -> None:
+        super().__init__(fps)
+        self.realtime: bool = realtime
+        self.loop: bool = loop
+        self.position: int = 0          # 다음에 읽을 프레임 번호 (반복 재생해도 계속 증가)
+        self.start: Optional[float] = None
+        self.finished: bool = False     # 반복하지 않는 입력을 끝까지 읽음
+
+    @property
+    @abstractmethod
+    def length(self) -> int:
+        """전체 프레임 수 (알 수 없으면 0, 읽기에 실패할 때까지 읽음)"""
+
+    @abstractmethod
+    def load(self, index: int, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        """index번째 프레임 읽기"""
+
+    @property
+    def exhausted(self) -> bool:
+        return self.finished
+
+    def grab(self, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        if self.finished:
+            return False, None
+
+        if self.realtime:
+            now = time.perf_counter()
+            if self.start is None:
+                self.start = now
+
+            due = int((now - self.start) * self.fps)    # 지금 재생해야 하는 프레임 번호
+            if self.length and not self.loop:
+                due = min(due, self.length)             # 끝 이후의 프레임은 누락으로 세지 않음
+
+            if due > self.position:
+                self.dropped += due - self.position
+                self.position = due
+            else:
+                time.sleep(max(0.0, self.start + self.position / self.fps - now))
+
+        if self.length and self.position >= self.length and not self.loop:
+            self.finished = True
+            return False, None
+
+        ret, frame = self.load(self.position % self.length if self.length else self.position, image)
+        self.position += 1
+
+        # 전체 프레임 수를 모르는 입력은 읽기에 실패하면 끝으로 판단
+        if not ret and not self.loop:
+            self.finished = True
+
+        return ret, frame
+
+
+class VideoFileSource(PacedSource):
+    """동영상 파일"""
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False) -> None:
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise ValueError(f"동영상을 열 수 없습니다: {path}")
+
+        self.frame_total: int = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.next_index: int = 0        # cap이 다음에 반환할 프레임 번호
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS), realtime, loop)
+
+    @property
+    def length(self) -> int:
+        return self.frame_total
+
+    def load(self, index: int, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        # 반복 재생으로 처음으로 돌아간 경우에만 위치 이동 (건너뛴 프레임은 grab으로 디코딩 없이 넘김)
+        if index < self.next_index:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+            self.next_index = index
+
+        while self.next_index < index:
+            self.cap.grab()
+            self.next_index += 1
+
+        ret, frame = self.cap.read(image=image) if image is not None else self.cap.read()
+        self.next_index += 1
+        return ret, frame
+
+    def release(self) -> None:
+        self.cap.release()
+
+
+class ImageFolderSource(PacedSource):
+    """이미지 폴더 (파일 이름 순서로 한 장씩 읽음)"""
+
+    def __init__(self, path: str, fps: float = 30.0, realtime: bool = True, loop: bool = False) -> None:
+        self.paths: list[str] = sorted(
+            os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.paths:
+            raise ValueError(f"이미지가 없는 폴더입니다: {path}")
+
+        super().__init__(fps, realtime, loop)
+
+    @property
+    def length(self) -> int:
+        return len(self.paths)
+
+    def load(self, index: int, image: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        frame = cv2.imread(self.paths[index])
+        if frame is None:
+            return False, None
+
+        # 풀 버퍼와 크기가 같으면 버퍼에 복사하여 같은 배열을 반환
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+
+        return True, frame
+
+
+def open_source(source: Union[int, str], frame_width: int = 1920, frame_height: int = 1080, realtime: bool = True) -> FrameSource:
+    """
+    입력 지정으로 프레임 입력 생성
+
+    Args:
+        source: 카메라 번호 / 장치 경로, RTSP 주소, 이미지 폴더, "live:영상 파일", 동영상 파일
+        frame_width, frame_height: 카메라 요청 해상도 (파일, 폴더, RTSP는 원본 크기)
+        realtime: 파일, 폴더를 원래 FPS로 재생 (False이면 최대 속도, 처리량 측정용)
+
+    Raises:
+        ValueError: 열 수 없는 파일이나 빈 폴더
+    """
+    if isinstance(source, int) or (isinstance(source, str) and source.isdigit()):
+        return CameraSource(int(source), frame_width, frame_height)
+
+    if source.startswith("/dev/"):
+        return CameraSource(source, frame_width, frame_height)
+
+    if source.startswith(("rtsp://", "rtsps://", "http://", "https://")):
+        return RtspSource(source)
+
+    if source.startswith(LIVE_FILE_PREFIX):
+        return VideoFileSource(source[len(LIVE_FILE_PREFIX):], realtime=True, loop=True)
+
+    if os.path.isdir(source):
+        return ImageFolderSource(source, realtime=realtime)
+
+    return VideoFileSource(source, realtime=realtime)
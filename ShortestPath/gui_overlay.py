@@ -0,0 +1,106 @@
+# 프레임에 주차 구역, 이동 구역, 차량을 표시하는 함수 모음 (GUI 창과 미리보기 스트림에서 공통 사용)
+
+from typing import Optional
+import cv2
+import numpy as np
+from shortest_route import Car, CarStatus
+
+RED = (0, 0, 255)
+WHITE = (255, 255, 255)
+BLUE = (255, 0, 0)
+GREEN = (0, 255, 0)
+YELLOW = (0, 255, 255)
+
+# 프레임에 주차 구역 및 이동 구역을 표시하는 함수
+def draw_spaces(image, parking_data, moving_data, scale: float = 1.0):
+    # 주차 구역 흰색으로 표시
+    for space in parking_data.values():
+        points = (np.array(space["position"], np.float32) * scale).astype(np.int32)
+        cv2.polylines(image, [points], isClosed=True, color=RED, thickness=2)
+        centroid = points.mean(axis=0).astype(int)
+        cv2.putText(image, space["name"], (centroid[0], centroid[1]), cv2.FONT_HERSHEY_SIMPLEX, 0.6, WHITE, 2)
+
+    # 이동 구역 파랑색으로 표시
+    for space in moving_data.values():
+        points = (np.array(space["position"], np.float32) * scale).astype(np.int32)
+        cv2.polylines(image, [points], isClosed=True, color=BLUE, thickness=2)
+        centroid = points.mean(axis=0).astype(int)
+        cv2.putText(image, space["name"], (centroid[0], centroid[1]), cv2.FONT_HERSHEY_SIMPLEX, 0.6, BLUE, 2)
+
+    return image
+
+def draw_car(frame, ltrb, car: Car, scale: float = 1.0):
+
+    xmin, ymin, xmax, ymax = int(ltrb[0] * scale), int(ltrb[1] * scale), int(ltrb[2] * scale), int(ltrb[3] * scale)
+
+    # 주차를 위해 움직이는 차량은 초록색 사각형 및 번호 표시
+    if car.status == CarStatus.ENTRY:
+        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), GREEN, 2)
+        cv2.rectangle(frame, (xmin, ymin - 35), (xmin + 75, ymin), GREEN, -1)
+        cv2.putText(frame, str(car.car_number), (xmin + 5, ymin - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
+
+    # 주차한 차량은 빨강색 사각형 및 번호 표시
+    elif car.status == CarStatus.PARKING:
+        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), RED, 2)
+        cv2.rectangle(frame, (xmin, ymin - 35), (xmin + 75, ymin), RED, -1)
+        cv2.putText(frame, str(car.car_number), (xmin + 5, ymin - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
+
+    # 출차를 위해 움직이는 차량은 노랑색 사각형 및 번호 표시
+    else:
+        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), YELLOW, 2)
+        cv2.rectangle(frame, (xmin, ymin - 35), (xmin + 75, ymin), YELLOW, -1)
+        cv2.putText(frame, str(car.car_number), (xmin + 5, ymin - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
+
+
+class StaticOverlay:
+    """
+    구역 표시를 별도의 레이어에 한 번만 그려 두고 매 프레임 합성하는 클래스
+
+    구역 좌표는 변하지 않으므로 매 프레임 다각형 배열과 중심점을 다시 계산하지 않음
+    """
+
+    def __init__(self, parking_data, moving_data, scale: float = 1.0) -> None:
+        """
+        Args:
+            parking_data, moving_data: 구역 JSON 데이터
+            scale: 미리보기 축소 비율 (1.0이면 원본 크기)
+        """
+        self.parking_data = parking_data
+        self.moving_data = moving_data
+        self.scale: float = scale
+        self.layer: Optional[np.ndarray] = None
+        self.mask: Optional[np.ndarray] = None
+        self.stale: bool = False    # 구역 데이터가 바뀌어 레이어를 다시 그려야 하는지 여부
+
+    def set_layout(self, parking_data, moving_data) -> None:
+        """구역 데이터를 교체하고 다음 프레임에서 레이어를 다시 그림 (layout_manager의 listener로 등록)"""
+
+        self.parking_data = parking_data
+        self.moving_data = moving_data
+        self.stale = True
+
+    def render(self, shape) -> None:
+        """프레임 크기에 맞는 구역 레이어와 마스크 생성"""
+
+        self.layer = np.zeros(shape, dtype=np.uint8)
+        draw_spaces(self.layer, self.parking_data, self.moving_data, self.scale)
+        self.mask = np.any(self.layer != 0, axis=2).astype(np.uint8)
+
+    def resize(self, frame):
+        """미리보기 비율로 프레임 축소 (원본 프레임은 변경하지 않음)"""
+
+        if self.scale == 1.0:
+            return frame
+
+        height, width = frame.shape[:2]
+        return cv2.resize(frame, (int(width * self.scale), int(height * self.scale)), interpolation=cv2.INTER_AREA)
+
+    def apply(self, frame):
+        """프레임에 구역 레이어를 합성 (처음 호출, 프레임 크기 또는 구역 데이터가 바뀐 경우에만 레이어를 다시 그림)"""
+
+        if self.stale or self.layer is None or self.layer.shape != frame.shape:
+            self.stale = False
+            self.render(frame.shape)
+
+        cv2.copyTo(self.layer, self.mask, frame)
+        return frame
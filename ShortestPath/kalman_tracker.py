@@ -0,0 +1,188 @@
+# 트래커의 중심점을 등속도 칼만 필터로 평활화하고, 추론이 없는 프레임과 짧은 추적 끊김을 예측 위치로 채우는 모듈
+
+import time
+from queue import Empty
+from typing import Optional
+import numpy as np
+
+# 관측 행렬 (상태 [x, y, vx, vy]에서 위치만 관측)
+H = np.array([[1, 0, 0, 0], [0, 1, 0, 0]], dtype=np.float64)
+
+
+class CentroidKalman:
+    """
+    모든 트랙의 등속도 칼만 필터를 배열 하나로 관리하는 클래스
+
+    - 상태: [x, y, vx, vy] (N, 4), 공분산: (N, 4, 4)
+    - 예측과 보정을 트랙별 반복문 없이 NumPy 배열 연산으로 한 번에 수행
+    - 관측이 끊긴 트랙은 max_dropout초 동안 예측 위치로 유지한 뒤 제거 (이후에는 shortest_route의 lost_tracking_time이 처리)
+    """
+
+    def __init__(self, process_noise: float = 500.0, measurement_noise: float = 25.0, max_dropout: float = 1.0) -> None:
+        """
+        Args:
+            process_noise: 가속도 잡음 분산 (클수록 관측을 빠르게 따라감)
+            measurement_noise: 관측 잡음 분산 (픽셀², 클수록 더 많이 평활화)
+            max_dropout: 관측 없이 예측 위치로 유지하는 최대 시간 (초)
+        """
+        self.process_noise: float = process_noise
+        self.measurement_noise: float = measurement_noise
+        self.max_dropout: float = max_dropout
+
+        self.track_ids: list[int] = []
+        self.index: dict[int, int] = {}     # 트랙 ID -> 배열 행 번호
+        self.state = np.zeros((0, 4), dtype=np.float64)
+        self.covariance = np.zeros((0, 4, 4), dtype=np.float64)
+        self.last_seen = np.zeros((0,), dtype=np.float64)
+        self.last_time: Optional[float] = None
+
+        # 마지막 update/predict 시점의 트랙 ID -> 속도 (다른 쓰레드에서 읽는 스냅샷, shortest_route의 혼잡도 모델이 사용)
+        self.latest_velocities: dict[int, tuple[float, float]] = {}
+
+    def update(self, measurements: dict[int, tuple[float, float]], now: Optional[float] = None) -> dict[int, tuple[float, float]]:
+        """
+        트래커의 관측으로 상태를 보정하고 평활화된 위치를 반환
+
+        Args:
+            measurements: 트랙 ID -> 관측 중심점
+            now: 관측 시각 (None이면 현재 시각)
+
+        Returns:
+            dict: 트랙 ID -> 평활화된 위치 (관측이 잠시 끊긴 트랙은 예측 위치)
+        """
+        now = time.time() if now is None else now
+        self.predict_to(now)
+
+        observed_rows = []
+        observed_values = []
+        new_ids = []
+
+        for track_id, position in measurements.items():
+            row = self.index.get(track_id)
+            if row is None:
+                new_ids.append(track_id)
+            else:
+                observed_rows.append(row)
+                observed_values.append(position)
+
+        if observed_rows:
+            self.correct(np.array(observed_rows), np.array(observed_values, dtype=np.float64), now)
+
+        if new_ids:
+            self.add_tracks(new_ids, np.array([measurements[track_id] for track_id in new_ids], dtype=np.float64), now)
+
+        self.remove_expired(now)
+        self.latest_velocities = self.velocities()
+
+        return self.positions()
+
+    def predict(self, now: Optional[float] = None) -> dict[int, tuple[float, float]]:
+        """관측 없이 now 시각의 예측 위치를 반환 (추론하지 않은 프레임용)"""
+
+        now = time.time() if now is None else now
+        self.predict_to(now)
+        self.remove_expired(now)
+        self.latest_velocities = self.velocities()
+
+        return self.positions()
+
+    def positions(self) -> dict[int, tuple[float, float]]:
+        """트랙 ID -> 현재 추정 위치"""
+
+        return {track_id: (float(x), float(y)) for track_id, (x, y) in zip(self.track_ids, self.state[:, :2])}
+
+    def velocities(self) -> dict[int, tuple[float, float]]:
+        """트랙 ID -> 현재 추정 속도 (픽셀/초)"""
+
+        return {track_id: (float(vx), float(vy)) for track_id, (vx, vy) in zip(self.track_ids, self.state[:, 2:])}
+
+    def predict_to(self, now: float) -> None:
+        """모든 트랙의 상태를 now 시각으로 예측"""
+
+        if self.last_time is None:
+            self.last_time = now
+            return
+
+        dt = now - self.last_time
+        if dt <= 0:
+            return
+        self.last_time = now
+
+        if not self.track_ids:
+            return
+
+        F = np.array([[1, 0, dt, 0], [0, 1, 0, dt], [0, 0, 1, 0], [0, 0, 0, 1]], dtype=np.float64)
+
+        # 등가속도 백색 잡음 모델의 프로세스 잡음
+        q = self.process_noise
+        Q = q * np.array([
+            [dt ** 4 / 4, 0, dt ** 3 / 2, 0],
+            [0, dt ** 4 / 4, 0, dt ** 3 / 2],
+            [dt ** 3 / 2, 0, dt ** 2, 0],
+            [0, dt ** 3 / 2, 0, dt ** 2],
+        ])
+
+        self.state = self.state @ F.T
+        self.covariance = F @ self.covariance @ F.T + Q
+
+    def correct(self, rows: np.ndarray, values: np.ndarray, now: float) -> None:
+        """관측된 트랙(rows)의 상태를 관측값(values)으로 보정"""
+
+        P = self.covariance[rows]                                   # (m, 4, 4)
+        S = P[:, :2, :2] + self.measurement_noise * np.eye(2)       # (m, 2, 2)
+        K = P[:, :, :2] @ np.linalg.inv(S)                          # (m, 4, 2)
+        residual = values - self.state[rows, :2]                    # (m, 2)
+
+        self.state[rows] += np.einsum("mij,mj->mi", K, residual)
+        self.covariance[rows] = P - K @ P[:, :2, :]
+        self.last_seen[rows] = now
+
+    def add_tracks(self, track_ids: list[int], values: np.ndarray, now: float) -> None:
+        """새 트랙을 관측 위치, 속도 0으로 추가 (속도의 불확실성은 크게 설정)"""
+
+        count = len(track_ids)
+        state = np.zeros((count, 4), dtype=np.float64)
+        state[:, :2] = values
+
+        covariance = np.zeros((count, 4, 4), dtype=np.float64)
+        covariance[:, 0, 0] = covariance[:, 1, 1] = self.measurement_noise
+        covariance[:, 2, 2] = covariance[:, 3, 3] = 1e4
+
+        for track_id in track_ids:
+            self.index[track_id] = len(self.track_ids)
+            self.track_ids.append(track_id)
+
+        self.state = np.concatenate([self.state, state])
+        self.covariance = np.concatenate([self.covariance, covariance])
+        self.last_seen = np.concatenate([self.last_seen, np.full(count, now)])
+
+    def remove_expired(self, now: float) -> None:
+        """max_dropout초 이상 관측되지 않은 트랙 제거"""
+
+        keep = now - self.last_seen <= self.max_dropout
+        if keep.all():
+            return
+
+        self.track_ids = [track_id for track_id, alive in zip(self.track_ids, keep) if alive]
+        self.index = {track_id: row for row, track_id in enumerate(self.track_ids)}
+        self.state = self.state[keep]
+        self.covariance = self.covariance[keep]
+        self.last_seen = self.last_seen[keep]
+
+
+def run_kalman_stage(raw_track_queue, yolo_data_queue, kalman: CentroidKalman, event, stop_event, output_interval: float = 1 / 15):
+    """
+    트래커의 추적 데이터를 칼만 필터로 평활화하여 yolo_data_queue로 전달하는 쓰레드 함수
+
+    output_interval초 동안 새 추적 데이터가 없으면 예측 위치를 전달하여 추론 FPS가 낮아도 경로 계산과 웹 지도가 부드럽게 갱신되도록 함
+    초기화(event) 전에는 shortest_route가 사전 입차 차량 프레임을 세어 사용하므로 예측 프레임을 보내지 않음
+    """
+    while not stop_event.is_set():
+        try:
+            tracks = raw_track_queue.get(timeout=output_interval)
+        except Empty:
+            if event.is_set() and kalman.track_ids:
+                yolo_data_queue.put(kalman.predict())
+            continue
+
+        yolo_data_queue.put(kalman.update(tracks))
@@ -0,0 +1,268 @@
+# 구역 json(parking_space.json, moving_space.json)을 검증하여 하나의 바이너리 파일(NPZ)로 컴파일하고, 실행 시 json 대신 읽어오는 모듈
+#
+# 컴파일: python layout_bundle.py [parking_space.json] [moving_space.json] [layout_bundle.npz]
+#
+# 번들에는 구역 좌표, 인접 구역, 디스플레이 방향 테이블, 웹 좌표 투시 변환 행렬이 들어 있으며
+# 원본 json의 해시를 함께 저장하여 json이 수정된 뒤 다시 컴파일하지 않은 번들은 사용하지 않음 (json으로 실행)
+
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import os
+from typing import Optional
+
+import numpy as np
+
+import display_direction
+import layout_manager
+import shortest_route as sr
+from display_direction import Direction
+from web_position import web_coordinates, web_homography, quad_key, QuadKey
+
+# 번들 형식 버전 (배열 구성이 바뀌면 증가, 다른 버전의 번들은 사용하지 않음)
+BUNDLE_FORMAT_VERSION = 2
+
+# 방향 테이블의 다음 구역 종류 (문자열 대신 정수로 저장)
+NEXT_KIND = ("moving", "parking")
+
+# 기본 경로 (이 파일 기준 position_file 폴더)
+POSITION_FILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "position_file")
+
+
+def file_hash(path: str) -> str:
+    """파일 내용의 sha1 해시 (수정 시각은 복사나 배포 시 바뀌므로 내용으로 비교)"""
+
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def pack_polygons(spaces: dict[int, dict]) -> tuple[np.ndarray, np.ndarray]:
+    """구역 좌표를 (전체 꼭짓점 좌표, 구역별 시작 위치) 배열로 변환 (꼭짓점 수가 달라도 저장 가능)"""
+
+    offsets = [0]
+    points = []
+    for data in spaces.values():
+        points.extend(data["position"])
+        offsets.append(len(points))
+
+    return np.asarray(points).reshape(-1, 2), np.asarray(offsets, dtype=np.int32)
+
+
+def pack_lists(lists: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """정수 목록의 목록을 (이어 붙인 값, 목록별 시작 위치) 배열로 변환"""
+
+    offsets = [0]
+    values = []
+    for items in lists:
+        values.extend(items)
+        offsets.append(len(values))
+
+    return np.asarray(values, dtype=np.int32), np.asarray(offsets, dtype=np.int32)
+
+
+def unpack(values: np.ndarray, offsets: np.ndarray, index: int) -> list:
+    """pack_polygons, pack_lists로 저장한 index번째 목록"""
+
+    return values[offsets[index]:offsets[index + 1]].tolist()
+
+
+def compile_layout(parking_space_path: str, moving_space_path: str, bundle_path: str) -> dict[str, np.ndarray]:
+    """
+    구역 json을 검증하고 번들 파일로 저장하는 함수
+
+    Raises:
+        ValueError: 구역 데이터가 올바르지 않은 경우 (번들을 만들지 않음)
+
+    Returns:
+        dict: 번들에 저장한 배열
+    """
+    with open(parking_space_path, "r") as f:
+        parking = layout_manager.parse_space_keys(json.load(f), "주차 구역")
+    with open(moving_space_path, "r") as f:
+        moving = layout_manager.parse_space_keys(json.load(f), "이동 구역")
+
+    errors = layout_manager.validate_layout(parking, moving)
+    if errors:
+        raise ValueError("\n".join(errors))
+
+    parking_spaces, moving_spaces = sr.build_spaces(parking, moving)
+    direction_table = display_direction.build_direction_table(parking_spaces, moving_spaces, install=False)
+
+    parking_points, parking_offsets = pack_polygons(parking)
+    moving_points, moving_offsets = pack_polygons(moving)
+    near_moving, near_moving_offsets = pack_lists([data["near_moving_space_id"] for data in moving.values()])
+    near_parking, near_parking_offsets = pack_lists([data["near_parking_space_id"] for data in moving.values()])
+
+    # 웹 좌표가 정해진 이동 구역의 투시 변환 행렬
+    web_ids = [space_id for space_id in moving if space_id in web_coordinates and len(moving[space_id]["position"]) == 4]
+    homographies = [web_homography(moving[space_id]["position"], web_coordinates[space_id]) for space_id in web_ids]
+
+    arrays = {
+        "format_version": np.asarray(BUNDLE_FORMAT_VERSION),
+        "source_hashes": np.asarray([file_hash(parking_space_path), file_hash(moving_space_path)]),
+
+        "parking_ids": np.asarray(list(parking), dtype=np.int32),
+        "parking_names": np.asarray([data["name"] for data in parking.values()], dtype=str),
+        "parking_points": parking_points,
+        "parking_offsets": parking_offsets,
+        "parking_near_moving": np.asarray([data["near_moving_space_id"] for data in parking.values()], dtype=np.int32),
+
+        "moving_ids": np.asarray(list(moving), dtype=np.int32),
+        "moving_names": np.asarray([data["name"] for data in moving.values()], dtype=str),
+        "moving_points": moving_points,
+        "moving_offsets": moving_offsets,
+        "moving_congestion": np.asarray([data["congestion"] for data in moving.values()], dtype=np.int32),
+        "moving_near_moving": near_moving,
+        "moving_near_moving_offsets": near_moving_offsets,
+        "moving_near_parking": near_parking,
+        "moving_near_parking_offsets": near_parking_offsets,
+
+        # (디스플레이 구역 ID, 다음 구역 종류, 다음 구역 ID) -> 방향
+        "direction_keys": np.asarray(
+            [(display_id, NEXT_KIND.index(kind), next_id) for display_id, kind, next_id in direction_table],
+            dtype=np.int32,
+        ).reshape(-1, 3),
+        "direction_values": np.asarray([direction.value for direction in direction_table.values()], dtype=str),
+
+        "web_ids": np.asarray(web_ids, dtype=np.int32),
+        "web_homographies": np.asarray(homographies, dtype=np.float64).reshape(-1, 3, 3),
+    }
+
+    # 실행 중인 프로그램이 저장 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f"{bundle_path}.tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(temp_path, bundle_path)
+
+    return arrays
+
+
+class LayoutBundle:
+    """번들 파일에서 읽은 구역 데이터"""
+
+    def __init__(self, arrays) -> None:
+        """
+        Args:
+            arrays: np.load로 읽은 번들 (또는 compile_layout이 반환한 배열)
+        """
+        self.source_hashes: list[str] = arrays["source_hashes"].tolist()
+
+        # json과 같은 형식의 구역 데이터 (정수 키), shortest_route.build_spaces와 GUI 표시에 그대로 사용
+        parking_ids = arrays["parking_ids"].tolist()
+        parking_names = arrays["parking_names"].tolist()
+        parking_near_moving = arrays["parking_near_moving"].tolist()
+        self.parking_data: dict[int, dict] = {
+            space_id: {
+                "name": parking_names[i],
+                "position": unpack(arrays["parking_points"], arrays["parking_offsets"], i),
+                "near_moving_space_id": parking_near_moving[i],
+            }
+            for i, space_id in enumerate(parking_ids)
+        }
+
+        moving_ids = arrays["moving_ids"].tolist()
+        moving_names = arrays["moving_names"].tolist()
+        moving_congestion = arrays["moving_congestion"].tolist()
+        self.moving_data: dict[int, dict] = {
+            space_id: {
+                "name": moving_names[i],
+                "position": unpack(arrays["moving_points"], arrays["moving_offsets"], i),
+                "congestion": moving_congestion[i],
+                "near_parking_space_id": unpack(arrays["moving_near_parking"], arrays["moving_near_parking_offsets"], i),
+                "near_moving_space_id": unpack(arrays["moving_near_moving"], arrays["moving_near_moving_offsets"], i),
+            }
+            for i, space_id in enumerate(moving_ids)
+        }
+
+        self.direction_table: dict[tuple[int, str, int], Direction] = {
+            (display_id, NEXT_KIND[kind], next_id): Direction(value)
+            for (display_id, kind, next_id), value in zip(arrays["direction_keys"].tolist(), arrays["direction_values"].tolist())
+        }
+
+        # 이동 구역 ID -> (구역 좌표 키, 투시 변환 행렬), web_position.WebHomographyCache의 seed
+        self.web_homographies: dict[int, tuple[QuadKey, np.ndarray]] = {
+            space_id: (quad_key(self.moving_data[space_id]["position"]), homography)
+            for space_id, homography in zip(arrays["web_ids"].tolist(), arrays["web_homographies"])
+        }
+
+    def is_fresh(self, parking_space_path: str, moving_space_path: str) -> bool:
+        """번들을 컴파일한 뒤 json이 수정되지 않았는지 확인 (json이 없으면 번들만 사용)"""
+
+        for path, source_hash in zip((parking_space_path, moving_space_path), self.source_hashes):
+            if os.path.exists(path) and file_hash(path) != source_hash:
+                return False
+
+        return True
+
+
+def load_bundle(bundle_path: str) -> LayoutBundle:
+    """
+    번들 파일 읽기
+
+    Raises:
+        OSError: 파일이 없는 경우
+        ValueError: 번들 형식이 다르거나 손상된 경우
+    """
+    try:
+        with np.load(bundle_path, allow_pickle=False) as arrays:
+            if int(arrays["format_version"]) != BUNDLE_FORMAT_VERSION:
+                raise ValueError(f"번들 형식 버전이 다릅니다: {int(arrays['format_version'])} (필요: {BUNDLE_FORMAT_VERSION})")
+            return LayoutBundle(arrays)
+
+    except KeyError as e:
+        raise ValueError(f"번들에 {e} 배열이 없습니다.") from None
+
+
+def load_layout_data(
+    parking_space_path: str,
+    moving_space_path: str,
+    bundle_path: Optional[str] = None,
+) -> tuple[dict[int, dict], dict[int, dict], Optional[LayoutBundle]]:
+    """
+    구역 데이터 읽기 (번들이 있고 json과 같으면 번들, 아니면 json)
+
+    Returns:
+        tuple: (주차 구역 데이터, 이동 구역 데이터, 번들 (json을 읽은 경우 None)), 구역 데이터는 정수 키
+    """
+    if bundle_path is not None and os.path.exists(bundle_path):
+        try:
+            bundle = load_bundle(bundle_path)
+
+            if bundle.is_fresh(parking_space_path, moving_space_path):
+                return bundle.parking_data, bundle.moving_data, bundle
+
+            print(f"구역 번들이 json보다 오래되었습니다. json으로 실행합니다 (다시 컴파일: python layout_bundle.py): {bundle_path}")
+
+        except (OSError, ValueError) as e:
+            print(f"구역 번들을 읽을 수 없습니다. json으로 실행합니다: {e}")
+
+    with open(parking_space_path, "r") as f:
+        parking_data = layout_manager.parse_space_keys(json.load(f), "주차 구역")
+    with open(moving_space_path, "r") as f:
+        moving_data = layout_manager.parse_space_keys(json.load(f), "이동 구역")
+
+    return parking_data, moving_data, None
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """구역 json을 번들로 컴파일하는 명령"""
+
+    parser = argparse.ArgumentParser(description="구역 json을 검증하여 번들(NPZ)로 컴파일")
+    parser.add_argument("parking_space_path", nargs="?", default=os.path.join(POSITION_FILE_DIR, "parking_space.json"))
+    parser.add_argument("moving_space_path", nargs="?", default=os.path.join(POSITION_FILE_DIR, "moving_space.json"))
+    parser.add_argument("bundle_path", nargs="?", default=os.path.join(POSITION_FILE_DIR, "layout_bundle.npz"))
+    args = parser.parse_args(argv)
+
+    try:
+        arrays = compile_layout(args.parking_space_path, args.moving_space_path, args.bundle_path)
+    except ValueError as e:
+        print(f"구역 데이터가 올바르지 않습니다:\n{e}")
+        raise SystemExit(1)
+
+    print(f"번들 저장 완료: {args.bundle_path} (주차 구역 {len(arrays['parking_ids'])}개, 이동 구역 {len(arrays['moving_ids'])}개, "
+          f"방향 {len(arrays['direction_values'])}개, 웹 좌표 변환 {len(arrays['web_ids'])}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+# 구역 데이터의 기하 검사와, 기록한 추적 데이터(track_log)를 재생하여 구역 경계별 비용을 분석하는 도구
+#
+# 실행: python layout_lint.py [--parking parking_space.json] [--moving moving_space.json] [--track-log track_log.jsonl]
+#
+# - 검사: 구역 겹침, 경로상 인접 구역 사이의 틈, 좌표와 인접 구역 목록의 불일치, 도달할 수 없는 주차 구역
+# - 재생: 경계마다 구역 판정 변화, 확정된 구역 전환, 경로 재계산, 구역 밖 삭제 횟수를 세어 보정할 경계의 순위를 출력
+
+from __future__ import annotations
+import argparse
+import itertools
+import os
+from collections import deque
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
+import cv2
+
+import layout_bundle
+import layout_manager
+import shortest_route as sr
+from track_log import read_track_log
+from zone_filter import ZoneKey, ZoneTransitionFilter
+
+# 겹친 넓이가 작은 구역 넓이의 이 비율 이상이면 경고 (손으로 그린 구역의 꼭짓점이 살짝 겹치는 경우는 제외)
+OVERLAP_RATIO = 0.1
+
+# 인접 구역 사이의 거리가 이 값(카메라 좌표 픽셀)보다 크면 틈으로 판단 (차량 중심점이 틈에 들어가면 roop에서 삭제)
+GAP_TOLERANCE = 10.0
+
+# 맞닿은 길이(카메라 좌표 픽셀)가 이 값보다 짧으면 대각선 구역의 꼭짓점만 닿은 것으로 보고 불일치 검사에서 제외
+# (실제 구역 데이터: 꼭짓점 접촉 30 ~ 60px, 변 접촉 140px 이상)
+MIN_CONTACT_LENGTH = 80.0
+
+# 구역 경계: 두 구역 키를 정렬한 튜플 (구역 밖은 None)
+Boundary = tuple[ZoneKey, ZoneKey]
+
+
+def polygon_points(position: list) -> np.ndarray:
+    """구역 좌표를 cv2 함수에 사용할 float32 배열로 변환"""
+
+    return np.asarray(position, dtype=np.float32).reshape(-1, 1, 2)
+
+
+def overlap_area(a: list, b: list) -> float:
+    """두 구역이 겹친 넓이 (구역을 볼록 다각형으로 보고 계산)"""
+
+    area, _ = cv2.intersectConvexConvex(cv2.convexHull(polygon_points(a)), cv2.convexHull(polygon_points(b)))
+    return max(0.0, float(area))
+
+
+def polygon_distance(a: list, b: list) -> float:
+    """두 구역 경계 사이의 최단 거리 (겹치거나 닿아 있으면 0)"""
+
+    if overlap_area(a, b) > 0:
+        return 0.0
+
+    # 교차하지 않는 두 다각형 사이의 최단 거리는 한쪽 꼭짓점과 다른 쪽 경계 사이에서 나옴
+    points_a = polygon_points(a)
+    points_b = polygon_points(b)
+    distance = min(
+        min(-cv2.pointPolygonTest(points_b, (float(x), float(y)), True) for x, y in a),
+        min(-cv2.pointPolygonTest(points_a, (float(x), float(y)), True) for x, y in b),
+    )
+    return max(0.0, distance)
+
+
+def contact_length(a: list, b: list, tolerance: float, step: float = 1.0) -> float:
+    """b 구역 경계 중 a 구역에서 tolerance 이내인 부분의 길이 (경계를 step 간격으로 나누어 계산)"""
+
+    points_a = polygon_points(a)
+    points_b = np.asarray(b, dtype=np.float64)
+    length = 0.0
+
+    for start, end in zip(points_b, np.roll(points_b, -1, axis=0)):
+        edge = float(np.hypot(*(end - start)))
+        count = max(1, int(np.ceil(edge / step)))
+
+        for t in (np.arange(count) + 0.5) / count:
+            x, y = start + (end - start) * t
+            if cv2.pointPolygonTest(points_a, (float(x), float(y)), True) >= -tolerance:
+                length += edge / count
+
+    return length
+
+
+def reachable_moving_spaces(moving: Mapping[int, dict], start: int) -> set[int]:
+    """start 이동 구역에서 near_moving_space_id를 따라 갈 수 있는 이동 구역 (start 포함)"""
+
+    if start not in moving:
+        return set()
+
+    visited = {start}
+    queue = deque([start])
+
+    while queue:
+        space_id = queue.popleft()
+        for near_id in moving[space_id]["near_moving_space_id"]:
+            if near_id in moving and near_id not in visited:
+                visited.add(near_id)
+                queue.append(near_id)
+
+    return visited
+
+
+def lint_layout(
+    parking: Mapping[int, dict],
+    moving: Mapping[int, dict],
+    gap_tolerance: float = GAP_TOLERANCE,
+    overlap_ratio: float = OVERLAP_RATIO,
+    min_contact_length: float = MIN_CONTACT_LENGTH,
+) -> list[str]:
+    """
+    validate_layout을 통과한 구역 데이터의 기하 문제를 찾는 함수 (경로 계산은 가능하지만 떨림, 재계산, 삭제의 원인)
+
+    - 겹침: 두 구역이 크게 겹치면 겹친 영역에서 구역 판정이 우선순위에 따라 바뀜
+    - 틈: 인접 구역으로 기록된 두 구역이 떨어져 있으면 그 사이를 지나는 차량이 구역 밖으로 판정되어 삭제됨
+    - 불일치: 맞닿은(틈과 같은 기준으로 gap_tolerance 이내, 꼭짓점만 닿은 경우 제외) 이동 구역이 서로의 인접 구역에 없으면
+      차량이 지나갈 때마다 경로 재계산
+    - 도달 불가: 입차 구역에서 갈 수 없는 주차 구역, 출구 구역으로 갈 수 없는 이동 구역
+
+    Returns:
+        list[str]: 경고 목록
+    """
+    warnings = []
+
+    zones = [("주차 구역", space_id, data) for space_id, data in parking.items()]
+    zones += [("이동 구역", space_id, data) for space_id, data in moving.items()]
+
+    for (kind_a, id_a, data_a), (kind_b, id_b, data_b) in itertools.combinations(zones, 2):
+        area = overlap_area(data_a["position"], data_b["position"])
+        if area <= 0:
+            continue
+
+        # 주차 구역과 인접 이동 구역의 겹침은 입차 위치이며 주차 구역이 우선이므로 제외
+        if kind_a == "주차 구역" and kind_b == "이동 구역" and data_a["near_moving_space_id"] == id_b:
+            continue
+
+        smaller = min(layout_manager.polygon_area(data_a["position"]), layout_manager.polygon_area(data_b["position"]))
+        if area >= smaller * overlap_ratio:
+            warnings.append(f"겹침: {kind_a} {id_a}({data_a['name']})와 {kind_b} {id_b}({data_b['name']})이(가) "
+                            f"{area:.0f}px² ({area / smaller * 100:.0f}%) 겹칩니다.")
+
+    for space_id, data in parking.items():
+        near_id = data["near_moving_space_id"]
+        distance = polygon_distance(data["position"], moving[near_id]["position"])
+        if distance > gap_tolerance:
+            warnings.append(f"틈: 주차 구역 {space_id}({data['name']})와 인접 이동 구역 {near_id} 사이가 {distance:.1f}px 떨어져 있습니다.")
+
+    for space_id, near_id in itertools.combinations(moving, 2):
+        distance = polygon_distance(moving[space_id]["position"], moving[near_id]["position"])
+
+        if near_id in moving[space_id]["near_moving_space_id"]:
+            if distance > gap_tolerance:
+                warnings.append(f"틈: 이동 구역 {space_id}와 {near_id} 사이가 {distance:.1f}px 떨어져 있습니다.")
+
+        # 맞닿은(겹치거나 틈 기준 이내) 이동 구역인데 인접 구역으로 기록되지 않은 경우
+        elif (distance <= gap_tolerance
+              and contact_length(moving[space_id]["position"], moving[near_id]["position"], gap_tolerance) >= min_contact_length):
+            warnings.append(f"불일치: 이동 구역 {space_id}({moving[space_id]['name']})와 {near_id}({moving[near_id]['name']})이(가) "
+                            f"맞닿아 있지만 인접 구역이 아닙니다.")
+
+    from_entry = reachable_moving_spaces(moving, sr.ENTRY_MOVING_SPACE_ID)
+    for space_id, data in parking.items():
+        if data["near_moving_space_id"] not in from_entry:
+            warnings.append(f"도달 불가: 주차 구역 {space_id}({data['name']})은(는) 입차 구역에서 갈 수 없습니다.")
+
+    # 인접 이동 구역은 양쪽에 기록되어 있으므로(validate_layout) 출구에서 갈 수 있으면 출구로도 갈 수 있음
+    to_exit = reachable_moving_spaces(moving, layout_manager.EXIT_MOVING_SPACE_ID)
+    for space_id, data in moving.items():
+        if space_id not in to_exit:
+            warnings.append(f"도달 불가: 이동 구역 {space_id}({data['name']})에서 출구 구역으로 갈 수 없습니다.")
+
+    return warnings
+
+
+class BoundaryStats:
+    """구역 경계 하나에서 재생 중 발생한 횟수"""
+
+    __slots__ = ("raw_changes", "transitions", "reroutes", "deletions")
+
+    def __init__(self) -> None:
+        self.raw_changes: int = 0   # 필터 전 구역 판정이 바뀐 횟수 (경계의 떨림)
+        self.transitions: int = 0   # 필터를 거쳐 확정된 구역 전환 횟수
+        self.reroutes: int = 0      # 경로 재계산 횟수 (직전에 떠난 이동 구역으로 돌아온 경우, 이미 경로에서 제거된 구역)
+        self.deletions: int = 0     # 구역 밖으로 확정되어 roop에서 차량이 삭제된 횟수
+
+    def cost(self) -> tuple[int, int, int]:
+        """정렬 기준 (재계산 + 삭제, 확정된 전환, 판정 변화 순으로 비교)"""
+
+        return self.reroutes + self.deletions, self.transitions, self.raw_changes
+
+
+def boundary_key(a: ZoneKey, b: ZoneKey) -> Boundary:
+    """두 구역 사이 경계의 키 (방향 무관)"""
+
+    return tuple(sorted((a, b), key=lambda zone: (zone is None, zone or ("", 0))))
+
+
+def replay_track_log(
+    frames: Iterable[tuple[float, Mapping[int, tuple[float, float]]]],
+    parking_spaces: Mapping[int, sr.ParkingSpace],
+    moving_spaces: Mapping[int, sr.MovingSpace],
+    zone_filter: Optional[ZoneTransitionFilter] = None,
+) -> dict[Boundary, BoundaryStats]:
+    """
+    기록한 추적 데이터를 roop와 같은 구역 전환 필터로 재생하여 경계별 횟수를 세는 함수
+
+    경로는 계산하지 않으므로 재계산은 직전에 떠난 이동 구역으로 돌아온 경우만 셈 (해당 구역은 pop_route로 이미 제거됨)
+    구역 밖으로 삭제되거나 출구에 도착한 차량은 roop와 같이 이후 프레임을 무시
+
+    Args:
+        frames: read_track_log의 결과 (수신 시각, 차량 ID -> 좌표)
+        zone_filter: 구역 전환 필터 (None이면 shortest_route.zone_filter와 같은 설정)
+
+    Returns:
+        dict: 경계 -> 횟수
+    """
+    if zone_filter is None:
+        zone_filter = ZoneTransitionFilter(sr.zone_filter.min_dwell_frames, sr.zone_filter.boundary_margin, sr.zone_filter.smoothing)
+
+    stats: dict[Boundary, BoundaryStats] = {}
+    raw_zones: dict[int, ZoneKey] = {}          # 차량별 직전 프레임의 필터 전 구역
+    zones: dict[int, ZoneKey] = {}              # 차량별 확정된 구역
+    left_moving: dict[int, int] = {}            # 차량별 직전에 떠난 이동 구역
+    finished: set[int] = set()                  # 삭제되거나 출차한 차량
+
+    def boundary_stats(a: ZoneKey, b: ZoneKey) -> BoundaryStats:
+        return stats.setdefault(boundary_key(a, b), BoundaryStats())
+
+    for _, car_tracks in frames:
+        for car_id, position in car_tracks.items():
+            if car_id in finished:
+                continue
+
+            raw_zone = zone_filter.classify(position, parking_spaces, moving_spaces)
+            if car_id in raw_zones and raw_zones[car_id] != raw_zone:
+                boundary_stats(raw_zones[car_id], raw_zone).raw_changes += 1
+            raw_zones[car_id] = raw_zone
+
+            kind, space = zone_filter.update(car_id, position, parking_spaces, moving_spaces)
+            zone = (kind, space.space_id) if space is not None else None
+
+            if car_id not in zones:
+                zones[car_id] = zone
+                continue
+
+            previous = zones[car_id]
+            if zone == previous:
+                continue
+
+            boundary = boundary_stats(previous, zone)
+            boundary.transitions += 1
+            zones[car_id] = zone
+
+            if zone is None:
+                boundary.deletions += 1
+                finished.add(car_id)
+                zone_filter.forget(car_id)
+                continue
+
+            if zone == ("moving", layout_manager.EXIT_MOVING_SPACE_ID):
+                finished.add(car_id)
+                zone_filter.forget(car_id)
+                continue
+
+            if previous is not None and previous[0] == "moving" and zone[0] == "moving":
+                if left_moving.get(car_id) == zone[1]:
+                    boundary.reroutes += 1
+                left_moving[car_id] = previous[1]
+
+    return stats
+
+
+def rank_hotspots(stats: Mapping[Boundary, BoundaryStats], top: Optional[int] = None) -> list[tuple[Boundary, BoundaryStats]]:
+    """비용이 큰 경계부터 정렬 (top개까지)"""
+
+    ranked = sorted(stats.items(), key=lambda item: item[1].cost(), reverse=True)
+    return ranked[:top] if top is not None else ranked
+
+
+def zone_name(zone: ZoneKey, parking: Mapping[int, dict], moving: Mapping[int, dict]) -> str:
+    """출력용 구역 이름"""
+
+    if zone is None:
+        return "구역 밖"
+
+    kind, space_id = zone
+    data = parking if kind == "parking" else moving
+    return f"{'주차' if kind == 'parking' else '이동'} {space_id}({data[space_id]['name']})"
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """구역 데이터를 검사하고 추적 기록이 있으면 경계별 비용 순위를 출력하는 명령"""
+
+    parser = argparse.ArgumentParser(description="구역 데이터 기하 검사와 추적 기록 재생 분석")
+    parser.add_argument("--parking", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "parking_space.json"))
+    parser.add_argument("--moving", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "moving_space.json"))
+    parser.add_argument("--track-log", help="main.py의 TRACK_LOG_PATH로 기록한 추적 데이터 (JSON Lines)")
+    parser.add_argument("--gap", type=float, default=GAP_TOLERANCE, help="틈으로 판단할 구역 사이 거리 (px)")
+    parser.add_argument("--overlap", type=float, default=OVERLAP_RATIO, help="경고할 겹침 비율 (작은 구역 넓이 기준)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 경계 수")
+    args = parser.parse_args(argv)
+
+    parking, moving, _ = layout_bundle.load_layout_data(args.parking, args.moving)
+
+    errors = layout_manager.validate_layout(parking, moving)
+    if errors:
+        print("구역 데이터가 올바르지 않습니다:")
+        for error in errors:
+            print(f"  - {error}")
+        raise SystemExit(1)
+
+    warnings = lint_layout(parking, moving, args.gap, args.overlap)
+    print(f"\n[기하 검사] 경고 {len(warnings)}개")
+    for warning in warnings:
+        print(f"  - {warning}")
+
+    if args.track_log is None:
+        return
+
+    parking_spaces, moving_spaces = sr.build_spaces(parking, moving)
+    stats = replay_track_log(read_track_log(args.track_log), parking_spaces, moving_spaces)
+
+    print(f"\n[경계별 비용 순위] {args.track_log}")
+    print(f"{'순위':<4} {'경계':<40} {'재계산':>6} {'삭제':>6} {'전환':>6} {'판정 변화':>8}")
+    for rank, ((a, b), boundary) in enumerate(rank_hotspots(stats, args.top), start=1):
+        name = f"{zone_name(a, parking, moving)} - {zone_name(b, parking, moving)}"
+        print(f"{rank:<4} {name:<40} {boundary.reroutes:>6} {boundary.deletions:>6} {boundary.transitions:>6} {boundary.raw_changes:>8}")
+
+
+if __name__ == "__main__":
+    main()
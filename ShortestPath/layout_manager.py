@@ -0,0 +1,337 @@
+# 구역 데이터(parking_space.json, moving_space.json)의 변경을 감지하여 검증하고, 새 구역 인스턴스를 미리 만들어 두는 모듈
+# 실제 교체는 shortest_route.roop가 프레임 사이에서 apply_layout으로 수행 (프로그램을 재시작하지 않고 구역 보정)
+
+from __future__ import annotations
+import json
+import os
+import threading
+from typing import Any, Callable, Mapping, Optional
+
+from zone_map import ZoneMap
+
+import display_direction
+import layout_bundle
+import shortest_route as sr
+
+# 출구 구역 (이동 구역 ID, shortest_route에서 고정으로 사용)
+EXIT_MOVING_SPACE_ID = 1
+
+
+class StagedLayout:
+    """검증을 마치고 roop에서 교체할 준비가 된 구역 데이터"""
+
+    __slots__ = ("version", "parking_data", "moving_data", "parking_spaces", "moving_spaces", "direction_table", "zone_map")
+
+    def __init__(
+        self,
+        version: int,
+        parking_data: dict[int, dict],
+        moving_data: dict[int, dict],
+        parking_spaces: dict[int, sr.ParkingSpace],
+        moving_spaces: dict[int, sr.MovingSpace],
+        direction_table: dict,
+        zone_map: Optional[ZoneMap] = None,
+    ) -> None:
+        self.version: int = version
+        self.parking_data: dict[int, dict] = parking_data       # 정수 키로 변환한 json 데이터 (GUI 표시용)
+        self.moving_data: dict[int, dict] = moving_data
+        self.parking_spaces: dict[int, sr.ParkingSpace] = parking_spaces
+        self.moving_spaces: dict[int, sr.MovingSpace] = moving_spaces
+        self.direction_table: dict = direction_table
+        self.zone_map: Optional[ZoneMap] = zone_map                # 구역 라벨 이미지 (None이면 다각형 판정만 사용)
+
+
+def parse_space_keys(data: Any, kind: str) -> dict[int, dict]:
+    """json의 문자열 키를 정수로 변환 (올바르지 않은 키는 ValueError)"""
+
+    if not isinstance(data, dict):
+        raise ValueError(f"{kind} 데이터는 구역 ID를 키로 하는 객체여야 합니다.")
+
+    try:
+        return {int(key): value for key, value in data.items()}
+    except (TypeError, ValueError):
+        raise ValueError(f"{kind} 구역 ID는 정수여야 합니다.") from None
+
+
+def is_int(value: Any) -> bool:
+    """bool을 제외한 정수인지 확인"""
+
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def check_polygon(position: Any) -> bool:
+    """구역 좌표가 3개 이상의 (x, y) 꼭짓점인지 확인"""
+
+    if not isinstance(position, list) or len(position) < 3:
+        return False
+
+    return all(
+        isinstance(point, (list, tuple)) and len(point) == 2
+        and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in point)
+        for point in position
+    )
+
+
+def polygon_area(position: Any) -> float:
+    """
+    구역 좌표의 부호 있는 넓이 (신발끈 공식, 이미지 좌표)
+
+    꼭짓점이 좌상단, 우상단, 우하단, 좌하단 순서(화면에서 시계방향)이면 양수
+    """
+    n = len(position)
+    return sum(position[i][0] * position[(i + 1) % n][1] - position[(i + 1) % n][0] * position[i][1] for i in range(n)) / 2
+
+
+def validate_layout(parking: Mapping[int, dict], moving: Mapping[int, dict]) -> list[str]:
+    """
+    구역 데이터가 경로 계산에 사용할 수 있는지 확인하는 함수
+
+    - 필수 항목과 좌표 형식, 꼭짓점 순서 (좌상단부터 시계방향, 웹 좌표 변환과 경계 판정에 사용)
+    - 인접 구역 ID가 실제로 존재하는지, 주차 구역과 이동 구역의 연결이 양쪽에 모두 기록되어 있는지
+    - 출구 구역과 입차 구역이 있는지
+
+    Returns:
+        list[str]: 문제 목록 (비어 있으면 사용 가능)
+    """
+    errors = []
+
+    for space_id, data in parking.items():
+        if not isinstance(data, dict) or not isinstance(data.get("name"), str):
+            errors.append(f"주차 구역 {space_id}: name이 없습니다.")
+            continue
+
+        if not check_polygon(data.get("position")):
+            errors.append(f"주차 구역 {space_id}: position은 3개 이상의 [x, y] 좌표여야 합니다.")
+
+        elif polygon_area(data["position"]) <= 0:
+            errors.append(f"주차 구역 {space_id}: 꼭짓점이 시계방향(좌상단, 우상단, 우하단, 좌하단)이 아니거나 넓이가 0입니다.")
+
+        near_moving_space_id = data.get("near_moving_space_id")
+        if not is_int(near_moving_space_id) or near_moving_space_id not in moving:
+            errors.append(f"주차 구역 {space_id}: 인접 이동 구역 {near_moving_space_id}이(가) 없습니다.")
+
+        elif space_id not in (moving[near_moving_space_id].get("near_parking_space_id") or []):
+            errors.append(f"주차 구역 {space_id}: {near_moving_space_id}번 이동 구역의 near_parking_space_id에 없습니다.")
+
+    for space_id, data in moving.items():
+        if not isinstance(data, dict) or not isinstance(data.get("name"), str):
+            errors.append(f"이동 구역 {space_id}: name이 없습니다.")
+            continue
+
+        if not check_polygon(data.get("position")):
+            errors.append(f"이동 구역 {space_id}: position은 3개 이상의 [x, y] 좌표여야 합니다.")
+
+        elif polygon_area(data["position"]) <= 0:
+            errors.append(f"이동 구역 {space_id}: 꼭짓점이 시계방향(좌상단, 우상단, 우하단, 좌하단)이 아니거나 넓이가 0입니다.")
+
+        if not is_int(data.get("congestion")):
+            errors.append(f"이동 구역 {space_id}: congestion은 정수여야 합니다.")
+
+        near_parking_space_ids = data.get("near_parking_space_id")
+        near_moving_space_ids = data.get("near_moving_space_id")
+
+        if not isinstance(near_parking_space_ids, list) or not all(is_int(value) for value in near_parking_space_ids):
+            errors.append(f"이동 구역 {space_id}: near_parking_space_id는 정수 목록이어야 합니다.")
+
+        else:
+            for parking_space_id in near_parking_space_ids:
+                # -1은 출구 구역을 나타내는 값
+                if parking_space_id != -1 and parking_space_id not in parking:
+                    errors.append(f"이동 구역 {space_id}: 인접 주차 구역 {parking_space_id}이(가) 없습니다.")
+
+        if not isinstance(near_moving_space_ids, list) or not all(is_int(value) for value in near_moving_space_ids):
+            errors.append(f"이동 구역 {space_id}: near_moving_space_id는 정수 목록이어야 합니다.")
+            continue
+
+        for moving_space_id in near_moving_space_ids:
+            if moving_space_id == space_id or moving_space_id not in moving:
+                errors.append(f"이동 구역 {space_id}: 인접 이동 구역 {moving_space_id}이(가) 없습니다.")
+
+            elif space_id not in (moving[moving_space_id].get("near_moving_space_id") or []):
+                errors.append(f"이동 구역 {space_id}: {moving_space_id}번 이동 구역과의 연결이 한쪽에만 있습니다.")
+
+    for moving_space_id, name in ((EXIT_MOVING_SPACE_ID, "출구"), (sr.ENTRY_MOVING_SPACE_ID, "입차")):
+        if moving_space_id not in moving:
+            errors.append(f"{name} 구역({moving_space_id}번 이동 구역)이 없습니다.")
+
+    return errors
+
+
+def prepare_layout(
+    parking_data: Any,
+    moving_data: Any,
+    version: int = 0,
+    direction_table: Optional[dict] = None,
+    zone_map_factory: Optional[Callable[[Mapping[int, sr.ParkingSpace], Mapping[int, sr.MovingSpace]], ZoneMap]] = None,
+) -> StagedLayout:
+    """
+    구역 json 데이터를 검증하고 구역 인스턴스와 디스플레이 방향 테이블을 미리 생성하는 함수
+
+    roop를 멈추지 않도록 감시 쓰레드 또는 flask 쓰레드에서 호출 (전역 구역 데이터는 변경하지 않음)
+    direction_table: 구역 번들에 미리 계산된 방향 테이블 (None이면 계산)
+    zone_map_factory: (주차 구역, 이동 구역) -> 구역 라벨 이미지 (None이면 라벨 이미지 없음)
+
+    Raises:
+        ValueError: 구역 데이터가 올바르지 않은 경우 (문제마다 한 줄)
+    """
+    parking = parse_space_keys(parking_data, "주차 구역")
+    moving = parse_space_keys(moving_data, "이동 구역")
+
+    errors = validate_layout(parking, moving)
+    if errors:
+        raise ValueError("\n".join(errors))
+
+    parking_spaces, moving_spaces = sr.build_spaces(parking, moving)
+    if direction_table is None:
+        direction_table = display_direction.build_direction_table(parking_spaces, moving_spaces, install=False)
+
+    zone_map = zone_map_factory(parking_spaces, moving_spaces) if zone_map_factory is not None else None
+
+    return StagedLayout(version, parking, moving, parking_spaces, moving_spaces, direction_table, zone_map)
+
+
+class LayoutManager:
+    """
+    구역 데이터 교체 관리 클래스
+
+    - watch: 구역 파일의 수정 시각을 주기적으로 확인하여 바뀐 경우 다시 읽음 (draw_poligon.py로 저장한 경우)
+    - submit: flask_server의 /layout으로 받은 구역 데이터를 검증하고 파일에 저장
+    - take_pending: roop가 프레임 사이에서 준비된 구역 데이터를 가져감 (여러 번 바뀐 경우 마지막 데이터만 교체)
+
+    검증에 실패한 구역 데이터는 교체하지 않으며, 기존 구역으로 계속 동작
+    """
+
+    def __init__(self, parking_space_path: str, moving_space_path: str, poll_interval: float = 1.0, bundle_path: Optional[str] = None) -> None:
+        """
+        Args:
+            parking_space_path, moving_space_path: 구역 데이터 경로 (shortest_route.initialize_space와 동일)
+            poll_interval: 파일 수정 시각 확인 주기 (초)
+            bundle_path: 컴파일된 구역 번들 경로 (다시 컴파일하면 번들로 교체, json만 수정하면 json으로 교체)
+        """
+        self.parking_space_path: str = parking_space_path
+        self.moving_space_path: str = moving_space_path
+        self.poll_interval: float = poll_interval
+        self.bundle_path: Optional[str] = bundle_path
+
+        # 새 구역의 라벨 이미지 생성 함수 (shortest_route.main과 동일, None이면 라벨 이미지 없이 교체)
+        self.zone_map_factory: Optional[Callable[[Mapping[int, sr.ParkingSpace], Mapping[int, sr.MovingSpace]], ZoneMap]] = None
+
+        self.lock = threading.Lock()
+        self.version: int = 0
+        self.pending: Optional[StagedLayout] = None
+        self.file_mtimes: tuple[Optional[int], ...] = self.read_mtimes()
+
+        # 구역 데이터가 교체될 때 호출할 함수 (parking_data, moving_data), GUI와 미리보기 구역 표시 갱신에 사용
+        self.listeners: list[Callable[[dict[int, dict], dict[int, dict]], None]] = []
+
+    def read_mtimes(self) -> tuple[Optional[int], ...]:
+        """구역 파일(과 번들)의 수정 시각 (파일이 없으면 None)"""
+
+        mtimes = []
+        for path in (self.parking_space_path, self.moving_space_path, self.bundle_path):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns if path is not None else None)
+            except OSError:
+                mtimes.append(None)
+
+        return tuple(mtimes)
+
+    def add_listener(self, listener: Callable[[dict[int, dict], dict[int, dict]], None]) -> None:
+        """구역 데이터 교체 시 호출할 함수 등록"""
+
+        self.listeners.append(listener)
+
+    def set_pending(self, layout: StagedLayout) -> StagedLayout:
+        """준비한 구역 데이터를 교체 대기 데이터로 설정 (self.lock 안에서 호출)"""
+
+        self.version = layout.version
+        self.pending = layout
+
+        print(f"구역 데이터 {layout.version}번 준비 완료: 주차 구역 {len(layout.parking_spaces)}개, 이동 구역 {len(layout.moving_spaces)}개")
+
+        return layout
+
+    def check_files(self) -> Optional[StagedLayout]:
+        """
+        구역 파일이 바뀐 경우 다시 읽어 교체 대기 데이터로 설정하는 함수
+
+        두 파일 중 하나만 저장되어 검증에 실패한 경우에도 수정 시각은 기록하므로, 나머지 파일이 저장되면 다시 확인
+
+        Returns:
+            Optional[StagedLayout]: 새로 준비한 구역 데이터, 바뀌지 않았거나 검증에 실패하면 None
+        """
+        with self.lock:
+            mtimes = self.read_mtimes()
+            if mtimes == self.file_mtimes:
+                return None
+            self.file_mtimes = mtimes
+
+            try:
+                # 번들이 json과 같으면 번들의 방향 테이블도 사용
+                parking_data, moving_data, bundle = layout_bundle.load_layout_data(self.parking_space_path, self.moving_space_path, self.bundle_path)
+                direction_table = bundle.direction_table if bundle is not None else None
+
+                return self.set_pending(prepare_layout(parking_data, moving_data, self.version + 1, direction_table, self.zone_map_factory))
+
+            except (OSError, ValueError) as e:
+                # json.JSONDecodeError도 ValueError
+                print(f"구역 파일 변경을 적용하지 않음:\n{e}")
+                return None
+
+    def submit(self, parking_data: Any, moving_data: Any, persist: bool = True) -> StagedLayout:
+        """
+        구역 데이터를 검증하고 교체 대기 데이터로 설정하는 함수 (flask_server 쓰레드에서 호출)
+
+        Args:
+            parking_data, moving_data: 구역 json 데이터
+            persist: 구역 파일에도 저장할지 여부 (재시작 후에도 유지)
+
+        Raises:
+            ValueError: 구역 데이터가 올바르지 않은 경우 (파일과 구역은 변경하지 않음)
+            OSError: 구역 파일 저장에 실패한 경우 (구역은 변경하지 않음)
+        """
+        with self.lock:
+            layout = prepare_layout(parking_data, moving_data, self.version + 1, zone_map_factory=self.zone_map_factory)
+
+            if persist:
+                self.write_file(self.parking_space_path, parking_data)
+                self.write_file(self.moving_space_path, moving_data)
+
+                # 직접 저장한 변경은 check_files에서 다시 읽지 않음
+                self.file_mtimes = self.read_mtimes()
+
+            return self.set_pending(layout)
+
+    @staticmethod
+    def write_file(path: str, data: Any) -> None:
+        """임시 파일에 쓴 뒤 교체하여 다른 프로그램이 저장 중인 파일을 읽지 않도록 함"""
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def take_pending(self) -> Optional[StagedLayout]:
+        """
+        준비된 구역 데이터를 꺼내는 함수 (roop에서 프레임마다 호출, 없으면 None)
+
+        꺼낸 구역 데이터는 등록된 listener에 전달
+        """
+        if self.pending is None:
+            return None
+
+        with self.lock:
+            layout, self.pending = self.pending, None
+
+        if layout is not None:
+            for listener in self.listeners:
+                listener(layout.parking_data, layout.moving_data)
+
+        return layout
+
+    def watch(self, stop_event) -> None:
+        """구역 파일 감시 루프 (쓰레드에서 실행, stop_event가 설정되면 종료)"""
+
+        while not stop_event.is_set():
+            self.check_files()
+            stop_event.wait(self.poll_interval)
@@ -1,68 +1,29 @@
 # 각 쓰레드를 생성하고 변수를 부여하여 시작하는 메인 프로그램
 
 import threading
+import functools
+import multiprocessing as mp
 from queue import Queue, Empty
 import cv2
-# import yolo_tracking_deep_sort as yolo_deep_sort
-import yolo_tracking_bytetrack as yolo_deep_sort
+import detection_tracking
 import send_to_server as server
 import platform
-import json
-import numpy as np
+import os
+import time
 import flask_server
-from shortest_route import Car, CarStatus
+from shortest_route import Car
+from gui_overlay import StaticOverlay, draw_car
+from preview_stream import PreviewStream
+from web_position import WebHomographyCache
 import shortest_route as sr
-
-# 프레임에 주차 구역 및 이동 구역을 표시하는 함수
-def draw_spaces(image, parking_data, moving_data):
-    # 주차 구역 흰색으로 표시
-    for space in parking_data.values():
-        points = np.array(space["position"], np.int32)
-        cv2.polylines(image, [points], isClosed=True, color=RED, thickness=2)
-        centroid = points.mean(axis=0).astype(int)
-        cv2.putText(image, space["name"], (centroid[0], centroid[1]), cv2.FONT_HERSHEY_SIMPLEX, 0.6, WHITE, 2)
-
-    # 이동 구역 파랑색으로 표시
-    for space in moving_data.values():
-        points = np.array(space["position"], np.int32)
-        cv2.polylines(image, [points], isClosed=True, color=BLUE, thickness=2)
-        centroid = points.mean(axis=0).astype(int)
-        cv2.putText(image, space["name"], (centroid[0], centroid[1]), cv2.FONT_HERSHEY_SIMPLEX, 0.6, BLUE, 2)
-
-    return image
-
-def draw_car(frame, ltrb, car: Car):
-
-    xmin, ymin, xmax, ymax = int(ltrb[0]), int(ltrb[1]), int(ltrb[2]), int(ltrb[3])
- 
-    # 주차를 위해 움직이는 차량은 초록색 사각형 및 번호 표시
-    if car.status == CarStatus.ENTRY:
-        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), GREEN, 2)
-        cv2.rectangle(frame, (xmin, ymin - 35), (xmin + 75, ymin), GREEN, -1)
-        cv2.putText(frame, str(car.car_number), (xmin + 5, ymin - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
-    
-    # 주차한 차량은 빨강색 사각형 및 번호 표시
-    elif car.status == CarStatus.PARKING:
-        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), RED, 2)
-        cv2.rectangle(frame, (xmin, ymin - 35), (xmin + 75, ymin), RED, -1)
-        cv2.putText(frame, str(car.car_number), (xmin + 5, ymin - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
-
-    # 출차를 위해 움직이는 차량은 노랑색 사각형 및 번호 표시
-    else:
-        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), YELLOW, 2)
-        cv2.rectangle(frame, (xmin, ymin - 35), (xmin + 75, ymin), YELLOW, -1)
-        cv2.putText(frame, str(car.car_number), (xmin + 5, ymin - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
-
-def load_json(filename):
-    with open(filename, 'r') as file:
-        return json.load(file)
-
-
-RED = (0, 0, 255)
-WHITE = (255, 255, 255)
-BLUE = (255, 0, 0)
-GREEN = (0, 255, 0)
-YELLOW = (0, 255, 255)
+import multi_camera
+import tracker_process
+import kalman_tracker
+from layout_manager import LayoutManager
+import layout_bundle
+import zone_map
+import frame_preprocess
+from track_log import TrackLogWriter
 
 if platform.system() == "Darwin":
     # 서버 주소 및 포트 (Socket.IO)
@@ -79,6 +40,14 @@ if platform.system() == "Darwin":
     FRAME_WIDTH = 1920
     FRAME_HEIGHT = 1080
 
+    # 경로 안내 디스플레이 시리얼 포트 -> 담당 디스플레이 번호 (DISPLAY_SPACE 순서)
+    DISPLAY_SERIAL_PORTS = {}
+
+    # 다중 카메라 설정 (비어 있으면 VIDEO_SOURCE 한 대만 사용)
+    # 각 카메라의 구역 JSON은 해당 카메라의 픽셀 좌표로 작성하고, 구역 ID는 PARKING_SPACE_PATH/MOVING_SPACE_PATH와 동일하게 사용
+    # 예: {"camera_id": 0, "video_source": 0, "parking_space_path": "...", "moving_space_path": "..."}
+    CAMERAS = []
+
 elif platform.system() == "Windows":
     # 서버 주소 및 포트
     URI = "http://127.0.0.1:5002"
@@ -94,6 +63,14 @@ elif platform.system() == "Windows":
     FRAME_WIDTH = 1920
     FRAME_HEIGHT = 1080
 
+    # 경로 안내 디스플레이 시리얼 포트 -> 담당 디스플레이 번호 (DISPLAY_SPACE 순서)
+    DISPLAY_SERIAL_PORTS = {}
+
+    # 다중 카메라 설정 (비어 있으면 VIDEO_SOURCE 한 대만 사용)
+    # 각 카메라의 구역 JSON은 해당 카메라의 픽셀 좌표로 작성하고, 구역 ID는 PARKING_SPACE_PATH/MOVING_SPACE_PATH와 동일하게 사용
+    # 예: {"camera_id": 0, "video_source": 0, "parking_space_path": "...", "moving_space_path": "..."}
+    CAMERAS = []
+
 else:   # Linux (Jetson)
     # 서버 주소 및 포트 (Socket.IO)
     URI = "http://192.168.0.48:3000"
@@ -109,125 +86,403 @@ else:   # Linux (Jetson)
     FRAME_WIDTH = 1920
     FRAME_HEIGHT = 1080
 
-# 프로그램 종료 플래그
-stop_event = threading.Event()
-init_event = threading.Event()
-
-# 공유할 데이터 큐
-yolo_data_queue = Queue()
-car_number_data_queue = Queue()
-car_number_response_queue = Queue() # 입차기에 응답할 데이터
-route_data_queue = Queue()
-frame_queue = Queue(maxsize=2)    # gui에 표시할 이미지
-id_match_car_number_queue: Queue[dict[int, Car]] = Queue(maxsize=2)
-exit_queue = Queue()
-
-# 쓰레드 생성
-thread1 = threading.Thread(
-    target=yolo_deep_sort.main, 
-    kwargs={
-        "yolo_data_queue": yolo_data_queue, 
-        "frame_queue": frame_queue, 
-        "event": init_event, 
-        "model_path": MODEL_PATH, 
-        "video_source": VIDEO_SOURCE,
-        "frame_width": FRAME_WIDTH,
-        "frame_height": FRAME_HEIGHT,
-        "stop_event": stop_event, # 성능 체크
+    # 경로 안내 디스플레이 시리얼 포트 -> 담당 디스플레이 번호 (DISPLAY_SPACE 순서)
+    DISPLAY_SERIAL_PORTS = {
+        "/dev/ttyUSB0": (1, 2, 3),
+        "/dev/ttyUSB1": (4, 5, 6),
     }
-)
-
-thread2 = threading.Thread(
-    target=sr.main, 
-    kwargs={
-        "yolo_data_queue": yolo_data_queue, 
-        "car_number_data_queue": car_number_data_queue, 
-        "route_data_queue": route_data_queue, 
-        "event": init_event, 
-        "parking_space_path": PARKING_SPACE_PATH, 
-        "moving_space_path": MOVING_SPACE_PATH, 
-        "id_match_car_number_queue": id_match_car_number_queue,
-        "car_number_response_queue": car_number_response_queue,
-        "exit_queue": exit_queue,
-    }
-)
 
-thread3 = threading.Thread(
-    target=flask_server.run_flask_server,
-    kwargs={
-        "car_number_data_queue": car_number_data_queue,
-        "response_data_queue": car_number_response_queue,
-    }
-)
-
-thread4 = threading.Thread(
-    target=server.send_to_server, 
-    kwargs={
-        "uri": URI, 
-        "route_data_queue": route_data_queue,
-        "exit_queue": exit_queue,
-    }
-)
+    # 다중 카메라 설정 (비어 있으면 VIDEO_SOURCE 한 대만 사용)
+    # 각 카메라의 구역 JSON은 해당 카메라의 픽셀 좌표로 작성하고, 구역 ID는 PARKING_SPACE_PATH/MOVING_SPACE_PATH와 동일하게 사용
+    # 예: {"camera_id": 0, "video_source": 0, "parking_space_path": "...", "moving_space_path": "..."}
+    CAMERAS = []
 
-# 쓰레드 시작
-thread1.start()
-thread2.start()
-thread3.start()
-thread4.start()
+# 탐지/추적 백엔드 (detection_backend.BACKENDS)
+# - "bytetrack": ultralytics YOLO + 내장 ByteTrack, "deepsort": ultralytics YOLO + DeepSORT
+# - "onnx": ONNX Runtime CPU + NumPy ByteTrack (torch 없이 실행, MODEL_PATH를 .onnx 모델로 지정)
+# - "auto": MODEL_PATH(.pt)를 ONNX, INT8 ONNX, OpenVINO, TensorRT로 변환하여 측정하고 정확도 기준을 만족하는 가장 빠른 모델 사용
+#           (model_manager, 변환/측정 결과는 .pt 옆에 저장하여 다음 실행부터는 바로 사용)
+DETECTION_BACKEND = "bytetrack"
+DETECTION_BACKEND_OPTIONS = {}  # 백엔드 생성자 추가 설정 (예: onnx의 {"num_threads": 4})
+# "deepsort"는 정지 차량 등의 외형 임베딩을 재사용 (embedding_cache, 끄려면 {"embedding_cache": False})
+# "auto"일 때는 model_manager.select_backend 설정 (예: {"min_agreement": 0.9, "backend_options": {"onnx": {"num_threads": 4}}})
 
-parking_data = load_json(PARKING_SPACE_PATH)
-moving_data = load_json(MOVING_SPACE_PATH)
+# 탐지 모델 입력 크기 (ultralytics imgsz, "auto"는 이 크기로 변환, onnx는 변환할 때의 크기를 사용)
+# python tune_imgsz.py로 녹화 영상에서 인접한 주차 구역을 구분하는 가장 작은 크기를 확인하여 설정
+INFERENCE_SIZE = 640
+# 구역(주차, 이동)이 있는 영역만 잘라 INFERENCE_SIZE로 한 번만 축소하여 탐지 (None이면 프레임 전체)
+# 값은 구역 바깥으로 넓히는 픽셀 수 (구역 경계에 걸친 차량이 잘리지 않도록, 실행 중 구역을 수정해도 시작할 때의 영역 사용)
+INFERENCE_CROP_MARGIN = 80
+
+# VIDEO_SOURCE(카메라 설정의 video_source 포함)가 동영상 파일이나 이미지 폴더일 때 원래 FPS로 재생 (카메라와 같이 늦으면 프레임을 건너뜀)
+# False이면 최대 속도로 모든 프레임을 처리 (트래커 처리량 측정용, python detection_tracking.py MODEL SOURCE --fast와 같음)
+# VIDEO_SOURCE 형식: 카메라 번호, "/dev/video0", "rtsp://...", 이미지 폴더, 동영상 파일, "live:동영상 파일"(RTSP 대신 반복 재생)
+FRAME_SOURCE_REALTIME = True
+
+# 트래커를 별도의 프로세스에서 실행 (프레임은 공유 메모리, 추적 결과는 파이프로 전달하여 GIL 경합 방지)
+TRACKER_PROCESS = False
+
+# 트래커와 경로 계산 사이에서 중심점을 칼만 필터로 평활화 (추론이 늦거나 잠시 끊긴 프레임은 예측 위치로 채움)
+KALMAN_SMOOTHING = True
+KALMAN_OUTPUT_FPS = 15      # 새 추적 데이터가 없을 때 예측 위치를 보내는 최대 FPS
+KALMAN_MAX_DROPOUT = 1.0    # 추적이 끊긴 차량을 예측 위치로 유지하는 시간 (초), 이후 lost_tracking_time으로 처리
+
+# 입차기 요청(/entry) 시 주차 구역을 바로 예약하고 응답에 포함 (False이면 차량이 입차 구역에 나타날 때까지 응답 대기)
+BAY_RESERVATION = True
+
+# 컴파일된 구역 번들 (python layout_bundle.py로 생성, 없거나 json보다 오래되면 json 사용)
+LAYOUT_BUNDLE_PATH = os.path.join(os.path.dirname(PARKING_SPACE_PATH), "layout_bundle.npz")
+
+# 구역 라벨 이미지 (차량 좌표의 구역 확인을 배열 조회 한 번으로 처리, 없거나 구역 데이터와 다르면 생성하여 저장)
+ZONE_MAP_PATH = os.path.join(os.path.dirname(PARKING_SPACE_PATH), "zone_map.npy")
+ZONE_MAP_SCALE = 1.0        # 라벨 이미지 축소 비율 (젯슨 등 메모리가 부족하면 0.25, 경계 칸만 다각형 판정)
+
+# 경로 계산 쓰레드가 받은 추적 데이터를 기록 (python layout_lint.py --track-log로 재생하여 보정할 구역 경계 확인, None이면 기록하지 않음)
+TRACK_LOG_PATH = None       # 예: os.path.join(os.path.dirname(os.path.abspath(__file__)), "tracking_file", "track_log.jsonl")
+
+# 구역 파일이 바뀌거나 flask_server의 /layout으로 구역 데이터를 받으면 재시작 없이 교체
+LAYOUT_HOT_RELOAD = True
+LAYOUT_POLL_INTERVAL = 1.0  # 구역 파일 수정 시각 확인 주기 (초)
+
+# OpenCV 창 없이 실행 (운영 환경에서 GUI가 경로 계산과 CPU를 경쟁하지 않도록, CAMERAS를 설정하면 항상 GUI 없이 실행)
+HEADLESS = False
+
+# GUI 표시 최대 FPS (트래킹 FPS와 별개로 화면 갱신 횟수 제한)
+DISPLAY_FPS = 10
+
+# GUI 표시 축소 비율 (1.0이면 원본 크기)
+PREVIEW_SCALE = 0.5
+
+# flask_server의 /preview로 MJPEG 미리보기 제공 (시청자가 있을 때만 인코딩)
+PREVIEW_STREAM = True
+PREVIEW_STREAM_FPS = 5
+PREVIEW_STREAM_SCALE = 0.5
+
+def run_headless(stop_event, frame_queue, id_match_car_number_queue, preview):
+    """GUI 없이 종료 신호를 기다리는 메인 루프 (미리보기 스트림이 있으면 프레임 전달)"""
 
-try:
-    # 메인 루프에서 프레임을 받아 GUI 표시
     car_numbers = {}
-    while True:
+    while not stop_event.is_set():
+        # shortest_route가 막히지 않도록 차량 데이터 큐를 비움
         try:
+            if preview is None:
+                id_match_car_number_queue.get(timeout=0.5)
+                continue
+
             if not id_match_car_number_queue.empty():
                 car_numbers = id_match_car_number_queue.get_nowait()
 
-            frame, tracks = frame_queue.get(timeout=0.1)
+            lease, tracks = frame_queue.get(timeout=0.1)
+            try:
+                frame = lease.image
+                if frame is not None:
+                    preview.publish(frame, tracks, car_numbers)
+            finally:
+                lease.release()
+
+        except Empty:
+            continue
 
-            # 구역 작성
-            frame_with_space = draw_spaces(frame, parking_data, moving_data)
 
-            # 탐지한 객체 루프
-            for track in tracks:
-                if not track.is_confirmed():
-                    continue
-                track_id = int(track.track_id)
-                if track_id in car_numbers:
-                    draw_car(frame_with_space, track.to_ltrb(), car_numbers[track_id])
+def run_gui(stop_event, frame_queue, id_match_car_number_queue, preview, layout_manager, parking_data, moving_data):
+    """프레임을 받아 구역과 차량을 표시하는 메인 루프 (DISPLAY_FPS로 표시 횟수 제한, PREVIEW_SCALE로 축소)"""
 
-            # 젯슨 환경에서 GUI 사이즈 조절을 위해 필요
-            cv2.namedWindow("YOLO Tracking", cv2.WINDOW_NORMAL)
+    # 구역 표시는 한 번만 그려 두고 매 프레임 합성 (구역 데이터가 교체되면 다시 그림)
+    overlay = StaticOverlay(parking_data, moving_data, PREVIEW_SCALE)
+    if layout_manager is not None:
+        layout_manager.add_listener(overlay.set_layout)
 
-            # GUI 표시
-            cv2.imshow("YOLO Tracking", frame_with_space)
+    # 젯슨 환경에서 GUI 사이즈 조절을 위해 필요
+    cv2.namedWindow("YOLO Tracking", cv2.WINDOW_NORMAL)
 
-            # 키 입력 처리 (1ms 대기)
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                print("'q' 키 입력 - 프로그램 종료 중...")
-                stop_event.set()
-                break
+    display_interval = 1.0 / DISPLAY_FPS
+    last_display_time = 0.0
+
+    # 메인 루프에서 프레임을 받아 GUI 표시
+    car_numbers = {}
+    while True:
+        try:
+            if not id_match_car_number_queue.empty():
+                car_numbers = id_match_car_number_queue.get_nowait()
+
+            # 프레임 풀 버퍼는 표시가 끝나면 반환 (덮어쓴 프레임은 건너뜀)
+            lease, tracks = frame_queue.get(timeout=0.1)
+            try:
+                frame = lease.image
+                if frame is None:
+                    continue
+
+                # 미리보기 스트림 전달 (GUI가 프레임에 그리기 전에 전달)
+                if preview is not None:
+                    preview.publish(frame, tracks, car_numbers)
+
+                # 표시 주기가 되지 않은 프레임은 그리지 않고 버림
+                now = time.perf_counter()
+                if now - last_display_time < display_interval:
+                    continue
+                last_display_time = now
+
+                # 축소 후 구역 합성
+                frame_with_space = overlay.apply(overlay.resize(frame))
+
+                # 탐지한 객체 루프
+                for track in tracks:
+                    if not track.is_confirmed():
+                        continue
+                    track_id = int(track.track_id)
+                    if track_id in car_numbers:
+                        draw_car(frame_with_space, track.to_ltrb(), car_numbers[track_id], PREVIEW_SCALE)
+
+                # GUI 표시
+                cv2.imshow("YOLO Tracking", frame_with_space)
+
+                # 키 입력 처리 (1ms 대기)
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q'):
+                    print("'q' 키 입력 - 프로그램 종료 중...")
+                    stop_event.set()
+                    break
+            finally:
+                lease.release()
 
         except Empty:
             # 프레임이 없으면 계속 대기
             continue
 
-except KeyboardInterrupt:
-    # 키보드 인터럽트 발생 시 쓰레드 종료
-    print("프로그램 종료 중...")
-    stop_event.set()
-
-# OpenCV 윈도우 정리
-cv2.destroyAllWindows()
 
-# 모든 쓰레드가 종료될 때까지 대기
-thread1.join()
-thread2.join()
-thread3.join()
-thread4.join()
+def main():
+    if CAMERAS or TRACKER_PROCESS:
+        # 카메라 프로세스와 공유하기 위해 multiprocessing Event 사용
+        ctx = mp.get_context("spawn")
+        stop_event = ctx.Event()
+        init_event = ctx.Event()
+    else:
+        # 프로그램 종료 플래그
+        stop_event = threading.Event()
+        init_event = threading.Event()
+
+    # 공유할 데이터 큐
+    yolo_data_queue = Queue()
+    car_number_data_queue = Queue()
+    car_number_response_queue = Queue() # 입차기에 응답할 데이터
+    route_data_queue = Queue()
+    frame_queue = Queue(maxsize=2)    # gui에 표시할 이미지
+    id_match_car_number_queue: Queue[dict[int, Car]] = Queue(maxsize=2)
+    exit_queue = Queue()
+
+    threads = []
+
+    # 트래커(또는 다중 카메라 통합)의 추적 데이터를 받을 큐 (칼만 필터를 사용하면 필터를 거쳐 yolo_data_queue로 전달)
+    track_output_queue = Queue() if KALMAN_SMOOTHING else yolo_data_queue
+
+    # 다중 카메라는 카메라 프로세스가 프레임을 보내지 않아 GUI에 표시할 프레임이 없으므로 항상 GUI 없이 실행 (종료는 Ctrl+C)
+    headless = HEADLESS or bool(CAMERAS)
+
+    # 트래커가 메인 루프로 프레임을 보낼지 여부 (GUI 또는 미리보기 스트림에서 사용)
+    send_frames = not headless or PREVIEW_STREAM
+
+    # 구역 표시용 데이터 (번들이 json과 같으면 번들에서 읽음)
+    parking_data, moving_data, bundle = layout_bundle.load_layout_data(PARKING_SPACE_PATH, MOVING_SPACE_PATH, LAYOUT_BUNDLE_PATH)
+
+    # 미리보기 스트림 (flask_server의 /preview)
+    preview = None
+    if PREVIEW_STREAM:
+        preview = PreviewStream(parking_data, moving_data, PREVIEW_STREAM_SCALE, PREVIEW_STREAM_FPS)
+
+    # 구역 경계 분석용 추적 데이터 기록 (flush 주기마다 파일에 내보내므로 종료 시 마지막 1초 이내의 데이터는 빠질 수 있음)
+    if TRACK_LOG_PATH is not None:
+        sr.track_log = TrackLogWriter(TRACK_LOG_PATH)
+
+    # 탐지할 영역 (카메라 프레임에서 구역이 있는 부분)
+    inference_crop = None
+    if INFERENCE_CROP_MARGIN is not None:
+        inference_crop = frame_preprocess.zone_bounds(parking_data, moving_data, (FRAME_WIDTH, FRAME_HEIGHT), INFERENCE_CROP_MARGIN)
+
+    # 구역 데이터 -> 구역 라벨 이미지 (시작할 때와 구역 데이터 교체 시 사용)
+    zone_map_factory = functools.partial(zone_map.load_or_build, ZONE_MAP_PATH, frame_size=(FRAME_WIDTH, FRAME_HEIGHT), scale=ZONE_MAP_SCALE)
+
+    # 구역 데이터 교체 (감시 쓰레드에서 검증하고 구역을 미리 생성, 경로 계산 쓰레드가 프레임 사이에서 교체)
+    layout_manager = None
+    if LAYOUT_HOT_RELOAD:
+        layout_manager = LayoutManager(PARKING_SPACE_PATH, MOVING_SPACE_PATH, LAYOUT_POLL_INTERVAL, LAYOUT_BUNDLE_PATH)
+        layout_manager.zone_map_factory = zone_map_factory
+        if preview is not None:
+            layout_manager.add_listener(preview.overlay.set_layout)
+
+        threads.append(threading.Thread(
+            target=layout_manager.watch,
+            kwargs={
+                "stop_event": stop_event,
+            }
+        ))
+
+    if CAMERAS:
+        # 카메라마다 별도의 프로세스에서 트래킹하고, 통합 쓰레드에서 전역 차량 ID와 전역 좌표로 변환
+        track_queue = ctx.Queue()
+        camera_processes = multi_camera.start_camera_workers(
+            cameras=CAMERAS,
+            track_queue=track_queue,
+            event=init_event,
+            stop_event=stop_event,
+            model_path=MODEL_PATH,
+            frame_width=FRAME_WIDTH,
+            frame_height=FRAME_HEIGHT,
+            backend=DETECTION_BACKEND,
+            backend_options=DETECTION_BACKEND_OPTIONS,
+            imgsz=INFERENCE_SIZE,
+            crop_margin=INFERENCE_CROP_MARGIN,
+            realtime=FRAME_SOURCE_REALTIME,
+        )
+
+        threads.append(threading.Thread(
+            target=multi_camera.run_fusion,
+            kwargs={
+                "track_queue": track_queue,
+                "yolo_data_queue": track_output_queue,
+                "fusion": multi_camera.create_fusion(CAMERAS, PARKING_SPACE_PATH, MOVING_SPACE_PATH),
+                "stop_event": stop_event,
+            }
+        ))
+
+    elif TRACKER_PROCESS:
+        # 트래커 프로세스와 메인 프로세스의 쓰레드(경로 계산, 전송)를 분리
+        process, tracker_conn = tracker_process.start_tracker_process(
+            event=init_event,
+            stop_event=stop_event,
+            model_path=MODEL_PATH,
+            video_source=VIDEO_SOURCE,
+            frame_width=FRAME_WIDTH,
+            frame_height=FRAME_HEIGHT,
+            send_frames=send_frames,
+            backend=DETECTION_BACKEND,
+            backend_options=DETECTION_BACKEND_OPTIONS,
+            imgsz=INFERENCE_SIZE,
+            crop=inference_crop,
+            realtime=FRAME_SOURCE_REALTIME,
+        )
+        camera_processes = [process]
+
+        threads.append(threading.Thread(
+            target=tracker_process.run_tracker_bridge,
+            kwargs={
+                "conn": tracker_conn,
+                "yolo_data_queue": track_output_queue,
+                "frame_queue": frame_queue,
+                "stop_event": stop_event,
+            }
+        ))
 
-print("프로그램이 정상적으로 종료되었습니다.")
+    else:
+        camera_processes = []
+
+        # 쓰레드 생성
+        threads.append(threading.Thread(
+            target=detection_tracking.main,
+            kwargs={
+                "yolo_data_queue": track_output_queue, 
+                "frame_queue": frame_queue if send_frames else None, 
+                "event": init_event, 
+                "model_path": MODEL_PATH, 
+                "video_source": VIDEO_SOURCE,
+                "frame_width": FRAME_WIDTH,
+                "frame_height": FRAME_HEIGHT,
+                "stop_event": stop_event, # 성능 체크
+                "backend": DETECTION_BACKEND,
+                "backend_options": DETECTION_BACKEND_OPTIONS,
+                "imgsz": INFERENCE_SIZE,
+                "crop": inference_crop,
+                "realtime": FRAME_SOURCE_REALTIME,
+            }
+        ))
+
+    if KALMAN_SMOOTHING:
+        # 혼잡도 모델의 차량 속도(ETA)도 칼만 필터 속도를 사용
+        kalman = kalman_tracker.CentroidKalman(max_dropout=KALMAN_MAX_DROPOUT)
+        sr.congestion_model.velocity_source = lambda: kalman.latest_velocities
+        # 칼만 필터가 이미 평활화한 중심점이므로 구역 전환 필터에서 다시 평활화하지 않음 (지연만 늘어남)
+        sr.zone_filter.smoothing = 1.0
+
+        threads.append(threading.Thread(
+            target=kalman_tracker.run_kalman_stage,
+            kwargs={
+                "raw_track_queue": track_output_queue,
+                "yolo_data_queue": yolo_data_queue,
+                "kalman": kalman,
+                "event": init_event,
+                "stop_event": stop_event,
+                "output_interval": 1 / KALMAN_OUTPUT_FPS,
+            }
+        ))
+
+    threads.append(threading.Thread(
+        target=sr.main, 
+        kwargs={
+            "yolo_data_queue": yolo_data_queue, 
+            "car_number_data_queue": car_number_data_queue, 
+            "route_data_queue": route_data_queue, 
+            "event": init_event, 
+            "parking_space_path": PARKING_SPACE_PATH, 
+            "moving_space_path": MOVING_SPACE_PATH, 
+            "id_match_car_number_queue": id_match_car_number_queue,
+            "car_number_response_queue": None if BAY_RESERVATION else car_number_response_queue,
+            "exit_queue": exit_queue,
+            "layout_manager": layout_manager,
+            "layout_bundle_path": LAYOUT_BUNDLE_PATH,
+            "zone_map_factory": zone_map_factory,
+        }
+    ))
+
+    threads.append(threading.Thread(
+        target=flask_server.run_flask_server,
+        kwargs={
+            "car_number_data_queue": car_number_data_queue,
+            "response_data_queue": car_number_response_queue,
+            "preview": preview,
+            "reserve": sr.reserve_bay if BAY_RESERVATION else None,
+            "layout": layout_manager,
+        }
+    ))
+
+    threads.append(threading.Thread(
+        target=server.send_to_server, 
+        kwargs={
+            "uri": URI, 
+            "route_data_queue": route_data_queue,
+            "exit_queue": exit_queue,
+            "display_ports": DISPLAY_SERIAL_PORTS,
+            "web_homographies": WebHomographyCache(seed=bundle.web_homographies if bundle is not None else None),
+        }
+    ))
+
+    # 쓰레드 시작
+    for thread in threads:
+        thread.start()
+
+    try:
+        if headless:
+            run_headless(stop_event, frame_queue, id_match_car_number_queue, preview)
+        else:
+            run_gui(stop_event, frame_queue, id_match_car_number_queue, preview, layout_manager, parking_data, moving_data)
+
+    except KeyboardInterrupt:
+        # 키보드 인터럽트 발생 시 쓰레드 종료
+        print("프로그램 종료 중...")
+        stop_event.set()
+
+    # OpenCV 윈도우 정리
+    if not headless:
+        cv2.destroyAllWindows()
+
+    # 모든 쓰레드가 종료될 때까지 대기
+    for process in camera_processes:
+        process.join()
+
+    for thread in threads:
+        thread.join()
+
+    print("프로그램이 정상적으로 종료되었습니다.")
+
+
+# 카메라 프로세스(spawn)가 이 파일을 다시 import 할 때 실행되지 않도록 보호
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+# 학습한 YOLO 모델(.pt)을 ONNX, INT8 ONNX, OpenVINO, TensorRT로 변환하여 .pt 옆에 저장하고,
+# 카메라 프레임으로 각 모델의 탐지 속도와 정확도를 측정하여 가장 빠른 백엔드를 선택하는 모듈
+#
+# 변환/측정: python model_manager.py MODEL.pt [--source 0] [--formats onnx onnx_int8 ...] [--force]
+#
+# - 정확도는 .pt 모델의 탐지 결과를 기준으로 한 박스 일치율(F1)과 평균 신뢰도(model/check_prediction_score.py와 같은 방식)로 판단
+# - 변환 결과와 선택 결과는 MODEL.models.json에 .pt의 해시와 함께 저장하여 다음 실행부터는 변환, 측정 없이 바로 선택한 모델을 사용
+#   (.pt나 모델 입력 크기가 바뀌면 다시 변환, 다른 장비(호스트 이름)에서 실행하면 다시 측정)
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+from typing import Any, Optional
+
+import numpy as np
+
+from detection_backend import DetectionBackend, create_backend
+from frame_source import open_source
+from layout_bundle import file_hash
+from numpy_bytetrack import iou_matrix, match
+
+# 변환 형식 -> (사용할 백엔드, .pt 이름 뒤에 붙는 경로, ultralytics export 설정)
+# onnx_int8은 ultralytics가 아니라 onnxruntime의 동적 양자화로 onnx 모델에서 생성
+VARIANT_FORMATS: dict[str, tuple[str, str, Optional[dict[str, Any]]]] = {
+    "onnx": ("onnx", ".onnx", {"format": "onnx", "simplify": True}),
+    "onnx_int8": ("onnx", "_int8.onnx", None),
+    "openvino": ("bytetrack", "_openvino_model", {"format": "openvino", "half": True}),
+    "engine": ("bytetrack", ".engine", {"format": "engine", "half": True}),
+}
+
+DEFAULT_FORMATS = ("onnx", "onnx_int8", "openvino", "engine")
+
+# 측정에 사용하는 카메라 프레임 수와 그중 시간 측정에서 제외하는 예열 프레임 수
+BENCHMARK_FRAMES = 20
+WARMUP_FRAMES = 3
+
+# 기준 모델과 같은 차량으로 보는 IoU
+MATCH_IOU = 0.5
+
+
+class ModelVariant:
+    """변환한 모델 하나 (원본 .pt 포함)"""
+
+    def __init__(self, name: str, backend: str, path: str) -> None:
+        self.name: str = name
+        self.backend: str = backend
+        self.path: str = path
+
+    def __repr__(self) -> str:
+        return f"ModelVariant({self.name}, {self.backend}, {self.path})"
+
+
+class BenchmarkResult:
+    """모델 하나의 측정 결과"""
+
+    def __init__(self, variant: ModelVariant, latency: float, agreement: float, mean_confidence: float) -> None:
+        self.variant: ModelVariant = variant
+        self.latency: float = latency                   # 프레임당 탐지 시간 (초)
+        self.agreement: float = agreement               # 기준 모델과의 박스 일치율 (F1)
+        self.mean_confidence: float = mean_confidence   # 탐지 신뢰도 평균
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "variant": self.variant.name,
+            "latency_ms": round(self.latency * 1000, 2),
+            "agreement": round(self.agreement, 4),
+            "mean_confidence": round(self.mean_confidence, 4),
+        }
+
+
+def variant_path(pt_path: str, name: str) -> str:
+    """.pt 옆에 저장할 변환 모델 경로 (예: v4_best_medium.pt -> v4_best_medium_int8.onnx)"""
+
+    return os.path.splitext(pt_path)[0] + VARIANT_FORMATS[name][1]
+
+
+def manifest_path(pt_path: str) -> str:
+    return os.path.splitext(pt_path)[0] + ".models.json"
+
+
+def load_manifest(pt_path: str, pt_hash: str, imgsz: int = 640) -> dict[str, Any]:
+    """.pt의 해시와 모델 입력 크기가 같은 경우에만 저장된 변환/선택 정보를 반환 (없거나 다르면 빈 정보)"""
+
+    try:
+        with open(manifest_path(pt_path), "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    if manifest.get("pt_hash") != pt_hash or manifest.get("imgsz") != imgsz:
+        return {"pt_hash": pt_hash, "imgsz": imgsz, "variants": [], "failed": [], "selection": None}
+
+    return manifest
+
+
+def save_manifest(pt_path: str, manifest: dict[str, Any]) -> None:
+    """다른 카메라 프로세스가 읽는 중에도 깨지지 않도록 임시 파일에 쓰고 교체"""
+
+    path = manifest_path(pt_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"모델 정보 저장 실패: {e}")
+
+
+def export_variant(pt_path: str, name: str, imgsz: int = 640) -> None:
+    """
+    .pt를 name 형식으로 변환하여 variant_path에 저장
+
+    ultralytics는 .pt와 같은 폴더에 중간 파일(engine 변환 시 .onnx 등)을 만들기 때문에
+    임시 폴더에 .pt를 복사하여 변환하고 결과만 옮김
+
+    Raises:
+        Exception: 변환에 필요한 패키지가 없거나 장비에서 지원하지 않는 형식 (engine은 CUDA 필요)
+    """
+    path = variant_path(pt_path, name)
+
+    if name == "onnx_int8":
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        quantize_dynamic(variant_path(pt_path, "onnx"), temp_path, weight_type=QuantType.QUInt8)
+        os.replace(temp_path, path)
+        return
+
+    from ultralytics import YOLO
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(pt_path))) as work_dir:
+        work_pt = shutil.copy2(pt_path, os.path.join(work_dir, os.path.basename(pt_path)))
+        output = YOLO(work_pt).export(imgsz=imgsz, **VARIANT_FORMATS[name][2])
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(output, path)
+
+
+def export_variants(pt_path: str, formats=DEFAULT_FORMATS, imgsz: int = 640, force: bool = False) -> list[ModelVariant]:
+    """
+    변환하지 않았거나 .pt가 바뀐 형식만 변환하고 사용 가능한 모델 목록을 반환 (첫 번째는 원본 .pt)
+
+    변환에 실패한 형식(패키지 없음, 지원하지 않는 장비)은 목록에서 제외하고, .pt가 바뀌거나 force일 때만 다시 변환
+    """
+    pt_hash = file_hash(pt_path)
+    manifest = load_manifest(pt_path, pt_hash, imgsz)
+    exported = [name for name in manifest["variants"] if os.path.exists(variant_path(pt_path, name))]
+    failed = [] if force else manifest.get("failed", [])
+
+    # onnx_int8은 onnx 모델에서 만들기 때문에 onnx를 먼저 변환
+    names = sorted(formats, key=lambda name: name != "onnx")
+    if "onnx_int8" in names and "onnx" not in names:
+        names.insert(0, "onnx")
+
+    for name in names:
+        if name in exported or name in failed:
+            continue
+
+        print(f"{os.path.basename(pt_path)} -> {name} 변환 중...")
+        try:
+            export_variant(pt_path, name, imgsz)
+        except Exception as e:
+            print(f"{name} 변환 실패: {e}")
+            failed.append(name)
+            continue
+
+        exported.append(name)
+
+    manifest["variants"] = exported
+    manifest["failed"] = failed
+    save_manifest(pt_path, manifest)
+
+    variants = [ModelVariant("pt", "bytetrack", pt_path)]
+    variants += [ModelVariant(name, VARIANT_FORMATS[name][0], variant_path(pt_path, name)) for name in formats if name in exported]
+    return variants
+
+
+def benchmark(detector: DetectionBackend, frames: list[np.ndarray], warmup: int = WARMUP_FRAMES) -> tuple[float, list[tuple[np.ndarray, np.ndarray]]]:
+    """
+    예열 프레임을 제외한 프레임당 평균 탐지 시간 측정
+
+    Returns:
+        tuple: (프레임당 탐지 시간 (초), 측정한 프레임의 탐지 결과 목록)
+    """
+    for frame in frames[:warmup]:
+        detector.detect(frame)
+
+    measured = frames[warmup:] or frames
+    start = time.perf_counter()
+    detections = [detector.detect(frame) for frame in measured]
+
+    return (time.perf_counter() - start) / len(measured), detections
+
+
+def agreement(reference: list[tuple[np.ndarray, np.ndarray]], candidate: list[tuple[np.ndarray, np.ndarray]], iou: float = MATCH_IOU) -> float:
+    """
+    기준 모델과 비교 모델의 프레임별 탐지 박스 일치율 (F1, 놓친 차량과 잘못 탐지한 차량 모두 감점)
+
+    두 모델 모두 차량을 탐지하지 않은 경우 1.0
+    """
+    matched = 0
+    total = 0
+
+    for (reference_boxes, _), (candidate_boxes, _) in zip(reference, candidate):
+        matches, _, _ = match(1 - iou_matrix(reference_boxes, candidate_boxes), 1 - iou)
+        matched += len(matches)
+        total += len(reference_boxes) + len(candidate_boxes)
+
+    return 2 * matched / total if total else 1.0
+
+
+def mean_confidence(detections: list[tuple[np.ndarray, np.ndarray]]) -> float:
+    """모든 프레임의 탐지 신뢰도 평균 (탐지한 차량이 없으면 0)"""
+
+    scores = [scores for _, scores in detections if len(scores)]
+    return float(np.concatenate(scores).mean()) if scores else 0.0
+
+
+def cached_backend(manifest: dict[str, Any], variants: list[ModelVariant], backend_options: dict[str, dict], imgsz: int) -> Optional[DetectionBackend]:
+    """이 장비에서 이전에 선택한 모델이 있으면 측정 없이 생성"""
+
+    selection = manifest.get("selection")
+    if not selection or selection.get("host") != platform.node():
+        return None
+
+    for variant in variants:
+        if variant.name == selection["variant"]:
+            try:
+                return create_backend(variant.backend, variant.path, backend_options.get(variant.backend), imgsz)
+            except Exception as e:
+                print(f"{variant.name} 모델 로드 실패: {e}")
+                return None
+
+    return None
+
+
+def select_backend(
+    model_path: str,
+    frames: list[np.ndarray],
+    formats=DEFAULT_FORMATS,
+    min_agreement: float = 0.9,
+    min_confidence_ratio: float = 0.9,
+    warmup: int = WARMUP_FRAMES,
+    imgsz: int = 640,
+    backend_options: Optional[dict[str, dict]] = None,
+    force: bool = False,
+) -> DetectionBackend:
+    """
+    변환한 모델을 모두 측정하여 정확도 기준을 만족하는 모델 중 가장 빠른 모델의 백엔드를 반환
+
+    Args:
+        model_path: 학습한 모델 (.pt)
+        frames: 측정에 사용할 카메라 프레임 (앞의 warmup장은 예열)
+        formats: 변환할 형식 (VARIANT_FORMATS의 키)
+        min_agreement: 기준(.pt) 모델과의 최소 박스 일치율
+        min_confidence_ratio: 기준 모델 대비 최소 평균 신뢰도 비율
+        backend_options: 백엔드 이름 -> 백엔드 생성자 추가 설정 (예: {"onnx": {"num_threads": 4}})
+        force: 저장된 선택 결과를 무시하고 다시 측정 (변환에 실패했던 형식도 다시 변환)
+
+    Raises:
+        RuntimeError: 사용할 수 있는 모델이 없음
+    """
+    backend_options = backend_options or {}
+    variants = export_variants(model_path, formats, imgsz, force)
+
+    # 이전 실행에서 측정한 결과가 있으면 바로 사용 (매번 모든 모델을 로드, 예열하지 않음)
+    manifest = load_manifest(model_path, file_hash(model_path), imgsz)
+    if not force:
+        detector = cached_backend(manifest, variants, backend_options, imgsz)
+        if detector is not None:
+            print(f"탐지 모델: {manifest['selection']['variant']} (저장된 측정 결과)")
+            return detector
+
+    best: Optional[tuple[DetectionBackend, BenchmarkResult]] = None
+    reference: Optional[tuple[list[tuple[np.ndarray, np.ndarray]], float]] = None
+    results: list[BenchmarkResult] = []
+
+    for variant in variants:
+        try:
+            detector = create_backend(variant.backend, variant.path, backend_options.get(variant.backend), imgsz)
+            latency, detections = benchmark(detector, frames, warmup)
+        except Exception as e:
+            print(f"{variant.name} 측정 실패: {e}")
+            continue
+
+        # 처음으로 측정에 성공한 모델(보통 .pt)을 정확도 기준으로 사용
+        if reference is None:
+            reference = (detections, mean_confidence(detections))
+
+        result = BenchmarkResult(variant, latency, agreement(reference[0], detections), mean_confidence(detections))
+        results.append(result)
+        print(f"{variant.name}: {result.latency * 1000:.1f}ms, 일치율 {result.agreement:.3f}, 평균 신뢰도 {result.mean_confidence:.3f}")
+
+        accurate = result.agreement >= min_agreement and result.mean_confidence >= reference[1] * min_confidence_ratio
+        if accurate and (best is None or result.latency < best[1].latency):
+            if best is not None:
+                best[0].close()
+            best = (detector, result)
+        else:
+            detector.close()
+
+    if best is None:
+        raise RuntimeError(f"사용할 수 있는 탐지 모델이 없습니다: {model_path}")
+
+    manifest["selection"] = {
+        "host": platform.node(),
+        "variant": best[1].variant.name,
+        "results": [result.to_dict() for result in results],
+    }
+    save_manifest(model_path, manifest)
+
+    print(f"탐지 모델: {best[1].variant.name} ({best[1].latency * 1000:.1f}ms)")
+    return best[0]
+
+
+def read_frames(cap, count: int = BENCHMARK_FRAMES) -> list[np.ndarray]:
+    """카메라에서 측정용 프레임 읽기 (읽지 못한 프레임은 제외)"""
+
+    frames = []
+    for _ in range(count):
+        ret, frame = cap.read()
+        if ret:
+            frames.append(frame)
+
+    return frames
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="YOLO 모델 변환 및 탐지 백엔드 측정")
+    parser.add_argument("model", help="학습한 모델 (.pt)")
+    parser.add_argument("--source", default="0", help="측정에 사용할 카메라 번호, 동영상 파일, 이미지 폴더 (frame_source.open_source)")
+    parser.add_argument("--frames", type=int, default=BENCHMARK_FRAMES, help="측정 프레임 수")
+    parser.add_argument("--formats", nargs="+", default=list(DEFAULT_FORMATS), choices=list(VARIANT_FORMATS), help="변환할 형식")
+    parser.add_argument("--imgsz", type=int, default=640, help="모델 입력 크기")
+    parser.add_argument("--min-agreement", type=float, default=0.9, help="기준 모델과의 최소 박스 일치율")
+    parser.add_argument("--force", action="store_true", help="저장된 측정 결과를 무시하고 실패했던 변환을 다시 시도")
+    args = parser.parse_args(argv)
+
+    cap = open_source(args.source, realtime=False)
+    frames = read_frames(cap, args.frames)
+    cap.release()
+
+    if not frames:
+        print(f"프레임을 읽을 수 없습니다: {args.source}")
+        return
+
+    detector = select_backend(args.model, frames, args.formats, args.min_agreement, imgsz=args.imgsz, force=args.force)
+    detector.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# 여러 대의 카메라에서 추적한 차량을 하나의 주차장 좌표계와 전역 차량 ID로 통합하는 모듈
+
+import json
+import math
+import time
+import multiprocessing as mp
+from queue import Empty
+from typing import Optional
+import numpy as np
+import cv2
+from shortest_route import ParkingSpace, MovingSpace, check_position
+from frame_preprocess import load_zone_bounds
+
+# 구역 키: (구역 종류("parking", "moving"), 구역 ID)
+ZoneKey = tuple[str, int]
+
+
+def load_spaces(parking_space_path: str, moving_space_path: str) -> tuple[dict[int, ParkingSpace], dict[int, MovingSpace]]:
+    """
+    구역 JSON 파일로부터 구역 인스턴스를 생성하는 함수
+
+    shortest_route의 전역 인스턴스(parking_space_instances 등)에는 등록하지 않음
+    """
+    with open(parking_space_path, "r") as f:
+        parking_data = {int(key): value for key, value in json.load(f).items()}
+
+    with open(moving_space_path, "r") as f:
+        moving_data = {int(key): value for key, value in json.load(f).items()}
+
+    parking_spaces = {
+        space_id: ParkingSpace(
+            space_id=space_id,
+            name=space_data["name"],
+            position=space_data["position"],
+            near_moving_space_id=space_data["near_moving_space_id"]
+        )
+        for space_id, space_data in parking_data.items()
+    }
+
+    moving_spaces = {
+        space_id: MovingSpace(
+            space_id=space_id,
+            name=space_data["name"],
+            position=space_data["position"],
+            congestion=space_data["congestion"],
+            near_parking_space_id=space_data["near_parking_space_id"],
+            near_moving_space_id=space_data["near_moving_space_id"]
+        )
+        for space_id, space_data in moving_data.items()
+    }
+
+    return parking_spaces, moving_spaces
+
+
+class CameraTrackQueue:
+    """트래커가 put하는 추적 데이터에 카메라 ID를 붙여 프로세스 간 큐로 전달하는 클래스"""
+
+    def __init__(self, camera_id: int, track_queue) -> None:
+        self.camera_id: int = camera_id
+        self.track_queue = track_queue
+
+    def put(self, tracked_objects: dict[int, tuple[float, float]]) -> None:
+        self.track_queue.put((self.camera_id, tracked_objects))
+
+
+def camera_worker(camera_id, track_queue, event, stop_event, model_path, video_source, frame_width, frame_height, backend="bytetrack", backend_options=None,
+                  imgsz=None, crop=None, realtime=True):
+    """카메라 한 대의 트래커를 실행하는 프로세스 함수 (GUI 프레임은 전송하지 않음)"""
+
+    # 프로세스마다 모델을 따로 로드하므로 프로세스 내부에서 import
+    import detection_tracking
+
+    detection_tracking.main(
+        yolo_data_queue=CameraTrackQueue(camera_id, track_queue),
+        frame_queue=None,
+        event=event,
+        model_path=model_path,
+        video_source=video_source,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        stop_event=stop_event,
+        backend=backend,
+        backend_options=backend_options,
+        imgsz=imgsz,
+        crop=crop,
+        realtime=realtime,
+    )
+
+
+def start_camera_workers(cameras, track_queue, event, stop_event, model_path, frame_width, frame_height,
+                         backend: str = "bytetrack", backend_options: Optional[dict] = None,
+                         imgsz: Optional[int] = None, crop_margin: Optional[int] = None, realtime: bool = True) -> list[mp.Process]:
+    """
+    카메라마다 트래커 프로세스를 생성하여 시작하는 함수
+
+    Args:
+        cameras: 카메라 설정 리스트 [{"camera_id", "video_source", "parking_space_path", "moving_space_path"}, ...]
+                 (video_source는 카메라 번호, 동영상 파일, 이미지 폴더, RTSP 주소 등 frame_source.open_source 형식)
+        track_queue: 모든 카메라가 (카메라 ID, 추적 데이터)를 전달하는 multiprocessing 큐
+        event, stop_event: spawn 컨텍스트로 생성한 multiprocessing Event
+        backend, backend_options: 탐지 백엔드 설정 (detection_backend.create_backend)
+        imgsz: 모델 입력 크기
+        crop_margin: None이 아니면 카메라마다 구역 JSON의 영역을 이만큼 넓혀 잘라서 탐지 (frame_preprocess.load_zone_bounds)
+        realtime: 파일, 폴더 입력을 원래 FPS로 재생
+    """
+    ctx = mp.get_context("spawn")   # CUDA 사용을 위해 fork 대신 spawn 사용
+    processes = []
+
+    for camera in cameras:
+        crop = None
+        if crop_margin is not None:
+            crop = load_zone_bounds(camera["parking_space_path"], camera["moving_space_path"], (frame_width, frame_height), crop_margin)
+
+        process = ctx.Process(
+            target=camera_worker,
+            kwargs={
+                "camera_id": camera["camera_id"],
+                "track_queue": track_queue,
+                "event": event,
+                "stop_event": stop_event,
+                "model_path": model_path,
+                "video_source": camera["video_source"],
+                "frame_width": frame_width,
+                "frame_height": frame_height,
+                "backend": backend,
+                "backend_options": backend_options,
+                "imgsz": imgsz,
+                "crop": crop,
+                "realtime": realtime,
+            },
+            daemon=True,
+        )
+        process.start()
+        processes.append(process)
+
+    return processes
+
+
+class CameraView:
+    """카메라 한 대의 구역(카메라 픽셀 좌표)과 구역별 전역 좌표 변환 행렬"""
+
+    def __init__(
+        self,
+        camera_id: int,
+        parking_space_path: str,
+        moving_space_path: str,
+        global_parking_spaces: dict[int, ParkingSpace],
+        global_moving_spaces: dict[int, MovingSpace],
+    ) -> None:
+        """
+        Args:
+            camera_id: 카메라 ID
+            parking_space_path, moving_space_path: 해당 카메라가 보는 구역의 JSON (구역 ID는 전역 구역 ID와 동일)
+            global_parking_spaces, global_moving_spaces: shortest_route가 사용하는 전역 구역
+        """
+        self.camera_id: int = camera_id
+        self.parking_spaces, self.moving_spaces = load_spaces(parking_space_path, moving_space_path)
+
+        # 구역 키 -> 카메라 좌표를 전역 좌표로 변환하는 투시 변환 행렬
+        self.homographies: dict[ZoneKey, np.ndarray] = {}
+
+        for kind, spaces, global_spaces in (
+            ("parking", self.parking_spaces, global_parking_spaces),
+            ("moving", self.moving_spaces, global_moving_spaces),
+        ):
+            for space_id, space in spaces.items():
+                if space_id not in global_spaces:
+                    raise ValueError(f"{camera_id}번 카메라의 {kind} 구역 {space_id}가 전역 구역에 없습니다.")
+
+                self.homographies[(kind, space_id)] = cv2.getPerspectiveTransform(
+                    np.array(space.position, dtype="float32"),
+                    np.array(global_spaces[space_id].position, dtype="float32"),
+                )
+
+    def to_global(self, position: tuple[float, float]) -> Optional[tuple[ZoneKey, tuple[float, float]]]:
+        """
+        카메라 좌표를 (구역 키, 전역 좌표)로 변환 (주차 구역을 먼저 확인, 구역 밖이면 None 반환)
+        """
+        if (parking_space := check_position(position, self.parking_spaces)) is not None:
+            zone = ("parking", parking_space.space_id)
+        elif (moving_space := check_position(position, self.moving_spaces)) is not None:
+            zone = ("moving", moving_space.space_id)
+        else:
+            return None
+
+        point = np.array([[position]], dtype="float32")
+        global_x, global_y = cv2.perspectiveTransform(point, self.homographies[zone])[0][0]
+
+        return zone, (float(global_x), float(global_y))
+
+
+class TrackFusion:
+    """
+    카메라별 트래킹 ID를 전역 차량 ID로 매핑하는 클래스
+
+    새로 나타난 카메라 트랙은 최근에 다른 카메라(또는 같은 카메라의 끊긴 트랙)에서 본 차량 중
+    같은 구역 또는 인접 구역에 있고 전역 좌표가 가까운 차량의 ID를 이어 받음 (hand-off)
+    같은 카메라에서 이 프레임에 보이는 트랙의 ID만 후보에서 제외하므로 트래커의 ID가 바뀌어도 전역 ID를 유지
+
+    카메라 프로세스는 GUI 프레임을 보내지 않으므로 다중 카메라 모드는 항상 GUI 없이 실행 (main.py)
+    """
+
+    def __init__(
+        self,
+        views: dict[int, CameraView],
+        global_parking_spaces: dict[int, ParkingSpace],
+        global_moving_spaces: dict[int, MovingSpace],
+        handoff_timeout: float = 2.0,
+        handoff_distance: float = 150.0,
+    ) -> None:
+        """
+        Args:
+            views: 카메라 ID -> CameraView
+            handoff_timeout: 마지막으로 본 뒤 hand-off 후보로 유지하는 시간 (초)
+            handoff_distance: hand-off를 허용하는 전역 좌표 상의 최대 거리
+        """
+        self.views: dict[int, CameraView] = views
+        self.handoff_timeout: float = handoff_timeout
+        self.handoff_distance: float = handoff_distance
+
+        self.local_to_global: dict[tuple[int, int], int] = {}   # (카메라 ID, 트래킹 ID) -> 전역 ID
+        self.last_seen: dict[tuple[int, int], float] = {}       # (카메라 ID, 트래킹 ID) -> 마지막으로 본 시간
+        self.global_state: dict[int, tuple[ZoneKey, tuple[float, float], float]] = {}  # 전역 ID -> (구역, 전역 좌표, 시간)
+        self.next_global_id: int = 1
+
+        # 구역 키 -> 인접한 구역 키 (같은 구역 포함)
+        self.adjacent: dict[ZoneKey, set[ZoneKey]] = {}
+        for space_id, space in global_parking_spaces.items():
+            self.adjacent[("parking", space_id)] = {("parking", space_id), ("moving", space.near_moving_space_id)}
+        for space_id, space in global_moving_spaces.items():
+            self.adjacent[("moving", space_id)] = (
+                {("moving", space_id)}
+                | {("moving", near_id) for near_id in space.near_moving_space_id}
+                | {("parking", near_id) for near_id in space.near_parking_space_id if near_id != -1}
+            )
+
+    def update(self, camera_tracks: dict[int, dict[int, tuple[float, float]]], now: float) -> dict[int, tuple[float, float]]:
+        """
+        카메라별 추적 데이터를 받아 전역 ID -> 전역 좌표로 통합
+
+        Args:
+            camera_tracks: 카메라 ID -> {트래킹 ID: (x, y) 카메라 좌표}
+            now: 현재 시간
+
+        Returns:
+            dict: 전역 ID -> 전역 좌표 (여러 카메라에서 본 차량은 평균 좌표)
+        """
+        observations: dict[int, list[tuple[float, float]]] = {}
+
+        for camera_id, tracks in camera_tracks.items():
+            view = self.views[camera_id]
+
+            # 이 프레임에 있는 트랙의 전역 ID만 제외 (끊긴 트랙의 ID는 같은 카메라의 새 트랙이 이어 받을 수 있음)
+            present = {int(track_id) for track_id in tracks}
+            owned = {
+                global_id for (owner, track_id), global_id in self.local_to_global.items()
+                if owner == camera_id and track_id in present
+            }
+
+            for track_id, position in tracks.items():
+                mapped = view.to_global(position)
+                if mapped is None:
+                    continue
+
+                zone, global_position = mapped
+                key = (camera_id, int(track_id))
+
+                global_id = self.local_to_global.get(key)
+                if global_id is None:
+                    global_id = self.match_handoff(zone, global_position, now, owned)
+                    self.release_lost(camera_id, global_id, present)
+                    self.local_to_global[key] = global_id
+                    owned.add(global_id)
+
+                self.last_seen[key] = now
+                self.global_state[global_id] = (zone, global_position, now)
+                observations.setdefault(global_id, []).append(global_position)
+
+        self.expire(now)
+
+        return {
+            global_id: (sum(p[0] for p in positions) / len(positions), sum(p[1] for p in positions) / len(positions))
+            for global_id, positions in observations.items()
+        }
+
+    def release_lost(self, camera_id: int, global_id: int, present: set[int]) -> None:
+        """같은 카메라의 끊긴 트랙이 넘겨준 전역 ID의 이전 매핑 제거 (끊긴 트랙이 다시 나타나면 새로 매칭)"""
+
+        for key in [key for key, mapped in self.local_to_global.items() if key[0] == camera_id and key[1] not in present and mapped == global_id]:
+            del self.local_to_global[key]
+            self.last_seen.pop(key, None)
+
+    def match_handoff(self, zone: ZoneKey, global_position: tuple[float, float], now: float, owned: set[int]) -> int:
+        """새로 나타난 트랙에 이어 받을 전역 ID를 찾고, 없으면 새 전역 ID를 발급"""
+
+        best_id = None
+        best_distance = self.handoff_distance
+        candidate_zones = self.adjacent.get(zone, {zone})
+
+        for global_id, (last_zone, last_position, last_time) in self.global_state.items():
+            if global_id in owned or now - last_time > self.handoff_timeout or last_zone not in candidate_zones:
+                continue
+
+            distance = math.dist(global_position, last_position)
+            if distance <= best_distance:
+                best_id = global_id
+                best_distance = distance
+
+        if best_id is not None:
+            return best_id
+
+        global_id = self.next_global_id
+        self.next_global_id += 1
+        return global_id
+
+    def expire(self, now: float) -> None:
+        """hand-off 대기 시간이 지난 카메라 트랙과 전역 차량 정리"""
+
+        for key in [key for key, seen in self.last_seen.items() if now - seen > self.handoff_timeout]:
+            del self.last_seen[key]
+            del self.local_to_global[key]
+
+        active = set(self.local_to_global.values())
+        for global_id in [global_id for global_id, state in self.global_state.items() if global_id not in active and now - state[2] > self.handoff_timeout]:
+            del self.global_state[global_id]
+
+
+def create_fusion(cameras, parking_space_path: str, moving_space_path: str) -> TrackFusion:
+    """카메라 설정과 전역 구역 JSON으로 TrackFusion 생성"""
+
+    global_parking_spaces, global_moving_spaces = load_spaces(parking_space_path, moving_space_path)
+
+    views = {
+        camera["camera_id"]: CameraView(
+            camera["camera_id"],
+            camera["parking_space_path"],
+            camera["moving_space_path"],
+            global_parking_spaces,
+            global_moving_spaces,
+        )
+        for camera in cameras
+    }
+
+    return TrackFusion(views, global_parking_spaces, global_moving_spaces)
+
+
+def run_fusion(track_queue, yolo_data_queue, fusion: TrackFusion, stop_event, max_wait: float = 0.2):
+    """
+    카메라 프로세스들의 추적 데이터를 모아 전역 추적 데이터로 통합하여 yolo_data_queue로 전달하는 쓰레드 함수
+
+    모든 카메라에서 새 프레임이 도착하거나 첫 프레임 도착 후 max_wait초가 지나면 한 번 통합 (멈춘 카메라가 전체를 막지 않도록)
+    """
+    latest: dict[int, dict[int, tuple[float, float]]] = {}
+    first_time = None
+
+    while not stop_event.is_set():
+        try:
+            camera_id, tracks = track_queue.get(timeout=0.05)
+            latest[camera_id] = tracks  # 같은 카메라의 이전 프레임은 최신 프레임으로 대체
+            if first_time is None:
+                first_time = time.time()
+        except Empty:
+            pass
+
+        if latest and (len(latest) == len(fusion.views) or time.time() - first_time >= max_wait):
+            yolo_data_queue.put(fusion.update(latest, time.time()))
+            latest = {}
+            first_time = None
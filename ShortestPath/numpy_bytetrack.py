@@ -0,0 +1,227 @@
+# NumPy만으로 동작하는 ByteTrack (ultralytics, torch 없이 ONNX Runtime 탐지 결과를 추적)
+#
+# custom_bytetrack.yaml과 같은 설정 이름을 사용하며, 매칭은 IoU 거리와 bay_assignment.hungarian으로 계산
+# - 1차 매칭: 추적 중이거나 잠시 끊긴 트랙 <-> 신뢰도 높은 탐지
+# - 2차 매칭: 1차에서 남은 추적 중인 트랙 <-> 신뢰도 낮은 탐지 (가려진 차량 유지)
+# - 남은 신뢰도 높은 탐지 중 new_track_thresh 이상만 새 트랙으로 시작
+
+import numpy as np
+
+from bay_assignment import hungarian
+from track_array import TRACK_COLUMNS, empty_tracks
+
+# 2차 매칭의 최대 IoU 거리 (ByteTrack 기본값)
+SECOND_MATCH_THRESH = 0.5
+
+# 칼만 필터 잡음 비율 (바운딩 박스 높이 기준, ByteTrack 기본값)
+STD_WEIGHT_POSITION = 1 / 20
+STD_WEIGHT_VELOCITY = 1 / 160
+
+# 등속도 모델 전이 행렬 (상태 [cx, cy, a, h, vcx, vcy, va, vh], a = 너비 / 높이)
+F = np.eye(8)
+F[:4, 4:] = np.eye(4)
+
+# 관측 행렬 (위치 [cx, cy, a, h]만 관측)
+H = np.eye(4, 8)
+
+
+def xyxy_to_xyah(boxes: np.ndarray) -> np.ndarray:
+    """[xmin, ymin, xmax, ymax] -> [cx, cy, 너비 / 높이, 높이]"""
+
+    width = boxes[:, 2] - boxes[:, 0]
+    height = np.maximum(boxes[:, 3] - boxes[:, 1], 1e-6)
+    return np.stack([(boxes[:, 0] + boxes[:, 2]) / 2, (boxes[:, 1] + boxes[:, 3]) / 2, width / height, height], axis=1)
+
+
+def xyah_to_xyxy(xyah: np.ndarray) -> np.ndarray:
+    """[cx, cy, 너비 / 높이, 높이] -> [xmin, ymin, xmax, ymax]"""
+
+    width = xyah[:, 2] * xyah[:, 3]
+    return np.stack([xyah[:, 0] - width / 2, xyah[:, 1] - xyah[:, 3] / 2, xyah[:, 0] + width / 2, xyah[:, 1] + xyah[:, 3] / 2], axis=1)
+
+
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """두 바운딩 박스 목록 (N, 4), (M, 4)의 IoU 행렬 (N, M)"""
+
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)), dtype=np.float64)
+
+    left = np.maximum(a[:, None, 0], b[None, :, 0])
+    top = np.maximum(a[:, None, 1], b[None, :, 1])
+    right = np.minimum(a[:, None, 2], b[None, :, 2])
+    bottom = np.minimum(a[:, None, 3], b[None, :, 3])
+
+    intersection = np.clip(right - left, 0, None) * np.clip(bottom - top, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+
+    return intersection / np.maximum(area_a[:, None] + area_b[None, :] - intersection, 1e-9)
+
+
+def match(cost: np.ndarray, thresh: float) -> tuple[list[tuple[int, int]], list[int], list[int]]:
+    """
+    비용 행렬의 최소 비용 매칭 (thresh보다 큰 비용의 쌍은 매칭하지 않음)
+
+    Returns:
+        tuple: (매칭된 (행, 열) 목록, 남은 행, 남은 열)
+    """
+    rows, cols = cost.shape
+    if rows == 0 or cols == 0:
+        return [], list(range(rows)), list(range(cols))
+
+    # 임계값을 넘는 쌍은 다른 쌍보다 항상 비싸게 만들어 hungarian이 피하도록 함
+    gated = np.where(cost > thresh, thresh + 1e3, cost)
+    pairs = [(row, col) for row, col in hungarian(gated.tolist()) if cost[row, col] <= thresh]
+
+    matched_rows = {row for row, _ in pairs}
+    matched_cols = {col for _, col in pairs}
+    return pairs, [row for row in range(rows) if row not in matched_rows], [col for col in range(cols) if col not in matched_cols]
+
+
+class STrack:
+    """트랙 하나의 칼만 필터 상태"""
+
+    __slots__ = ("track_id", "mean", "covariance", "score", "lost_frames")
+
+    def __init__(self, track_id: int, box: np.ndarray, score: float) -> None:
+        measurement = xyxy_to_xyah(box[None, :])[0]
+        height = measurement[3]
+
+        self.track_id: int = track_id
+        self.mean: np.ndarray = np.concatenate([measurement, np.zeros(4)])
+        std = np.array([
+            2 * STD_WEIGHT_POSITION * height, 2 * STD_WEIGHT_POSITION * height, 1e-2, 2 * STD_WEIGHT_POSITION * height,
+            10 * STD_WEIGHT_VELOCITY * height, 10 * STD_WEIGHT_VELOCITY * height, 1e-5, 10 * STD_WEIGHT_VELOCITY * height,
+        ])
+        self.covariance: np.ndarray = np.diag(std ** 2)
+        self.score: float = score
+        self.lost_frames: int = 0    # 연속으로 매칭되지 않은 프레임 수 (0이면 추적 중)
+
+    def predict(self) -> None:
+        """다음 프레임으로 상태 예측 (끊긴 트랙은 높이 속도를 0으로 고정)"""
+
+        if self.lost_frames > 0:
+            self.mean[7] = 0
+
+        height = self.mean[3]
+        std = np.array([
+            STD_WEIGHT_POSITION * height, STD_WEIGHT_POSITION * height, 1e-2, STD_WEIGHT_POSITION * height,
+            STD_WEIGHT_VELOCITY * height, STD_WEIGHT_VELOCITY * height, 1e-5, STD_WEIGHT_VELOCITY * height,
+        ])
+        self.mean = F @ self.mean
+        self.covariance = F @ self.covariance @ F.T + np.diag(std ** 2)
+
+    def update(self, box: np.ndarray, score: float) -> None:
+        """매칭된 탐지로 상태 보정"""
+
+        measurement = xyxy_to_xyah(box[None, :])[0]
+        height = self.mean[3]
+        std = np.array([STD_WEIGHT_POSITION * height, STD_WEIGHT_POSITION * height, 1e-1, STD_WEIGHT_POSITION * height])
+
+        S = H @ self.covariance @ H.T + np.diag(std ** 2)
+        K = self.covariance @ H.T @ np.linalg.inv(S)
+
+        self.mean = self.mean + K @ (measurement - H @ self.mean)
+        self.covariance = self.covariance - K @ H @ self.covariance
+        self.score = score
+        self.lost_frames = 0
+
+    def box(self) -> np.ndarray:
+        """현재 상태의 [xmin, ymin, xmax, ymax]"""
+
+        return xyah_to_xyxy(self.mean[None, :4])[0]
+
+
+class ByteTracker:
+    """
+    탐지 결과(바운딩 박스, 신뢰도)를 받아 트랙 배열을 반환하는 ByteTrack
+
+    ultralytics ByteTrack과 달리 새 트랙은 두 번째 프레임을 기다리지 않고 바로 확정 (DeepSORT 설정의 n_init=1과 동일)
+    """
+
+    def __init__(
+        self,
+        track_high_thresh: float = 0.1,
+        track_low_thresh: float = 0.05,
+        new_track_thresh: float = 0.7,
+        track_buffer: int = 90,
+        match_thresh: float = 0.85,
+        frame_rate: int = 30,
+    ) -> None:
+        """
+        Args:
+            track_high_thresh: 1차 매칭에 사용할 탐지의 최소 신뢰도
+            track_low_thresh: 2차 매칭에 사용할 탐지의 최소 신뢰도
+            new_track_thresh: 새 트랙을 시작할 탐지의 최소 신뢰도
+            track_buffer: 끊긴 트랙을 유지하는 프레임 수 (30 FPS 기준)
+            match_thresh: 1차 매칭의 최대 IoU 거리 (1 - IoU)
+            frame_rate: 카메라 FPS (track_buffer 환산)
+        """
+        self.track_high_thresh: float = track_high_thresh
+        self.track_low_thresh: float = track_low_thresh
+        self.new_track_thresh: float = new_track_thresh
+        self.max_lost_frames: int = int(frame_rate / 30 * track_buffer)
+        self.match_thresh: float = match_thresh
+
+        self.tracks: list[STrack] = []
+        self.next_id: int = 1
+
+    def update(self, boxes: np.ndarray, scores: np.ndarray) -> np.ndarray:
+        """
+        한 프레임의 탐지 결과로 트랙을 갱신
+
+        Args:
+            boxes: (N, 4) [xmin, ymin, xmax, ymax]
+            scores: (N,) 신뢰도
+
+        Returns:
+            np.ndarray: 이번 프레임에 매칭된 트랙의 트랙 배열 (N, 5)
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        scores = np.asarray(scores, dtype=np.float64).reshape(-1)
+
+        high = scores >= self.track_high_thresh
+        low = ~high & (scores >= self.track_low_thresh)
+        high_boxes, high_scores = boxes[high], scores[high]
+        low_boxes, low_scores = boxes[low], scores[low]
+
+        for track in self.tracks:
+            track.predict()
+
+        matched: list[STrack] = []
+        track_boxes = np.array([track.box() for track in self.tracks]).reshape(-1, 4)
+
+        # 1차 매칭: 모든 트랙 <-> 신뢰도 높은 탐지
+        pairs, remaining, unmatched_high = match(1 - iou_matrix(track_boxes, high_boxes), self.match_thresh)
+        for row, col in pairs:
+            self.tracks[row].update(high_boxes[col], high_scores[col])
+            matched.append(self.tracks[row])
+
+        # 2차 매칭: 1차에서 남은 추적 중인 트랙 <-> 신뢰도 낮은 탐지
+        active = [row for row in remaining if self.tracks[row].lost_frames == 0]
+        pairs, _, _ = match(1 - iou_matrix(track_boxes[active], low_boxes), SECOND_MATCH_THRESH)
+        for index, col in pairs:
+            track = self.tracks[active[index]]
+            track.update(low_boxes[col], low_scores[col])
+            matched.append(track)
+
+        matched_ids = {id(track) for track in matched}
+        for track in self.tracks:
+            if id(track) not in matched_ids:
+                track.lost_frames += 1
+
+        self.tracks = [track for track in self.tracks if track.lost_frames <= self.max_lost_frames]
+
+        # 매칭되지 않은 신뢰도 높은 탐지로 새 트랙 시작
+        for col in unmatched_high:
+            if high_scores[col] >= self.new_track_thresh:
+                track = STrack(self.next_id, high_boxes[col], high_scores[col])
+                self.next_id += 1
+                self.tracks.append(track)
+                matched.append(track)
+
+        if not matched:
+            return empty_tracks()
+
+        return np.array([[track.track_id, *track.box()] for track in matched], dtype=np.float32).reshape(-1, TRACK_COLUMNS)
+
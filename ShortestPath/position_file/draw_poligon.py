@@ -1,7 +1,9 @@
 import cv2
 import numpy as np
 import json
+import os
 import platform
+import sys
 
 # 전역 변수 초기화
 zones = []
@@ -191,3 +193,10 @@ elif space_type == "moving_space":
         json.dump(moving_space, f, indent=2)
 
     print("\n✅ Moving space data saved to moving_space.json.")
+
+# 저장한 구역 데이터 검사 (겹침, 틈, 인접 구역 불일치, 도달할 수 없는 주차 구역)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import layout_lint
+
+if os.path.exists('parking_space.json') and os.path.exists('moving_space.json'):
+    layout_lint.main(["--parking", "parking_space.json", "--moving", "moving_space.json"])
@@ -0,0 +1,96 @@
+# 구역과 차량을 표시한 미리보기 영상을 MJPEG로 인코딩하여 flask_server로 제공
+
+import time
+import threading
+from typing import Iterator, Mapping, Optional
+import cv2
+from shortest_route import Car
+from gui_overlay import StaticOverlay, draw_car
+
+
+class PreviewStream:
+    """
+    MJPEG 미리보기 스트림
+
+    - 시청자가 없으면 인코딩하지 않음 (publish는 바로 반환)
+    - fps 간격으로 한 번만 인코딩하고 모든 시청자가 같은 JPEG를 공유
+    """
+
+    def __init__(self, parking_data, moving_data, scale: float = 0.5, fps: float = 5, jpeg_quality: int = 70) -> None:
+        """
+        Args:
+            parking_data, moving_data: 구역 JSON 데이터
+            scale: 미리보기 축소 비율
+            fps: 최대 인코딩 FPS
+            jpeg_quality: JPEG 품질 (0 ~ 100)
+        """
+        self.overlay = StaticOverlay(parking_data, moving_data, scale)
+        self.scale: float = scale
+        self.interval: float = 1.0 / fps
+        self.encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality]
+
+        self.condition = threading.Condition()
+        self.viewers: int = 0
+        self.jpeg: Optional[bytes] = None
+        self.jpeg_seq: int = 0
+        self.last_encode_time: float = 0.0
+
+    def publish(self, frame, tracks, car_numbers: Mapping[int, Car]) -> None:
+        """
+        메인 루프에서 프레임마다 호출, 시청자가 있고 인코딩 주기가 된 경우에만 그리고 인코딩
+
+        Args:
+            frame: 원본 카메라 프레임 (변경하지 않음)
+            tracks: 트래커의 Track 리스트
+            car_numbers: 트래킹 ID -> Car
+        """
+        if self.viewers == 0:
+            return
+
+        now = time.perf_counter()
+        if now - self.last_encode_time < self.interval:
+            return
+        self.last_encode_time = now
+
+        # 원본 프레임은 GUI에서도 사용하므로 복사본에 그림
+        preview = self.overlay.resize(frame)
+        if preview is frame:
+            preview = frame.copy()
+        self.overlay.apply(preview)
+
+        for track in tracks:
+            if not track.is_confirmed():
+                continue
+            track_id = int(track.track_id)
+            if track_id in car_numbers:
+                draw_car(preview, track.to_ltrb(), car_numbers[track_id], self.scale)
+
+        ok, encoded = cv2.imencode(".jpg", preview, self.encode_params)
+        if not ok:
+            return
+
+        with self.condition:
+            self.jpeg = encoded.tobytes()
+            self.jpeg_seq += 1
+            self.condition.notify_all()
+
+    def frames(self) -> Iterator[bytes]:
+        """시청자 한 명에게 multipart MJPEG 조각을 전달하는 제너레이터 (연결이 끊기면 시청자 수 감소)"""
+
+        with self.condition:
+            self.viewers += 1
+
+        last_seq = 0   # 첫 인코딩 전에는 대기
+        try:
+            while True:
+                with self.condition:
+                    self.condition.wait_for(lambda: self.jpeg_seq != last_seq, timeout=1.0)
+                    if self.jpeg_seq == last_seq:
+                        continue
+                    jpeg = self.jpeg
+                    last_seq = self.jpeg_seq
+
+                yield b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + jpeg + b"\r\n"
+        finally:
+            with self.condition:
+                self.viewers -= 1
@@ -0,0 +1,128 @@
+# 트래커의 ID가 바뀐 경우 새 트랙을 추적이 끊긴 차량과 다시 연결하는 모듈
+
+from __future__ import annotations
+import math
+from typing import Mapping, Optional, TYPE_CHECKING
+
+# shortest_route에서 사용하므로 타입 확인 시에만 import (순환 import 방지)
+if TYPE_CHECKING:
+    from shortest_route import Car, ParkingSpace, MovingSpace
+
+
+class TrackReassociator:
+    """
+    등록되지 않은 새 트랙을 추적이 끊긴 차량(lost_tracking_time)과 연결하는 클래스
+
+    - 시간 간격: 추적이 끊긴 지 max_gap초 이내인 차량만 후보
+    - 위치: 마지막 위치와의 거리가 max_distance + max_speed * 시간 간격 이내
+    - 구역 인접: 새 트랙의 구역이 차량의 마지막 구역과 같거나 인접한 경우만 후보
+
+    추적 데이터(yolo_data_queue)는 차량 ID -> 중심점만 전달하므로 외형 임베딩은 사용하지 않음
+    """
+
+    def __init__(
+        self,
+        max_gap: float = 3.0,
+        max_distance: float = 100.0,
+        max_speed: float = 300.0,
+    ) -> None:
+        """
+        Args:
+            max_gap: 연결 가능한 최대 추적 끊김 시간 (초)
+            max_distance: 시간 간격이 0일 때 허용 거리 (카메라 좌표)
+            max_speed: 끊긴 동안 이동 가능한 최대 속도 (픽셀/초)
+        """
+        self.max_gap: float = max_gap
+        self.max_distance: float = max_distance
+        self.max_speed: float = max_speed
+
+    def match(
+        self,
+        position: tuple[float, float],
+        candidates: Mapping[int, tuple[Car, float]],
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> Optional[int]:
+        """
+        새 트랙과 가장 잘 맞는 추적이 끊긴 차량의 ID를 반환하는 함수
+
+        Args:
+            position: 새 트랙의 위치
+            candidates: 차량 ID -> (차량 인스턴스, 추적이 끊긴 시간(초))
+
+        Returns:
+            Optional[int]: 연결할 차량 ID, 조건에 맞는 차량이 없으면 None
+        """
+        zone = self.locate(position, parking_spaces, moving_spaces)
+
+        best_car_id = None
+        best_cost = float('inf')
+
+        for car_id, (car, gap) in candidates.items():
+            if gap > self.max_gap:
+                continue
+
+            gate = self.max_distance + self.max_speed * gap
+            distance = math.hypot(position[0] - car.position[0], position[1] - car.position[1])
+            if distance > gate:
+                continue
+
+            if not self.is_adjacent(zone, car, parking_spaces, moving_spaces):
+                continue
+
+            cost = distance / gate
+            if cost < best_cost:
+                best_cost = cost
+                best_car_id = car_id
+
+        return best_car_id
+
+    @staticmethod
+    def locate(
+        position: tuple[float, float],
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> Optional[tuple[str, int]]:
+        """위치가 속한 (구역 종류, 구역 ID), 구역 밖이면 None"""
+
+        for space_id, space in parking_spaces.items():
+            if space.is_car_in_space(position[0], position[1]):
+                return "parking", space_id
+
+        for space_id, space in moving_spaces.items():
+            if space.is_car_in_space(position[0], position[1]):
+                return "moving", space_id
+
+        return None
+
+    @staticmethod
+    def is_adjacent(
+        zone: Optional[tuple[str, int]],
+        car: Car,
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> bool:
+        """새 트랙의 구역이 차량의 마지막 구역과 같거나 인접한지 확인 (어느 한쪽 구역을 모르면 위치 조건만 사용)"""
+
+        if zone is None or car.space_id is None:
+            return True
+
+        kind, space_id = zone
+        car_kind = "parking" if car.is_parking() else "moving"
+
+        if (kind, space_id) == (car_kind, car.space_id):
+            return True
+
+        # 이동 구역과 이동 구역: 인접 이동 구역
+        if kind == "moving" and car_kind == "moving":
+            return space_id in moving_spaces[car.space_id].near_moving_space_id
+
+        # 주차 구역과 이동 구역: 주차 구역에 연결된 이동 구역
+        if kind == "parking" and car_kind == "moving":
+            return parking_spaces[space_id].near_moving_space_id == car.space_id
+
+        if kind == "moving" and car_kind == "parking":
+            return parking_spaces[car.space_id].near_moving_space_id == space_id
+
+        # 주차 구역과 주차 구역: 같은 이동 구역에 연결된 구역
+        return parking_spaces[space_id].near_moving_space_id == parking_spaces[car.space_id].near_moving_space_id
@@ -5,9 +5,11 @@ import time
 import queue
 import numpy as np
 import cv2
-from enum import Enum
-from typing import Mapping, TypeVar, Protocol
+from typing import Mapping, TypeVar, Protocol, Optional, Sequence
 from shortest_route import Car, ParkingSpace, MovingSpace
+from display_driver import DisplayDriver
+from display_direction import DISPLAY_SPACE, DisplayAssignment
+from web_position import web_coordinates, web_homography, WebHomographyCache
 
 # to_dict 메서드를 가진 객체를 위한 Protocol
 class ToDictable(Protocol):
@@ -15,43 +17,9 @@ class ToDictable(Protocol):
 
 T = TypeVar('T', bound=ToDictable)
 
-class Direction(Enum):
-    RIGHT = "right"
-    LEFT = "left"
-    UP = "up"
-    DOWN = "down"
-
 # 카메라 회전 각도 설정 (0, 90, 180, 270 중 선택)
 CAMERA_ROTATION_ANGLE = 90  # 현재 90도 회전된 상태
 
-# 웹 페이지 각 구역 좌표
-web_coordinates = {
-    1: [(1066, -10), (1393, 0)],
-    2: [(1066, 0), (1393, 237)],
-    3: [(1066, 238), (1393, 592)],
-    4: [(1066, 593), (1393, 792)],
-    5: [(803, 0), (1065, 237)],
-    6: [(803, 593), (1065, 792)],
-    7: [(547, 0), (802, 237)],
-    8: [(547, 238), (802, 592)],
-    9: [(547, 593), (802, 792)],
-    10: [(282, 0), (546, 237)],
-    11: [(282, 593), (546, 792)],
-    12: [(0, 0), (281, 237)],
-    13: [(0, 238), (281, 592)],
-    14: [(0, 593), (281, 792)],
-    15: [(0, -10), (281, 0)]
-}
-
-# 아두이노로 전송할 데이터
-arduino_data = {}
-
-# 이전에 아두이노로 전송한 데이터
-previous_arduino_data = None
-
-# 경로를 안내하는 디스플레이의 구역 번호 (아두이노의 메트릭스 순서에 맞게 조정)
-DISPLAY_SPACE = (12, 7, 2, 14, 9, 4)
-
 # 이동 구역의 좌표
 walking_space = {}
 
@@ -67,7 +35,8 @@ def calculate_center(points):
 def transform_point_in_quadrilateral_to_rectangle(
         point: tuple[float, float], 
         quadrilateral: list[tuple[int, int]], 
-        arg_web_coordinate: list[tuple[int, int]]
+        arg_web_coordinate: list[tuple[int, int]],
+        transform_matrix: Optional[np.ndarray] = None,
     ):
     """
     사각형 내부의 특정 점을 웹 좌표 내 직사각형의 대응 위치로 변환
@@ -75,23 +44,13 @@ def transform_point_in_quadrilateral_to_rectangle(
     :param point: (px, py) 사각형 내부의 특정 점의 좌표
     :param quadrilateral: [(x1, y1), (x2, y2), (x3, y3), (x4, y4)] 사각형의 네 꼭짓점 좌표 (좌상단, 우상단, 우하단, 좌하단 순서)
     :param arg_web_coordinate: 변환 대상 구역의 웹 좌표 내 직사각형 [(x1, y1), (x2, y2)] 좌상단 및 우하단 좌표
+    :param transform_matrix: 미리 계산한 투시 변환 행렬 (None이면 계산)
     :return: 변환된 웹 내 점의 좌표 (x, y)
     """
 
-    # 사각형의 네 꼭짓점 좌표 배열화
-    quad_pts = np.array(quadrilateral, dtype="float32")
-
-    # 웹 좌표 내 직사각형 꼭짓점 설정
-    web_top_left, web_bottom_right = arg_web_coordinate
-    rect_pts = np.array([
-        [web_top_left[0], web_top_left[1]],
-        [web_bottom_right[0], web_top_left[1]],
-        [web_bottom_right[0], web_bottom_right[1]],
-        [web_top_left[0], web_bottom_right[1]]
-    ], dtype="float32")
-
     # 투시 변환 행렬 계산
-    transform_matrix = cv2.getPerspectiveTransform(quad_pts, rect_pts)
+    if transform_matrix is None:
+        transform_matrix = web_homography(quadrilateral, arg_web_coordinate)
 
     # 특정 점을 배열로 변환하여 투시 변환 적용
     point_array = np.array([[point]], dtype="float32")  # (px, py)
@@ -150,15 +109,18 @@ def rotate_point_by_angle(point, rectangle_corners, rotation_angle=0):
     return final_x, final_y
 
 
-def cal_web_position(car: Car, moving_spaces: Mapping[int, MovingSpace]) -> tuple[float, float]:
+def cal_web_position(car: Car, moving_spaces: Mapping[int, MovingSpace], homographies: Optional[WebHomographyCache] = None) -> tuple[float, float]:
 
     if car.space_id is None:
         return 0, 0
 
+    quadrilateral = moving_spaces[car.space_id].position
+
     transformed_x, transformed_y = transform_point_in_quadrilateral_to_rectangle(
         car.position,
-        moving_spaces[car.space_id].position,
+        quadrilateral,
         web_coordinates[car.space_id],
+        homographies.get(car.space_id, quadrilateral) if homographies is not None else None,
     )
 
     reflect_x, reflect_y = rotate_point_by_angle((transformed_x, transformed_y), web_coordinates[car.space_id], CAMERA_ROTATION_ANGLE)
@@ -166,30 +128,6 @@ def cal_web_position(car: Car, moving_spaces: Mapping[int, MovingSpace]) -> tupl
     return reflect_x, reflect_y
 
 
-def cal_display_direction(display_center: tuple[float, float], next_center: tuple[float, float]) -> Direction:
-    """
-    중심점을 이용해서 다음 구역의 방향을 반환하는 함수
-
-    :return: 카메라가 보는 방향 기준 방향 반환
-    """
-    
-    # display 구역과 다음 구역의 중심점 좌표 차이 계산
-    delta_x = abs(display_center[0] - next_center[0])
-    delta_y = abs(display_center[1] - next_center[1])
-
-    if delta_x > delta_y:
-        if display_center[0] > next_center[0]:
-            return Direction.LEFT
-        else:
-            return Direction.RIGHT
-    
-    else:
-        if display_center[1] > next_center[1]:
-            return Direction.UP
-        else:
-            return Direction.DOWN
-
-
 def to_dict_mapping(objects: Mapping[int, T]) -> dict[int, dict]:
     """
     to_dict 메서드를 가진 객체들의 Mapping을 딕셔너리로 변환
@@ -218,12 +156,30 @@ def disconnect():
 def connect_error(data):
     print(f"⚠️ 연결 오류: {data}")
 
-def send_to_server(uri, route_data_queue, exit_queue: queue.Queue):
+def send_to_server(uri, route_data_queue, exit_queue: queue.Queue, display_ports: Optional[Mapping[str, Sequence[int]]] = None, web_homographies: Optional[WebHomographyCache] = None):
+    """
+    Args:
+        uri: Express 서버 주소
+        route_data_queue: shortest_route로부터 차량 및 구역 데이터를 받는 큐
+        exit_queue: 출차한 차량 데이터를 받는 큐
+        display_ports: 시리얼 포트 -> 담당 디스플레이 번호 (None이면 아두이노로 전송하지 않음)
+        web_homographies: 이동 구역별 웹 좌표 투시 변환 행렬 (layout_bundle에서 읽은 값, None이면 처음 사용할 때 계산)
+    """
     # 서버 연결
-    global arduino_data
-    global previous_arduino_data
     global walking_space
 
+    # 경로가 변경된 차량만 디스플레이 배정을 다시 계산
+    display_assignment = DisplayAssignment(DISPLAY_SPACE)
+
+    # 차량마다 투시 변환 행렬을 계산하지 않고 구역별로 재사용
+    homographies = web_homographies if web_homographies is not None else WebHomographyCache()
+
+    # 경로 안내 디스플레이(아두이노) 연결
+    display_driver = None
+    if display_ports:
+        display_driver = DisplayDriver(display_ports)
+        display_driver.open()
+
     # 서버 연결 시도
     try:
         print(f"🔌 Express 서버 연결 시도: {uri}")
@@ -244,33 +200,23 @@ def send_to_server(uri, route_data_queue, exit_queue: queue.Queue):
             parking_spaces: Mapping[int, ParkingSpace] = data["parking"]  # 주차 구역 데이터
             moving_spaces: Mapping[int, MovingSpace] = data["moving"]  # 이동 구역 데이터
 
-            display_dict: dict[int, list[tuple[str, str]]] = { 1: [], 2: [], 3: [], 4: [], 5: [], 6: [] }
+            # 디스플레이 방향 계산 (경로가 변경된 차량만)
+            display_assignment.apply(data["route_changed"], cars, parking_spaces, moving_spaces)
+            display_dict: dict[int, list[tuple[str, str]]] = display_assignment.to_display_dict()
+
             web_positions: dict[int, tuple[float, float]] = {}  # 차량 ID -> 웹 좌표 매핑
 
             for car_id, car in cars.items():
-                route = car.route
-
-                # 디스플레이 방향 계산
-                if route and len(route) >= 2 and route[1] in DISPLAY_SPACE:
-                    dispaly_center = moving_spaces[route[1]].center_position
-
-                    if len(route) == 2 and car.target_parking_space_id is not None:
-                        next_center = parking_spaces[car.target_parking_space_id].center_position
-                    elif len(route) > 2:
-                        next_center = moving_spaces[route[2]].center_position
-                    else:
-                        continue
-
-                    display_number = DISPLAY_SPACE.index(route[1]) + 1
-                    direction = cal_display_direction(dispaly_center, next_center)
-
-                    display_dict[display_number].append((car.car_number, direction.value))
 
                 # 이동 중인 차량의 웹 좌표 계산
                 if car.is_moving():
-                    web_x, web_y = cal_web_position(car, moving_spaces)
+                    web_x, web_y = cal_web_position(car, moving_spaces, homographies)
                     web_positions[car_id] = (web_x, web_y)
             
+            # 변경된 디스플레이만 아두이노로 전송
+            if display_driver is not None:
+                display_driver.update(display_dict)
+
             exit_dict = {}
 
             # Queue에서 데이터 확인
@@ -4,13 +4,26 @@ from __future__ import annotations
 import heapq
 import math
 import time
-import json
 import copy
+import threading
 from types import MappingProxyType
-from typing import Optional, Tuple, List, Dict, Mapping, overload
+from typing import Callable, Optional, Tuple, List, Dict, Mapping, overload, TYPE_CHECKING
 from queue import Queue
 from enum import Enum
 from abc import ABC
+import display_direction
+import layout_bundle
+from zone_map import ZoneMap
+from zone_filter import ZoneTransitionFilter
+from track_log import TrackLogWriter
+from reid import TrackReassociator
+from timing_wheel import TimingWheel
+from congestion_model import CongestionModel
+from bay_assignment import INF, assign_bays
+
+# layout_manager가 구역 클래스를 사용하므로 타입 확인 시에만 import (순환 import 방지)
+if TYPE_CHECKING:
+    from layout_manager import LayoutManager
 
 ### Enum 정의 ###
 
@@ -90,6 +103,7 @@ class Car:
         self.target_parking_space_id: Optional[int] = target_parking_space_id
         self.space_id: Optional[int] = space_id
         self.route: List[int] = []
+        self.reserved_parking_space_id: Optional[int] = None   # 입차 시 예약된 주차 구역 (첫 경로 계산에서 목표로 사용)
     
     @classmethod
     def create_entry_car(cls, car_id: int, car_number: str, position: Tuple[float, float]):
@@ -109,7 +123,9 @@ class Car:
     
     def delete_car(self):
         """차량이 출차할 때, 구역을 벗어났을 때 삭제"""
-        
+
+        zone_filter.forget(self.car_id)
+
         if self.space_id is not None:
             
             if self.status == CarStatus.PARKING:
@@ -175,10 +191,10 @@ class Car:
             moving_space.append_car(self.car_id)
             self.pop_route(moving_space.space_id)
         
-        # 루트에 없는 구역으로 간 경우 재계산
+        # 루트에 없는 구역으로 간 경우 재계산 (프레임 끝에서 한 번에 처리)
         else:
             moving_space.append_car(self.car_id)
-            self.cal_route()
+            request_reroute(self.car_id)
 
 
     def set_parking(self, parking_space: ParkingSpace):
@@ -203,21 +219,33 @@ class Car:
         """차량 상태 업데이트"""
         self.status = status
 
-    def cal_route(self):
+    def cal_route(self, find_route: Callable[[int, int], list[int]] = None, target_parking_space_id: Optional[int] = None):
         """
         기존의 경로를 초기화하고 경로를 재계산하여 설정
 
         목표로 하는 주차 구역 또한 이곳에서 설정
+
+        Args:
+            find_route: (출발 구역 ID, 도착 구역 ID) -> 경로 함수 (None이면 dijkstra, flush_reroutes에서는 출발 구역별 최단 경로 트리 공유)
+            target_parking_space_id: flush_reroutes에서 여러 차량을 함께 배정한 목표 주차 구역 (None이면 가까운 구역을 직접 선택)
         """
+        find_route = dijkstra if find_route is None else find_route
         self.clear_route()
         print(f"아이디: {self.car_id}, 타겟: {self.target_parking_space_id}, 구역: {self.space_id} 재계산")
 
-        if self.space_id is not None:
+        # 배정된 목표 주차 구역으로 경로 설정
+        if self.space_id is not None and target_parking_space_id is not None:
+            route = find_route(self.space_id, get_moving_space_id_by_parking_space_id(target_parking_space_id))
+            parking_space_instances[target_parking_space_id].set_target(self.car_id)
+            self.target_parking_space_id = target_parking_space_id
+            self.set_route(route)
+
+        elif self.space_id is not None:
 
             target_parking_space_id = get_target_parking_space_id(self.position, self.status)
             target_moving_space_id = get_moving_space_id_by_parking_space_id(target_parking_space_id)
 
-            route = dijkstra(self.space_id, target_moving_space_id)
+            route = find_route(self.space_id, target_moving_space_id)
 
             # 출구를 향하는 경우
             if target_moving_space_id == 1:
@@ -248,6 +276,7 @@ class Car:
             moving_space_instances[space_id].append_route(self.car_id)
 
         self.route = route
+        route_changed_car_ids.add(self.car_id)
 
     def clear_route(self) -> None:
         """경로 초기화"""
@@ -257,11 +286,15 @@ class Car:
             for space_id in self.route:
                 moving_space_instances[space_id].remove_route(self.car_id)
 
+        # 혼잡도 모델의 가중치에서도 이 차량의 예상 점유 제거
+        congestion_model.remove_route(self.car_id)
+
         if self.target_parking_space_id is not None:
             parking_space_instances[self.target_parking_space_id].set_empty()
 
         self.route = []
         self.target_parking_space_id = None
+        route_changed_car_ids.add(self.car_id)
     
     def pop_route(self, space_id: int) -> None:
         """
@@ -284,6 +317,53 @@ class Car:
         for removed_space in removed_spaces:
             moving_space_instances[removed_space].remove_route(self.car_id)
 
+        if removed_spaces:
+            route_changed_car_ids.add(self.car_id)
+
+    def change_car_id(self, new_car_id: int) -> None:
+        """
+        트래커의 ID가 바뀐 차량을 새 트래킹 ID로 변경하는 함수
+
+        구역의 차량 목록, 경로 구역의 route_set, 주차 구역의 차량 ID를 새 ID로 바꾸며 혼잡도와 목표 주차 구역은 그대로 유지
+
+        Args:
+            new_car_id: 새 트래킹 ID
+        """
+        old_car_id = self.car_id
+
+        # 현재 구역의 차량 목록 (append_car/remove_car는 혼잡도와 주차 상태를 바꾸므로 직접 변경)
+        if self.space_id is not None:
+            space = parking_space_instances[self.space_id] if self.status == CarStatus.PARKING else moving_space_instances[self.space_id]
+            if old_car_id in space.car_set:
+                space.car_set.remove(old_car_id)
+                space.car_set.add(new_car_id)
+
+        # 경로로 지정한 구역
+        for space_id in self.route:
+            route_set = moving_space_instances[space_id].route_set
+            if old_car_id in route_set:
+                route_set.remove(old_car_id)
+                route_set.add(new_car_id)
+
+        # 목표 또는 주차한 주차 구역
+        for parking_space_id in (self.target_parking_space_id, self.space_id if self.status == CarStatus.PARKING else None):
+            if parking_space_id is not None and parking_space_instances[parking_space_id].car_id == old_car_id:
+                parking_space_instances[parking_space_id].car_id = new_car_id
+
+        zone_filter.rename(old_car_id, new_car_id)
+        congestion_model.rename(old_car_id, new_car_id)
+
+        # 아직 처리되지 않은 경로 재계산 요청
+        if old_car_id in reroute_requests:
+            reroute_requests.remove(old_car_id)
+            reroute_requests.add(new_car_id)
+
+        self.car_id = new_car_id
+
+        # 디스플레이 배정을 이전 ID에서 새 ID로 이동
+        route_changed_car_ids.add(old_car_id)
+        route_changed_car_ids.add(new_car_id)
+
     def is_moving(self) -> bool:
         
         return self.status != CarStatus.PARKING and self.space_id != None
@@ -366,6 +446,35 @@ class Space(ABC):
 
         return inside
     
+    def distance_to_boundary(self, x: float, y: float) -> float:
+        """
+        특정 좌표 (x, y)에서 구역 경계(각 변)까지의 최소 거리를 반환하는 메소드
+
+        Args:
+            x: 확인할 x 좌표
+            y: 확인할 y 좌표
+        Return:
+            float 가장 가까운 변까지의 거리
+        """
+        rectangle = self.position
+        n = len(rectangle)
+        min_distance = float('inf')
+
+        for i in range(n):
+            x1, y1 = rectangle[i]
+            x2, y2 = rectangle[(i + 1) % n]
+            dx, dy = x2 - x1, y2 - y1
+            length_sq = dx * dx + dy * dy
+
+            # 선분 위로 투영한 점 (선분 밖이면 가까운 끝점)
+            t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length_sq))
+            distance = math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+            if distance < min_distance:
+                min_distance = distance
+
+        return min_distance
+
     def append_car(self, car_id: int):
         """
         구역에 차량이 들어온 경우 처리
@@ -440,9 +549,9 @@ class ParkingSpace(Space):
             
             # 원래 들어올 예정이 아니었던 차량이 들어온 경우
             elif self.status == ParkingSpaceEnum.TARGET and self.car_id != car_id and self.car_id is not None :
-                prev_car_instance = car_number_instances[self.car_id]
+                prev_car_id = self.car_id
                 self.set_occupied(car_id)
-                prev_car_instance.cal_route()
+                request_reroute(prev_car_id)
 
             # 비어 있는 구역에 차량이 들어온 경우
             else:
@@ -495,6 +604,14 @@ class ParkingSpace(Space):
         self.car_number = car_number_instances[car_id].car_number
         self.status = ParkingSpaceEnum.TARGET
 
+    def set_reserved(self, car_number: str):
+        """입차기에서 예약된 주차 구역으로 설정하는 함수 (차량이 아직 추적되지 않아 차량 ID는 없음)"""
+
+        self.parking_time = None
+        self.car_id = None
+        self.car_number = car_number
+        self.status = ParkingSpaceEnum.TARGET
+
     def set_occupied(self, car_id):
         """주차 구역을 occupied로 설정하는 함수"""
 
@@ -619,11 +736,56 @@ car_number_instances: dict[int, Car] = {}
 # 트래킹이 끊긴 차량의 마지막 추적 시간을 관리하는 딕셔너리
 lost_tracking_time: dict[int, float] = {}
 
+# 입차 구역 (이동 구역 ID)
+ENTRY_MOVING_SPACE_ID = 15
+
+# 추적이 끊긴 차량을 삭제하기까지의 시간 (초)
+LOST_TRACKING_TIMEOUT = 3.0
+
+# 주차 구역 배정 비용에서 차량과 주차 구역 중심 사이 픽셀 거리에 곱하는 가중치
+# 비용은 다익스트라 경로 비용(혼잡도 단위, 이동 구역 하나에 100 이상)이 정하고, 거리는 같은 이동 구역에 붙은 주차 구역 사이의 순서만 정하도록
+# 작게 반영 (1920x1080 대각선 약 2200픽셀 -> 2.2, 카메라 해상도가 바뀌어도 경로 비용의 순서를 바꾸지 않음)
+BAY_DISTANCE_WEIGHT = 0.001
+
+# 이동 구역의 유입량과 예상 점유를 반영한 다익스트라 가중치 (roop에서 프레임마다 갱신)
+congestion_model = CongestionModel()
+
+# 추적이 끊긴 차량의 삭제 시각 (매 프레임 모든 차량을 확인하지 않고 삭제 시각이 된 차량만 꺼냄)
+lost_expiry_wheel = TimingWheel(tick=0.1, slots=64)
+
+# 마지막 전송 이후 경로 또는 목표 주차 구역이 변경된 차량의 ID (디스플레이 방향 갱신에 사용)
+route_changed_car_ids: set[int] = set()
+
+# roop의 프레임 처리와 입차기 예약(reserve_bay, flask 쓰레드)이 구역과 차량 상태를 동시에 바꾸지 않도록 하는 잠금
+state_lock = threading.RLock()
+
+# 입차기에서 예약한 주차 구역 (차량 번호 -> 주차 구역 ID), 차량이 입차 구역에 나타나면 entry에서 사용
+bay_holds: dict[str, int] = {}
+
+# 예약 후 차량이 입차 구역에 나타나지 않을 때 예약을 해제하기까지의 시간 (초)
+BAY_HOLD_TIMEOUT = 30.0
+
+# 예약 해제 시각 (차량 번호 단위)
+hold_expiry_wheel = TimingWheel(tick=0.5, slots=128)
+
+# 프레임 중에 경로 재계산이 요청된 차량의 ID (roop의 프레임 끝에서 flush_reroutes로 한 번에 처리)
+reroute_requests: set[int] = set()
+
+# 구역 경계에서 중심점이 흔들려 구역 전환(경로 재계산)이 반복되지 않도록 걸러내는 필터
+# smoothing은 칼만 필터 단계가 없을 때의 값 (main.KALMAN_SMOOTHING이면 1.0으로 바꿔 두 번 평활화하지 않음)
+zone_filter = ZoneTransitionFilter(min_dwell_frames=3, boundary_margin=10.0, smoothing=0.5)
+
+# 트래커 ID가 바뀐 새 트랙을 추적이 끊긴 차량과 다시 연결하는 인스턴스 (추적이 끊긴 차량이 삭제되기 전까지)
+track_reid = TrackReassociator(max_gap=LOST_TRACKING_TIMEOUT)
+
+# 프레임마다 받은 추적 데이터를 기록 (layout_lint로 재생하여 구역 경계 보정에 사용, None이면 기록하지 않음)
+track_log: Optional[TrackLogWriter] = None
+
 
 ### 함수 선언 ###
 
 # 쓰레드에서 실행 되는 메인 함수
-def main(yolo_data_queue: Queue[dict[int, tuple[float, float]]], car_number_data_queue, route_data_queue, event, parking_space_path, moving_space_path, id_match_car_number_queue, car_number_response_queue, exit_queue):
+def main(yolo_data_queue: Queue[dict[int, tuple[float, float]]], car_number_data_queue, route_data_queue, event, parking_space_path, moving_space_path, id_match_car_number_queue, car_number_response_queue, exit_queue, layout_manager: Optional[LayoutManager] = None, layout_bundle_path: Optional[str] = None, zone_map_factory: Optional[Callable[[Mapping[int, ParkingSpace], Mapping[int, MovingSpace]], ZoneMap]] = None):
     """
     쓰레드에서 호출 되어 실행되는 메인 함수로 각각의 함수를 순서대로 실행
 
@@ -635,23 +797,32 @@ def main(yolo_data_queue: Queue[dict[int, tuple[float, float]]], car_number_data
         parking_space_path (str): 주차 구역 데이터 경로
         walking_space_path (str): 이동 구역 데이터 경로
         serial_port (str): 시리얼 포트
+        layout_manager (LayoutManager): 변경된 구역 데이터를 프레임 사이에 교체하기 위한 인스턴스 (None이면 최초 데이터만 사용)
+        layout_bundle_path (str): 컴파일된 구역 번들 경로 (None이거나 json보다 오래된 경우 json 사용)
+        zone_map_factory (Callable): (주차 구역, 이동 구역) -> 구역 라벨 이미지 (None이면 다각형 판정만 사용)
     """
 
     # 사전에 입차한 차량을 확인 (최초 실행 시 카메라가 늦게 활성화 되어 비어있을 수 있으므로, 10 프레임 제거)
     for i in range(10):
         yolo_data_queue.get()
 
-    # parking_space, walking_space 설정
-    initialize_space(parking_space_path, moving_space_path)
+    # 초기화가 끝나기 전에는 입차기 예약(reserve_bay)을 받지 않음
+    with state_lock:
+        # parking_space, walking_space 설정
+        initialize_space(parking_space_path, moving_space_path, layout_bundle_path)
 
-    # 최초 실행 시 사전에 입차한 차량 번호 부여
-    init(yolo_data_queue)
+        # 차량 좌표의 구역 확인을 라벨 이미지 조회로 처리
+        if zone_map_factory is not None:
+            zone_filter.zone_map = zone_map_factory(parking_space_instances, moving_space_instances)
+
+        # 최초 실행 시 사전에 입차한 차량 번호 부여
+        init(yolo_data_queue)
 
     # tracking 쓰레드 루프 시작
     event.set()
 
     # 루프 실행
-    roop(yolo_data_queue, car_number_data_queue, route_data_queue, id_match_car_number_queue, car_number_response_queue, exit_queue)
+    roop(yolo_data_queue, car_number_data_queue, route_data_queue, id_match_car_number_queue, car_number_response_queue, exit_queue, layout_manager)
 
 
 def init(yolo_data_queue: Queue[dict[int, tuple[float, float]]]):
@@ -755,30 +926,282 @@ def init(yolo_data_queue: Queue[dict[int, tuple[float, float]]]):
             if (parking_space := check_position(car.position, parking_space_instances)) is not None:
                 car.update_in_parking(parking_space)
 
-def entry(car_id: int, data_queue: Queue[str], arg_position: tuple[float, float], car_number_response_queue: Queue[bool]):
-    """차량이 입차할 때 번호를 받아 차량 인스턴스를 생성하는 함수"""
+    # 초기화 중에 요청된 경로 재계산 처리
+    flush_reroutes()
+
+def entry(car_id: int, data_queue: Queue[str], arg_position: tuple[float, float], car_number_response_queue: Optional[Queue[bool]]):
+    """
+    차량이 입차할 때 번호를 받아 차량 인스턴스를 생성하는 함수
+
+    입차기에서 주차 구역을 예약한 차량은 예약된 구역을 목표로 설정 (응답은 flask_server에서 이미 전달)
+    car_number_response_queue가 None이면 응답을 보내지 않음 (예약 방식)
 
-    # 가장 최근의 데이터만 사용
-    while (data_queue.qsize() != 1):
-        data_queue.get()
-    car_number = data_queue.get()
+    예약 방식은 입차기가 응답을 기다리지 않아 여러 번호가 함께 대기할 수 있으므로 아직 유효한 예약(bay_holds) 중
+    가장 먼저 예약한 번호를 사용 (시간 초과로 해제된 번호, 같은 번호의 중복 요청은 bay_holds에 남지 않음)
+    응답 방식은 입차기가 응답을 받을 때까지 다음 번호를 보내지 않으므로 가장 최근의 번호만 사용
+    """
+    if car_number_response_queue is None:
+        car_number = next(iter(bay_holds), None)
+        if car_number is None:
+            return
+    else:
+        while (data_queue.qsize() != 1):
+            data_queue.get()
+        car_number = data_queue.get()
 
     print(f"입차하는 차량이 있습니다: 입출차기에서 수신한 차량 번호: {car_number}")
 
-    target = get_target_parking_space_id((0, 0), CarStatus.ENTRY)
+    reserved_parking_space_id = take_bay_hold(car_number)
 
-    # 주차장이 만차인 경우
-    if target == -1:
-        car_number_response_queue.put(False)
-        return
+    # 예약이 없는 경우 (예약 시간 초과 포함) 빈 주차 구역 확인
+    if reserved_parking_space_id is None:
+        target = get_target_parking_space_id((0, 0), CarStatus.ENTRY)
 
-    car_number_instances[car_id] = Car.create_entry_car(
+        # 주차장이 만차인 경우
+        if target == -1:
+            if car_number_response_queue is not None:
+                car_number_response_queue.put(False)
+            return
+
+    car = Car.create_entry_car(
         car_id=car_id,
         car_number=car_number,
         position=arg_position
     )
+    car_number_instances[car_id] = car
+
+    # 예약된 주차 구역을 차량의 목표로 변경 (첫 경로 계산에서 그대로 사용)
+    if reserved_parking_space_id is not None:
+        parking_space_instances[reserved_parking_space_id].set_target(car_id)
+        car.target_parking_space_id = reserved_parking_space_id
+        car.reserved_parking_space_id = reserved_parking_space_id
+
+    if car_number_response_queue is not None:
+        car_number_response_queue.put(True)
+
+
+def reserve_bay(car_number: str, current_time: Optional[float] = None) -> Optional[tuple[int, str]]:
+    """
+    입차기에서 차량 번호를 받았을 때 주차 구역을 바로 예약하는 함수 (flask_server 쓰레드에서 호출)
+
+    - state_lock으로 roop의 프레임 처리와 배타적으로 실행하여 마지막 남은 구역을 두 차량에 예약하지 않음
+    - 같은 차량 번호로 다시 요청하면 기존 예약을 유지하고 예약 시간만 연장
+    - 차량이 BAY_HOLD_TIMEOUT초 안에 입차 구역에 나타나지 않으면 예약 해제
+
+    Returns:
+        Optional[tuple[int, str]]: (주차 구역 ID, 주차 구역 이름), 빈 주차 구역이 없으면 None
+    """
+    current_time = time.time() if current_time is None else current_time
+
+    with state_lock:
+        release_expired_holds(current_time)
+
+        parking_space_id = bay_holds.get(car_number)
+
+        if parking_space_id is None:
+            if ENTRY_MOVING_SPACE_ID not in moving_space_instances:
+                return None
+
+            parking_space_id = get_target_parking_space_id(moving_space_instances[ENTRY_MOVING_SPACE_ID].center_position, CarStatus.ENTRY)
+            if parking_space_id == -1:
+                return None
+
+            parking_space_instances[parking_space_id].set_reserved(car_number)
+            bay_holds[car_number] = parking_space_id
+            print(f"차량 {car_number} 주차 구역 예약: {parking_space_instances[parking_space_id].name}")
+
+        hold_expiry_wheel.schedule(car_number, current_time + BAY_HOLD_TIMEOUT)
+
+        return parking_space_id, parking_space_instances[parking_space_id].name
+
+
+def take_bay_hold(car_number: str) -> Optional[int]:
+    """차량이 입차 구역에 나타났을 때 예약을 꺼내는 함수 (주차 구역은 예약 상태 유지)"""
+
+    parking_space_id = bay_holds.pop(car_number, None)
+    hold_expiry_wheel.cancel(car_number)
+
+    if parking_space_id is None:
+        return None
+
+    # 예약 후 다른 차량이 주차한 경우 예약 없음으로 처리
+    parking_space = parking_space_instances[parking_space_id]
+    if parking_space.car_id is not None or parking_space.car_number != car_number:
+        return None
+
+    return parking_space_id
+
+
+def release_expired_holds(current_time: float) -> list[str]:
+    """
+    예약 시간이 지난 주차 구역 예약을 해제하는 함수
+
+    Returns:
+        list[str]: 예약이 해제된 차량 번호
+    """
+    released = []
+
+    for car_number in hold_expiry_wheel.advance(current_time):
+        parking_space_id = bay_holds.pop(car_number, None)
+        if parking_space_id is None:
+            continue
+
+        # 다른 차량이 주차하거나 목표로 바꾸지 않은 경우에만 빈 구역으로 변경
+        parking_space = parking_space_instances[parking_space_id]
+        if parking_space.car_id is None and parking_space.car_number == car_number:
+            parking_space.set_empty()
+
+        print(f"차량 {car_number} 주차 구역 예약 시간 초과로 해제: {parking_space.name}")
+        released.append(car_number)
+
+    return released
+
+
+def restore_lost_car(car_id: int, position: tuple[float, float]) -> Optional[Car]:
+    """
+    등록되지 않은 새 트랙을 추적이 끊긴 차량과 연결하여 차량 번호와 목표 주차 구역을 유지하는 함수
+
+    Returns:
+        Optional[Car]: 복구된 차량 인스턴스, 연결할 차량이 없으면 None
+    """
+    current_time = time.time()
+    candidates = {
+        lost_car_id: (car_number_instances[lost_car_id], current_time - lost_time)
+        for lost_car_id, lost_time in lost_tracking_time.items()
+    }
+
+    lost_car_id = track_reid.match(position, candidates, parking_space_instances, moving_space_instances)
+    if lost_car_id is None:
+        return None
+
+    car = car_number_instances.pop(lost_car_id)
+    clear_lost_tracking(lost_car_id)
+
+    car.change_car_id(car_id)
+    car_number_instances[car_id] = car
+
+    print(f"차량 {lost_car_id}번 추적 복구 - 새 ID {car_id}번 ({car.car_number})")
+
+    return car
+
+
+def request_reroute(car_id: int) -> None:
+    """차량의 경로 재계산 요청 (같은 프레임에 여러 번 요청해도 한 번만 계산)"""
+
+    reroute_requests.add(car_id)
+
+
+def flush_reroutes() -> list[int]:
+    """
+    프레임 중에 요청된 경로 재계산을 한 번에 처리하는 함수
+
+    - 차량 ID 순서로 처리하여 같은 입력이면 항상 같은 결과
+    - 요청 후 같은 프레임에 삭제, 출차, 주차한 차량은 계산하지 않음
+    - 같은 출발 구역의 차량은 최단 경로 트리를 한 번만 계산하여 공유
+    - 주차 구역이 필요한 차량들은 목표 주차 구역을 함께 배정 (assign_bays, 총 경로 비용 + 주차 구역까지의 거리 최소)
+
+    Returns:
+        list[int]: 경로를 재계산한 차량 ID
+    """
+    if not reroute_requests:
+        return []
+
+    car_ids = sorted(reroute_requests)
+    reroute_requests.clear()
+
+    # 출발 구역 ID -> (최단 경로 트리, 구역별 경로 비용)
+    path_trees: dict[int, tuple[dict[int, int], dict[int, float]]] = {}
+
+    def get_tree(start_id: int) -> tuple[dict[int, int], dict[int, float]]:
+        if start_id not in path_trees:
+            path_trees[start_id] = shortest_path_tree(start_id)
+        return path_trees[start_id]
+
+    def find_route(start_id: int, goal_id: int) -> list[int]:
+        return trace_route(get_tree(start_id)[0], goal_id)
+
+    cars = [car_number_instances[car_id] for car_id in car_ids if car_id in car_number_instances]
+    cars = [car for car in cars if car.status != CarStatus.PARKING]
+
+    # 기존 목표를 먼저 해제하여 함께 배정할 수 있는 주차 구역에 포함
+    for car in cars:
+        car.clear_route()
+
+    entry_cars = {car.car_id: car for car in cars if car.status == CarStatus.ENTRY and car.space_id is not None}
+
+    # 입차기에서 예약한 주차 구역은 첫 경로 계산에서 그대로 사용
+    reserved = {}
+    for car_id, car in list(entry_cars.items()):
+        parking_space_id = car.reserved_parking_space_id
+        car.reserved_parking_space_id = None
+        if parking_space_id is not None and parking_space_instances[parking_space_id].available_target():
+            reserved[car_id] = parking_space_id
+            del entry_cars[car_id]
+
+    bay_ids = [
+        space_id for space_id, parking_space in parking_space_instances.items()
+        if parking_space.available_target() and space_id not in reserved.values()
+    ]
+
+    def bay_cost(car_id: int, bay_id: int) -> float:
+        car = entry_cars[car_id]
+        parking_space = parking_space_instances[bay_id]
+        route_cost = get_tree(car.space_id)[1].get(parking_space.get_near_moving_space_id())
+        if route_cost is None:
+            return INF
+
+        # 경로 비용이 같은 주차 구역(같은 이동 구역에 인접)은 차량과 가까운 순서
+        center_x, center_y = parking_space.center_position
+        return route_cost + BAY_DISTANCE_WEIGHT * math.hypot(car.position[0] - center_x, car.position[1] - center_y)
+
+    assignment = assign_bays(list(entry_cars), bay_ids, bay_cost)
+    assignment.update(reserved)
+
+    processed = []
+    for car in cars:
+        car.cal_route(find_route, assignment.get(car.car_id))
+        processed.append(car.car_id)
+
+    return processed
+
+
+def update_lost_tracking(car_tracks: Mapping[int, tuple[float, float]], current_time: float) -> list[int]:
+    """
+    추적이 끊긴 차량을 기록하고 LOST_TRACKING_TIMEOUT초가 지난 차량을 삭제하는 함수
+
+    새로 끊긴 차량은 등록 차량과 추적 ID의 집합 차이로 찾고, 삭제 대상은 타이밍 휠에서 만료된 차량만 꺼냄
+
+    Returns:
+        list[int]: 삭제된 차량 ID
+    """
+
+    # 처음 추적이 끊긴 경우 현재 시간 기록
+    for car_id in car_number_instances.keys() - car_tracks.keys() - lost_tracking_time.keys():
+        lost_tracking_time[car_id] = current_time
+        lost_expiry_wheel.schedule(car_id, current_time + LOST_TRACKING_TIMEOUT)
+        print(f"차량 {car_id}번 추적 끊김 - {LOST_TRACKING_TIMEOUT:g}초 대기 중...")
+
+    # 추적이 끊긴지 LOST_TRACKING_TIMEOUT초가 지난 경우 삭제
+    deleted_car_ids = []
+    for car_id in lost_expiry_wheel.advance(current_time):
+        lost_tracking_time.pop(car_id, None)
+
+        if car_id not in car_number_instances:
+            continue
 
-    car_number_response_queue.put(True)
+        print(f"차량 {car_id}번 {LOST_TRACKING_TIMEOUT:g}초 경과로 삭제")
+        car_number_instances[car_id].delete_car()
+        del car_number_instances[car_id]
+        deleted_car_ids.append(car_id)
+
+    return deleted_car_ids
+
+
+def clear_lost_tracking(car_id: int) -> None:
+    """추적이 복구된 차량을 lost_tracking_time과 삭제 예정 목록에서 제거"""
+
+    lost_tracking_time.pop(car_id, None)
+    lost_expiry_wheel.cancel(car_id)
 
 
 def car_exit(car: Car, exit_queue: Queue):
@@ -789,110 +1212,145 @@ def car_exit(car: Car, exit_queue: Queue):
     del car_number_instances[car.car_id]
 
 
-def roop(yolo_data_queue: Queue[dict[int, tuple[float, float]]], car_number_data_queue: Queue[str], route_data_queue, id_match_car_number_queue, car_number_response_queue, exit_queue):
+def roop(yolo_data_queue: Queue[dict[int, tuple[float, float]]], car_number_data_queue: Queue[str], route_data_queue, id_match_car_number_queue, car_number_response_queue, exit_queue, layout_manager: Optional[LayoutManager] = None):
     """차량 추적 데이터와 차량 번호 데이터를 받아와 계산하는 함수
 
     Args:
         yolo_data_queue (Queue): yolo로 추적한 데이터를 받기 위한 큐
         car_number_data_queue (Queue): uart로 수신 받은 차량 번호 데이터 큐
         route_data_queue (Queue): send_to_server로 데이터를 전달하기 위한 큐
+        layout_manager (LayoutManager): 준비된 구역 데이터가 있으면 프레임 처리 전에 교체 (None이면 교체하지 않음)
     """
 
     while True:
         # yolo로 추적한 데이터 큐에서 가져오기
         car_tracks = yolo_data_queue.get()
 
+        if track_log is not None:
+            track_log.write(car_tracks)
+
         id_match_car_number_queue.put(car_number_instances)
 
-        for car_id, position in car_tracks.items():
+        # 입차기 예약(reserve_bay)과 동시에 상태를 바꾸지 않도록 프레임 처리 중에는 잠금
+        with state_lock:
+
+            # 새 구역 데이터가 준비된 경우 이번 프레임 처리 전에 교체
+            if layout_manager is not None:
+                layout = layout_manager.take_pending()
+                if layout is not None:
+                    apply_layout(layout.parking_spaces, layout.moving_spaces, layout.direction_table, layout.zone_map)
+
+            for car_id, position in car_tracks.items():
+
+                # 등록되지 않은 트랙이 추적이 끊긴 차량의 바뀐 ID인 경우 기존 차량 인스턴스를 복구
+                if car_id not in car_number_instances and lost_tracking_time:
+                    restore_lost_car(car_id, position)
 
-            # 등록된 차량 확인
-            if car_id in car_number_instances:
+                # 등록된 차량 확인
+                if car_id in car_number_instances:
 
-                car = car_number_instances[car_id]  # 차량 인스턴스
-                car.update_position(position)
+                    car = car_number_instances[car_id]  # 차량 인스턴스
+                    car.update_position(position)
 
-                # 추적이 복구된 차량은 lost_tracking_time에서 제거
-                if car_id in lost_tracking_time:
-                    del lost_tracking_time[car_id]
+                    # 추적이 복구된 차량은 lost_tracking_time에서 제거
+                    if car_id in lost_tracking_time:
+                        clear_lost_tracking(car_id)
 
-                if len(car.route) != 0:
-                    print(f"{car.car_id}번 루트: {car.route}")
+                    if len(car.route) != 0:
+                        print(f"{car.car_id}번 루트: {car.route}")
                 
-                # 주차 구역에 있는지 확인 하고 처리
-                if (parking_space := check_position(position, parking_space_instances)) is not None:
-                    car.update_in_parking(parking_space)
+                    # 구역 전환이 확정된 구역 (경계에서 흔들리는 동안에는 기존 구역 유지)
+                    kind, space = zone_filter.update(car_id, position, parking_space_instances, moving_space_instances)
+
+                    # 주차 구역에 있는지 확인 하고 처리
+                    if kind == "parking":
+                        car.update_in_parking(space)
                 
-                # 이동 구역에 있는지 확인 하고 처리
-                elif (moving_space := check_position(position, moving_space_instances)) is not None:
+                    # 이동 구역에 있는지 확인 하고 처리
+                    elif kind == "moving":
 
-                    # 차량이 출구 구역에 있는 경우
-                    if moving_space.space_id == 1:
-                        car_exit(car, exit_queue)
+                        # 차량이 출구 구역에 있는 경우
+                        if space.space_id == 1:
+                            car_exit(car, exit_queue)
                     
-                    else:
-                        car.update_in_moving(moving_space)
+                        else:
+                            car.update_in_moving(space)
                 
-                # 구역 밖 처리
-                else:
-                    car_number_instances[car_id].delete_car()
-                    del car_number_instances[car_id]
-
-            # 등록되지 않은 차량이 입차 구역에 있으며 입차기로부터 번호판을 받은 경우
-            elif moving_space_instances[15].is_car_in_space(position[0], position[1]) and car_number_data_queue.qsize() > 0:
-                entry(car_id, car_number_data_queue, position, car_number_response_queue)
-
-        # car_number_instances에 있으나 car_tracks에 없는 차량 처리 (추적이 끊긴 차량)
-        current_time = time.time()
-        cars_to_delete = []
-
-        for car_id in list(car_number_instances.keys()):
-            if car_id not in car_tracks:
-                # 처음 추적이 끊긴 경우 현재 시간 기록
-                if car_id not in lost_tracking_time:
-                    lost_tracking_time[car_id] = current_time
-                    print(f"차량 {car_id}번 추적 끊김 - 3초 대기 중...")
-
-                # 추적이 끊긴지 3초가 지난 경우 삭제
-                elif current_time - lost_tracking_time[car_id] >= 3.0:
-                    print(f"차량 {car_id}번 3초 경과로 삭제")
-                    cars_to_delete.append(car_id)
-
-        # 삭제 대상 차량 처리
-        for car_id in cars_to_delete:
-            car_number_instances[car_id].delete_car()
-            del car_number_instances[car_id]
-            del lost_tracking_time[car_id]
-
-        # 차량 데이터 전송 (cars: 차량 정보, parking: 주차 구역 정보, moving: 이동 구역 정보)
-        # MappingProxyType을 사용하여 read-only view 생성 (메모리 효율적)
-        route_data_queue.put({
-            "cars": MappingProxyType(car_number_instances),
-            "parking": MappingProxyType(parking_space_instances),
-            "moving": MappingProxyType(moving_space_instances),
-        })
+                    # 구역 밖 처리
+                    else:
+                        car_number_instances[car_id].delete_car()
+                        del car_number_instances[car_id]
+
+                # 등록되지 않은 차량이 입차 구역에 있으며 입차기로부터 번호판을 받은 경우 (예약 방식은 유효한 예약이 있는 경우)
+                elif (moving_space_instances[ENTRY_MOVING_SPACE_ID].is_car_in_space(position[0], position[1])
+                      and (bay_holds if car_number_response_queue is None else car_number_data_queue.qsize() > 0)):
+                    entry(car_id, car_number_data_queue, position, car_number_response_queue)
+
+            # car_number_instances에 있으나 car_tracks에 없는 차량 처리 (추적이 끊긴 차량)
+            current_time = time.time()
+            update_lost_tracking(car_tracks, current_time)
+
+            # 이번 프레임에 요청된 경로 재계산을 한 번에 처리
+            flush_reroutes()
+
+            # 차량이 나타나지 않은 주차 구역 예약 해제
+            release_expired_holds(current_time)
+
+            # 다음 프레임의 경로 계산에 사용할 혼잡도 가중치 갱신
+            congestion_model.update(car_number_instances, moving_space_instances, current_time, MovingSpace.ROUTE_CONGESTION)
+
+            # 차량 데이터 전송 (cars: 차량 정보, parking: 주차 구역 정보, moving: 이동 구역 정보)
+            # MappingProxyType을 사용하여 read-only view 생성 (메모리 효율적)
+            route_data_queue.put({
+                "cars": MappingProxyType(car_number_instances),
+                "parking": MappingProxyType(parking_space_instances),
+                "moving": MappingProxyType(moving_space_instances),
+                "route_changed": frozenset(route_changed_car_ids),
+            })
+            route_changed_car_ids.clear()
 
         yolo_data_queue.task_done()  # 처리 완료 신호
 
 
-def initialize_space(parking_space_path, moving_space_path):
-    """최초 실행 시 구역 데이터 설정"""
+def initialize_space(parking_space_path, moving_space_path, bundle_path=None):
+    """
+    최초 실행 시 구역 데이터 설정
+
+    컴파일된 구역 번들(layout_bundle)이 json과 같으면 번들의 구역 데이터와 디스플레이 방향 테이블을 사용
+    """
     global parking_space_instances
     global moving_space_instances
 
-    # json으로 부터 parking_space 데이터를 읽어옴
-    with open(parking_space_path, "r") as f:
-        parking_space = json.load(f)
-        parking_space = {int(key): value for key, value in parking_space.items()}  # 문자열 키를 숫자로 변환
+    # 번들 또는 json으로 부터 구역 데이터를 읽어옴 (정수 키)
+    parking_space, moving_space, bundle = layout_bundle.load_layout_data(parking_space_path, moving_space_path, bundle_path)
+
+    parking_spaces, moving_spaces = build_spaces(parking_space, moving_space)
+    parking_space_instances.update(parking_spaces)
+    moving_space_instances.update(moving_spaces)
+
+    # 디스플레이 구역과 다음 구역 사이의 방향 (번들에 미리 계산되어 있지 않으면 계산)
+    if bundle is not None:
+        display_direction.install_direction_table(bundle.direction_table)
+    else:
+        display_direction.build_direction_table(parking_space_instances, moving_space_instances)
+
 
-    # json으로 부터 moving_space 데이터를 읽어옴
-    with open(moving_space_path, "r") as f:
-        moving_space = json.load(f)
-        moving_space = {int(key): value for key, value in moving_space.items()}  # 문자열 키를 숫자로 변환
+def build_spaces(
+    parking_space: Mapping[int, dict],
+    moving_space: Mapping[int, dict],
+) -> tuple[dict[int, ParkingSpace], dict[int, MovingSpace]]:
+    """
+    구역 데이터(정수 키로 변환한 json)로 구역 인스턴스를 생성하는 함수
+
+    Returns:
+        tuple: (주차 구역 ID -> ParkingSpace, 이동 구역 ID -> MovingSpace)
+    """
+    parking_spaces: dict[int, ParkingSpace] = {}
+    moving_spaces: dict[int, MovingSpace] = {}
 
     # ParkingSpace 클래스 인스턴스 생성
     for space_id, space_data in parking_space.items():
-        parking_space_instances[space_id] = ParkingSpace(
+        parking_spaces[space_id] = ParkingSpace(
             space_id=space_id,
             name=space_data["name"],
             position=space_data["position"],
@@ -901,7 +1359,7 @@ def initialize_space(parking_space_path, moving_space_path):
 
     # MovingSpace 클래스 인스턴스 생성
     for space_id, space_data in moving_space.items():
-        moving_space_instances[space_id] = MovingSpace(
+        moving_spaces[space_id] = MovingSpace(
             space_id=space_id,
             name=space_data["name"],
             position=space_data["position"],
@@ -909,7 +1367,108 @@ def initialize_space(parking_space_path, moving_space_path):
             near_parking_space_id=space_data["near_parking_space_id"],
             near_moving_space_id=space_data["near_moving_space_id"]
         )
-        
+
+    return parking_spaces, moving_spaces
+
+
+def apply_layout(
+    parking_spaces: dict[int, ParkingSpace],
+    moving_spaces: dict[int, MovingSpace],
+    direction_table: Optional[Mapping] = None,
+    zone_map: Optional[ZoneMap] = None,
+) -> None:
+    """
+    구역 인스턴스를 새 구역 데이터로 교체하고 추적 중인 차량을 새 구역으로 옮기는 함수
+
+    roop의 프레임 사이(state_lock 안)에서 호출하며, 전달한 딕셔너리의 내용으로 기존 딕셔너리를 바꾸므로
+    send_to_server 등에 전달된 MappingProxyType도 새 구역을 가리킴
+
+    - 기존 경로와 목표 주차 구역은 해제하고 이동 구역의 차량은 프레임 끝(flush_reroutes)에서 경로를 다시 계산
+    - 주차한 차량은 마지막 위치의 주차 구역에 주차 시간을 유지한 채 다시 등록
+      (마지막 위치가 새 주차 구역 밖이면 출차로 보지 않고 같은 ID 또는 가장 가까운 주차 구역에 두고, 실제로 움직일 때까지 유지)
+    - 입차기 예약은 같은 ID의 주차 구역이 남아 있고 비어 있는 경우에만 유지
+    - 혼잡도 가중치는 새 구역으로 다시 계산
+
+    Args:
+        parking_spaces, moving_spaces: build_spaces로 생성한 새 구역 인스턴스
+        direction_table: 새 구역으로 미리 계산한 디스플레이 방향 테이블 (None이면 여기서 계산)
+        zone_map: 새 구역의 라벨 이미지 (None이면 다각형 판정만 사용)
+    """
+    # 기존 구역의 혼잡도와 목표 주차 구역 해제
+    for car in car_number_instances.values():
+        car.clear_route()
+
+    parking_space_instances.clear()
+    parking_space_instances.update(parking_spaces)
+    moving_space_instances.clear()
+    moving_space_instances.update(moving_spaces)
+
+    if direction_table is None:
+        display_direction.build_direction_table(parking_space_instances, moving_space_instances)
+    else:
+        display_direction.install_direction_table(direction_table)
+
+    # 기존 구역 키로 저장된 전환 상태는 새 구역에서 의미가 없으므로 제거
+    zone_filter.reset()
+    zone_filter.zone_map = zone_map
+
+    # 차량의 마지막 위치로 새 구역 확인 (구역 밖의 차량은 다음 프레임의 roop에서 삭제)
+    for car_id, car in car_number_instances.items():
+        parking_time = car.parking_time if car.status == CarStatus.PARKING else None
+        previous_space_id = car.space_id
+        car.space_id = None
+
+        kind, space = zone_filter.update(car_id, car.position, parking_space_instances, moving_space_instances)
+
+        # 새 구역에서 주차 구역 밖이 된 주차 차량 (구역 데이터만 바뀌었으므로 출차로 처리하지 않음)
+        if parking_time is not None and kind != "parking" and parking_space_instances:
+            kind, space = "parking", layout_parking_space(car, previous_space_id)
+            zone_filter.pin(car_id, car.position, ("parking", space.space_id))
+
+        if kind == "parking":
+            car.update_in_parking(space)
+            if parking_time is not None:
+                car.parking_time = parking_time
+                space.parking_time = parking_time
+
+        elif kind == "moving":
+            car.update_in_moving(space)
+
+        if car.reserved_parking_space_id not in parking_space_instances:
+            car.reserved_parking_space_id = None
+
+    # 새 구역에서 유지할 수 없는 입차기 예약 해제
+    for car_number, parking_space_id in list(bay_holds.items()):
+        parking_space = parking_space_instances.get(parking_space_id)
+
+        if parking_space is not None and parking_space.available_target():
+            parking_space.set_reserved(car_number)
+        else:
+            del bay_holds[car_number]
+            hold_expiry_wheel.cancel(car_number)
+            print(f"차량 {car_number} 주차 구역 예약 해제: 변경된 구역 데이터에 {parking_space_id}번 주차 구역을 사용할 수 없음")
+
+    # 기존 구역 ID로 계산된 혼잡도 가중치를 새 구역으로 다시 계산 (프레임 끝의 경로 재계산에서 사용)
+    congestion_model.relayout(car_number_instances, moving_space_instances, time.time(), MovingSpace.ROUTE_CONGESTION)
+
+    print(f"구역 데이터 교체 완료: 주차 구역 {len(parking_space_instances)}개, 이동 구역 {len(moving_space_instances)}개, 차량 {len(car_number_instances)}대")
+
+def layout_parking_space(car: Car, previous_space_id: Optional[int]) -> ParkingSpace:
+    """
+    구역 데이터 교체 후 주차 구역 밖이 된 주차 차량을 둘 주차 구역
+
+    기존과 같은 ID의 주차 구역이 비어 있으면 그 구역, 아니면 빈 구역 중 경계가 가장 가까운 구역 (빈 구역이 없으면 가장 가까운 구역)
+    """
+    previous = parking_space_instances.get(previous_space_id) if previous_space_id is not None else None
+    if previous is not None and not previous.car_set:
+        return previous
+
+    return min(
+        parking_space_instances.values(),
+        key=lambda space: (len(space.car_set) > 0, space.distance_to_boundary(car.position[0], car.position[1])),
+    )
+
+
 @overload
 def check_position(position, spaces: Mapping[int, ParkingSpace]) -> Optional[ParkingSpace]: ...
 
@@ -935,8 +1494,7 @@ def dijkstra(arg_start_id: int, arg_goal_id: int) -> list[int]:
     """경로를 계산하여 반환하는 함수"""
 
     pq = []
-    start_space = moving_space_instances[arg_start_id]
-    heapq.heappush(pq, (start_space.congestion, arg_start_id))
+    heapq.heappush(pq, (get_congestion(arg_start_id), arg_start_id))
     came_from = {arg_start_id: 0}
     cost_so_far = {arg_start_id: 0}
 
@@ -949,13 +1507,45 @@ def dijkstra(arg_start_id: int, arg_goal_id: int) -> list[int]:
         current_space = moving_space_instances[current_space_id]
 
         for next_space_id in current_space.near_moving_space_id:
-            new_cost = cost_so_far[current_space_id] + moving_space_instances[next_space_id].congestion
+            new_cost = cost_so_far[current_space_id] + get_congestion(next_space_id)
             if next_space_id not in cost_so_far or new_cost < cost_so_far[next_space_id]:
                 cost_so_far[next_space_id] = new_cost
                 heapq.heappush(pq, (new_cost, next_space_id))
                 came_from[next_space_id] = current_space_id
 
     # 경로를 역추적하여 반환
+    return trace_route(came_from, arg_goal_id)
+
+
+def shortest_path_tree(arg_start_id: int) -> tuple[dict[int, int], dict[int, float]]:
+    """
+    출발 구역에서 모든 이동 구역까지의 최단 경로 트리를 계산하는 함수 (dijkstra와 같은 가중치와 순서, 도착 구역에서 멈추지 않음)
+
+    Returns:
+        tuple: (구역 ID -> 이전 구역 ID (출발 구역은 0), 구역 ID -> 경로 비용)
+    """
+    pq = []
+    heapq.heappush(pq, (get_congestion(arg_start_id), arg_start_id))
+    came_from = {arg_start_id: 0}
+    cost_so_far = {arg_start_id: 0}
+
+    while pq:
+        current_space_id: int = heapq.heappop(pq)[1]
+        current_space = moving_space_instances[current_space_id]
+
+        for next_space_id in current_space.near_moving_space_id:
+            new_cost = cost_so_far[current_space_id] + get_congestion(next_space_id)
+            if next_space_id not in cost_so_far or new_cost < cost_so_far[next_space_id]:
+                cost_so_far[next_space_id] = new_cost
+                heapq.heappush(pq, (new_cost, next_space_id))
+                came_from[next_space_id] = current_space_id
+
+    return came_from, cost_so_far
+
+
+def trace_route(came_from: Mapping[int, int], arg_goal_id: int) -> list[int]:
+    """최단 경로 트리에서 도착 구역까지의 경로를 역추적하여 반환"""
+
     current_space_id = arg_goal_id
     result_path = []
     while current_space_id:
@@ -966,6 +1556,16 @@ def dijkstra(arg_start_id: int, arg_goal_id: int) -> list[int]:
     return result_path
 
 
+def get_congestion(space_id: int) -> float:
+    """다익스트라에서 사용하는 이동 구역의 가중치 (혼잡도 모델이 아직 계산하지 않은 구역은 현재 혼잡도 사용)"""
+
+    weight = congestion_model.weights.get(space_id)
+    if weight is None:
+        return moving_space_instances[space_id].congestion
+
+    return weight
+
+
 def check_route(arg_route) -> tuple[Optional[int], Optional[int]]:
     """경로상에 주차할 구역이 있는지 확인하는 함수"""
 
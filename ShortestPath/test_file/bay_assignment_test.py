@@ -0,0 +1,92 @@
+"""
+주차 구역 일괄 배정 테스트 코드
+bay_assignment.py의 hungarian, assign_bays에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import random
+from itertools import permutations
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bay_assignment import INF, assign_bays, hungarian
+
+
+class TestBayAssignment:
+    """주차 구역 일괄 배정 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    @staticmethod
+    def brute_force(cost):
+        """모든 배정을 확인하여 최소 비용 계산 (행 수 <= 열 수)"""
+        rows, cols = len(cost), len(cost[0])
+        return min(sum(cost[i][j] for i, j in enumerate(columns)) for columns in permutations(range(cols), rows))
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("주차 구역 일괄 배정 테스트 시작")
+        print("=" * 80)
+
+        print("\n[헝가리안 알고리즘 테스트]")
+        cost = [[4, 1, 3], [2, 0, 5], [3, 2, 2]]
+        self.check("TC1: 정사각 행렬 최소 배정", hungarian(cost), [(0, 1), (1, 0), (2, 2)])
+
+        # 탐욕 배정(0번 차량이 가장 가까운 0번 구역 선택)보다 총 비용이 작은 배정
+        cost = [[1, 2], [2, 100]]
+        self.check("TC2: 탐욕 배정보다 작은 총 비용", hungarian(cost), [(0, 1), (1, 0)])
+
+        self.check("TC3: 행이 적은 경우 모든 행 배정", hungarian([[5, 1, 9, 3]]), [(0, 1)])
+        self.check("TC4: 행이 많은 경우 모든 열 배정", hungarian([[5], [1], [9]]), [(1, 0)])
+        self.check("TC5: 빈 행렬", hungarian([]), [])
+
+        rng = random.Random(0)
+        matched = True
+        for _ in range(30):
+            rows = rng.randint(1, 5)
+            cols = rng.randint(rows, 6)
+            cost = [[rng.randint(0, 50) for _ in range(cols)] for _ in range(rows)]
+            result = hungarian(cost)
+            if sum(cost[i][j] for i, j in result) != self.brute_force(cost) or len({j for _, j in result}) != rows:
+                matched = False
+        self.check("TC6: 무작위 행렬의 최소 비용이 완전 탐색과 동일", matched, True)
+
+        print("\n[주차 구역 배정 테스트]")
+        costs = {("a", 10): 1, ("a", 11): 2, ("b", 10): 2, ("b", 11): 100}
+        self.check("TC7: 차량 ID -> 주차 구역 ID", assign_bays(["a", "b"], [10, 11], lambda car, bay: costs[(car, bay)]), {"a": 11, "b": 10})
+
+        costs = {("a", 10): INF, ("a", 11): INF, ("b", 10): 3, ("b", 11): 1}
+        self.check("TC8: 도달할 수 없는 차량은 제외", assign_bays(["a", "b"], [10, 11], lambda car, bay: costs[(car, bay)]), {"b": 11})
+        self.check("TC9: 빈 주차 구역이 없는 경우", assign_bays(["a"], [], lambda car, bay: 0), {})
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestBayAssignment()
+    tester.run_all_tests()
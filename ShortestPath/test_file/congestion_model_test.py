@@ -0,0 +1,170 @@
+"""
+혼잡도 모델 테스트 코드
+congestion_model.py의 유입량 감쇠, 예상 점유, 다익스트라 가중치, 차량 ID 변경, 칼만 속도 사용에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import math
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import Car, CarStatus, MovingSpace
+from congestion_model import CongestionModel
+
+
+class TestCongestionModel:
+    """혼잡도 모델 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def setup_spaces(self):
+        """테스트용 구역 설정: 1 - 2 - 3 가로 배치 (구역 폭 100)"""
+        sr.moving_space_instances.clear()
+        sr.parking_space_instances.clear()
+        sr.car_number_instances.clear()
+        sr.congestion_model = CongestionModel()
+
+        for space_id in (1, 2, 3):
+            x = (space_id - 1) * 100
+            sr.moving_space_instances[space_id] = MovingSpace(
+                space_id=space_id,
+                name=f"space_{space_id}",
+                position=[(x, 0), (x + 100, 0), (x + 100, 100), (x, 100)],
+                congestion=100,
+                near_parking_space_id=[],
+                near_moving_space_id=[n for n in (space_id - 1, space_id + 1) if 1 <= n <= 3]
+            )
+
+    def moving_car(self, car_id, space_id, route, position):
+        """이동 구역에 있는 차량 생성"""
+        car = Car.create_entry_car(car_id=car_id, car_number=str(car_id), position=position)
+        car.status = CarStatus.ENTRY
+        car.space_id = space_id
+        sr.moving_space_instances[space_id].append_car(car_id)
+        car.route = route
+        for route_space_id in route:
+            sr.moving_space_instances[route_space_id].append_route(car_id)
+        sr.car_number_instances[car_id] = car
+        return car
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("혼잡도 모델 테스트 시작")
+        print("=" * 80)
+
+        print("\n[유입량 테스트]")
+        model = CongestionModel(flow_time_constant=60.0)
+        model.add_flow(2, 0.0)
+        model.add_flow(2, 0.0)
+        self.check("TC1: 유입량 누적", model.decayed_flow(2, 0.0), 2.0)
+        self.check("TC2: 시간 상수만큼 지나면 1/e로 감쇠", abs(model.decayed_flow(2, 60.0) - 2 / math.e) < 1e-9, True)
+        self.check("TC3: 유입이 없던 구역은 0", model.flow_rate(3, 60.0), 0.0)
+
+        print("\n[예상 점유 테스트]")
+        self.setup_spaces()
+        model = CongestionModel(horizon=10.0, flow_congestion=0.0, min_speed=10.0)
+        car = self.moving_car(1, 1, [1, 2, 3], (50, 50))
+        weights = model.update(sr.car_number_instances, sr.moving_space_instances, 0.0, MovingSpace.ROUTE_CONGESTION)
+        self.check("TC4: 곧 도착할 구역의 가중치가 더 큼", weights[2] > weights[3], True)
+        self.check("TC5: 경로 차량 수 대신 예상 점유 사용 (ETA 10초)",
+                   abs(weights[2] - (100 + MovingSpace.ROUTE_CONGESTION * math.exp(-1))) < 1e-6, True)
+        self.check("TC6: 현재 구역은 차량 혼잡도 유지", weights[1], 100 + MovingSpace.CAR_CONGESTION)
+
+        car.position = (150, 50)
+        weights = model.update(sr.car_number_instances, sr.moving_space_instances, 1.0, MovingSpace.ROUTE_CONGESTION)
+        self.check("TC7: 속도가 빨라지면 예상 점유 증가", weights[3] > 100 + MovingSpace.ROUTE_CONGESTION * math.exp(-2), True)
+
+        print("\n[다익스트라 가중치 테스트]")
+        self.setup_spaces()
+        self.check("TC8: 모델 갱신 전에는 현재 혼잡도 사용", sr.get_congestion(2), 100)
+        sr.congestion_model.weights = {1: 100, 2: 100, 3: 5000}
+        self.check("TC9: 모델 가중치 사용", sr.get_congestion(3), 5000)
+
+        print("\n[차량 ID 변경 테스트]")
+        self.setup_spaces()
+        model = CongestionModel(flow_time_constant=60.0, speed_smoothing=1.0)
+        car = self.moving_car(1, 1, [1, 2, 3], (50, 50))
+        model.update(sr.car_number_instances, sr.moving_space_instances, 0.0, MovingSpace.ROUTE_CONGESTION)
+        car.position = (60, 50)
+        model.update(sr.car_number_instances, sr.moving_space_instances, 1.0, MovingSpace.ROUTE_CONGESTION)
+
+        model.rename(1, 9)
+        sr.car_number_instances[9] = sr.car_number_instances.pop(1)
+        car.position = (70, 50)
+        model.update(sr.car_number_instances, sr.moving_space_instances, 2.0, MovingSpace.ROUTE_CONGESTION)
+        self.check("TC10: ID가 바뀌어도 같은 구역에 유입량을 다시 더하지 않고 속도 유지",
+                   (round(model.decayed_flow(1, 2.0), 6), model.car_motion[9][2], 1 in model.car_space), (round(math.exp(-2 / 60), 6), 10.0, False))
+
+        self.setup_spaces()
+        car = self.moving_car(1, 1, [1, 2, 3], (50, 50))
+        sr.congestion_model.update(sr.car_number_instances, sr.moving_space_instances, 0.0, MovingSpace.ROUTE_CONGESTION)
+        car.change_car_id(9)
+        self.check("TC11: change_car_id가 혼잡도 모델의 차량 기록도 변경",
+                   (sorted(sr.congestion_model.car_motion), sorted(sr.congestion_model.car_space), sorted(sr.congestion_model.contributions)),
+                   ([9], [9], [9]))
+
+        print("\n[칼만 속도 테스트]")
+        self.setup_spaces()
+        model = CongestionModel(horizon=10.0, flow_congestion=0.0, min_speed=1.0, velocity_source=lambda: {1: (6.0, 8.0)})
+        self.moving_car(1, 1, [1, 2, 3], (50, 50))
+        weights = model.update(sr.car_number_instances, sr.moving_space_instances, 0.0, MovingSpace.ROUTE_CONGESTION)
+        self.check("TC12: 칼만 속도(10픽셀/초)로 ETA 계산, 이동 평균은 계산하지 않음",
+                   (abs(weights[2] - (100 + MovingSpace.ROUTE_CONGESTION * math.exp(-1))) < 1e-6, 1 in model.car_motion), (True, False))
+
+        print("\n[경로 재계산 테스트]")
+        self.setup_spaces()
+        car = self.moving_car(1, 1, [1, 2, 3], (50, 50))
+        self.moving_car(2, 1, [1, 2], (60, 50))
+        sr.congestion_model.update(sr.car_number_instances, sr.moving_space_instances, 0.0, MovingSpace.ROUTE_CONGESTION)
+        before = sr.congestion_model.weights[2]
+        car.clear_route()
+        weights = sr.congestion_model.weights
+        self.check("TC13: 경로를 해제한 차량의 예상 점유만 가중치에서 제거 (다른 차량의 예상 점유 유지)",
+                   (abs(before - weights[2] - MovingSpace.ROUTE_CONGESTION * math.exp(-0.5)) < 1e-6, weights[3], 1 in sr.congestion_model.contributions),
+                   (True, 100.0, False))
+
+        self.setup_spaces()
+        self.moving_car(1, 1, [1, 2, 3], (50, 50))
+        sr.congestion_model.add_flow(3, 0.0)
+        sr.congestion_model.update(sr.car_number_instances, sr.moving_space_instances, 0.0, MovingSpace.ROUTE_CONGESTION)
+        new_moving = {space_id: MovingSpace(space_id=space_id, name=f"new_{space_id}", position=space.position, congestion=100,
+                                            near_parking_space_id=[], near_moving_space_id=[n for n in space.near_moving_space_id if n != 3])
+                      for space_id, space in sr.moving_space_instances.items() if space_id != 3}
+        flow = sr.congestion_model.decayed_flow(1, 0.0)
+        sr.apply_layout({}, new_moving)
+        self.check("TC14: 구역 데이터를 교체하면 새 구역으로 가중치를 다시 계산 (구역 변경은 유입으로 세지 않음)",
+                   (sorted(sr.congestion_model.weights), 3 in sr.congestion_model.flow, sr.congestion_model.decayed_flow(1, 0.0) == flow),
+                   ([1, 2], False, True))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestCongestionModel()
+    tester.run_all_tests()
@@ -0,0 +1,187 @@
+"""
+탐지 백엔드 테스트 코드
+detection_backend.py의 ONNX 전처리/후처리, numpy_bytetrack.py의 ByteTracker, track_array.py의 변환과
+detection_tracking.one_frame에 대한 테스트 케이스를 포함 (ultralytics, onnxruntime 없이 실행)
+"""
+
+import sys
+import os
+import queue
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import detection_tracking
+from detection_backend import DetectionBackend, OnnxByteTrackBackend, create_backend, decode_yolo_output
+from frame_pool import FramePool
+from frame_preprocess import FramePreprocessor
+from numpy_bytetrack import ByteTracker
+from track_array import Track, array_to_tracks, track_centers, tracks_to_array
+
+
+class FixedBackend(DetectionBackend):
+    """정해진 트랙 배열을 반환하는 백엔드"""
+
+    def __init__(self, track_array):
+        self.track_array = track_array
+
+    def detect(self, frame):
+        return self.track_array[:, 1:5], np.ones(len(self.track_array), dtype=np.float32)
+
+    def track(self, frame):
+        return self.track_array
+
+
+class FixedSession:
+    """정해진 YOLOv8 출력을 반환하는 ONNX Runtime 세션"""
+
+    def __init__(self, output):
+        self.output = output
+
+    def run(self, names, inputs):
+        return [self.output]
+
+
+def onnx_backend(output):
+    """onnxruntime 없이 세션만 바꾼 OnnxByteTrackBackend"""
+
+    backend = OnnxByteTrackBackend.__new__(OnnxByteTrackBackend)
+    backend.session = FixedSession(output)
+    backend.input_name = "images"
+    backend.iou_threshold = 0.7
+    backend.preprocessor = FramePreprocessor((640, 640))
+    backend.tracker = ByteTracker()
+    backend.min_confidence = backend.tracker.track_high_thresh
+    return backend
+
+
+class FakeCapture:
+    """프레임 한 장을 반환하는 카메라 (image가 주어지면 cv2.VideoCapture.read와 같이 그 배열에 복사)"""
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def read(self, image=None):
+        if image is None or image.shape != self.frame.shape:
+            return True, self.frame.copy()
+        image[...] = self.frame
+        return True, image
+
+
+class TestDetectionBackend:
+    """탐지 백엔드 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("탐지 백엔드 테스트 시작")
+        print("=" * 80)
+
+        print("\n[NumPy ByteTrack 테스트]")
+        tracker = ByteTracker()
+        first = tracker.update(np.array([[100, 100, 200, 180], [400, 400, 480, 470]]), np.array([0.9, 0.9]))
+        self.check("TC1: 신뢰도 높은 탐지로 새 트랙 시작", first[:, 0].tolist(), [1.0, 2.0])
+
+        ids = []
+        for step in range(1, 6):
+            result = tracker.update(np.array([[100 + 8 * step, 100, 200 + 8 * step, 180], [400, 400, 480, 470]]), np.array([0.9, 0.08]))
+            ids.append(result[:, 0].tolist())
+        self.check("TC2: 움직이는 차량과 신뢰도가 낮아진(가려진) 차량의 ID 유지", ids, [[1.0, 2.0]] * 5)
+
+        result = tracker.update(np.array([[900, 900, 980, 970]]), np.array([0.5]))
+        self.check("TC3: new_track_thresh 미만의 탐지는 새 트랙으로 시작하지 않음", (result.shape, len(tracker.tracks)), ((0, 5), 2))
+
+        for _ in range(3):
+            tracker.update(np.zeros((0, 4)), np.zeros((0,)))
+        result = tracker.update(np.array([[148, 100, 248, 180]]), np.array([0.9]))
+        self.check("TC4: 잠시 끊긴 트랙은 예측 위치로 다시 매칭", result[:, 0].tolist(), [1.0])
+
+        short = ByteTracker(track_buffer=2)
+        short.update(np.array([[100, 100, 200, 180]]), np.array([0.9]))
+        for _ in range(3):
+            short.update(np.zeros((0, 4)), np.zeros((0,)))
+        self.check("TC5: track_buffer 프레임 이상 끊긴 트랙 제거", len(short.tracks), 0)
+
+        print("\n[ONNX 전처리/후처리 테스트]")
+        frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+        preprocessor = FramePreprocessor((640, 640))
+        image = preprocessor(frame)
+        self.check("TC6: 비율을 유지하여 640x640에 맞춤",
+                   (image.shape, round(preprocessor.scale, 4), preprocessor.pad), ((640, 640, 3), 0.3333, (0.0, 140.0)))
+
+        # 앵커 3개, 클래스 2개 (두 앵커는 같은 차량, 하나는 신뢰도 미달)
+        output = np.zeros((1, 6, 3), dtype=np.float32)
+        output[0, :4, 0] = [320, 320, 100, 50]
+        output[0, 4:, 0] = [0.9, 0.1]
+        output[0, :4, 1] = [322, 321, 100, 50]
+        output[0, 4:, 1] = [0.1, 0.6]
+        output[0, :4, 2] = [100, 200, 20, 20]
+        output[0, 4:, 2] = [0.01, 0.02]
+        boxes, scores = decode_yolo_output(output, 0.05, 0.7)
+        self.check("TC7: 중복 탐지는 NMS로 제거하고 원본 좌표로 변환",
+                   (np.round(preprocessor.boxes_to_frame(boxes)).tolist(), [round(float(score), 2) for score in scores]),
+                   ([[810.0, 465.0, 1110.0, 615.0]], [0.9]))
+
+        # 신뢰도 0.9, 0.08 (2차 매칭용), 0.02 (제외)인 앵커 3개
+        output = np.zeros((1, 5, 3), dtype=np.float32)
+        output[0, :, 0] = [320, 320, 100, 50, 0.9]
+        output[0, :, 1] = [100, 100, 40, 40, 0.08]
+        output[0, :, 2] = [500, 500, 40, 40, 0.02]
+        backend = onnx_backend(output)
+        self.check("TC8: detect는 ultralytics 백엔드와 같은 최소 신뢰도(track_high_thresh) 이상만, track은 2차 매칭용 탐지도 사용",
+                   ([round(float(score), 2) for score in backend.detect(frame)[1]], len(backend.infer(frame, backend.tracker.track_low_thresh)[1])),
+                   ([0.9], 2))
+
+        print("\n[트랙 배열 테스트]")
+        track_array = np.array([[7, 100, 100, 201, 181]], dtype=np.float32)
+        self.check("TC9: 트랙 배열 -> 중심점", track_centers(track_array), {7: (150, 140)})
+        self.check("TC10: Track 목록 <-> 트랙 배열",
+                   tracks_to_array(array_to_tracks(track_array)).tolist(), track_array.tolist())
+
+        yolo_data_queue = queue.Queue()
+        frame_queue = queue.Queue(maxsize=1)
+        pool = FramePool(slots=3)
+        detection_tracking.one_frame(FakeCapture(frame), FixedBackend(track_array), yolo_data_queue, frame_queue, pool)
+        lease, tracks = frame_queue.get_nowait()
+        self.check("TC11: 한 프레임 처리 결과 전달 (프레임은 풀 버퍼, 추론 쪽 참조는 해제)",
+                   (yolo_data_queue.get_nowait(), lease.image.shape, lease.slot.refs, [(track.track_id, isinstance(track, Track)) for track in tracks]),
+                   ({7: (150, 140)}, frame.shape, 1, [(7, True)]))
+
+        try:
+            create_backend("yolo", "model.pt")
+            result = None
+        except ValueError as e:
+            result = str(e)
+        self.check("TC12: 알 수 없는 백엔드 이름", result, "알 수 없는 탐지 백엔드: yolo (사용 가능: bytetrack, deepsort, onnx)")
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestDetectionBackend()
+    tester.run_all_tests()
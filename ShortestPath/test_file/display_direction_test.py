@@ -0,0 +1,123 @@
+"""
+디스플레이 방향 배정 테스트 코드
+display_direction.py의 경로 변경 기반 디스플레이 배정에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import Car, MovingSpace, ParkingSpace
+import display_direction
+from display_direction import DisplayAssignment, Direction, build_direction_table
+
+
+class TestDisplayDirection:
+    """디스플레이 방향 배정 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def setup_spaces(self):
+        """테스트용 구역 설정: 1 - 2 - 3 가로 배치, 2번 구역 아래에 주차 구역 0"""
+        sr.moving_space_instances.clear()
+        sr.parking_space_instances.clear()
+        sr.car_number_instances.clear()
+        sr.route_changed_car_ids.clear()
+
+        for space_id, near in ((1, [2]), (2, [1, 3]), (3, [2])):
+            x = (space_id - 1) * 100
+            sr.moving_space_instances[space_id] = MovingSpace(
+                space_id=space_id,
+                name=f"space_{space_id}",
+                position=[(x, 0), (x + 100, 0), (x + 100, 100), (x, 100)],
+                congestion=100,
+                near_parking_space_id=[0] if space_id == 2 else [],
+                near_moving_space_id=near
+            )
+
+        sr.parking_space_instances[0] = ParkingSpace(
+            space_id=0,
+            name="P0",
+            position=[(100, 100), (200, 100), (200, 200), (100, 200)],
+            near_moving_space_id=2
+        )
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("디스플레이 방향 배정 테스트 시작")
+        print("=" * 80)
+
+        self.setup_spaces()
+        assignment = DisplayAssignment(display_space=(2,))
+        car = Car.create_entry_car(car_id=7, car_number="1234", position=(50, 50))
+        sr.car_number_instances[7] = car
+
+        print("\n[경로 변경 이벤트 테스트]")
+        car.set_route([1, 2, 3])
+        self.check("TC1: set_route 시 변경 이벤트 기록", sr.route_changed_car_ids, {7})
+
+        assignment.apply(sr.route_changed_car_ids, sr.car_number_instances, sr.parking_space_instances, sr.moving_space_instances)
+        sr.route_changed_car_ids.clear()
+        self.check("TC2: 다음 이동 구역 방향 배정", assignment.to_display_dict(), {1: [("1234", "right")]})
+
+        car.pop_route(2)
+        self.check("TC3: pop_route 시 변경 이벤트 기록", sr.route_changed_car_ids, {7})
+        sr.route_changed_car_ids.clear()
+
+        car.pop_route(2)
+        self.check("TC4: 같은 구역 pop_route는 이벤트 없음", sr.route_changed_car_ids, set())
+
+        print("\n[주차 구역 방향 테스트]")
+        car.clear_route()
+        car.target_parking_space_id = 0
+        car.route = [1, 2]
+        assignment.apply({7}, sr.car_number_instances, sr.parking_space_instances, sr.moving_space_instances)
+        self.check("TC5: 목표 주차 구역 방향 배정", assignment.to_display_dict(), {1: [("1234", "down")]})
+
+        print("\n[방향 테이블 테스트]")
+        table = build_direction_table(sr.parking_space_instances, sr.moving_space_instances, display_space=(2,))
+        self.check("TC6: 모든 구역 쌍을 계산", len(table), 2 + 1)
+        self.check("TC7: 카메라가 보는 방향 기준 방향", (table[(2, "moving", 1)], table[(2, "moving", 3)]), (Direction.LEFT, Direction.RIGHT))
+
+        display_direction.direction_table[(2, "parking", 0)] = Direction.LEFT
+        assignment.apply({7}, sr.car_number_instances, sr.parking_space_instances, sr.moving_space_instances)
+        self.check("TC8: 배정 시 방향 테이블 사용", assignment.to_display_dict(), {1: [("1234", "left")]})
+        display_direction.direction_table.clear()
+
+        print("\n[배정 해제 테스트]")
+        del sr.car_number_instances[7]
+        assignment.apply({7}, sr.car_number_instances, sr.parking_space_instances, sr.moving_space_instances)
+        self.check("TC9: 삭제된 차량의 배정 해제", assignment.to_display_dict(), {1: []})
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestDisplayDirection()
+    tester.run_all_tests()
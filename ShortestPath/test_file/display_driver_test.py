@@ -0,0 +1,129 @@
+"""
+디스플레이 드라이버 테스트 코드
+display_driver.py의 압축 프레임 생성, 변경분 전송, 응답 처리에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from display_driver import DisplayDriver, build_frame, encode_display
+
+
+class FakeSerial:
+    """시리얼 포트 대신 전송한 데이터를 기록하는 테스트용 클래스"""
+
+    def __init__(self):
+        self.written = []
+        self.incoming = b""
+
+    @property
+    def in_waiting(self):
+        return len(self.incoming)
+
+    def read(self, size):
+        data, self.incoming = self.incoming[:size], self.incoming[size:]
+        return data
+
+    def write(self, data):
+        self.written.append(data)
+
+    def close(self):
+        pass
+
+
+class TestDisplayDriver:
+    """디스플레이 드라이버 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def create_driver(self):
+        """포트 두 개를 가진 테스트용 드라이버 생성"""
+        driver = DisplayDriver({"port1": (1, 2, 3), "port2": (4, 5, 6)}, ack_timeout=1.0)
+        driver.serials = {"port1": FakeSerial(), "port2": FakeSerial()}
+        driver.read_buffers = {"port1": b"", "port2": b""}
+        return driver
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("디스플레이 드라이버 테스트 시작")
+        print("=" * 80)
+
+        print("\n[프레임 인코딩 테스트]")
+        self.check("TC1: 빈 디스플레이는 끄기 코드", encode_display([]), "-")
+        self.check("TC2: 첫 번째 차량의 방향 사용", encode_display([("1234", "left"), ("5678", "up")]), "L")
+        self.check("TC3: 압축 프레임 형식", build_frame(7, {3: "-", 1: "R"}), b"7:1R3-\n")
+
+        print("\n[변경분 전송 테스트]")
+        driver = self.create_driver()
+        display_dict = {1: [("1234", "right")], 2: [], 3: [], 4: [("5678", "up")], 5: [], 6: []}
+        driver.update(display_dict)
+        self.check("TC4: 최초 전송은 포트당 한 번", driver.serials["port1"].written, [b"0:1R2-3-\n"])
+        self.check("TC5: 두 번째 포트 전송", driver.serials["port2"].written, [b"0:4U5-6-\n"])
+
+        driver.update(display_dict)
+        self.check("TC6: 변경이 없으면 전송하지 않음", len(driver.serials["port1"].written), 1)
+
+        display_dict[2] = [("1234", "down")]
+        driver.update(display_dict)
+        self.check("TC7: 변경된 디스플레이만 전송", driver.serials["port1"].written[-1], b"1:2D\n")
+        self.check("TC8: 변경이 없는 포트는 전송하지 않음", len(driver.serials["port2"].written), 1)
+
+        print("\n[응답 처리 테스트]")
+        driver.serials["port1"].incoming = b"READY\nA0\nA1\n"
+        driver.poll_acks()
+        self.check("TC9: 응답 수신 시 대기 프레임 제거", len(driver.pending["port1"]), 0)
+        self.check("TC10: 응답 수 기록", driver.stats()["acks"], 2)
+
+        driver.poll_acks(now=driver.pending["port2"][0][0] + 2.0)
+        self.check("TC11: 응답 시간 초과 기록", driver.stats()["timeouts"], 1)
+
+        driver.update(display_dict)
+        self.check("TC12: 응답이 없던 디스플레이 재전송", driver.serials["port2"].written[-1], b"1:4U5-6-\n")
+
+        print("\n[pyserial 미설치 테스트]")
+        serial_module = sys.modules.get("serial")
+        sys.modules["serial"] = None    # import serial이 ImportError를 발생시키도록 설정
+        try:
+            driver = DisplayDriver({"port1": (1, 2, 3)})
+            driver.open()
+            driver.update({1: [("1234", "right")]})
+            result = (driver.serials, driver.stats()["frames"])
+        finally:
+            if serial_module is None:
+                del sys.modules["serial"]
+            else:
+                sys.modules["serial"] = serial_module
+        self.check("TC13: pyserial이 없으면 연결하지 않고 전송만 생략", result, ({}, 0))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestDisplayDriver()
+    tester.run_all_tests()
@@ -0,0 +1,123 @@
+"""
+DeepSORT 임베딩 캐시 테스트 코드
+embedding_cache.py의 정지 차량 임베딩 재사용, 겹치는 차량의 재계산, 재계산 간격, 한 프레임 배치 계산과 박스 자르기에 대한 테스트 케이스를 포함
+(deep_sort_realtime, torch 없이 실행)
+"""
+
+import sys
+import os
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedding_cache import EmbeddingCache, crop_boxes
+
+
+class RecordingEmbedder:
+    """호출마다 박스 수를 기록하고 박스 좌표를 임베딩으로 반환하는 임베딩 모델"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, frame, boxes):
+        self.calls.append(len(boxes))
+        return boxes.copy()
+
+
+def box(x, y, size=100):
+    return [x, y, x + size, y + size]
+
+
+class TestEmbeddingCache:
+    """DeepSORT 임베딩 캐시 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("DeepSORT 임베딩 캐시 테스트 시작")
+        print("=" * 80)
+
+        frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+        print("\n[정지 차량 테스트]")
+        embedder = RecordingEmbedder()
+        cache = EmbeddingCache(embedder, stationary_refresh=3)
+        parked = np.array([box(100, 100), box(300, 100), box(500, 100)], dtype=np.float32)
+        first = cache(frame, parked)
+        self.check("TC1: 첫 프레임은 모든 박스를 한 번에 계산", (embedder.calls, [e.tolist() for e in first]), ([3], parked.tolist()))
+
+        jittered = parked + np.array([1, 0, 1, 0], dtype=np.float32)
+        second = cache(frame, jittered)
+        self.check("TC2: 조금 흔들린 정지 차량은 이전 임베딩 재사용",
+                   (embedder.calls, [e.tolist() for e in second], cache.reused), ([3], parked.tolist(), 3))
+
+        for _ in range(3):
+            cache(frame, parked)
+        self.check("TC3: 재계산 간격(3프레임) 동안 재사용한 뒤 다시 계산", (embedder.calls, cache.ages.tolist()), ([3, 3], [0, 0, 0]))
+
+        print("\n[이동 차량 테스트]")
+        embedder = RecordingEmbedder()
+        cache = EmbeddingCache(embedder, moving_refresh=5)
+        cache(frame, np.array([box(100, 100), box(800, 100)], dtype=np.float32))
+        moved = np.array([box(120, 100), box(800, 100), box(1500, 500)], dtype=np.float32)
+        embeddings = cache(frame, moved)
+        self.check("TC4: 다른 박스와 겹치지 않는 이동 차량은 재사용, 새 차량만 계산",
+                   (embedder.calls, embeddings[0].tolist(), embeddings[2].tolist()), ([2, 1], box(100, 100), box(1500, 500)))
+
+        embedder = RecordingEmbedder()
+        cache = EmbeddingCache(embedder)
+        cache(frame, np.array([box(100, 100), box(170, 100)], dtype=np.float32))
+        cache(frame, np.array([box(120, 100), box(190, 100)], dtype=np.float32))
+        self.check("TC5: 서로 겹치는 이동 차량은 다시 계산 (한 번의 배치)", embedder.calls, [2, 2])
+
+        embedder = RecordingEmbedder()
+        cache = EmbeddingCache(embedder)
+        cache(frame, np.array([box(100, 100)], dtype=np.float32))
+        cache(frame, np.array([box(100, 100), box(102, 100)], dtype=np.float32))
+        self.check("TC6: 이전 박스 하나의 임베딩은 한 탐지만 재사용", (embedder.calls, cache.reused), ([1, 1], 1))
+
+        print("\n[탐지 없음 테스트]")
+        embedder = RecordingEmbedder()
+        cache = EmbeddingCache(embedder)
+        cache(frame, np.array([box(100, 100)], dtype=np.float32))
+        empty = cache(frame, np.zeros((0, 4), dtype=np.float32))
+        cache(frame, np.array([box(100, 100)], dtype=np.float32))
+        self.check("TC7: 탐지가 없는 프레임은 모델을 호출하지 않고 이전 박스를 비움", (empty, embedder.calls), ([], [1, 1]))
+
+        print("\n[박스 자르기 테스트]")
+        crops = crop_boxes(frame, np.array([[10, 20, 50, 80], [-30, -10, 40, 30], [1900, 1070, 1950, 1100], [500, 500, 500, 500]]))
+        self.check("TC8: 프레임 밖은 잘라내고 최소 1픽셀", [crop.shape[:2] for crop in crops], [(60, 40), (30, 40), (10, 20), (1, 1)])
+
+        self.check("TC9: 계산, 재사용 수 통계 (TC7)", cache.stats(), "임베딩 계산 2개 (2회), 재사용 0개 (0.0%)")
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestEmbeddingCache()
+    tester.run_all_tests()
@@ -0,0 +1,143 @@
+"""
+프레임 풀 테스트 코드
+frame_pool.py의 버퍼 재사용, 참조 수, 가장 오래된 버퍼 덮어쓰기와 tracker_process의 링 버퍼 -> 풀 버퍼 복사에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_pool import FramePool
+from tracker_process import SharedFrameRing
+
+
+class CountingCapture:
+    """프레임 번호로 채운 프레임을 반환하는 카메라 (image가 주어지면 그 배열에 씀)"""
+
+    def __init__(self, shape=(4, 6, 3), fail_at=None):
+        self.shape = shape
+        self.count = 0
+        self.allocations = 0
+        self.fail_at = fail_at
+
+    def read(self, image=None):
+        self.count += 1
+        if self.count == self.fail_at:
+            return False, None
+
+        if image is None or image.shape != self.shape:
+            image = np.empty(self.shape, dtype=np.uint8)
+            self.allocations += 1
+
+        image[...] = self.count
+        return True, image
+
+
+class TestFramePool:
+    """프레임 풀 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("프레임 풀 테스트 시작")
+        print("=" * 80)
+
+        print("\n[버퍼 재사용 테스트]")
+        pool = FramePool(slots=3)
+        cap = CountingCapture()
+        buffers = set()
+        for _ in range(30):
+            lease = pool.read(cap)
+            buffers.add(id(lease.image))
+            lease.release()
+        self.check("TC1: 바로 해제하면 슬롯 수 이하의 버퍼만 할당하여 재사용", (cap.allocations, len(buffers) <= 3), (3, True))
+
+        pool = FramePool(slots=3)
+        cap = CountingCapture()
+        held = pool.read(cap)
+        gui = held.retain()
+        held.release()
+        others = []
+        for _ in range(2):
+            lease = pool.read(cap)
+            others.append(int(lease.image[0, 0, 0]))
+            lease.release()
+        self.check("TC2: 다른 소비자가 참조 중인 프레임은 덮어쓰지 않음", (int(gui.image[0, 0, 0]), others, held.slot.refs), (1, [2, 3], 1))
+
+        gui.release()
+        gui.release()
+        self.check("TC3: 여러 번 release해도 참조 수는 한 번만 감소", gui.slot.refs, 0)
+
+        print("\n[덮어쓰기 테스트]")
+        pool = FramePool(slots=2)
+        cap = CountingCapture()
+        first = pool.read(cap)
+        second = pool.read(cap)
+        third = pool.read(cap)
+        self.check("TC4: 모든 버퍼가 참조 중이면 가장 오래된 버퍼를 덮어쓰고 이전 참조는 무효화",
+                   (first.image is None, int(second.image[0, 0, 0]), int(third.image[0, 0, 0]), pool.overwrites),
+                   (True, 2, 3, 1))
+
+        first.release()
+        self.check("TC5: 무효화된 참조의 release는 새 프레임의 참조 수에 영향 없음", third.slot.refs, 1)
+
+        print("\n[읽기 실패 테스트]")
+        pool = FramePool(slots=2)
+        cap = CountingCapture(fail_at=1)
+        self.check("TC6: 읽기에 실패하면 None, 버퍼는 다시 사용 가능",
+                   (pool.read(cap), [slot.refs for slot in pool.slots], int(pool.read(cap).image[0, 0, 0])), (None, [0, 0], 2))
+
+        pool = FramePool(slots=1)
+        cap = CountingCapture(shape=(4, 6, 3))
+        pool.read(cap).release()
+        cap.shape = (8, 12, 3)
+        lease = pool.read(cap)
+        self.check("TC7: 해상도가 바뀌면 새 크기의 버퍼로 교체", (lease.image.shape, cap.allocations), ((8, 12, 3), 2))
+
+        print("\n[링 버퍼 복사 테스트]")
+        ring = SharedFrameRing((4, 6, 3), slots=2)
+        try:
+            slot, seq = ring.write(np.full((4, 6, 3), 9, dtype=np.uint8))
+            pool = FramePool(slots=2)
+            lease = pool.acquire(ring.shape)
+            copied = ring.read(slot, seq, out=lease.image)
+            ring.write(np.zeros((4, 6, 3), dtype=np.uint8))
+            ring.write(np.zeros((4, 6, 3), dtype=np.uint8))
+            self.check("TC8: 링 버퍼 프레임을 풀 버퍼에 복사, 덮어쓴 슬롯은 None",
+                       (copied is lease.image, int(lease.image.sum()), ring.read(slot, seq, out=lease.image)), (True, 9 * 72, None))
+        finally:
+            ring.close()
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestFramePool()
+    tester.run_all_tests()
@@ -0,0 +1,146 @@
+"""
+탐지 전처리 테스트 코드
+frame_preprocess.py의 구역 영역 계산, 재사용 버퍼 letterbox, 카메라 좌표 변환과
+detection_backend.ZoneCropBackend, tune_imgsz.py의 구역별 탐지율 계산에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tune_imgsz
+from detection_backend import DetectionBackend, ZoneCropBackend
+from frame_preprocess import FramePreprocessor, zone_bounds
+
+
+class InputRecordingBackend(DetectionBackend):
+    """입력 이미지 크기를 기록하고 입력 이미지 좌표의 박스 하나를 반환하는 백엔드"""
+
+    def __init__(self, size):
+        self.input_size = size
+        self.inputs = []
+
+    def detect(self, frame):
+        self.inputs.append(frame.shape)
+        return np.array([[100, 100, 200, 150]], dtype=np.float32), np.array([0.9], dtype=np.float32)
+
+    def track(self, frame):
+        self.inputs.append(frame.shape)
+        return np.array([[3, 100, 100, 200, 150]], dtype=np.float32)
+
+
+def square(x, y, size=100):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+
+
+class TestFramePreprocess:
+    """탐지 전처리 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("탐지 전처리 테스트 시작")
+        print("=" * 80)
+
+        print("\n[구역 영역 테스트]")
+        parking = {0: {"position": square(500, 300)}, 1: {"position": square(600, 300)}}
+        moving = {1: {"position": square(500, 400, 200)}, 2: {"position": square(1800, 950, 150)}}
+        self.check("TC1: 모든 구역을 포함하고 margin만큼 넓힘", zone_bounds(parking, {1: moving[1]}, (1920, 1080), 80), (420, 220, 780, 680))
+        self.check("TC2: 프레임 밖으로 넘어가지 않음", zone_bounds(parking, moving, (1920, 1080), 80), (420, 220, 1920, 1080))
+        self.check("TC3: 구역이 없으면 프레임 전체", zone_bounds({}, {}, (1920, 1080)), (0, 0, 1920, 1080))
+
+        print("\n[letterbox 테스트]")
+        preprocessor = FramePreprocessor((320, 320), crop=(420, 220, 1060, 540))
+        frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+        frame[220:540, 420:1060] = 200
+        first = preprocessor(frame)
+        second = preprocessor(frame)
+        self.check("TC4: 잘라낸 영역(640x320)을 320x320에 맞추고 버퍼를 재사용",
+                   (first.shape, first is second, preprocessor.scale, preprocessor.pad), ((320, 320, 3), True, 0.5, (0.0, 80.0)))
+        self.check("TC5: 여백은 회색(114), 영역은 원본 값",
+                   (int(first[0, 0, 0]), int(first[79, 160, 0]), int(first[80, 160, 0]), int(first[239, 160, 0]), int(first[240, 160, 0])),
+                   (114, 114, 200, 200, 114))
+
+        boxes = preprocessor.boxes_to_frame(np.array([[0, 80, 320, 240], [100, 100, 140, 120]]))
+        self.check("TC6: 입력 이미지 좌표 -> 카메라 좌표", boxes.tolist(), [[420, 220, 1060, 540], [620, 260, 700, 300]])
+
+        same = FramePreprocessor((640, 320), crop=(420, 220, 1060, 540))
+        image = same(frame)
+        self.check("TC7: 영역이 입력 크기와 같으면 축소하지 않음",
+                   (image.shape, same.buffer is None, same.boxes_to_frame(np.array([[0, 0, 10, 10]])).tolist()),
+                   ((320, 640, 3), True, [[420, 220, 430, 230]]))
+
+        print("\n[구역 영역 탐지 백엔드 테스트]")
+        inner = InputRecordingBackend((320, 320))
+        backend = ZoneCropBackend(inner, crop=(420, 220, 1060, 540))
+        boxes, scores = backend.detect(frame)
+        track_array = backend.track(frame)
+        self.check("TC8: 입력 크기로 축소한 이미지로 탐지하고 결과는 카메라 좌표",
+                   (inner.inputs, boxes.tolist(), track_array.tolist()),
+                   ([(320, 320, 3)] * 2, [[620, 260, 820, 360]], [[3, 620, 260, 820, 360]]))
+
+        print("\n[입력 크기별 탐지율 테스트]")
+
+        def zone_of(position):
+            if 500 <= position[0] < 600 and 300 <= position[1] < 400:
+                return ("parking", 0)
+            if 600 <= position[0] < 700 and 300 <= position[1] < 400:
+                return ("parking", 1)
+            return None
+
+        def detections(*boxes):
+            return np.array(boxes, dtype=np.float32).reshape(-1, 4), np.ones(len(boxes), dtype=np.float32)
+
+        reference = [detections([550, 310, 630, 390], [610, 310, 690, 390], [10, 10, 50, 50])]
+        merged = [detections([510, 310, 690, 390])]                               # 인접한 두 차량을 하나로 탐지
+        shifted = [detections([565, 310, 645, 390], [610, 310, 690, 390])]        # 중심점이 옆 구역으로 넘어감
+        self.check("TC9: 구역별 탐지율 (구역 밖 차량 제외)",
+                   [tune_imgsz.zone_recall(reference, reference, zone_of),
+                    tune_imgsz.zone_recall(reference, merged, zone_of),
+                    tune_imgsz.zone_recall(reference, shifted, zone_of)],
+                   [{("parking", 0): (1, 1), ("parking", 1): (1, 1)},
+                    {("parking", 0): (0, 1), ("parking", 1): (0, 1)},
+                    {("parking", 0): (0, 1), ("parking", 1): (1, 1)}])
+
+        recalls = {
+            320: {("parking", 0): (0, 1), ("parking", 1): (1, 1)},
+            480: {("parking", 0): (19, 20), ("parking", 1): (20, 20)},
+            640: {("parking", 0): (20, 20), ("parking", 1): (20, 20)},
+        }
+        self.check("TC10: 모든 구역의 탐지율을 만족하는 가장 작은 크기",
+                   (tune_imgsz.smallest_size(recalls, 0.95), tune_imgsz.smallest_size(recalls, 0.99), tune_imgsz.smallest_size({320: recalls[320]})),
+                   (480, 640, None))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestFramePreprocess()
+    tester.run_all_tests()
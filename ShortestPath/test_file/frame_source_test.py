@@ -0,0 +1,211 @@
+"""
+프레임 입력 테스트 코드
+frame_source.py의 이미지 폴더, 동영상 파일 입력 (최대 속도/실시간 재생, 반복, 누락 프레임 수), 카메라 누락 프레임 추정,
+open_source 입력 지정과 detection_tracking.measure_throughput에 대한 테스트 케이스를 포함 (카메라 없이 실행)
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import queue
+import numpy as np
+import cv2
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import detection_backend
+import detection_tracking
+from detection_backend import DetectionBackend
+from frame_pool import FramePool
+from frame_source import ImageFolderSource, LiveSource, VideoFileSource, open_source
+
+
+class CountingBackend(DetectionBackend):
+    """추적한 프레임의 첫 픽셀 값을 기록하는 백엔드"""
+
+    def __init__(self, model_path=None):
+        self.seen = []
+
+    def detect(self, frame):
+        return np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.float32)
+
+    def track(self, frame):
+        self.seen.append(int(frame[0, 0, 0]))
+        return np.zeros((0, 5), dtype=np.float32)
+
+
+class FixedFpsCapture:
+    """FPS만 알려주는 카메라 (누락 프레임 계산용)"""
+
+    def get(self, prop):
+        return 10.0 if prop == cv2.CAP_PROP_FPS else 0.0
+
+    def release(self):
+        pass
+
+
+def write_images(path, count, shape=(4, 6, 3)):
+    """프레임 번호 * 10으로 채운 이미지를 파일 이름 순서대로 저장"""
+
+    for i in range(count):
+        cv2.imwrite(os.path.join(path, f"{i:03d}.png"), np.full(shape, i * 10, dtype=np.uint8))
+
+
+def write_video(path, count, shape=(32, 32, 3), fps=10.0):
+    """프레임 번호 * 20으로 채운 동영상 저장 (코덱이 없으면 False)"""
+
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (shape[1], shape[0]))
+    if not writer.isOpened():
+        return False
+
+    for i in range(count):
+        writer.write(np.full(shape, i * 20, dtype=np.uint8))
+    writer.release()
+    return True
+
+
+class TestFrameSource:
+    """프레임 입력 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("프레임 입력 테스트 시작")
+        print("=" * 80)
+
+        with tempfile.TemporaryDirectory() as folder:
+            write_images(folder, 4)
+            with open(os.path.join(folder, "readme.txt"), "w") as f:
+                f.write("이미지가 아닌 파일")
+
+            print("\n[이미지 폴더 테스트]")
+            source = ImageFolderSource(folder, realtime=False)
+            values = []
+            while True:
+                ret, frame = source.read()
+                if not ret:
+                    break
+                values.append(int(frame[0, 0, 0]))
+            self.check("TC1: 이미지 파일만 이름 순서대로 읽고 끝나면 실패", (values, source.frame_count, source.dropped), ([0, 10, 20, 30], 4, 0))
+
+            source = ImageFolderSource(folder, realtime=False, loop=True)
+            values = [int(source.read()[1][0, 0, 0]) for _ in range(6)]
+            self.check("TC2: 반복 재생", values, [0, 10, 20, 30, 0, 10])
+
+            pool = FramePool(slots=1)
+            source = ImageFolderSource(folder, realtime=False)
+            first = pool.read(source)
+            buffer = first.image
+            first.release()
+            second = pool.read(source)
+            self.check("TC3: 같은 크기의 풀 버퍼에 복사하여 재사용", (second.image is buffer, int(second.image[0, 0, 0]), source.timestamp > 0), (True, 10, True))
+            second.release()
+
+            print("\n[실시간 재생 테스트]")
+            source = ImageFolderSource(folder, fps=4.0, realtime=True)
+            source.read()
+            source.start -= 0.6       # 처리가 늦어 0.6초가 지난 것으로 설정 (4 FPS에서 프레임 2를 재생할 시각)
+            ret, frame = source.read()
+            self.check("TC4: 처리가 늦으면 재생 시각이 지난 프레임을 건너뛰고 누락으로 계산",
+                       (ret, int(frame[0, 0, 0]), source.dropped, source.read()[0]), (True, 20, 1, True))
+
+            source = ImageFolderSource(folder, fps=4.0, realtime=True)
+            source.read()
+            source.start -= 10.0      # 입력이 끝난 지 한참 지난 시각
+            self.check("TC5: 끝난 입력은 실시간 재생에서도 누락을 더 세지 않고 exhausted",
+                       (source.read()[0], source.read()[0], source.dropped, source.exhausted), (False, False, 3, True))
+
+            print("\n[입력 지정 테스트]")
+            self.check("TC6: 폴더는 이미지 폴더, realtime 설정 전달",
+                       (type(open_source(folder, realtime=False)).__name__, open_source(folder, realtime=False).realtime), ("ImageFolderSource", False))
+
+            try:
+                open_source(os.path.join(folder, "missing.mp4"))
+                missing = None
+            except ValueError:
+                missing = "ValueError"
+            self.check("TC7: 열 수 없는 동영상 파일은 예외 발생", missing, "ValueError")
+
+            print("\n[동영상 파일 테스트]")
+            video_path = os.path.join(folder, "sample.avi")
+            if write_video(video_path, 5):
+                source = VideoFileSource(video_path, realtime=False)
+                values = []
+                while True:
+                    ret, frame = source.read()
+                    if not ret:
+                        break
+                    values.append(int(round(frame[0, 0, 0] / 20)))
+                self.check("TC8: 동영상 파일을 모든 프레임 순서대로 읽기", (values, source.fps), ([0, 1, 2, 3, 4], 10.0))
+
+                source = open_source("live:" + video_path)
+                values = [int(round(source.read()[1][0, 0, 0] / 20)) for _ in range(2)]
+                source.start -= 0.5       # 0.5초 지연 -> 프레임 6(반복하여 1)을 재생할 시각
+                values.append(int(round(source.read()[1][0, 0, 0] / 20)))
+                self.check("TC9: live: 로컬 영상은 실시간 반복 재생 (늦으면 건너뛰고 처음으로 돌아감)",
+                           (values, source.dropped, source.loop), ([0, 1, 1], 4, True))
+                source.release()
+            else:
+                print("⚠️  동영상 코덱이 없어 동영상 파일 테스트를 건너뜁니다.")
+
+            print("\n[처리량 측정 테스트]")
+            backend = CountingBackend()
+            processed, elapsed, latency = detection_tracking.measure_throughput(ImageFolderSource(folder, realtime=False), backend, 10)
+            self.check("TC10: 입력이 끝날 때까지 모든 프레임을 추적", (processed, backend.seen, elapsed >= 0, latency >= 0), (4, [0, 10, 20, 30], True, True))
+
+            print("\n[트래커 종료 테스트]")
+            original = dict(detection_backend.BACKENDS)
+            detection_backend.BACKENDS["counting"] = CountingBackend
+            event, stop_event = threading.Event(), threading.Event()
+            event.set()
+            tracker = threading.Thread(target=detection_tracking.main,
+                                       args=(queue.Queue(), None, event, None, folder, 1920, 1080, stop_event),
+                                       kwargs={"backend": "counting", "realtime": False}, daemon=True)
+            try:
+                tracker.start()
+                tracker.join(timeout=5.0)
+                self.check("TC11: 반복하지 않는 입력이 끝나면 트래커 종료 (읽기 실패를 반복하지 않음)", tracker.is_alive(), False)
+            finally:
+                stop_event.set()
+                detection_backend.BACKENDS.clear()
+                detection_backend.BACKENDS.update(original)
+
+        print("\n[카메라 누락 프레임 테스트]")
+        live = LiveSource(FixedFpsCapture())
+        live.count_dropped(0.1)
+        live.count_dropped(0.14)
+        live.count_dropped(0.31)
+        self.check("TC12: 프레임 간격(10 FPS, 0.1초)이 1.5배를 넘으면 그 사이 프레임을 누락으로 계산", live.dropped, 2)
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestFrameSource()
+    tester.run_all_tests()
@@ -0,0 +1,93 @@
+"""
+칼만 필터 중심점 평활화 테스트 코드
+kalman_tracker.py의 CentroidKalman에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kalman_tracker import CentroidKalman
+
+
+class TestKalman:
+    """칼만 필터 중심점 평활화 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("칼만 필터 중심점 평활화 테스트 시작")
+        print("=" * 80)
+
+        print("\n[새 트랙 테스트]")
+        kalman = CentroidKalman(max_dropout=1.0)
+        positions = kalman.update({1: (100, 200)}, now=0.0)
+        self.check("TC1: 새 트랙은 관측 위치 그대로", positions, {1: (100.0, 200.0)})
+
+        print("\n[등속도 추정 테스트]")
+        # x 방향으로 초당 300픽셀 이동 (10 FPS)
+        for i in range(1, 21):
+            positions = kalman.update({1: (100 + 30 * i, 200)}, now=i * 0.1)
+        vx, vy = kalman.velocities()[1]
+        self.check("TC2: 속도 추정 (300픽셀/초)", abs(vx - 300) < 15 and abs(vy) < 5, True)
+        self.check("TC3: 위치가 관측을 따라감", abs(positions[1][0] - 700) < 5, True)
+
+        print("\n[평활화 테스트]")
+        kalman = CentroidKalman(max_dropout=1.0)
+        rng = np.random.default_rng(0)
+        errors_raw, errors_smooth = [], []
+        for i in range(50):
+            noisy = (500 + rng.normal(0, 5), 500 + rng.normal(0, 5))
+            smoothed = kalman.update({2: noisy}, now=i * 0.1)[2]
+            if i >= 10:
+                errors_raw.append(np.hypot(noisy[0] - 500, noisy[1] - 500))
+                errors_smooth.append(np.hypot(smoothed[0] - 500, smoothed[1] - 500))
+        self.check("TC4: 정지 차량의 떨림 감소", np.mean(errors_smooth) < np.mean(errors_raw), True)
+
+        print("\n[예측 및 끊김 테스트]")
+        kalman = CentroidKalman(max_dropout=1.0)
+        for i in range(20):
+            kalman.update({3: (100 + 30 * i, 100)}, now=i * 0.1)
+        predicted = kalman.predict(now=2.0)
+        self.check("TC5: 추론 없는 프레임의 예측 위치", abs(predicted[3][0] - 700) < 10, True)
+
+        positions = kalman.update({}, now=2.5)
+        self.check("TC6: 짧은 끊김은 예측 위치로 유지", 3 in positions, True)
+
+        positions = kalman.update({4: (0, 0)}, now=3.0)
+        self.check("TC7: max_dropout 이후 트랙 제거", sorted(positions), [4])
+        self.check("TC8: 제거 후 행 번호 재배치", kalman.index, {4: 0})
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestKalman()
+    tester.run_all_tests()
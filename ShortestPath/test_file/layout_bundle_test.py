@@ -0,0 +1,130 @@
+"""
+구역 번들 테스트 코드
+layout_bundle.py의 compile_layout, load_bundle, load_layout_data와 web_position.WebHomographyCache에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import display_direction
+import shortest_route as sr
+from layout_bundle import compile_layout, load_bundle, load_layout_data
+from web_position import WebHomographyCache, web_coordinates, web_homography
+
+POSITION_FILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "position_file")
+
+
+class TestLayoutBundle:
+    """구역 번들 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("구역 번들 테스트 시작")
+        print("=" * 80)
+
+        with tempfile.TemporaryDirectory() as directory:
+            parking_path = os.path.join(directory, "parking_space.json")
+            moving_path = os.path.join(directory, "moving_space.json")
+            bundle_path = os.path.join(directory, "layout_bundle.npz")
+            shutil.copy(os.path.join(POSITION_FILE_DIR, "parking_space.json"), parking_path)
+            shutil.copy(os.path.join(POSITION_FILE_DIR, "moving_space.json"), moving_path)
+
+            with open(parking_path, "r") as f:
+                parking_json = {int(key): value for key, value in json.load(f).items()}
+            with open(moving_path, "r") as f:
+                moving_json = {int(key): value for key, value in json.load(f).items()}
+
+            print("\n[컴파일 테스트]")
+            compile_layout(parking_path, moving_path, bundle_path)
+            bundle = load_bundle(bundle_path)
+            self.check("TC1: 주차 구역 데이터가 json과 동일", bundle.parking_data, parking_json)
+            self.check("TC2: 이동 구역 데이터가 json과 동일", bundle.moving_data, moving_json)
+
+            parking_spaces, moving_spaces = sr.build_spaces(parking_json, moving_json)
+            expected_table = display_direction.build_direction_table(parking_spaces, moving_spaces, install=False)
+            self.check("TC3: 방향 테이블이 직접 계산한 값과 동일", bundle.direction_table, expected_table)
+
+            space_id = 2
+            expected_homography = web_homography(moving_json[space_id]["position"], web_coordinates[space_id])
+            self.check("TC4: 웹 좌표 투시 변환 행렬",
+                       (sorted(bundle.web_homographies), np.allclose(bundle.web_homographies[space_id][1], expected_homography)),
+                       (sorted(web_coordinates), True))
+
+            print("\n[읽기 테스트]")
+            parking_data, moving_data, loaded = load_layout_data(parking_path, moving_path, bundle_path)
+            self.check("TC5: json과 같은 번들은 번들에서 읽음", (loaded is not None, parking_data == parking_json), (True, True))
+
+            # json을 수정하고 다시 컴파일하지 않은 경우
+            moving_json[2]["name"] = "Path_2_new"
+            with open(moving_path, "w") as f:
+                json.dump({str(key): value for key, value in moving_json.items()}, f)
+            parking_data, moving_data, loaded = load_layout_data(parking_path, moving_path, bundle_path)
+            self.check("TC6: json이 수정되면 json에서 읽음", (loaded, moving_data[2]["name"]), (None, "Path_2_new"))
+
+            parking_data, moving_data, loaded = load_layout_data(parking_path, moving_path, os.path.join(directory, "missing.npz"))
+            self.check("TC7: 번들이 없으면 json에서 읽음", (loaded, sorted(parking_data) == sorted(parking_json)), (None, True))
+
+            print("\n[검증 테스트]")
+            # 꼭짓점 순서를 반시계방향으로 저장한 구역
+            moving_json[3]["position"] = moving_json[3]["position"][::-1]
+            with open(moving_path, "w") as f:
+                json.dump({str(key): value for key, value in moving_json.items()}, f)
+            try:
+                compile_layout(parking_path, moving_path, bundle_path)
+                result = None
+            except ValueError as e:
+                result = str(e)
+            self.check("TC8: 꼭짓점 순서가 반대인 구역은 컴파일하지 않음",
+                       result, "이동 구역 3: 꼭짓점이 시계방향(좌상단, 우상단, 우하단, 좌하단)이 아니거나 넓이가 0입니다.")
+            self.check("TC9: 실패한 컴파일은 기존 번들 유지", load_bundle(bundle_path).moving_data[2]["name"], "Path_2")
+
+            print("\n[투시 변환 행렬 캐시 테스트]")
+            quadrilateral = [[0, 0], [100, 0], [100, 100], [0, 100]]
+            cache = WebHomographyCache({1: [(0, 0), (200, 200)]})
+            first = cache.get(1, quadrilateral)
+            self.check("TC10: 같은 구역 좌표는 행렬 재사용", cache.get(1, [list(point) for point in quadrilateral]) is first, True)
+
+            moved = [[0, 0], [50, 0], [50, 100], [0, 100]]
+            self.check("TC11: 구역 좌표가 바뀌면 다시 계산", np.allclose(cache.get(1, moved), web_homography(moved, [(0, 0), (200, 200)])), True)
+
+            seeded = WebHomographyCache(seed=bundle.web_homographies)
+            self.check("TC12: 번들의 행렬로 시작", seeded.get(2, bundle.moving_data[2]["position"]) is bundle.web_homographies[2][1], True)
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestLayoutBundle()
+    tester.run_all_tests()
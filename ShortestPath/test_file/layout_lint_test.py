@@ -0,0 +1,167 @@
+"""
+구역 데이터 검사 도구 테스트 코드
+layout_lint.py의 lint_layout, replay_track_log, rank_hotspots와 track_log.py의 기록/읽기에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import json
+import copy
+import tempfile
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from layout_lint import lint_layout, replay_track_log, rank_hotspots
+from layout_manager import parse_space_keys, validate_layout
+from track_log import TrackLogWriter, read_track_log
+from zone_filter import ZoneTransitionFilter
+
+POSITION_FILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "position_file")
+
+
+def rect(x1, y1, x2, y2):
+    """좌상단부터 시계방향 사각형 좌표"""
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+def make_layout():
+    """출구(1) - 2 - 3 - 입차(15) 일렬 이동 구역과 2번 아래 주차 구역 0"""
+    parking = {
+        0: {"name": "A1", "position": rect(100, 100, 200, 200), "near_moving_space_id": 2},
+    }
+    moving = {
+        1: {"name": "Exit", "position": rect(0, 0, 100, 100), "congestion": 0, "near_parking_space_id": [-1], "near_moving_space_id": [2]},
+        2: {"name": "Path_2", "position": rect(100, 0, 200, 100), "congestion": 0, "near_parking_space_id": [0], "near_moving_space_id": [1, 3]},
+        3: {"name": "Path_3", "position": rect(200, 0, 300, 100), "congestion": 0, "near_parking_space_id": [], "near_moving_space_id": [2, 15]},
+        15: {"name": "Entry", "position": rect(300, 0, 400, 100), "congestion": 0, "near_parking_space_id": [], "near_moving_space_id": [3]},
+    }
+    return parking, moving
+
+
+def kinds(warnings):
+    """경고 종류와 대상만 비교 (문구의 수치 제외)"""
+    return sorted(warning.split("(")[0] for warning in warnings)
+
+
+class TestLayoutLint:
+    """구역 데이터 검사 도구 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("구역 데이터 검사 도구 테스트 시작")
+        print("=" * 80)
+
+        print("\n[기하 검사 테스트]")
+        parking, moving = make_layout()
+        self.check("TC1: 문제가 없는 구역 데이터", (validate_layout(parking, moving), lint_layout(parking, moving)), ([], []))
+
+        gap_parking = copy.deepcopy(parking)
+        gap_parking[0]["position"] = rect(100, 120, 200, 220)
+        self.check("TC2: 인접 이동 구역과 떨어진 주차 구역", kinds(lint_layout(gap_parking, moving)), ["틈: 주차 구역 0"])
+
+        overlap_parking = copy.deepcopy(parking)
+        overlap_parking[1] = {"name": "A2", "position": rect(150, 100, 250, 200), "near_moving_space_id": 3}
+        self.check("TC3: 크게 겹친 주차 구역 (인접 이동 구역과의 겹침은 제외)",
+                   kinds(lint_layout(overlap_parking, moving)), ["겹침: 주차 구역 0"])
+
+        # 출구와만 연결된 4번, 4번과 맞닿았지만 연결이 없는 5번 (5번 옆 주차 구역 2는 입차 구역에서 갈 수 없음)
+        isolated_parking = copy.deepcopy(parking)
+        isolated_parking[2] = {"name": "A3", "position": rect(100, 200, 200, 300), "near_moving_space_id": 5}
+        isolated_moving = copy.deepcopy(moving)
+        isolated_moving[1]["near_moving_space_id"].append(4)
+        isolated_moving[4] = {"name": "Path_4", "position": rect(0, 100, 100, 200), "congestion": 0, "near_parking_space_id": [], "near_moving_space_id": [1]}
+        isolated_moving[5] = {"name": "Path_5", "position": rect(0, 190, 100, 300), "congestion": 0, "near_parking_space_id": [2], "near_moving_space_id": []}
+        self.check("TC4: 맞닿았지만 연결되지 않은 구역, 도달할 수 없는 구역",
+                   kinds(lint_layout(isolated_parking, isolated_moving)),
+                   ["겹침: 이동 구역 4", "도달 불가: 이동 구역 5", "도달 불가: 주차 구역 2", "불일치: 이동 구역 4"])
+
+        # 3번과 입차 구역 아래에 붙어 있지만 입차 구역과만 연결된 4번 (3번과는 겹치지 않고 변이 맞닿음)
+        edge_moving = copy.deepcopy(moving)
+        edge_moving[15]["near_moving_space_id"].append(4)
+        edge_moving[4] = {"name": "Path_4", "position": rect(200, 100, 400, 200), "congestion": 0, "near_parking_space_id": [], "near_moving_space_id": [15]}
+        self.check("TC5: 겹치지 않고 변이 맞닿은 구역도 인접 구역이 아니면 불일치 (꼭짓점만 닿은 2번 제외)",
+                   kinds(lint_layout(parking, edge_moving)), ["불일치: 이동 구역 3"])
+
+        with open(os.path.join(POSITION_FILE_DIR, "parking_space.json"), "r") as f:
+            real_parking = parse_space_keys(json.load(f), "주차 구역")
+        with open(os.path.join(POSITION_FILE_DIR, "moving_space.json"), "r") as f:
+            real_moving = parse_space_keys(json.load(f), "이동 구역")
+        gaps = [warning.split("(")[0] for warning in lint_layout(real_parking, real_moving) if warning.startswith("틈")]
+        self.check("TC6: 실제 구역 데이터의 틈", gaps, ["틈: 주차 구역 12", "틈: 주차 구역 13"])
+
+        print("\n[추적 기록 테스트]")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "track_log.jsonl")
+            writer = TrackLogWriter(path)
+            writer.write({1: (350.04, 50.0)}, timestamp=10.0)
+            writer.write({1: (250.0, 50.0), 2: (150.0, 150.0)}, timestamp=10.1)
+            writer.close()
+
+            # 기록 중에 종료되어 잘린 줄
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('{"time": 10.2, "tracks": {"1": [15')
+
+            self.check("TC7: 기록한 프레임을 순서대로 읽음 (잘린 줄 제외)",
+                       list(read_track_log(path)),
+                       [(10.0, {1: (350.0, 50.0)}), (10.1, {1: (250.0, 50.0), 2: (150.0, 150.0)})])
+
+        print("\n[재생 테스트]")
+        parking_spaces, moving_spaces = sr.build_spaces(parking, moving)
+        frames = [
+            (0.0, {1: (350, 50), 2: (150, 150)}),
+            (0.1, {1: (250, 50), 2: (150, 150)}),
+            (0.2, {1: (150, 50), 2: (150, 60)}),
+            (0.3, {1: (250, 50), 2: (50, 50)}),
+            (0.4, {1: (150, 50), 2: (50, 50)}),
+            (0.5, {1: (150, 250)}),
+            (0.6, {1: (250, 50)}),
+        ]
+        # 체류 조건, 경계 여유, 평활화 없이 재생 (판정 변화가 바로 확정)
+        stats = replay_track_log(frames, parking_spaces, moving_spaces, ZoneTransitionFilter(1, 0, 1.0))
+
+        path_boundary = stats[(("moving", 2), ("moving", 3))]
+        self.check("TC8: 직전에 떠난 이동 구역으로 돌아오면 재계산",
+                   (path_boundary.transitions, path_boundary.reroutes, path_boundary.raw_changes), (3, 2, 3))
+        self.check("TC9: 구역 밖으로 나가면 삭제 (이후 프레임 무시)",
+                   (stats[(("moving", 2), None)].deletions, stats[(("moving", 2), None)].transitions), (1, 1))
+        self.check("TC10: 주차 구역에서 출구까지의 전환",
+                   (stats[(("moving", 2), ("parking", 0))].transitions, stats[(("moving", 1), ("moving", 2))].transitions, stats[(("moving", 1), ("moving", 2))].reroutes),
+                   (1, 1, 0))
+
+        ranked = [boundary for boundary, _ in rank_hotspots(stats, top=2)]
+        self.check("TC11: 재계산과 삭제가 많은 경계부터 정렬",
+                   ranked, [(("moving", 2), ("moving", 3)), (("moving", 2), None)])
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestLayoutLint()
+    tester.run_all_tests()
@@ -0,0 +1,250 @@
+"""
+구역 데이터 교체 테스트 코드
+layout_manager.py의 validate_layout, LayoutManager와 shortest_route.apply_layout에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import json
+import copy
+import tempfile
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import Car, CarStatus, ParkingSpaceEnum
+from layout_manager import LayoutManager, prepare_layout, validate_layout
+from timing_wheel import TimingWheel
+
+
+def square(x, y, size=100):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+
+
+def base_layout():
+    """
+    테스트용 구역 데이터 (json 형식, 문자열 키)
+
+    출구 1 - 2 - 입차 15 가로 배치, 주차 구역 0, 1은 2번 구역 아래에 연결
+    """
+    parking = {
+        "0": {"name": "A1", "position": square(100, 100, 50), "near_moving_space_id": 2},
+        "1": {"name": "A2", "position": square(150, 100, 50), "near_moving_space_id": 2},
+    }
+    moving = {
+        "1": {"name": "Exit", "position": square(0, 0), "congestion": 100, "near_parking_space_id": [-1], "near_moving_space_id": [2]},
+        "2": {"name": "Path_2", "position": square(100, 0), "congestion": 100, "near_parking_space_id": [0, 1], "near_moving_space_id": [1, 15]},
+        "15": {"name": "Entry", "position": square(200, 0), "congestion": 100, "near_parking_space_id": [], "near_moving_space_id": [2]},
+    }
+    return parking, moving
+
+
+class TestLayoutManager:
+    """구역 데이터 교체 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def setup_state(self, parking, moving):
+        """전역 상태 초기화 후 구역 설정"""
+        sr.parking_space_instances.clear()
+        sr.moving_space_instances.clear()
+        sr.car_number_instances.clear()
+        sr.reroute_requests.clear()
+        sr.route_changed_car_ids.clear()
+        sr.bay_holds.clear()
+        sr.hold_expiry_wheel = TimingWheel(tick=0.5, slots=128)
+        sr.zone_filter.reset()
+
+        layout = prepare_layout(parking, moving)
+        sr.parking_space_instances.update(layout.parking_spaces)
+        sr.moving_space_instances.update(layout.moving_spaces)
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("구역 데이터 교체 테스트 시작")
+        print("=" * 80)
+
+        print("\n[검증 테스트]")
+        parking, moving = base_layout()
+        layout = prepare_layout(parking, moving)
+        self.check("TC1: 올바른 구역 데이터", (sorted(layout.parking_spaces), sorted(layout.moving_spaces)), ([0, 1], [1, 2, 15]))
+
+        broken_parking, broken_moving = base_layout()
+        broken_parking["1"]["near_moving_space_id"] = 15
+        self.check("TC2: 주차 구역과 이동 구역 연결 불일치",
+                   validate_layout({int(k): v for k, v in broken_parking.items()}, {int(k): v for k, v in broken_moving.items()}),
+                   ["주차 구역 1: 15번 이동 구역의 near_parking_space_id에 없습니다."])
+
+        broken_parking, broken_moving = base_layout()
+        broken_moving["2"]["near_moving_space_id"] = [1]
+        del broken_moving["15"]
+        errors = validate_layout({int(k): v for k, v in broken_parking.items()}, {int(k): v for k, v in broken_moving.items()})
+        self.check("TC3: 입차 구역 누락", errors, ["입차 구역(15번 이동 구역)이 없습니다."])
+
+        try:
+            prepare_layout({"a": {}}, moving)
+            result = None
+        except ValueError as e:
+            result = str(e)
+        self.check("TC4: 정수가 아닌 구역 ID", result, "주차 구역 구역 ID는 정수여야 합니다.")
+
+        print("\n[차량 이동 테스트]")
+        parking, moving = base_layout()
+        self.setup_state(parking, moving)
+
+        parked = Car.create_entry_car(car_id=1, car_number="1111", position=(125, 125))
+        sr.car_number_instances[1] = parked
+        parked.update_in_parking(sr.parking_space_instances[0])
+        parked.parking_time = 50.0
+        sr.parking_space_instances[0].parking_time = 50.0
+
+        moving_car = Car.create_entry_car(car_id=2, car_number="2222", position=(250, 50))
+        sr.car_number_instances[2] = moving_car
+        moving_car.update_in_moving(sr.moving_space_instances[15])
+        sr.flush_reroutes()
+        old_moving_space = sr.moving_space_instances[2]
+
+        # 2번 구역을 2, 3번으로 나누고 주차 구역 0을 3번 구역에 연결
+        new_parking, new_moving = base_layout()
+        new_parking["0"]["near_moving_space_id"] = 3
+        new_moving["2"]["position"] = square(100, 0, 50)
+        new_moving["2"]["near_parking_space_id"] = [1]
+        new_moving["2"]["near_moving_space_id"] = [1, 3]
+        new_moving["3"] = {"name": "Path_3", "position": [[150, 0], [200, 0], [200, 100], [150, 100]], "congestion": 100, "near_parking_space_id": [0], "near_moving_space_id": [2, 15]}
+        new_moving["15"]["near_moving_space_id"] = [3]
+        layout = prepare_layout(new_parking, new_moving)
+
+        proxy = sr.MappingProxyType(sr.moving_space_instances)
+        sr.apply_layout(layout.parking_spaces, layout.moving_spaces, layout.direction_table)
+
+        self.check("TC5: 기존 딕셔너리를 새 구역으로 교체", (sorted(proxy), proxy[2] is layout.moving_spaces[2], old_moving_space.route_set), ([1, 2, 3, 15], True, set()))
+        self.check("TC6: 주차한 차량은 주차 시간 유지",
+                   (parked.status, parked.space_id, parked.parking_time, sr.parking_space_instances[0].status, sr.parking_space_instances[0].parking_time),
+                   (CarStatus.PARKING, 0, 50.0, ParkingSpaceEnum.OCCUPIED, 50.0))
+        self.check("TC7: 이동 중인 차량은 새 구역에 등록하고 재계산 요청",
+                   (moving_car.space_id, sr.moving_space_instances[15].car_set, moving_car.route, sr.reroute_requests), (15, {2}, [], {2}))
+
+        sr.flush_reroutes()
+        self.check("TC8: 새 구역 기준 경로", (moving_car.route, moving_car.target_parking_space_id), ([15, 3, 2], 1))
+
+        print("\n[예약 유지 테스트]")
+        parking, moving = base_layout()
+        self.setup_state(parking, moving)
+        sr.reserve_bay("3333", 0.0)
+        sr.reserve_bay("4444", 0.0)
+        held = dict(sr.bay_holds)
+
+        new_parking, new_moving = base_layout()
+        del new_parking[str(held["4444"])]
+        new_moving["2"]["near_parking_space_id"] = [held["3333"]]
+        layout = prepare_layout(new_parking, new_moving)
+        sr.apply_layout(layout.parking_spaces, layout.moving_spaces, layout.direction_table)
+
+        self.check("TC9: 남아 있는 주차 구역의 예약은 유지",
+                   (sr.bay_holds, sr.parking_space_instances[held["3333"]].car_number), ({"3333": held["3333"]}, "3333"))
+        self.check("TC10: 없어진 주차 구역의 예약은 해제", "4444" in sr.hold_expiry_wheel, False)
+
+        print("\n[주차 구역 이동 테스트]")
+        parking, moving = base_layout()
+        self.setup_state(parking, moving)
+
+        parked = Car.create_entry_car(car_id=1, car_number="1111", position=(125, 125))
+        sr.car_number_instances[1] = parked
+        parked.update_in_parking(sr.parking_space_instances[0])
+        parked.parking_time = 50.0
+        sr.parking_space_instances[0].parking_time = 50.0
+
+        # 주차 구역 0을 아래로 옮기고 2번 구역을 차량의 마지막 위치까지 늘림
+        new_parking, new_moving = base_layout()
+        new_parking["0"]["position"] = square(100, 150, 50)
+        new_moving["2"]["position"] = [[100, 0], [200, 0], [200, 100], [150, 100], [150, 150], [100, 150]]
+        layout = prepare_layout(new_parking, new_moving)
+        sr.apply_layout(layout.parking_spaces, layout.moving_spaces, layout.direction_table)
+
+        self.check("TC11: 주차 구역 밖이 된 주차 차량은 출차로 처리하지 않고 같은 ID의 주차 구역에 유지",
+                   (parked.status, parked.space_id, parked.parking_time, sr.parking_space_instances[0].status, sr.moving_space_instances[2].car_set, sr.reroute_requests),
+                   (CarStatus.PARKING, 0, 50.0, ParkingSpaceEnum.OCCUPIED, set(), set()))
+
+        zones = [sr.zone_filter.update(1, (126, 124), sr.parking_space_instances, sr.moving_space_instances)[0] for _ in range(5)]
+        self.check("TC12: 움직이지 않는 동안 다음 프레임에도 주차 구역 유지", zones, ["parking"] * 5)
+
+        zones = [sr.zone_filter.update(1, (125, 50), sr.parking_space_instances, sr.moving_space_instances)[0] for _ in range(5)]
+        self.check("TC13: 실제로 움직이면 이동 구역으로 전환", zones[-1], "moving")
+
+        print("\n[파일 감시 테스트]")
+        with tempfile.TemporaryDirectory() as directory:
+            parking_path = os.path.join(directory, "parking_space.json")
+            moving_path = os.path.join(directory, "moving_space.json")
+            parking, moving = base_layout()
+            LayoutManager.write_file(parking_path, parking)
+            LayoutManager.write_file(moving_path, moving)
+
+            manager = LayoutManager(parking_path, moving_path)
+            received = []
+            manager.add_listener(lambda parking_data, moving_data: received.append(sorted(moving_data)))
+
+            self.check("TC14: 바뀌지 않은 파일은 다시 읽지 않음", (manager.check_files(), manager.take_pending()), (None, None))
+
+            # 잘못된 데이터를 저장한 경우 기존 구역 유지
+            moving["2"]["near_moving_space_id"] = [1, 15, 9]
+            with open(moving_path, "w") as f:
+                json.dump(moving, f)
+            os.utime(moving_path, ns=(1, 1))
+            self.check("TC15: 검증에 실패한 파일은 교체하지 않음", (manager.check_files(), manager.pending), (None, None))
+
+            moving["2"]["near_moving_space_id"] = [1, 15]
+            moving["2"]["name"] = "Path_2_new"
+            with open(moving_path, "w") as f:
+                json.dump(moving, f)
+            os.utime(moving_path, ns=(2, 2))
+            staged = manager.check_files()
+            self.check("TC16: 바뀐 파일은 다시 읽어 준비", (staged.version, staged.moving_spaces[2].name), (1, "Path_2_new"))
+
+            taken = manager.take_pending()
+            self.check("TC17: 꺼낸 구역 데이터는 listener에 전달", (taken is staged, manager.take_pending(), received), (True, None, [[1, 2, 15]]))
+
+            new_parking = copy.deepcopy(parking)
+            new_parking["1"]["name"] = "A2_new"
+            staged = manager.submit(new_parking, moving)
+            with open(parking_path, "r") as f:
+                saved = json.load(f)
+            self.check("TC18: submit은 파일에 저장하고 다시 읽지 않음",
+                       (staged.version, saved["1"]["name"], manager.check_files(), manager.take_pending() is staged), (2, "A2_new", None, True))
+
+            try:
+                manager.submit({}, {})
+                result = None
+            except ValueError as e:
+                result = str(e).splitlines()
+            self.check("TC19: 잘못된 submit은 예외", result, ["출구 구역(1번 이동 구역)이 없습니다.", "입차 구역(15번 이동 구역)이 없습니다."])
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestLayoutManager()
+    tester.run_all_tests()
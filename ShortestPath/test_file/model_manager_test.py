@@ -0,0 +1,185 @@
+"""
+모델 관리 테스트 코드
+model_manager.py의 변환 모델 경로, 정확도 계산, 측정 후 백엔드 선택과 선택 결과 재사용에 대한 테스트 케이스를 포함
+(ultralytics, onnxruntime 없이 가짜 백엔드로 실행)
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import detection_backend
+import model_manager
+from detection_backend import DetectionBackend
+from layout_bundle import file_hash
+
+CAR_A = [100, 100, 200, 180]
+CAR_B = [400, 400, 480, 470]
+
+# 모델 파일 이름 -> (탐지 시간, 바운딩 박스, 신뢰도)
+PROFILES = {
+    "model.pt": (0.004, [CAR_A, CAR_B], [0.9, 0.8]),
+    "model.onnx": (0.002, [CAR_A, CAR_B], [0.88, 0.8]),
+    "model_int8.onnx": (0.0005, [CAR_A], [0.7]),    # 빠르지만 차량 하나를 놓침
+}
+
+
+class FakeBackend(DetectionBackend):
+    """모델 파일 이름에 따라 정해진 시간 동안 탐지하는 백엔드"""
+
+    created = []
+
+    def __init__(self, model_path, **options):
+        if os.path.basename(model_path) not in PROFILES:
+            raise RuntimeError("지원하지 않는 모델")
+
+        self.model_path = model_path
+        self.delay, boxes, scores = PROFILES[os.path.basename(model_path)]
+        self.boxes = np.array(boxes, dtype=np.float32)
+        self.scores = np.array(scores, dtype=np.float32)
+        self.detect_count = 0
+        self.closed = False
+        FakeBackend.created.append(self)
+
+    def detect(self, frame):
+        self.detect_count += 1
+        time.sleep(self.delay)
+        return self.boxes, self.scores
+
+    def track(self, frame):
+        return np.zeros((0, 5), dtype=np.float32)
+
+    def close(self):
+        self.closed = True
+
+
+class TestModelManager:
+    """모델 관리 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("모델 관리 테스트 시작")
+        print("=" * 80)
+
+        print("\n[변환 모델 경로 테스트]")
+        self.check("TC1: .pt 옆의 변환 모델 경로",
+                   [os.path.basename(model_manager.variant_path("/m/v4_best_medium.pt", name)) for name in model_manager.DEFAULT_FORMATS],
+                   ["v4_best_medium.onnx", "v4_best_medium_int8.onnx", "v4_best_medium_openvino_model", "v4_best_medium.engine"])
+
+        print("\n[정확도 계산 테스트]")
+        both = (np.array([CAR_A, CAR_B], dtype=np.float32), np.array([0.9, 0.7], dtype=np.float32))
+        one = (np.array([CAR_A], dtype=np.float32), np.array([0.5], dtype=np.float32))
+        empty = (np.zeros((0, 4), dtype=np.float32), np.zeros((0,), dtype=np.float32))
+        self.check("TC2: 박스 일치율 (같음, 하나 놓침, 둘 다 탐지 없음)",
+                   [round(model_manager.agreement([both], [both]), 3),
+                    round(model_manager.agreement([both], [one]), 3),
+                    model_manager.agreement([empty], [empty])],
+                   [1.0, 0.667, 1.0])
+        self.check("TC3: 평균 신뢰도", (round(model_manager.mean_confidence([both, one, empty]), 3), model_manager.mean_confidence([empty])),
+                   (0.7, 0.0))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pt_path = os.path.join(temp_dir, "model.pt")
+            with open(pt_path, "wb") as f:
+                f.write(b"weights")
+            for name in ("onnx", "onnx_int8"):
+                with open(model_manager.variant_path(pt_path, name), "wb") as f:
+                    f.write(b"variant")
+
+            # 이미 변환한 모델로 기록 (ultralytics 없이 측정만 실행)
+            model_manager.save_manifest(pt_path, {"pt_hash": file_hash(pt_path), "imgsz": 640, "variants": ["onnx", "onnx_int8"], "failed": [], "selection": None})
+
+            original = dict(detection_backend.BACKENDS)
+            detection_backend.BACKENDS["bytetrack"] = FakeBackend
+            detection_backend.BACKENDS["onnx"] = FakeBackend
+            frames = [np.zeros((10, 10, 3), dtype=np.uint8)] * 6
+
+            try:
+                print("\n[백엔드 선택 테스트]")
+                variants = model_manager.export_variants(pt_path, ("onnx", "onnx_int8", "openvino"))
+                with open(model_manager.manifest_path(pt_path), "r") as f:
+                    failed = json.load(f)["failed"]
+                self.check("TC4: 변환에 실패한 형식(ultralytics 없음)은 제외하고 다시 시도하지 않도록 기록",
+                           ([(variant.name, variant.backend) for variant in variants], failed),
+                           ([("pt", "bytetrack"), ("onnx", "onnx"), ("onnx_int8", "onnx")], ["openvino"]))
+
+                detector = model_manager.select_backend(pt_path, frames, ("onnx", "onnx_int8"), warmup=2)
+                self.check("TC5: 정확도 기준을 만족하는 가장 빠른 모델 선택 (INT8은 차량을 놓쳐 제외)",
+                           os.path.basename(detector.model_path), "model.onnx")
+                self.check("TC6: 선택하지 않은 모델은 해제",
+                           [(os.path.basename(backend.model_path), backend.closed) for backend in FakeBackend.created],
+                           [("model.pt", True), ("model.onnx", False), ("model_int8.onnx", True)])
+
+                with open(model_manager.manifest_path(pt_path), "r") as f:
+                    selection = json.load(f)["selection"]
+                self.check("TC7: 측정 결과 저장",
+                           (selection["variant"], [result["variant"] for result in selection["results"]], selection["results"][2]["agreement"]),
+                           ("onnx", ["pt", "onnx", "onnx_int8"], 0.6667))
+
+                FakeBackend.created = []
+                detector = model_manager.select_backend(pt_path, frames, ("onnx", "onnx_int8"), warmup=2)
+                self.check("TC8: 다음 실행은 저장된 선택 결과로 측정 없이 생성",
+                           (os.path.basename(detector.model_path), len(FakeBackend.created), detector.detect_count), ("model.onnx", 1, 0))
+
+                FakeBackend.created = []
+                detector = model_manager.select_backend(pt_path, frames, ("onnx", "onnx_int8"), min_agreement=0.5, min_confidence_ratio=0.5,
+                                                        warmup=2, force=True)
+                self.check("TC9: 정확도 기준을 낮추면 INT8 모델 선택", os.path.basename(detector.model_path), "model_int8.onnx")
+
+                resized = model_manager.load_manifest(pt_path, file_hash(pt_path), imgsz=480)
+                with open(pt_path, "wb") as f:
+                    f.write(b"retrained weights")
+                manifest = model_manager.load_manifest(pt_path, file_hash(pt_path))
+                self.check("TC10: 모델 입력 크기나 .pt가 바뀌면 변환, 선택 결과를 사용하지 않음",
+                           [(info["variants"], info["failed"], info["selection"]) for info in (resized, manifest)], [([], [], None)] * 2)
+
+                saved = PROFILES.pop("model.pt")
+                try:
+                    model_manager.select_backend(pt_path, frames, (), force=True)
+                    result = None
+                except RuntimeError as e:
+                    result = str(e)
+                finally:
+                    PROFILES["model.pt"] = saved
+                self.check("TC11: 사용할 수 있는 모델이 없음", result, f"사용할 수 있는 탐지 모델이 없습니다: {pt_path}")
+            finally:
+                detection_backend.BACKENDS.clear()
+                detection_backend.BACKENDS.update(original)
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestModelManager()
+    tester.run_all_tests()
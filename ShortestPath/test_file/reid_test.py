@@ -0,0 +1,126 @@
+"""
+트랙 재연결 테스트 코드
+reid.py의 TrackReassociator와 shortest_route의 추적 복구(restore_lost_car, change_car_id)에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import Car, MovingSpace, ParkingSpace, ParkingSpaceEnum
+from reid import TrackReassociator
+
+
+class TestReid:
+    """트랙 재연결 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def setup_spaces(self):
+        """테스트용 구역 설정: 1 - 2 - 3 - 4 가로 배치, 3번 구역 아래에 주차 구역 0"""
+        sr.moving_space_instances.clear()
+        sr.parking_space_instances.clear()
+        sr.car_number_instances.clear()
+        sr.lost_tracking_time.clear()
+        sr.route_changed_car_ids.clear()
+
+        for space_id in (1, 2, 3, 4):
+            x = (space_id - 1) * 100
+            sr.moving_space_instances[space_id] = MovingSpace(
+                space_id=space_id,
+                name=f"space_{space_id}",
+                position=[(x, 0), (x + 100, 0), (x + 100, 100), (x, 100)],
+                congestion=100,
+                near_parking_space_id=[0] if space_id == 3 else [],
+                near_moving_space_id=[n for n in (space_id - 1, space_id + 1) if 1 <= n <= 4]
+            )
+
+        sr.parking_space_instances[0] = ParkingSpace(
+            space_id=0,
+            name="P0",
+            position=[(200, 100), (300, 100), (300, 200), (200, 200)],
+            near_moving_space_id=3
+        )
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("트랙 재연결 테스트 시작")
+        print("=" * 80)
+
+        self.setup_spaces()
+        reid = TrackReassociator(max_gap=3.0, max_distance=100.0, max_speed=100.0)
+
+        car = Car.create_entry_car(car_id=1, car_number="1234", position=(50, 50))
+        car.space_id = 1
+
+        print("\n[후보 선택 테스트]")
+        self.check("TC1: 가까운 차량과 연결",
+                   reid.match((80, 50), {1: (car, 0.5)}, sr.parking_space_instances, sr.moving_space_instances), 1)
+        self.check("TC2: 시간 간격 초과는 연결하지 않음",
+                   reid.match((80, 50), {1: (car, 3.5)}, sr.parking_space_instances, sr.moving_space_instances), None)
+        self.check("TC3: 허용 거리 초과는 연결하지 않음",
+                   reid.match((250, 50), {1: (car, 0.5)}, sr.parking_space_instances, sr.moving_space_instances), None)
+
+        far_car = Car.create_entry_car(car_id=2, car_number="5678", position=(280, 50))
+        far_car.space_id = 3
+        self.check("TC4: 인접하지 않은 구역은 연결하지 않음",
+                   reid.match((320, 50), {1: (car, 2.9)}, sr.parking_space_instances, sr.moving_space_instances), None)
+        self.check("TC5: 여러 후보 중 가장 가까운 차량",
+                   reid.match((260, 50), {1: (car, 2.0), 2: (far_car, 2.0)}, sr.parking_space_instances, sr.moving_space_instances), 2)
+
+        print("\n[차량 복구 테스트]")
+        self.setup_spaces()
+        car = Car.create_entry_car(car_id=10, car_number="1111", position=(150, 50))
+        sr.car_number_instances[10] = car
+        car.update_in_moving(sr.moving_space_instances[2])
+        sr.flush_reroutes()
+        sr.lost_tracking_time[10] = sr.time.time() - 1.0
+        sr.route_changed_car_ids.clear()
+        congestion = {space_id: space.congestion for space_id, space in sr.moving_space_instances.items()}
+
+        restored = sr.restore_lost_car(20, (160, 50))
+        self.check("TC6: 새 ID로 차량 복구", restored is car and car.car_id == 20, True)
+        self.check("TC7: car_number_instances 키 변경", sorted(sr.car_number_instances), [20])
+        self.check("TC8: lost_tracking_time에서 제거", sr.lost_tracking_time, {})
+        self.check("TC9: 구역 차량 목록 변경", sr.moving_space_instances[2].car_set, {20})
+        self.check("TC10: 경로 구역 route_set 변경",
+                   all(20 in sr.moving_space_instances[space_id].route_set and 10 not in sr.moving_space_instances[space_id].route_set
+                       for space_id in car.route), True)
+        self.check("TC11: 목표 주차 구역 유지",
+                   (sr.parking_space_instances[0].status, sr.parking_space_instances[0].car_id), (ParkingSpaceEnum.TARGET, 20))
+        self.check("TC12: 혼잡도 변화 없음",
+                   {space_id: space.congestion for space_id, space in sr.moving_space_instances.items()}, congestion)
+        self.check("TC13: 디스플레이 갱신 이벤트", sr.route_changed_car_ids, {10, 20})
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestReid()
+    tester.run_all_tests()
@@ -0,0 +1,143 @@
+"""
+경로 재계산 일괄 처리 테스트 코드
+shortest_route.py의 request_reroute, flush_reroutes, shortest_path_tree에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import Car, CarStatus, MovingSpace, ParkingSpace
+
+
+class TestReroute:
+    """경로 재계산 일괄 처리 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def setup_spaces(self):
+        """
+        테스트용 구역 설정
+
+        1 - 2 - 3 - 4 가로 배치, 5는 2와 4를 잇는 우회로
+        주차 구역 0, 1은 4번 구역에 연결
+        """
+        sr.moving_space_instances.clear()
+        sr.parking_space_instances.clear()
+        sr.car_number_instances.clear()
+        sr.reroute_requests.clear()
+        sr.route_changed_car_ids.clear()
+
+        neighbors = {1: [2], 2: [1, 3, 5], 3: [2, 4], 4: [3, 5], 5: [2, 4]}
+        for space_id, near in neighbors.items():
+            x = (space_id - 1) * 100
+            sr.moving_space_instances[space_id] = MovingSpace(
+                space_id=space_id,
+                name=f"space_{space_id}",
+                position=[(x, 0), (x + 100, 0), (x + 100, 100), (x, 100)],
+                congestion=100,
+                near_parking_space_id=[0, 1] if space_id == 4 else [],
+                near_moving_space_id=near
+            )
+
+        for parking_space_id in (0, 1):
+            x = 300 + parking_space_id * 50
+            sr.parking_space_instances[parking_space_id] = ParkingSpace(
+                space_id=parking_space_id,
+                name=f"P{parking_space_id}",
+                position=[(x, 100), (x + 50, 100), (x + 50, 200), (x, 200)],
+                near_moving_space_id=4
+            )
+
+    def moving_car(self, car_id, space_id):
+        """이동 구역에 있는 차량 생성"""
+        car = Car.create_entry_car(car_id=car_id, car_number=str(car_id), position=sr.moving_space_instances[space_id].center_position)
+        car.space_id = space_id
+        sr.car_number_instances[car_id] = car
+        return car
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("경로 재계산 일괄 처리 테스트 시작")
+        print("=" * 80)
+
+        print("\n[최단 경로 트리 테스트]")
+        self.setup_spaces()
+        sr.moving_space_instances[3].congestion = 1000
+        tree, costs = sr.shortest_path_tree(1)
+        self.check("TC1: 트리 경로와 dijkstra 경로 동일",
+                   [sr.trace_route(tree, goal) for goal in (1, 2, 3, 4, 5)],
+                   [sr.dijkstra(1, goal) for goal in (1, 2, 3, 4, 5)])
+        self.check("TC2: 혼잡한 구역 우회", (sr.trace_route(tree, 4), costs[4]), ([1, 2, 5, 4], 300))
+
+        print("\n[요청 병합 테스트]")
+        self.setup_spaces()
+        car_a = self.moving_car(7, 1)
+        car_b = self.moving_car(3, 1)
+        sr.request_reroute(7)
+        sr.request_reroute(3)
+        sr.request_reroute(7)
+        self.check("TC3: 요청만으로는 경로를 계산하지 않음", (car_a.route, car_b.route), ([], []))
+
+        calls = []
+        original_tree = sr.shortest_path_tree
+        sr.shortest_path_tree = lambda start_id: calls.append(start_id) or original_tree(start_id)
+        processed = sr.flush_reroutes()
+        sr.shortest_path_tree = original_tree
+
+        self.check("TC4: 차량 ID 순서로 한 번씩 처리", processed, [3, 7])
+        self.check("TC5: 같은 출발 구역은 트리 한 번만 계산", calls, [1])
+        self.check("TC6: 두 차량에 서로 다른 주차 구역 배정", {car_b.target_parking_space_id, car_a.target_parking_space_id}, {0, 1})
+        self.check("TC7: 요청 목록 초기화", (sr.reroute_requests, sr.flush_reroutes()), (set(), []))
+
+        print("\n[무효화된 요청 테스트]")
+        self.setup_spaces()
+        parked = self.moving_car(1, 4)
+        sr.request_reroute(1)
+        sr.request_reroute(2)   # 등록되지 않은 차량
+        parked.update_in_parking(sr.parking_space_instances[0])
+        self.check("TC8: 같은 프레임에 주차한 차량과 삭제된 차량은 계산하지 않음", sr.flush_reroutes(), [])
+        self.check("TC9: 주차한 차량 상태 유지", (parked.status, parked.route), (CarStatus.PARKING, []))
+
+        print("\n[이동 구역 이탈 테스트]")
+        self.setup_spaces()
+        car = self.moving_car(5, 1)
+        sr.flush_reroutes()
+        car.set_route([1, 2, 3, 4])
+        car.update_in_moving(sr.moving_space_instances[5])
+        self.check("TC10: 경로 밖 구역은 재계산 요청", sr.reroute_requests, {5})
+        sr.flush_reroutes()
+        self.check("TC11: 프레임 끝에서 새 구역 기준 경로", car.route, [5, 4])
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestReroute()
+    tester.run_all_tests()
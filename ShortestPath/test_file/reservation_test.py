@@ -0,0 +1,153 @@
+"""
+입차기 주차 구역 예약 테스트 코드
+shortest_route.py의 reserve_bay, release_expired_holds, entry의 예약 처리에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+from queue import Queue
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import MovingSpace, ParkingSpace, ParkingSpaceEnum
+from timing_wheel import TimingWheel
+
+
+class TestReservation:
+    """입차기 주차 구역 예약 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def setup_spaces(self):
+        """테스트용 구역 설정: 입차 구역 15 - 이동 구역 2, 주차 구역 0, 1은 2번 구역에 연결"""
+        sr.moving_space_instances.clear()
+        sr.parking_space_instances.clear()
+        sr.car_number_instances.clear()
+        sr.reroute_requests.clear()
+        sr.bay_holds.clear()
+        sr.hold_expiry_wheel = TimingWheel(tick=0.5, slots=128)
+
+        for space_id, x, near in ((sr.ENTRY_MOVING_SPACE_ID, 0, [2]), (2, 100, [sr.ENTRY_MOVING_SPACE_ID])):
+            sr.moving_space_instances[space_id] = MovingSpace(
+                space_id=space_id,
+                name=f"space_{space_id}",
+                position=[(x, 0), (x + 100, 0), (x + 100, 100), (x, 100)],
+                congestion=100,
+                near_parking_space_id=[0, 1] if space_id == 2 else [],
+                near_moving_space_id=near
+            )
+
+        for parking_space_id in (0, 1):
+            x = 100 + parking_space_id * 50
+            sr.parking_space_instances[parking_space_id] = ParkingSpace(
+                space_id=parking_space_id,
+                name=f"P{parking_space_id}",
+                position=[(x, 100), (x + 50, 100), (x + 50, 200), (x, 200)],
+                near_moving_space_id=2
+            )
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("입차기 주차 구역 예약 테스트 시작")
+        print("=" * 80)
+
+        print("\n[예약 테스트]")
+        self.setup_spaces()
+        self.check("TC1: 입차 구역에서 가까운 주차 구역 예약", sr.reserve_bay("1111", 0.0), (0, "P0"))
+        self.check("TC2: 예약된 구역은 목표 지정 불가",
+                   (sr.parking_space_instances[0].status, sr.parking_space_instances[0].car_number), (ParkingSpaceEnum.TARGET, "1111"))
+        self.check("TC3: 같은 차량 번호는 기존 예약 유지", sr.reserve_bay("1111", 10.0), (0, "P0"))
+        self.check("TC4: 다음 차량은 다른 구역 예약", sr.reserve_bay("2222", 10.0), (1, "P1"))
+        self.check("TC5: 만차이면 예약 불가", sr.reserve_bay("3333", 10.0), None)
+
+        print("\n[예약 시간 초과 테스트]")
+        self.check("TC6: 연장된 예약은 연장 전 시각에 해제되지 않음", sr.release_expired_holds(sr.BAY_HOLD_TIMEOUT + 1.0), [])
+        self.check("TC7: 예약 시간이 지나면 해제",
+                   sorted(sr.release_expired_holds(10.0 + sr.BAY_HOLD_TIMEOUT + 1.0)), ["1111", "2222"])
+        self.check("TC8: 해제된 구역은 다시 빈 구역",
+                   [sr.parking_space_instances[i].status for i in (0, 1)], [ParkingSpaceEnum.EMPTY, ParkingSpaceEnum.EMPTY])
+
+        print("\n[입차 테스트]")
+        self.setup_spaces()
+        sr.reserve_bay("1111", 0.0)
+        sr.reserve_bay("2222", 0.0)
+
+        car_number_queue = Queue()
+        sr.entry(7, car_number_queue, (50, 50), None)
+        car = sr.car_number_instances[7]
+        self.check("TC9: 먼저 예약한 번호의 구역을 차량 목표로 설정",
+                   (car.car_number, car.target_parking_space_id, sr.parking_space_instances[0].car_id), ("1111", 0, 7))
+        self.check("TC10: 예약 목록에서 제거", sorted(sr.bay_holds), ["2222"])
+
+        car.update_in_moving(sr.moving_space_instances[sr.ENTRY_MOVING_SPACE_ID])
+        sr.flush_reroutes()
+        self.check("TC11: 첫 경로 계산에서 예약 구역 유지",
+                   (car.target_parking_space_id, car.route, car.reserved_parking_space_id), (0, [sr.ENTRY_MOVING_SPACE_ID, 2], None))
+
+        print("\n[예약 없이 입차 테스트]")
+        response_queue = Queue()
+        car_number_queue.put("3333")
+        sr.entry(8, car_number_queue, (50, 50), response_queue)
+        self.check("TC12: 빈 구역이 없으면 입차 거부", (8 in sr.car_number_instances, response_queue.get_nowait()), (False, False))
+
+        print("\n[여러 번호 대기 테스트]")
+        self.setup_spaces()
+        sr.reserve_bay("1111", 0.0)
+        sr.reserve_bay("2222", 0.0)
+        sr.entry(7, car_number_queue, (50, 50), None)
+        sr.entry(8, car_number_queue, (60, 50), None)
+        self.check("TC13: 예약 방식은 예약한 순서대로 번호 사용",
+                   [(sr.car_number_instances[car_id].car_number, sr.car_number_instances[car_id].target_parking_space_id) for car_id in (7, 8)],
+                   [("1111", 0), ("2222", 1)])
+
+        sr.entry(9, car_number_queue, (70, 50), None)
+        self.check("TC14: 모든 예약 사용, 유효한 예약이 없으면 차량을 만들지 않음", (sr.bay_holds, 9 in sr.car_number_instances), ({}, False))
+
+        print("\n[예약 해제 후 입차 테스트]")
+        self.setup_spaces()
+        sr.reserve_bay("1111", 0.0)
+        sr.reserve_bay("2222", 10000.0)     # 1111 예약 시간 초과로 해제된 뒤 예약
+        sr.entry(7, car_number_queue, (50, 50), None)
+        car = sr.car_number_instances[7]
+        self.check("TC15: 해제된 번호는 사용하지 않고 유효한 예약의 번호와 구역 사용",
+                   (car.car_number, car.target_parking_space_id, sr.bay_holds), ("2222", 0, {}))
+
+        self.setup_spaces()
+        sr.reserve_bay("1111", 0.0)
+        sr.reserve_bay("1111", 5.0)         # 같은 번호로 다시 요청
+        sr.entry(7, car_number_queue, (50, 50), None)
+        sr.entry(8, car_number_queue, (60, 50), None)
+        self.check("TC16: 같은 번호를 다시 요청해도 한 차량만 입차",
+                   (sr.car_number_instances[7].car_number, 8 in sr.car_number_instances, sr.bay_holds), ("1111", False, {}))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestReservation()
+    tester.run_all_tests()
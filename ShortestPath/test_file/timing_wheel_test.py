@@ -0,0 +1,99 @@
+"""
+타이밍 휠 테스트 코드
+timing_wheel.py의 TimingWheel과 shortest_route의 추적 끊김 처리(update_lost_tracking)에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from shortest_route import Car
+from timing_wheel import TimingWheel
+
+
+class TestTimingWheel:
+    """타이밍 휠 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("타이밍 휠 테스트 시작")
+        print("=" * 80)
+
+        print("\n[만료 테스트]")
+        wheel = TimingWheel(tick=0.1, slots=8)
+        wheel.advance(100.0)
+        wheel.schedule("a", 100.35)
+        wheel.schedule("b", 100.5)
+        self.check("TC1: 만료 전에는 꺼내지 않음", wheel.advance(100.3), [])
+        self.check("TC2: 같은 tick 안의 만료 시각", wheel.advance(100.36), ["a"])
+        self.check("TC3: 만료된 항목은 휠에서 제거", ("a" in wheel, len(wheel)), (False, 1))
+        self.check("TC4: 여러 tick을 건너뛴 경우", wheel.advance(101.0), ["b"])
+
+        print("\n[취소 및 재설정 테스트]")
+        wheel.schedule("c", 101.2)
+        wheel.cancel("c")
+        self.check("TC5: 취소된 항목은 만료되지 않음", wheel.advance(102.0), [])
+        wheel.schedule("d", 102.2)
+        wheel.schedule("d", 102.6)
+        self.check("TC6: 재설정 시 이전 만료 시각 무시", wheel.advance(102.3), [])
+        self.check("TC7: 새 만료 시각에 만료", wheel.advance(102.6), ["d"])
+
+        print("\n[여러 바퀴 테스트]")
+        wheel.schedule("e", 104.0)      # 슬롯 8개 * 0.1초 = 0.8초보다 먼 만료 시각
+        self.check("TC8: 한 바퀴 전에 같은 슬롯을 지나도 만료되지 않음", wheel.advance(103.25), [])
+        self.check("TC9: 한 바퀴 이상 건너뛰어도 만료", wheel.advance(110.0), ["e"])
+        wheel.schedule("f", 105.0)
+        self.check("TC10: 지나간 만료 시각은 다음 확인에서 만료", wheel.advance(110.0), ["f"])
+
+        print("\n[추적 끊김 처리 테스트]")
+        sr.car_number_instances.clear()
+        sr.lost_tracking_time.clear()
+        sr.lost_expiry_wheel = TimingWheel(tick=0.1, slots=64)
+        for car_id in (1, 2, 3):
+            sr.car_number_instances[car_id] = Car.create_entry_car(car_id=car_id, car_number=str(car_id), position=(0, 0))
+
+        sr.update_lost_tracking({1: (0, 0)}, 1000.0)
+        self.check("TC11: 새로 끊긴 차량만 기록", sr.lost_tracking_time, {2: 1000.0, 3: 1000.0})
+
+        sr.clear_lost_tracking(3)
+        sr.update_lost_tracking({1: (0, 0), 3: (0, 0)}, 1002.0)
+        self.check("TC12: 대기 시간 전에는 삭제하지 않음", sorted(sr.car_number_instances), [1, 2, 3])
+
+        deleted = sr.update_lost_tracking({1: (0, 0), 3: (0, 0)}, 1000.0 + sr.LOST_TRACKING_TIMEOUT)
+        self.check("TC13: 대기 시간이 지난 차량 삭제", (deleted, sorted(sr.car_number_instances)), ([2], [1, 3]))
+        self.check("TC14: 복구된 차량은 삭제 예정에서 제외", (sr.lost_tracking_time, len(sr.lost_expiry_wheel)), ({}, 0))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestTimingWheel()
+    tester.run_all_tests()
@@ -0,0 +1,117 @@
+"""
+다중 카메라 통합 테스트 코드
+multi_camera.py의 TrackFusion (카메라 트랙 -> 전역 ID 매핑, 카메라 간 / 같은 카메라 안의 hand-off, 만료)에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multi_camera import TrackFusion
+from shortest_route import MovingSpace
+
+
+class ShiftView:
+    """카메라 좌표에 offset을 더해 전역 좌표로 변환하는 카메라 (x < 1000은 이동 구역 1, 그 외는 2, 음수는 구역 밖)"""
+
+    def __init__(self, offset=0.0):
+        self.offset = offset
+
+    def to_global(self, position):
+        x, y = position[0] + self.offset, position[1]
+        if x < 0:
+            return None
+        return ("moving", 1 if x < 1000 else 2), (x, y)
+
+
+def moving_space(space_id, near_moving_space_id):
+    return MovingSpace(space_id=space_id, name=str(space_id), position=[(0, 0), (1, 0), (1, 1), (0, 1)],
+                       congestion=0, near_parking_space_id=[-1], near_moving_space_id=near_moving_space_id)
+
+
+class TestTrackFusion:
+    """다중 카메라 통합 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("다중 카메라 통합 테스트 시작")
+        print("=" * 80)
+
+        moving = {1: moving_space(1, [2]), 2: moving_space(2, [1])}
+
+        print("\n[전역 ID 테스트]")
+        fusion = TrackFusion({0: ShiftView()}, {}, moving)
+        first = fusion.update({0: {5: (100, 100), 6: (500, 100)}}, now=0.0)
+        second = fusion.update({0: {5: (110, 100), 6: (510, 100)}}, now=0.1)
+        self.check("TC1: 카메라 트랙마다 새 전역 ID, 같은 트랙은 같은 ID 유지", (first, second),
+                   ({1: (100, 100), 2: (500, 100)}, {1: (110, 100), 2: (510, 100)}))
+
+        self.check("TC2: 구역 밖 트랙은 제외", fusion.update({0: {5: (120, 100), 9: (-50, 100)}}, now=0.2), {1: (120, 100)})
+
+        print("\n[같은 카메라 hand-off 테스트]")
+        fusion = TrackFusion({0: ShiftView()}, {}, moving)
+        fusion.update({0: {5: (100, 100)}}, now=0.0)
+        switched = fusion.update({0: {7: (105, 100)}}, now=0.1)
+        self.check("TC3: 트래커 ID가 바뀌면 끊긴 트랙의 전역 ID를 이어 받음", (switched, (0, 5) in fusion.local_to_global), ({1: (105, 100)}, False))
+
+        both = fusion.update({0: {7: (110, 100), 5: (400, 100)}}, now=0.2)
+        self.check("TC4: 끊긴 트랙이 다시 나타나면 새로 매칭", both, {1: (110, 100), 2: (400, 100)})
+
+        fusion = TrackFusion({0: ShiftView()}, {}, moving)
+        fusion.update({0: {5: (100, 100), 6: (120, 100)}}, now=0.0)
+        self.check("TC5: 이 프레임에 있는 트랙의 ID는 이어 받지 않음",
+                   fusion.update({0: {5: (100, 100), 6: (120, 100), 8: (110, 100)}}, now=0.1)[3], (110, 100))
+
+        print("\n[카메라 간 hand-off 테스트]")
+        fusion = TrackFusion({0: ShiftView(), 1: ShiftView(offset=900)}, {}, moving)
+        fusion.update({0: {5: (980, 100)}}, now=0.0)
+        handed = fusion.update({0: {}, 1: {3: (100, 100)}}, now=0.5)
+        self.check("TC6: 인접 구역의 가까운 차량 ID를 다른 카메라 트랙이 이어 받음", handed, {1: (1000, 100)})
+
+        overlap = fusion.update({0: {5: (990, 100)}, 1: {3: (95, 100)}}, now=0.6)
+        self.check("TC7: 두 카메라에서 보이는 차량은 평균 좌표", overlap, {1: (992.5, 100)})
+
+        far = TrackFusion({0: ShiftView(), 1: ShiftView(offset=900)}, {}, moving)
+        far.update({0: {5: (100, 100)}}, now=0.0)
+        self.check("TC8: 멀리 떨어진 트랙은 새 전역 ID", far.update({0: {}, 1: {3: (100, 100)}}, now=0.5), {2: (1000, 100)})
+
+        print("\n[만료 테스트]")
+        fusion = TrackFusion({0: ShiftView()}, {}, moving, handoff_timeout=1.0)
+        fusion.update({0: {5: (100, 100)}}, now=0.0)
+        fusion.update({0: {}}, now=2.0)
+        late = fusion.update({0: {7: (100, 100)}}, now=2.1)
+        self.check("TC9: hand-off 시간이 지나면 매핑을 지우고 새 전역 ID", (late, fusion.global_state.get(1)), ({2: (100, 100)}, None))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestTrackFusion()
+    tester.run_all_tests()
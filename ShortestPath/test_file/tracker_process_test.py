@@ -0,0 +1,100 @@
+"""
+트래커 프로세스 링 버퍼 테스트 코드
+tracker_process.py의 SharedFrameRing (seq로 덮어쓰기를 확인하는 쓰기/읽기, 이름으로 연결)에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import subprocess
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracker_process import SharedFrameRing
+
+
+def frame(value, shape=(4, 6, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class TestTrackerProcess:
+    """트래커 프로세스 링 버퍼 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("트래커 프로세스 링 버퍼 테스트 시작")
+        print("=" * 80)
+
+        ring = SharedFrameRing((4, 6, 3), slots=2)
+        reader = SharedFrameRing(ring.shape, ring.slots, name=ring.name)
+        try:
+            print("\n[쓰기/읽기 테스트]")
+            self.check("TC1: 새 링 버퍼의 슬롯은 비어 있음", reader.read(0, 0), None)
+
+            first = ring.write(frame(1))
+            second = ring.write(frame(2))
+            self.check("TC2: 슬롯을 순서대로 사용하고 이름으로 연결한 쪽에서 읽기",
+                       (first, second, int(reader.read(*first).sum()), int(reader.read(*second).sum())), ((0, 0), (1, 1), 72, 144))
+
+            out = np.zeros((4, 6, 3), dtype=np.uint8)
+            self.check("TC3: out을 주면 그 배열에 복사", (reader.read(*second, out=out) is out, int(out.sum())), (True, 144))
+
+            print("\n[덮어쓰기 테스트]")
+            third = ring.write(frame(3))
+            self.check("TC4: 덮어쓴 슬롯의 이전 seq는 None, 새 seq는 읽기 가능",
+                       (third, reader.read(*first), int(reader.read(*third).sum())), ((0, 2), None, 216))
+
+            ring.seqs[1] = -1   # 쓰는 중 표시
+            self.check("TC5: 쓰는 중인 슬롯은 None", reader.read(*second), None)
+
+            print("\n[연결 테스트]")
+            self.check("TC6: 연결한 쪽은 생성한 쪽이 아님 (unlink하지 않음)", (reader.owner, ring.owner), (False, True))
+        finally:
+            reader.close()
+            ring.close()
+
+        # 같은 resource_tracker에서 연결 후 등록 해제, 생성한 쪽의 unlink까지 실행 (resource_tracker는 별도 프로세스이므로 출력으로 확인)
+        script = (
+            f"import sys, time; sys.path.insert(0, {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})\n"
+            "from tracker_process import SharedFrameRing\n"
+            "ring = SharedFrameRing((4, 6, 3), slots=2)\n"
+            "reader = SharedFrameRing(ring.shape, ring.slots, name=ring.name)\n"
+            "reader.close()\n"
+            "ring.close()\n"
+            "time.sleep(0.5)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+        self.check("TC7: 생성한 쪽의 unlink에서 resource_tracker 예외, 누수 경고 없음", (result.returncode, result.stderr), (0, ""))
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestTrackerProcess()
+    tester.run_all_tests()
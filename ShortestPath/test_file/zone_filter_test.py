@@ -0,0 +1,118 @@
+"""
+구역 전환 필터 테스트 코드
+zone_filter.py의 최소 체류, 경계 여유, 중심점 평활화에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shortest_route import MovingSpace, ParkingSpace, Space
+from zone_filter import ZoneTransitionFilter
+
+
+class TestZoneFilter:
+    """구역 전환 필터 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+        # 이동 구역 1 (x: 0 ~ 100), 이동 구역 2 (x: 100 ~ 200), 이동 구역 2 아래에 주차 구역 0
+        self.moving_spaces = {
+            space_id: MovingSpace(
+                space_id=space_id,
+                name=f"space_{space_id}",
+                position=[(x, 0), (x + 100, 0), (x + 100, 100), (x, 100)],
+                congestion=100,
+                near_parking_space_id=[],
+                near_moving_space_id=[]
+            )
+            for space_id, x in ((1, 0), (2, 100))
+        }
+        self.parking_spaces = {
+            0: ParkingSpace(
+                space_id=0,
+                name="P0",
+                position=[(100, 100), (200, 100), (200, 200), (100, 200)],
+                near_moving_space_id=2
+            )
+        }
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    def zone(self, zone_filter, car_id, position):
+        """필터를 갱신하고 (구역 종류, 구역 ID) 반환"""
+        kind, space = zone_filter.update(car_id, position, self.parking_spaces, self.moving_spaces)
+        return kind, None if space is None else space.space_id
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("구역 전환 필터 테스트 시작")
+        print("=" * 80)
+
+        print("\n[경계 거리 테스트]")
+        square = Space(space_id=999, name="test_space", position=[(0, 0), (100, 0), (100, 100), (0, 100)])
+        self.check("TC1: 내부 점의 경계 거리", square.distance_to_boundary(50, 20), 20)
+        self.check("TC2: 외부 점의 경계 거리", square.distance_to_boundary(103, 104), 5)
+
+        print("\n[최초 관측 테스트]")
+        zone_filter = ZoneTransitionFilter(min_dwell_frames=3, boundary_margin=10.0, smoothing=1.0)
+        self.check("TC3: 처음 관측된 차량은 바로 확정", self.zone(zone_filter, 1, (50, 50)), ("moving", 1))
+
+        print("\n[최소 체류 테스트]")
+        self.check("TC4: 1프레임 이동은 전환하지 않음", self.zone(zone_filter, 1, (150, 50)), ("moving", 1))
+        self.check("TC5: 2프레임 이동은 전환하지 않음", self.zone(zone_filter, 1, (150, 50)), ("moving", 1))
+        self.check("TC6: 3프레임 연속이면 전환 확정", self.zone(zone_filter, 1, (150, 50)), ("moving", 2))
+
+        print("\n[경계 흔들림 테스트]")
+        zone_filter = ZoneTransitionFilter(min_dwell_frames=2, boundary_margin=10.0, smoothing=1.0)
+        self.zone(zone_filter, 2, (95, 50))
+        results = {self.zone(zone_filter, 2, (105 if i % 2 == 0 else 95, 50)) for i in range(10)}
+        self.check("TC7: 경계 여유 안에서 흔들리면 유지", results, {("moving", 1)})
+
+        results = {self.zone(zone_filter, 2, (150 if i % 2 == 0 else 50, 50)) for i in range(10)}
+        self.check("TC8: 연속되지 않은 후보는 체류 수 초기화", results, {("moving", 1)})
+
+        print("\n[평활화 테스트]")
+        zone_filter = ZoneTransitionFilter(min_dwell_frames=1, boundary_margin=0.0, smoothing=0.5)
+        self.zone(zone_filter, 3, (150, 20))
+        self.check("TC9: 튀는 한 프레임은 평활화로 무시", self.zone(zone_filter, 3, (150, 170)), ("moving", 2))
+        self.check("TC10: 계속 머무르면 주차 구역으로 전환", self.zone(zone_filter, 3, (150, 170)), ("parking", 0))
+
+        print("\n[구역 밖 및 삭제 테스트]")
+        zone_filter = ZoneTransitionFilter(min_dwell_frames=2, boundary_margin=10.0, smoothing=1.0)
+        self.zone(zone_filter, 4, (50, 50))
+        self.zone(zone_filter, 4, (50, 300))
+        self.check("TC11: 구역 밖도 체류 후 확정", self.zone(zone_filter, 4, (50, 300)), (None, None))
+
+        zone_filter.forget(4)
+        self.check("TC12: 삭제된 차량 상태 제거", 4 in zone_filter.states, False)
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestZoneFilter()
+    tester.run_all_tests()
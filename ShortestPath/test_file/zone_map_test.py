@@ -0,0 +1,163 @@
+"""
+구역 라벨 이미지 테스트 코드
+zone_map.py의 ZoneMap(build, load, save, lookup), load_or_build와 zone_filter의 라벨 이미지 조회에 대한 테스트 케이스를 포함
+"""
+
+import sys
+import os
+import json
+import tempfile
+import numpy as np
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shortest_route as sr
+from layout_manager import parse_space_keys
+from zone_filter import ZoneTransitionFilter
+from zone_map import ZoneMap, UNRESOLVED, classify_exact, load_or_build
+
+POSITION_FILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "position_file")
+FRAME_SIZE = (1920, 1080)
+
+
+class TestZoneMap:
+    """구역 라벨 이미지 테스트"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, name, result, expected):
+        """개별 테스트 케이스 결과 확인"""
+        if result == expected:
+            print(f"✅ PASS: {name}")
+            self.passed += 1
+        else:
+            print(f"❌ FAIL: {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            self.failed += 1
+
+    @staticmethod
+    def grid_mismatches(zone_map, parking_spaces, moving_spaces, step=7):
+        """격자 좌표마다 라벨 이미지 조회(경계 칸은 다각형 판정)와 다각형 판정을 비교하여 (다른 좌표 수, 경계 칸 비율) 반환"""
+
+        mismatched = 0
+        unresolved = 0
+        total = 0
+
+        for x in range(0, FRAME_SIZE[0], step):
+            for y in range(0, FRAME_SIZE[1], step):
+                position = (x + 0.3, y + 0.6)
+                zone = zone_map.lookup(position)
+                total += 1
+
+                if zone is UNRESOLVED:
+                    unresolved += 1
+                    continue
+
+                if zone != classify_exact(position, parking_spaces, moving_spaces):
+                    mismatched += 1
+
+        return mismatched, unresolved / total
+
+    def run_all_tests(self):
+        """모든 테스트 실행"""
+        print("=" * 80)
+        print("구역 라벨 이미지 테스트 시작")
+        print("=" * 80)
+
+        with open(os.path.join(POSITION_FILE_DIR, "parking_space.json"), "r") as f:
+            parking_data = parse_space_keys(json.load(f), "주차 구역")
+        with open(os.path.join(POSITION_FILE_DIR, "moving_space.json"), "r") as f:
+            moving_data = parse_space_keys(json.load(f), "이동 구역")
+        parking_spaces, moving_spaces = sr.build_spaces(parking_data, moving_data)
+
+        print("\n[생성 테스트]")
+        zone_map = ZoneMap.build(parking_spaces, moving_spaces, FRAME_SIZE)
+        self.check("TC1: 카메라 해상도, 구역 수에 맞는 정수형", (zone_map.labels.shape, zone_map.labels.dtype), ((1080, 1920), np.uint8))
+
+        mismatched, boundary_ratio = self.grid_mismatches(zone_map, parking_spaces, moving_spaces)
+        self.check("TC2: 경계 칸이 아닌 좌표는 다각형 판정과 동일", mismatched, 0)
+        self.check("TC3: 경계 칸은 일부 (5% 미만)", boundary_ratio < 0.05, True)
+
+        space = parking_spaces[next(iter(parking_spaces))]
+        self.check("TC4: 구역 중심점은 라벨 이미지로 확인", zone_map.lookup(space.center_position), ("parking", next(iter(parking_spaces))))
+        self.check("TC5: 이미지 밖 좌표는 다각형 판정", (zone_map.lookup((-5, 10)), zone_map.lookup((10, 5000))), (UNRESOLVED, UNRESOLVED))
+
+        # 주차 구역과 이동 구역이 겹치는 경우 주차 구역 우선 (roop와 동일)
+        overlap_parking = {1: {"name": "A", "position": [[100, 100], [300, 100], [300, 300], [100, 300]], "near_moving_space_id": 1}}
+        overlap_moving = {1: {"name": "M", "position": [[0, 0], [400, 0], [400, 400], [0, 400]], "congestion": 0,
+                              "near_parking_space_id": [1], "near_moving_space_id": []}}
+        small_parking, small_moving = sr.build_spaces(overlap_parking, overlap_moving)
+        overlap_map = ZoneMap.build(small_parking, small_moving, (500, 500))
+        self.check("TC6: 겹친 영역은 주차 구역 우선",
+                   (overlap_map.lookup((200, 200)), overlap_map.lookup((50, 350)), overlap_map.lookup((450, 450))),
+                   (("parking", 1), ("moving", 1), None))
+
+        print("\n[축소 해상도 테스트]")
+        coarse_map = ZoneMap.build(parking_spaces, moving_spaces, FRAME_SIZE, scale=0.25)
+        mismatched, coarse_boundary_ratio = self.grid_mismatches(coarse_map, parking_spaces, moving_spaces)
+        self.check("TC7: 1/4 해상도 (메모리 1/16)", (coarse_map.labels.shape, coarse_map.labels.nbytes * 16 == zone_map.labels.nbytes), ((270, 480), True))
+        self.check("TC8: 1/4 해상도에서도 경계 칸이 아닌 좌표는 다각형 판정과 동일", mismatched, 0)
+
+        zone_filter = ZoneTransitionFilter()
+        zone_filter.zone_map = coarse_map
+        positions = [(x + 0.5, y + 0.5) for x in range(0, FRAME_SIZE[0], 13) for y in range(0, FRAME_SIZE[1], 13)]
+        self.check("TC9: zone_filter는 경계 칸을 다각형 판정으로 확인",
+                   all(zone_filter.classify(position, parking_spaces, moving_spaces) == classify_exact(position, parking_spaces, moving_spaces)
+                       for position in positions),
+                   True)
+
+        print("\n[저장/읽기 테스트]")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "zone_map.npy")
+            built = load_or_build(path, parking_spaces, moving_spaces, FRAME_SIZE, scale=0.5)
+            loaded = load_or_build(path, parking_spaces, moving_spaces, FRAME_SIZE, scale=0.5)
+            self.check("TC10: 저장한 라벨 이미지는 메모리 매핑으로 읽음",
+                       (isinstance(loaded.labels, np.memmap), loaded.scale, np.array_equal(loaded.labels, built.labels)),
+                       (True, 0.5, True))
+            del loaded
+
+            # 저장한 뒤 구역 좌표가 바뀐 경우
+            moved_parking = {space_id: dict(data) for space_id, data in parking_data.items()}
+            first_id = next(iter(moved_parking))
+            moved_parking[first_id]["position"] = [[x + 400, y] for x, y in moved_parking[first_id]["position"]]
+            moved_spaces, _ = sr.build_spaces(moved_parking, moving_data)
+            self.check("TC11: 구역 데이터가 바뀐 라벨 이미지는 사용하지 않음", ZoneMap.load(path, moved_spaces, moving_spaces, FRAME_SIZE), None)
+            self.check("TC12: 카메라 해상도 비율이 다르면 사용하지 않음", ZoneMap.load(path, parking_spaces, moving_spaces, (1280, 1024)), None)
+
+            # 구역 한 변만 40픽셀 옮긴 경우 (구역 중심점의 라벨은 그대로)
+            edged_parking = {space_id: dict(data) for space_id, data in parking_data.items()}
+            edged_parking[first_id]["position"] = [[x + 40, y] if i in (1, 2) else [x, y]
+                                                   for i, (x, y) in enumerate(edged_parking[first_id]["position"])]
+            edged_spaces, _ = sr.build_spaces(edged_parking, moving_data)
+            self.check("TC13: 구역 한 변만 옮겨도 저장한 라벨 이미지는 사용하지 않음", ZoneMap.load(path, edged_spaces, moving_spaces, FRAME_SIZE), None)
+
+            rebuilt = load_or_build(path, edged_spaces, moving_spaces, FRAME_SIZE, scale=0.5)
+            reloaded = load_or_build(path, edged_spaces, moving_spaces, FRAME_SIZE, scale=0.5)
+            self.check("TC14: 다시 생성하여 저장한 뒤에는 메모리 매핑으로 읽음",
+                       (isinstance(rebuilt.labels, np.memmap), isinstance(reloaded.labels, np.memmap),
+                        np.array_equal(reloaded.labels, rebuilt.labels), np.array_equal(rebuilt.labels, built.labels)),
+                       (False, True, True, False))
+            del reloaded
+
+            os.remove(path + ".sha1")
+            self.check("TC15: 구역 다각형 해시 파일이 없으면 사용하지 않음", ZoneMap.load(path, edged_spaces, moving_spaces, FRAME_SIZE), None)
+
+        # 결과 출력
+        print("\n" + "=" * 80)
+        print("테스트 결과 요약")
+        print("=" * 80)
+        print(f"총 테스트: {self.passed + self.failed}개")
+        print(f"✅ 통과: {self.passed}개")
+        print(f"❌ 실패: {self.failed}개")
+        if self.passed + self.failed > 0:
+            print(f"성공률: {(self.passed / (self.passed + self.failed) * 100):.2f}%")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    tester = TestZoneMap()
+    tester.run_all_tests()
@@ -0,0 +1,85 @@
+# 만료 시각이 된 항목만 꺼내는 해시 타이밍 휠 (추적이 끊긴 차량의 삭제 시각 관리에 사용)
+
+import math
+from typing import Hashable, Optional
+
+
+class TimingWheel:
+    """
+    해시 타이밍 휠
+
+    - 만료 시각을 tick 단위로 나누어 slots개의 슬롯에 저장 (슬롯 = tick 번호 % slots)
+    - advance는 지난 호출 이후 지나간 tick의 슬롯만 확인하므로 전체 항목을 매번 순회하지 않음
+    - schedule, cancel은 O(1)
+    """
+
+    def __init__(self, tick: float = 0.1, slots: int = 64) -> None:
+        """
+        Args:
+            tick: 슬롯 하나가 담당하는 시간 (초)
+            slots: 슬롯 수 (tick * slots보다 먼 만료 시각은 휠을 여러 바퀴 돈 뒤 만료)
+        """
+        self.tick: float = tick
+        self.slots: list[dict[Hashable, float]] = [{} for _ in range(slots)]
+        self.entries: dict[Hashable, int] = {}      # 항목 -> 저장된 슬롯 번호
+        self.current_tick: Optional[int] = None     # 마지막으로 확인한 tick 번호
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """항목의 만료 시각 설정 (이미 있으면 새 만료 시각으로 변경)"""
+
+        self.cancel(key)
+
+        tick_index = math.floor(deadline / self.tick)
+
+        # 이미 지나간 tick의 슬롯에 넣으면 한 바퀴를 더 돌아야 하므로 현재 tick으로 당김
+        if self.current_tick is not None and tick_index < self.current_tick:
+            tick_index = self.current_tick
+
+        slot = tick_index % len(self.slots)
+        self.slots[slot][key] = deadline
+        self.entries[key] = slot
+
+    def cancel(self, key: Hashable) -> None:
+        """항목 삭제 (없으면 무시)"""
+
+        slot = self.entries.pop(key, None)
+        if slot is not None:
+            del self.slots[slot][key]
+
+    def advance(self, now: float) -> list[Hashable]:
+        """
+        now까지 만료된 항목을 휠에서 꺼내 반환
+
+        Returns:
+            list: 만료된 항목 (만료 시각 순서는 보장하지 않음)
+        """
+        target_tick = math.floor(now / self.tick)
+
+        if self.current_tick is None:
+            self.current_tick = target_tick
+
+        # 한 바퀴 이상 지난 경우 모든 슬롯을 한 번씩만 확인
+        tick_count = min(target_tick - self.current_tick + 1, len(self.slots))
+
+        expired = []
+        for tick_index in range(target_tick - tick_count + 1, target_tick + 1):
+            bucket = self.slots[tick_index % len(self.slots)]
+            if not bucket:
+                continue
+
+            for key, deadline in list(bucket.items()):
+                if deadline <= now:
+                    del bucket[key]
+                    del self.entries[key]
+                    expired.append(key)
+
+        # 현재 tick의 슬롯에는 아직 만료되지 않은 항목이 남을 수 있으므로 다음 호출에서 다시 확인
+        self.current_tick = target_tick
+
+        return expired
@@ -0,0 +1,57 @@
+# 트래커 결과를 주고받는 압축 배열 형식과 GUI용 Track 클래스 (ultralytics, torch 없이 import 가능)
+#
+# 트랙 배열: float32 (N, 5), 행마다 [track_id, xmin, ymin, xmax, ymax]
+
+from typing import Iterable
+import numpy as np
+
+# 트랙 배열의 열 수
+TRACK_COLUMNS = 5
+
+
+class Track:
+    """DeepSORT의 Track 객체와 호환되는 간단한 클래스 (GUI, 미리보기 표시용)"""
+
+    def __init__(self, track_id, bbox):
+        self.track_id = track_id
+        self._bbox = bbox  # [xmin, ymin, xmax, ymax]
+
+    def is_confirmed(self):
+        """항상 confirmed 상태로 반환"""
+        return True
+
+    def to_ltrb(self):
+        """바운딩 박스를 [left, top, right, bottom] 형태로 반환"""
+        return self._bbox
+
+
+def empty_tracks() -> np.ndarray:
+    """트랙이 없는 트랙 배열"""
+
+    return np.zeros((0, TRACK_COLUMNS), dtype=np.float32)
+
+
+def tracks_to_array(tracks: Iterable) -> np.ndarray:
+    """Track(또는 DeepSORT Track) 목록을 트랙 배열로 변환 (확정되지 않은 트랙 제외)"""
+
+    rows = [[track.track_id, *track.to_ltrb()] for track in tracks if track.is_confirmed()]
+    return np.array(rows, dtype=np.float32).reshape(-1, TRACK_COLUMNS)
+
+
+def array_to_tracks(track_array: np.ndarray) -> list[Track]:
+    """트랙 배열을 GUI에서 사용하는 Track 목록으로 변환"""
+
+    return [Track(int(row[0]), row[1:5]) for row in track_array]
+
+
+def track_centers(track_array: np.ndarray) -> dict[int, tuple[int, int]]:
+    """
+    트랙 배열을 shortest_route에 전달하는 중심점 딕셔너리로 변환
+
+    Returns:
+        dict: 트랙 ID -> 바운딩 박스 중심점 (정수 픽셀)
+    """
+    return {
+        int(row[0]): (int((row[1] + row[3]) / 2), int((row[2] + row[4]) / 2))
+        for row in track_array
+    }
@@ -0,0 +1,64 @@
+# 경로 계산 쓰레드가 받은 차량 추적 데이터를 프레임마다 파일에 기록하고 다시 읽는 모듈 (layout_lint의 재생 분석에 사용)
+#
+# 형식: JSON Lines, 한 줄에 한 프레임 {"time": 수신 시각, "tracks": {"차량 ID": [x, y]}}
+
+from __future__ import annotations
+import json
+import time
+from typing import Iterator, Mapping, Optional
+
+
+class TrackLogWriter:
+    """프레임마다 추적 데이터를 한 줄씩 기록하는 클래스 (roop에서 호출)"""
+
+    def __init__(self, path: str, flush_interval: float = 1.0) -> None:
+        """
+        Args:
+            path: 기록할 파일 경로 (있으면 이어서 기록)
+            flush_interval: 파일에 내보내는 주기 (초, 프레임마다 디스크에 쓰지 않도록)
+        """
+        self.path: str = path
+        self.flush_interval: float = flush_interval
+        self.file = open(path, "a", encoding="utf-8")
+        self.last_flush: float = time.time()
+
+    def write(self, car_tracks: Mapping[int, tuple[float, float]], timestamp: Optional[float] = None) -> None:
+        """한 프레임의 추적 데이터 기록 (좌표는 소수점 한 자리)"""
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        record = {
+            "time": round(timestamp, 3),
+            "tracks": {str(car_id): [round(position[0], 1), round(position[1], 1)] for car_id, position in car_tracks.items()},
+        }
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        if timestamp - self.last_flush >= self.flush_interval:
+            self.file.flush()
+            self.last_flush = timestamp
+
+    def close(self) -> None:
+        """남은 데이터를 내보내고 파일 닫기"""
+
+        self.file.close()
+
+
+def read_track_log(path: str) -> Iterator[tuple[float, dict[int, tuple[float, float]]]]:
+    """
+    기록한 추적 데이터를 프레임 순서대로 읽는 함수
+
+    프로그램이 기록 중에 종료되어 잘린 줄은 건너뜀
+
+    Returns:
+        Iterator: (수신 시각, 차량 ID -> 좌표)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                tracks = {int(car_id): (position[0], position[1]) for car_id, position in record["tracks"].items()}
+            except (ValueError, KeyError, TypeError, IndexError):
+                continue
+
+            yield record["time"], tracks
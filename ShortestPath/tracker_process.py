@@ -0,0 +1,270 @@
+# 트래커를 별도의 프로세스에서 실행하고 프레임은 공유 메모리 링 버퍼, 추적 결과는 파이프로 전달하는 모듈
+
+import multiprocessing as mp
+from multiprocessing import resource_tracker, shared_memory
+import sys
+from typing import Optional
+import numpy as np
+import detection_tracking
+from frame_pool import FramePool
+from track_array import array_to_tracks, tracks_to_array
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    다른 프로세스가 생성한 공유 메모리에 resource_tracker 등록 없이 연결 (해제는 생성한 프로세스가 담당)
+
+    Python 3.13 미만은 연결만 해도 등록되어 종료 시 누수 경고나 중복 unlink가 발생하므로 연결 후 등록 해제
+    (spawn 자식 프로세스는 부모와 같은 resource_tracker를 사용하므로 생성한 쪽의 등록도 함께 지워짐, SharedFrameRing.close 참고)
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SharedFrameRing:
+    """
+    공유 메모리에 고정 크기 프레임 슬롯을 두고 순환하며 덮어쓰는 링 버퍼
+
+    메모리 구조: [슬롯별 seq (int64) * slots][프레임 (uint8) * slots]
+    쓰는 중인 슬롯의 seq는 -1로 표시하여 읽는 쪽이 덮어쓰기 중인 프레임을 사용하지 않도록 함
+    """
+
+    def __init__(self, shape: tuple[int, int, int], slots: int = 4, name: Optional[str] = None) -> None:
+        """
+        Args:
+            shape: 프레임 크기 (height, width, channel)
+            slots: 슬롯 수
+            name: 이미 생성된 공유 메모리에 연결할 경우 그 이름 (None이면 새로 생성)
+        """
+        self.shape: tuple[int, int, int] = tuple(shape)
+        self.slots: int = slots
+        header_size = 8 * slots
+        frame_size = int(np.prod(self.shape))
+
+        self.owner: bool = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=header_size + frame_size * slots)
+        else:
+            self.shm = attach_shared_memory(name)
+
+        self.seqs = np.ndarray((slots,), dtype=np.int64, buffer=self.shm.buf)
+        self.frames = np.ndarray((slots, *self.shape), dtype=np.uint8, buffer=self.shm.buf, offset=header_size)
+        self.next_seq: int = 0
+
+        if self.owner:
+            self.seqs[:] = -1
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, frame: np.ndarray) -> tuple[int, int]:
+        """가장 오래된 슬롯에 프레임을 쓰고 (슬롯 번호, seq)를 반환"""
+
+        seq = self.next_seq
+        slot = seq % self.slots
+
+        self.seqs[slot] = -1    # 쓰는 중 표시
+        self.frames[slot][...] = frame
+        self.seqs[slot] = seq
+        self.next_seq += 1
+
+        return slot, seq
+
+    def read(self, slot: int, seq: int, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        슬롯의 프레임을 복사하여 반환, 이미 다른 프레임으로 덮어쓴 경우 None 반환
+
+        Args:
+            out: 복사할 배열 (프레임과 같은 크기, None이면 새로 할당)
+        """
+        if self.seqs[slot] != seq:
+            return None
+
+        if out is None:
+            frame = self.frames[slot].copy()
+        else:
+            np.copyto(out, self.frames[slot])
+            frame = out
+
+        # 복사하는 동안 덮어쓰기가 시작된 경우 버림
+        if self.seqs[slot] != seq:
+            return None
+
+        return frame
+
+    def close(self) -> None:
+        # 공유 메모리를 해제하기 전에 numpy 뷰를 먼저 제거
+        del self.seqs
+        del self.frames
+        self.shm.close()
+        if self.owner:
+            # 같은 resource_tracker를 쓰는 쪽이 attach_shared_memory에서 등록을 지웠을 수 있으므로 다시 등록한 뒤 해제
+            # (등록은 중복되지 않으므로 지워지지 않은 경우에도 그대로, unlink의 등록 해제에서 KeyError가 발생하지 않음)
+            if sys.version_info < (3, 13):
+                resource_tracker.register(self.shm._name, "shared_memory")
+            self.shm.unlink()
+
+
+class PipeTrackQueue:
+    """트래커가 put하는 추적 데이터를 파이프로 전달하는 클래스 (yolo_data_queue 대체)"""
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+    def put(self, tracked_objects: dict[int, tuple[float, float]]) -> None:
+        self.conn.send(("tracks", tracked_objects))
+
+
+class SharedFrameQueue:
+    """트래커가 put하는 (FrameLease, 트랙)을 프레임은 링 버퍼에, 트랙은 압축 배열로 파이프에 전달하는 클래스 (frame_queue 대체)"""
+
+    def __init__(self, conn, slots: int = 4) -> None:
+        self.conn = conn
+        self.slots: int = slots
+        self.ring: Optional[SharedFrameRing] = None
+
+    def full(self) -> bool:
+        # 링 버퍼는 가장 오래된 프레임을 덮어쓰므로 항상 쓸 수 있음
+        return False
+
+    def put(self, item) -> None:
+        lease, tracks = item
+
+        # 링 버퍼에 복사한 뒤에는 풀 버퍼가 필요 없으므로 바로 해제
+        try:
+            frame = lease.image
+            if frame is None:
+                return
+
+            # 카메라가 실제로 전달하는 해상도로 첫 프레임에서 링 버퍼 생성
+            if self.ring is None:
+                self.ring = SharedFrameRing(frame.shape, self.slots)
+                self.conn.send(("ring", self.ring.name, self.ring.shape, self.ring.slots))
+
+            slot, seq = self.ring.write(frame)
+        finally:
+            lease.release()
+
+        # [track_id, xmin, ymin, xmax, ymax]
+        self.conn.send(("frame", slot, seq, tracks_to_array(tracks)))
+
+    def close(self) -> None:
+        if self.ring is not None:
+            self.ring.close()
+
+
+def tracker_worker(conn, event, stop_event, model_path, video_source, frame_width, frame_height, ring_slots, send_frames, backend="bytetrack", backend_options=None,
+                   imgsz=None, crop=None, realtime=True):
+    """트래커 프로세스에서 실행되는 함수"""
+
+    frame_queue = SharedFrameQueue(conn, ring_slots) if send_frames else None
+
+    try:
+        detection_tracking.main(
+            yolo_data_queue=PipeTrackQueue(conn),
+            frame_queue=frame_queue,
+            event=event,
+            model_path=model_path,
+            video_source=video_source,
+            frame_width=frame_width,
+            frame_height=frame_height,
+            stop_event=stop_event,
+            backend=backend,
+            backend_options=backend_options,
+            imgsz=imgsz,
+            crop=crop,
+            realtime=realtime,
+        )
+    finally:
+        if frame_queue is not None:
+            frame_queue.close()
+        conn.close()
+
+
+def start_tracker_process(event, stop_event, model_path, video_source, frame_width, frame_height, ring_slots: int = 4, send_frames: bool = True,
+                          backend: str = "bytetrack", backend_options: Optional[dict] = None,
+                          imgsz: Optional[int] = None, crop: Optional[tuple[int, int, int, int]] = None, realtime: bool = True):
+    """
+    트래커 프로세스를 시작하고 (프로세스, 메인 프로세스 쪽 파이프)를 반환
+
+    event, stop_event는 spawn 컨텍스트로 생성한 multiprocessing Event를 사용
+    backend, backend_options: 탐지 백엔드 설정 (detection_backend.create_backend)
+    imgsz, crop: 모델 입력 크기와 탐지할 영역 (detection_tracking.main)
+    realtime: 파일, 폴더 입력을 원래 FPS로 재생 (frame_source.open_source)
+    """
+    ctx = mp.get_context("spawn")   # CUDA 사용을 위해 fork 대신 spawn 사용
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+
+    process = ctx.Process(
+        target=tracker_worker,
+        kwargs={
+            "conn": child_conn,
+            "event": event,
+            "stop_event": stop_event,
+            "model_path": model_path,
+            "video_source": video_source,
+            "frame_width": frame_width,
+            "frame_height": frame_height,
+            "ring_slots": ring_slots,
+            "send_frames": send_frames,
+            "backend": backend,
+            "backend_options": backend_options,
+            "imgsz": imgsz,
+            "crop": crop,
+            "realtime": realtime,
+        },
+        daemon=True,
+    )
+    process.start()
+    child_conn.close()
+
+    return process, parent_conn
+
+
+def run_tracker_bridge(conn, yolo_data_queue, frame_queue, stop_event):
+    """
+    트래커 프로세스의 파이프 메시지를 받아 yolo_data_queue, frame_queue로 전달하는 쓰레드 함수
+
+    프레임은 링 버퍼에서 GUI가 사용할 때만 프레임 풀 버퍼로 복사하여 (FrameLease, 트랙)으로 전달
+    """
+    ring: Optional[SharedFrameRing] = None
+    pool = FramePool()
+
+    try:
+        while not stop_event.is_set():
+            if not conn.poll(0.1):
+                continue
+
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+
+            kind = message[0]
+
+            if kind == "tracks":
+                yolo_data_queue.put(message[1])
+
+            elif kind == "ring":
+                _, name, shape, slots = message
+                ring = SharedFrameRing(shape, slots, name=name)
+
+            elif kind == "frame":
+                _, slot, seq, track_array = message
+                if ring is None or frame_queue is None or frame_queue.full():
+                    continue
+
+                lease = pool.acquire(ring.shape)
+                if ring.read(slot, seq, out=lease.image) is None:
+                    lease.release()
+                    continue
+
+                frame_queue.put((lease, array_to_tracks(track_array)))
+    finally:
+        if ring is not None:
+            ring.close()
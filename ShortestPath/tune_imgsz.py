@@ -0,0 +1,169 @@
+# 녹화 영상으로 모델 입력 크기(imgsz)별 구역별 탐지율을 측정하여 인접한 주차 구역을 구분하는 가장 작은 크기를 찾는 도구
+#
+# 실행: python tune_imgsz.py MODEL VIDEO [--sizes 320 416 512 640 800] [--reference 1280] [--frames 100] [--stride 15]
+#
+# 기준 크기(reference)의 탐지 결과를 정답으로 보고, 각 크기에서 같은 차량(IoU 0.5)을 탐지하고 그 중심점이 같은 구역에 있는 비율을 구역별로 계산
+# (인접한 두 주차 구역의 차량을 하나로 탐지하거나 박스가 밀려 중심점이 옆 구역으로 넘어가면 그 구역의 탐지율이 낮아짐)
+# main.py와 같이 구역 영역만 잘라(INFERENCE_CROP_MARGIN) 탐지하며, 입력 크기를 바꿀 수 없는 onnx 백엔드는 사용할 수 없음
+
+from __future__ import annotations
+import argparse
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+import layout_bundle
+import layout_lint
+import shortest_route as sr
+from detection_backend import BACKENDS, ZoneCropBackend, create_backend
+from frame_preprocess import CROP_MARGIN, zone_bounds
+from frame_source import open_source
+from numpy_bytetrack import iou_matrix, match
+from zone_filter import ZoneKey
+from zone_map import classify_exact
+
+DEFAULT_SIZES = (320, 416, 512, 640, 800)
+REFERENCE_SIZE = 1280
+
+# 기준 결과와 같은 차량으로 보는 IoU
+MATCH_IOU = 0.5
+
+# 이 탐지율 이상이면 구역을 구분한다고 판단
+MIN_RECALL = 0.95
+
+# 프레임별 탐지 결과 (바운딩 박스 (N, 4), 신뢰도 (N,))
+Detections = list[tuple[np.ndarray, np.ndarray]]
+
+
+def read_sample_frames(video_path: str, count: int, stride: int) -> list[np.ndarray]:
+    """녹화 영상(또는 이미지 폴더)에서 stride 프레임마다 한 장씩 최대 count장 읽기"""
+
+    cap = open_source(video_path, realtime=False)
+    frames = []
+    index = 0
+
+    while len(frames) < count:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        if index % stride == 0:
+            frames.append(frame)
+        index += 1
+
+    cap.release()
+    return frames
+
+
+def box_center(box: np.ndarray) -> tuple[int, int]:
+    """바운딩 박스 중심점 (track_array.track_centers와 같은 정수 픽셀)"""
+
+    return int((box[0] + box[2]) / 2), int((box[1] + box[3]) / 2)
+
+
+def zone_recall(reference: Detections, candidate: Detections, zone_of: Callable[[tuple[int, int]], ZoneKey],
+                iou: float = MATCH_IOU) -> dict[tuple[str, int], tuple[int, int]]:
+    """
+    기준 결과의 차량을 구역별로 나누어 비교 결과에서 같은 구역에 탐지한 수를 계산 (구역 밖 차량은 제외)
+
+    Returns:
+        dict: 구역 키 -> (같은 구역에 탐지한 수, 기준 결과의 차량 수)
+    """
+    counts: dict[tuple[str, int], list[int]] = {}
+
+    for (reference_boxes, _), (candidate_boxes, _) in zip(reference, candidate):
+        matches, _, _ = match(1 - iou_matrix(reference_boxes, candidate_boxes), 1 - iou)
+        matched = dict(matches)
+
+        for i, box in enumerate(reference_boxes):
+            zone = zone_of(box_center(box))
+            if zone is None:
+                continue
+
+            count = counts.setdefault(zone, [0, 0])
+            count[1] += 1
+            if i in matched and zone_of(box_center(candidate_boxes[matched[i]])) == zone:
+                count[0] += 1
+
+    return {zone: (hit, total) for zone, (hit, total) in counts.items()}
+
+
+def smallest_size(recalls: dict[int, dict[tuple[str, int], tuple[int, int]]], min_recall: float = MIN_RECALL) -> Optional[int]:
+    """모든 구역의 탐지율이 min_recall 이상인 가장 작은 크기 (없으면 None)"""
+
+    for size in sorted(recalls):
+        if all(hit / total >= min_recall for hit, total in recalls[size].values()):
+            return size
+
+    return None
+
+
+def detect_frames(backend: str, model_path: str, frames: list[np.ndarray], imgsz: int, crop, backend_options: Optional[dict] = None) -> Detections:
+    """한 입력 크기로 모든 프레임 탐지"""
+
+    detector = ZoneCropBackend(create_backend(backend, model_path, backend_options, imgsz), crop)
+    try:
+        return [detector.detect(frame) for frame in frames]
+    finally:
+        detector.close()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="모델 입력 크기별 구역 탐지율 측정")
+    parser.add_argument("model", help="탐지 모델 (.pt, .engine 등)")
+    parser.add_argument("video", help="주차장 녹화 영상")
+    parser.add_argument("--parking", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "parking_space.json"))
+    parser.add_argument("--moving", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "moving_space.json"))
+    parser.add_argument("--backend", default="bytetrack", help="탐지 백엔드 (입력 크기를 바꿀 수 있는 백엔드)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="측정할 입력 크기 (32의 배수)")
+    parser.add_argument("--reference", type=int, default=REFERENCE_SIZE, help="정답으로 사용할 입력 크기")
+    parser.add_argument("--frames", type=int, default=100, help="측정 프레임 수")
+    parser.add_argument("--stride", type=int, default=15, help="프레임 간격 (비슷한 프레임을 반복 측정하지 않도록)")
+    parser.add_argument("--margin", type=int, default=CROP_MARGIN, help="구역 영역을 넓히는 픽셀 수")
+    parser.add_argument("--min-recall", type=float, default=MIN_RECALL, help="구역을 구분한다고 판단할 최소 탐지율")
+    args = parser.parse_args(argv)
+
+    if args.backend not in BACKENDS or not BACKENDS[args.backend].resizable_input:
+        print(f"입력 크기를 바꿀 수 있는 백엔드가 아닙니다: {args.backend}")
+        return
+
+    frames = read_sample_frames(args.video, args.frames, args.stride)
+    if not frames:
+        print(f"영상을 읽을 수 없습니다: {args.video}")
+        return
+
+    parking, moving, _ = layout_bundle.load_layout_data(args.parking, args.moving)
+    parking_spaces, moving_spaces = sr.build_spaces(parking, moving)
+    height, width = frames[0].shape[:2]
+    crop = zone_bounds(parking, moving, (width, height), args.margin)
+
+    def zone_of(position: tuple[int, int]) -> ZoneKey:
+        return classify_exact(position, parking_spaces, moving_spaces)
+
+    print(f"프레임 {len(frames)}장, 탐지 영역 {crop}, 기준 크기 {args.reference}")
+    reference = detect_frames(args.backend, args.model, frames, args.reference, crop)
+
+    recalls = {}
+    for size in sorted(args.sizes):
+        recalls[size] = zone_recall(reference, detect_frames(args.backend, args.model, frames, size, crop), zone_of)
+
+    zones = sorted({zone for counts in recalls.values() for zone in counts})
+    print()
+    print("구역".ljust(23) + "".join(f"{size:>8}" for size in sorted(recalls)))
+    for zone in zones:
+        row = []
+        for size in sorted(recalls):
+            hit, total = recalls[size].get(zone, (0, 0))
+            row.append(f"{hit / total:>8.2f}" if total else f"{'-':>8}")
+        print(layout_lint.zone_name(zone, parking, moving).ljust(23) + "".join(row))
+
+    best = smallest_size(recalls, args.min_recall)
+    if best is None:
+        print(f"\n모든 구역의 탐지율이 {args.min_recall} 이상인 크기가 없습니다. 더 큰 크기를 측정하세요.")
+    else:
+        print(f"\n추천 입력 크기: {best} (main.py의 INFERENCE_SIZE)")
+
+
+if __name__ == "__main__":
+    main()
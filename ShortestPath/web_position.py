@@ -0,0 +1,93 @@
+# 카메라 좌표의 이동 구역을 웹 페이지 좌표의 직사각형으로 변환하는 투시 변환 행렬 관리
+# send_to_server와 layout_bundle에서 공통 사용 (socketio 없이 import 가능)
+
+from typing import Mapping, Optional, Sequence
+import numpy as np
+import cv2
+
+# 웹 페이지 각 구역 좌표
+web_coordinates = {
+    1: [(1066, -10), (1393, 0)],
+    2: [(1066, 0), (1393, 237)],
+    3: [(1066, 238), (1393, 592)],
+    4: [(1066, 593), (1393, 792)],
+    5: [(803, 0), (1065, 237)],
+    6: [(803, 593), (1065, 792)],
+    7: [(547, 0), (802, 237)],
+    8: [(547, 238), (802, 592)],
+    9: [(547, 593), (802, 792)],
+    10: [(282, 0), (546, 237)],
+    11: [(282, 593), (546, 792)],
+    12: [(0, 0), (281, 237)],
+    13: [(0, 238), (281, 592)],
+    14: [(0, 593), (281, 792)],
+    15: [(0, -10), (281, 0)]
+}
+
+# 구역 좌표를 비교하기 위한 키 ((x1, y1), (x2, y2), ...)
+QuadKey = tuple[tuple[float, float], ...]
+
+
+def quad_key(quadrilateral: Sequence[Sequence[float]]) -> QuadKey:
+    """구역 좌표를 해시 가능한 키로 변환"""
+
+    return tuple((point[0], point[1]) for point in quadrilateral)
+
+
+def web_homography(quadrilateral: Sequence[Sequence[float]], web_rectangle: Sequence[tuple[int, int]]) -> np.ndarray:
+    """
+    카메라 좌표의 사각형을 웹 좌표의 직사각형으로 변환하는 투시 변환 행렬
+
+    Args:
+        quadrilateral: 사각형의 네 꼭짓점 좌표 (좌상단, 우상단, 우하단, 좌하단 순서)
+        web_rectangle: 웹 좌표 내 직사각형의 [좌상단, 우하단] 좌표
+
+    Returns:
+        np.ndarray: 3x3 투시 변환 행렬
+    """
+    # 사각형의 네 꼭짓점 좌표 배열화
+    quad_pts = np.array(quadrilateral, dtype="float32")
+
+    # 웹 좌표 내 직사각형 꼭짓점 설정
+    web_top_left, web_bottom_right = web_rectangle
+    rect_pts = np.array([
+        [web_top_left[0], web_top_left[1]],
+        [web_bottom_right[0], web_top_left[1]],
+        [web_bottom_right[0], web_bottom_right[1]],
+        [web_top_left[0], web_bottom_right[1]]
+    ], dtype="float32")
+
+    return cv2.getPerspectiveTransform(quad_pts, rect_pts)
+
+
+class WebHomographyCache:
+    """
+    이동 구역별 투시 변환 행렬을 한 번만 계산하여 재사용하는 클래스
+
+    구역 좌표를 함께 저장하여 구역 데이터가 교체된(layout_manager) 구역만 다시 계산
+    """
+
+    def __init__(
+        self,
+        coordinates: Mapping[int, Sequence[tuple[int, int]]] = web_coordinates,
+        seed: Optional[Mapping[int, tuple[QuadKey, np.ndarray]]] = None,
+    ) -> None:
+        """
+        Args:
+            coordinates: 이동 구역 ID -> 웹 좌표 직사각형
+            seed: 미리 계산한 (구역 좌표 키, 행렬) (layout_bundle에서 읽은 값, None이면 처음 사용할 때 계산)
+        """
+        self.coordinates: Mapping[int, Sequence[tuple[int, int]]] = coordinates
+        self.homographies: dict[int, tuple[QuadKey, np.ndarray]] = dict(seed or {})
+
+    def get(self, space_id: int, quadrilateral: Sequence[Sequence[float]]) -> np.ndarray:
+        """구역의 투시 변환 행렬 (구역 좌표가 바뀐 경우에만 다시 계산)"""
+
+        key = quad_key(quadrilateral)
+        cached = self.homographies.get(space_id)
+
+        if cached is None or cached[0] != key:
+            cached = (key, web_homography(quadrilateral, self.coordinates[space_id]))
+            self.homographies[space_id] = cached
+
+        return cached[1]
@@ -0,0 +1,196 @@
+# 차량 중심점이 구역 경계에서 흔들릴 때 구역 전환이 반복되지 않도록 걸러내는 모듈
+
+from __future__ import annotations
+from typing import Mapping, Optional, TYPE_CHECKING
+from zone_map import UNRESOLVED, ZoneMap
+
+# shortest_route에서 필터를 사용하므로 타입 확인 시에만 import (순환 import 방지)
+if TYPE_CHECKING:
+    from shortest_route import Space, ParkingSpace, MovingSpace
+
+# 구역 키: ("parking" 또는 "moving", 구역 ID), 구역 밖이면 None
+ZoneKey = Optional[tuple[str, int]]
+
+
+class ZoneState:
+    """차량 한 대의 구역 전환 상태"""
+
+    __slots__ = ("position", "zone", "candidate", "count", "anchor")
+
+    def __init__(self, position: tuple[float, float], zone: ZoneKey) -> None:
+        self.position: tuple[float, float] = position   # 평활화된 중심점
+        self.zone: ZoneKey = zone                        # 확정된 구역
+        self.candidate: ZoneKey = zone                   # 전환 후보 구역
+        self.count: int = 0                              # 후보 구역이 연속으로 관측된 프레임 수
+        self.anchor: Optional[tuple[float, float]] = None  # pin으로 구역을 고정한 위치 (None이면 고정하지 않음)
+
+
+class ZoneTransitionFilter:
+    """
+    구역 전환 필터
+
+    - 중심점 평활화: 트랙별 지수 이동 평균으로 중심점의 떨림을 줄임
+    - 경계 여유: 현재 구역의 경계에서 boundary_margin 이내이면 전환 후보로 보지 않음
+    - 최소 체류: 같은 후보 구역이 min_dwell_frames 프레임 연속으로 관측되어야 전환을 확정
+    - 구역 고정: pin으로 고정한 차량은 고정한 위치에서 pin_radius 이상 움직일 때까지 고정한 구역을 유지
+
+    처음 관측된 차량은 바로 구역을 확정 (입차, 최초 실행 시 지연 없음)
+    """
+
+    def __init__(self, min_dwell_frames: int = 3, boundary_margin: float = 10.0, smoothing: float = 0.5, pin_radius: float = 30.0) -> None:
+        """
+        Args:
+            min_dwell_frames: 전환 확정에 필요한 연속 프레임 수 (1이면 체류 조건 없음)
+            boundary_margin: 현재 구역 경계로부터의 여유 거리 (카메라 좌표, 0이면 여유 없음)
+            smoothing: 새 위치의 가중치 (1.0이면 평활화하지 않음, 칼만 필터 단계를 사용하는 경우 main에서 1.0으로 설정)
+            pin_radius: 고정한 구역을 해제하는 이동 거리 (카메라 좌표, 정지한 차량 중심점의 떨림보다 크게)
+        """
+        self.min_dwell_frames: int = min_dwell_frames
+        self.boundary_margin: float = boundary_margin
+        self.smoothing: float = smoothing
+        self.pin_radius: float = pin_radius
+        self.states: dict[int, ZoneState] = {}
+        self.zone_map: Optional[ZoneMap] = None     # 구역 라벨 이미지 (None이면 모든 구역을 다각형 판정)
+
+    def update(
+        self,
+        car_id: int,
+        position: tuple[float, float],
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> tuple[Optional[str], Optional[Space]]:
+        """
+        차량의 새 위치를 반영하고 확정된 구역을 반환하는 함수
+
+        Args:
+            car_id: 차량 ID
+            position: 트래커가 전달한 중심점
+
+        Returns:
+            tuple: (구역 종류("parking", "moving"), 구역 인스턴스), 구역 밖이면 (None, None)
+        """
+        state = self.states.get(car_id)
+
+        if state is None:
+            state = ZoneState(position, self.classify(position, parking_spaces, moving_spaces))
+            self.states[car_id] = state
+            return self.resolve(state.zone, parking_spaces, moving_spaces)
+
+        alpha = self.smoothing
+        x = alpha * position[0] + (1 - alpha) * state.position[0]
+        y = alpha * position[1] + (1 - alpha) * state.position[1]
+        state.position = (x, y)
+
+        # 고정한 구역은 차량이 실제로 움직일 때까지 유지
+        if state.anchor is not None:
+            if (x - state.anchor[0]) ** 2 + (y - state.anchor[1]) ** 2 < self.pin_radius ** 2:
+                return self.resolve(state.zone, parking_spaces, moving_spaces)
+            state.anchor = None
+
+        observed = self.classify(state.position, parking_spaces, moving_spaces)
+
+        if observed == state.zone or self.near_boundary(state, parking_spaces, moving_spaces):
+            state.candidate = state.zone
+            state.count = 0
+
+        else:
+            if observed == state.candidate:
+                state.count += 1
+            else:
+                state.candidate = observed
+                state.count = 1
+
+            if state.count >= self.min_dwell_frames:
+                state.zone = observed
+                state.count = 0
+
+        return self.resolve(state.zone, parking_spaces, moving_spaces)
+
+    def pin(self, car_id: int, position: tuple[float, float], zone: ZoneKey) -> None:
+        """
+        차량의 구역을 zone으로 확정하고 position에서 pin_radius 이상 움직일 때까지 유지
+
+        구역 데이터 교체로 위치의 구역이 바뀐 주차 차량을 기존 주차 구역에 남겨둘 때 사용 (apply_layout)
+        """
+        state = ZoneState(position, zone)
+        state.anchor = position
+        self.states[car_id] = state
+
+    def forget(self, car_id: int) -> None:
+        """차량이 삭제된 경우 상태 제거"""
+
+        self.states.pop(car_id, None)
+
+    def rename(self, old_car_id: int, new_car_id: int) -> None:
+        """차량 ID가 바뀐 경우 상태를 새 ID로 이동"""
+
+        if old_car_id in self.states:
+            self.states[new_car_id] = self.states.pop(old_car_id)
+
+    def reset(self) -> None:
+        """구역 데이터가 바뀐 경우 모든 상태 제거 (다음 관측에서 새 구역으로 바로 확정)"""
+
+        self.states.clear()
+
+    def classify(
+        self,
+        position: tuple[float, float],
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> ZoneKey:
+        """
+        위치가 속한 구역 키를 반환 (roop와 동일하게 주차 구역을 먼저 확인)
+
+        구역 라벨 이미지가 있으면 배열 조회 한 번으로 확인하고, 경계 칸인 경우에만 다각형 판정
+        """
+        if self.zone_map is not None:
+            zone = self.zone_map.lookup(position)
+            if zone is not UNRESOLVED:
+                return zone
+
+        for space_id, space in parking_spaces.items():
+            if space.is_car_in_space(position[0], position[1]):
+                return ("parking", space_id)
+
+        for space_id, space in moving_spaces.items():
+            if space.is_car_in_space(position[0], position[1]):
+                return ("moving", space_id)
+
+        return None
+
+    def near_boundary(
+        self,
+        state: ZoneState,
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> bool:
+        """평활화된 중심점이 확정된 구역의 경계 여유 안에 있는지 확인"""
+
+        if state.zone is None or self.boundary_margin <= 0:
+            return False
+
+        _, space = self.resolve(state.zone, parking_spaces, moving_spaces)
+        if space is None:
+            return False
+
+        return space.distance_to_boundary(state.position[0], state.position[1]) < self.boundary_margin
+
+    @staticmethod
+    def resolve(
+        zone: ZoneKey,
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+    ) -> tuple[Optional[str], Optional[Space]]:
+        """구역 키를 (구역 종류, 구역 인스턴스)로 변환"""
+
+        if zone is None:
+            return None, None
+
+        kind, space_id = zone
+        spaces = parking_spaces if kind == "parking" else moving_spaces
+        space = spaces.get(space_id)
+
+        if space is None:
+            return None, None
+
+        return kind, space
@@ -0,0 +1,293 @@
+# 주차 구역과 이동 구역을 카메라 해상도(또는 축소한 해상도)의 라벨 이미지로 그려, 좌표의 구역을 배열 조회 한 번으로 찾는 모듈
+#
+# 생성: python zone_map.py [--width 1920] [--height 1080] [--scale 0.5] [출력 경로]
+#
+# - 구역이 겹치는 경우 roop(zone_filter.classify)와 같은 우선순위: 주차 구역 먼저, 같은 종류는 json 순서
+# - 구역 경계가 지나는 칸은 BOUNDARY로 표시하고 해당 칸만 기존 다각형 판정(is_car_in_space)으로 확인
+# - 실행 시 np.load(mmap_mode="r")로 읽어 필요한 페이지만 메모리에 올림
+# - 라벨 이미지를 만든 구역 다각형의 해시를 옆 파일(<경로>.sha1)에 저장하고, 다르면 다시 생성 (layout_bundle의 source_hashes와 같은 방식)
+
+from __future__ import annotations
+import argparse
+import hashlib
+import os
+from typing import Mapping, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+import cv2
+
+# shortest_route에서 사용하므로 타입 확인 시에만 import (순환 import 방지)
+if TYPE_CHECKING:
+    from shortest_route import ParkingSpace, MovingSpace
+
+# 구역 키: ("parking" 또는 "moving", 구역 ID), 구역 밖이면 None (zone_filter.ZoneKey와 동일)
+ZoneKey = Optional[tuple[str, int]]
+
+# lookup 결과가 라벨 이미지만으로 정해지지 않는 경우 (경계 칸, 이미지 밖)
+UNRESOLVED = ("unresolved", -1)
+
+# 다각형 좌표의 소수점 정밀도 (cv2 fillPoly/polylines의 shift, 2^4 = 1/16 픽셀)
+SHIFT = 4
+
+# 경계로 표시할 선 두께 (라벨 이미지 픽셀, 선이 걸친 칸을 빠짐없이 표시하도록 여유를 둠)
+BOUNDARY_THICKNESS = 3
+
+
+def zone_order(parking_spaces: Mapping[int, ParkingSpace], moving_spaces: Mapping[int, MovingSpace]) -> list[tuple[str, int]]:
+    """라벨 번호 순서의 구역 키 목록 (라벨 i + 1 = i번째 구역, 주차 구역 먼저)"""
+
+    return [("parking", space_id) for space_id in parking_spaces] + [("moving", space_id) for space_id in moving_spaces]
+
+
+def label_dtype(zone_count: int) -> type:
+    """구역 수와 BOUNDARY 라벨을 담을 수 있는 가장 작은 정수형"""
+
+    return np.uint8 if zone_count < np.iinfo(np.uint8).max else np.uint16
+
+
+def polygon_hash(parking_spaces: Mapping[int, ParkingSpace], moving_spaces: Mapping[int, MovingSpace]) -> str:
+    """구역 순서와 다각형 좌표의 sha1 해시 (저장한 라벨 이미지가 현재 구역 데이터로 만든 것인지 확인)"""
+
+    spaces = {("parking", space_id): space for space_id, space in parking_spaces.items()}
+    spaces.update({("moving", space_id): space for space_id, space in moving_spaces.items()})
+
+    digest = hashlib.sha1()
+    for kind, space_id in zone_order(parking_spaces, moving_spaces):
+        points = np.asarray(spaces[(kind, space_id)].position, dtype=np.float64).tolist()
+        digest.update(f"{kind}:{space_id}:{points};".encode())
+
+    return digest.hexdigest()
+
+
+def hash_path(path: str) -> str:
+    """라벨 이미지의 구역 다각형 해시를 저장하는 파일 경로"""
+
+    return f"{path}.sha1"
+
+
+def scaled_polygon(position: Sequence[Sequence[float]], scale: float) -> np.ndarray:
+    """
+    카메라 좌표의 다각형을 라벨 이미지 좌표로 변환 (cv2 shift 고정 소수점)
+
+    라벨 이미지의 c번 칸은 카메라 좌표 [c / scale, (c + 1) / scale) 범위이고,
+    cv2는 c번 픽셀을 정수 좌표 c에 두므로 0.5칸을 빼서 칸의 중심을 맞춤
+    """
+    points = np.asarray(position, dtype=np.float64) * scale - 0.5
+    return np.round(points * (1 << SHIFT)).astype(np.int32).reshape(-1, 1, 2)
+
+
+class ZoneMap:
+    """
+    좌표 -> 구역 라벨 이미지
+
+    labels[row, col]: 0 = 구역 밖, 1 ~ len(zones) = 구역, boundary = 경계 칸 (다각형 판정 필요)
+    """
+
+    def __init__(self, labels: np.ndarray, zones: list[tuple[str, int]], scale: float, source_hash: str) -> None:
+        """
+        Args:
+            labels: 라벨 이미지 (np.ndarray 또는 np.memmap)
+            zones: 라벨 번호 순서의 구역 키 (zone_order)
+            scale: 카메라 좌표 -> 라벨 이미지 좌표 비율 (1.0이면 카메라 해상도)
+            source_hash: 라벨 이미지를 만든 구역 다각형의 해시 (polygon_hash)
+        """
+        self.labels: np.ndarray = labels
+        self.zones: list[ZoneKey] = [None] + list(zones)
+        self.scale: float = scale
+        self.source_hash: str = source_hash
+        self.boundary: int = int(np.iinfo(labels.dtype).max)
+        self.height, self.width = labels.shape
+
+    @classmethod
+    def build(
+        cls,
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+        frame_size: tuple[int, int],
+        scale: float = 1.0,
+    ) -> ZoneMap:
+        """
+        구역 다각형으로 라벨 이미지를 생성
+
+        Args:
+            frame_size: 카메라 해상도 (너비, 높이)
+            scale: 라벨 이미지 축소 비율 (메모리가 부족한 환경에서는 0.25 등)
+        """
+        zones = zone_order(parking_spaces, moving_spaces)
+        width = max(1, int(round(frame_size[0] * scale)))
+        height = max(1, int(round(frame_size[1] * scale)))
+
+        dtype = label_dtype(len(zones))
+        labels = np.zeros((height, width), dtype=dtype)
+        boundary = int(np.iinfo(dtype).max)
+
+        spaces = {("parking", space_id): space for space_id, space in parking_spaces.items()}
+        spaces.update({("moving", space_id): space for space_id, space in moving_spaces.items()})
+        polygons = [scaled_polygon(spaces[zone].position, scale) for zone in zones]
+
+        # 우선순위가 낮은 구역부터 그려 우선순위가 높은 구역이 덮어쓰도록 함 (이동 구역 -> 주차 구역, 뒤의 구역 -> 앞의 구역)
+        for label in range(len(zones), 0, -1):
+            cv2.fillPoly(labels, [polygons[label - 1]], color=label, shift=SHIFT)
+
+        # 경계가 지나는 칸은 다각형 판정으로 확인
+        cv2.polylines(labels, polygons, isClosed=True, color=boundary, thickness=BOUNDARY_THICKNESS, shift=SHIFT)
+
+        return cls(labels, zones, scale, polygon_hash(parking_spaces, moving_spaces))
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        parking_spaces: Mapping[int, ParkingSpace],
+        moving_spaces: Mapping[int, MovingSpace],
+        frame_size: tuple[int, int],
+    ) -> Optional[ZoneMap]:
+        """
+        저장한 라벨 이미지를 메모리 매핑으로 읽는 함수
+
+        현재 구역 데이터와 맞지 않으면(구역 다각형 해시, 구역 수, 해상도 비율) None을 반환
+
+        Args:
+            frame_size: 카메라 해상도 (너비, 높이), 라벨 이미지 크기와의 비율로 scale 계산
+        """
+        if not os.path.exists(path):
+            return None
+
+        source_hash = polygon_hash(parking_spaces, moving_spaces)
+        try:
+            with open(hash_path(path), "r") as f:
+                saved_hash = f.read().strip()
+        except OSError:
+            saved_hash = None
+
+        if saved_hash != source_hash:
+            print(f"구역 라벨 이미지를 사용하지 않음 (구역 데이터가 바뀜): {path}")
+            return None
+
+        labels = np.load(path, mmap_mode="r", allow_pickle=False)
+        zones = zone_order(parking_spaces, moving_spaces)
+
+        if labels.ndim != 2 or labels.dtype != label_dtype(len(zones)):
+            print(f"구역 라벨 이미지를 사용하지 않음 (구역 수 또는 형식이 다름): {path}")
+            return None
+
+        scale = labels.shape[1] / frame_size[0]
+        if int(round(frame_size[1] * scale)) != labels.shape[0]:
+            print(f"구역 라벨 이미지를 사용하지 않음 (카메라 해상도 비율이 다름): {path}")
+            return None
+
+        return cls(labels, zones, scale, source_hash)
+
+    def save(self, path: str) -> None:
+        """라벨 이미지를 .npy로, 구역 다각형 해시를 <경로>.sha1로 저장 (임시 파일에 쓴 뒤 교체)"""
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.labels), allow_pickle=False)
+
+        temp_hash_path = f"{hash_path(path)}.tmp"
+        with open(temp_hash_path, "w") as f:
+            f.write(self.source_hash + "\n")
+
+        # 라벨 이미지만 교체된 상태로 중단되어도 해시가 달라 다음 실행에서 다시 생성
+        os.replace(temp_path, path)
+        os.replace(temp_hash_path, hash_path(path))
+
+    def lookup(self, position: tuple[float, float]) -> ZoneKey:
+        """
+        좌표가 속한 구역 키 (라벨 이미지 조회 한 번)
+
+        Returns:
+            구역 키, 구역 밖이면 None, 경계 칸이거나 이미지 밖이면 UNRESOLVED (다각형 판정 필요)
+        """
+        col = int(position[0] * self.scale)
+        row = int(position[1] * self.scale)
+
+        if position[0] < 0 or position[1] < 0 or col >= self.width or row >= self.height:
+            return UNRESOLVED
+
+        label = int(self.labels[row, col])
+        if label == self.boundary:
+            return UNRESOLVED
+
+        return self.zones[label]
+
+
+def classify_exact(
+    position: tuple[float, float],
+    parking_spaces: Mapping[int, ParkingSpace],
+    moving_spaces: Mapping[int, MovingSpace],
+) -> ZoneKey:
+    """다각형 판정으로 좌표가 속한 구역 키를 반환 (roop와 동일하게 주차 구역을 먼저 확인)"""
+
+    for space_id, space in parking_spaces.items():
+        if space.is_car_in_space(position[0], position[1]):
+            return ("parking", space_id)
+
+    for space_id, space in moving_spaces.items():
+        if space.is_car_in_space(position[0], position[1]):
+            return ("moving", space_id)
+
+    return None
+
+
+def load_or_build(
+    path: Optional[str],
+    parking_spaces: Mapping[int, ParkingSpace],
+    moving_spaces: Mapping[int, MovingSpace],
+    frame_size: tuple[int, int],
+    scale: float = 1.0,
+) -> ZoneMap:
+    """
+    저장한 라벨 이미지가 현재 구역 데이터와 같으면 메모리 매핑으로 읽고, 아니면 생성하여 저장
+
+    Args:
+        path: 라벨 이미지 경로 (None이면 저장하지 않고 메모리에서만 사용)
+    """
+    if path is None:
+        return ZoneMap.build(parking_spaces, moving_spaces, frame_size, scale)
+
+    zone_map = ZoneMap.load(path, parking_spaces, moving_spaces, frame_size)
+    if zone_map is not None:
+        return zone_map
+
+    zone_map = ZoneMap.build(parking_spaces, moving_spaces, frame_size, scale)
+
+    # 다음 실행부터 메모리 매핑으로 읽도록 저장 (저장하지 못해도 생성한 라벨 이미지로 실행)
+    try:
+        zone_map.save(path)
+        print(f"구역 라벨 이미지 저장: {path}")
+    except OSError as e:
+        print(f"구역 라벨 이미지를 저장할 수 없습니다: {e}")
+
+    return zone_map
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """구역 데이터로 라벨 이미지를 생성하여 저장하는 명령"""
+
+    import layout_bundle
+    import shortest_route as sr
+
+    parser = argparse.ArgumentParser(description="구역 다각형을 라벨 이미지(.npy)로 저장")
+    parser.add_argument("output_path", nargs="?", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "zone_map.npy"))
+    parser.add_argument("--parking", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "parking_space.json"))
+    parser.add_argument("--moving", default=os.path.join(layout_bundle.POSITION_FILE_DIR, "moving_space.json"))
+    parser.add_argument("--width", type=int, default=1920, help="카메라 해상도 너비")
+    parser.add_argument("--height", type=int, default=1080, help="카메라 해상도 높이")
+    parser.add_argument("--scale", type=float, default=1.0, help="라벨 이미지 축소 비율 (젯슨 등 메모리가 부족하면 0.25)")
+    args = parser.parse_args(argv)
+
+    parking_data, moving_data, _ = layout_bundle.load_layout_data(args.parking, args.moving)
+    parking_spaces, moving_spaces = sr.build_spaces(parking_data, moving_data)
+
+    zone_map = ZoneMap.build(parking_spaces, moving_spaces, (args.width, args.height), args.scale)
+    zone_map.save(args.output_path)
+
+    boundary_ratio = float(np.count_nonzero(zone_map.labels == zone_map.boundary)) / zone_map.labels.size
+    print(f"라벨 이미지 저장 완료: {args.output_path} ({zone_map.width}x{zone_map.height}, {zone_map.labels.dtype}, "
+          f"{zone_map.labels.nbytes / 1024:.0f}KB, 경계 칸 {boundary_ratio * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()